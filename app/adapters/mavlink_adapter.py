@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import os
+import threading
+from collections import deque
 from collections.abc import AsyncIterator
 from typing import Any
 
@@ -16,6 +18,18 @@ from app.domain.models import (
     TelemetryPosition,
 )
 
+MAV_RESULT_ACCEPTED = 0
+MAV_RESULT_IN_PROGRESS = 5
+MAV_RESULT_LABELS: dict[int, str] = {
+    0: "ACCEPTED",
+    1: "TEMPORARILY_REJECTED",
+    2: "DENIED",
+    3: "UNSUPPORTED",
+    4: "FAILED",
+    5: "IN_PROGRESS",
+    6: "CANCELLED",
+}
+
 
 class MavlinkAdapter(FakeAdapter):
     def __init__(
@@ -48,6 +62,11 @@ class MavlinkAdapter(FakeAdapter):
         self._latest_mode = "UNKNOWN"
         self._latest_battery_percent: float | None = None
         self._latest_battery_voltage: float | None = None
+        # COMMAND_ACK carries no request id, so waiters queue per mav_cmd in send order.
+        self._pending_acks: dict[int, deque[asyncio.Future[Ack]]] = {}
+        self._ack_reader: asyncio.Task[None] | None = None
+        self._recv_lock = threading.Lock()
+        self._streaming = False
 
     def _resolve_simulation_mode(self, simulation_mode: bool | None) -> bool:
         if simulation_mode is not None:
@@ -83,6 +102,10 @@ class MavlinkAdapter(FakeAdapter):
         return None
 
     async def disconnect(self) -> None:
+        reader = self._ack_reader
+        self._ack_reader = None
+        if reader is not None and not reader.done() and reader.get_loop() is asyncio.get_running_loop():
+            reader.cancel()
         master = self._master
         self._master = None
         self._mavutil = None
@@ -118,6 +141,28 @@ class MavlinkAdapter(FakeAdapter):
             return
         if msg_type == "HEARTBEAT":
             self._latest_mode = self._decode_mode(message)
+            return
+        if msg_type == "COMMAND_ACK":
+            self._resolve_command_ack(int(message.command), int(message.result))
+
+    def _resolve_command_ack(self, mav_cmd: int, result: int) -> None:
+        if result == MAV_RESULT_IN_PROGRESS:
+            return
+        waiters = self._pending_acks.get(mav_cmd)
+        future: asyncio.Future[Ack] | None = None
+        while waiters:
+            candidate = waiters.popleft()
+            if not candidate.done():
+                future = candidate
+                break
+        if waiters is not None and not waiters:
+            del self._pending_acks[mav_cmd]
+        if future is None:
+            return
+        label = MAV_RESULT_LABELS.get(result, str(result))
+        future.set_result(
+            Ack(ok=result == MAV_RESULT_ACCEPTED, message=f"MAVLink COMMAND_ACK {mav_cmd}: {label}")
+        )
 
     def _build_mavlink_telemetry(self, drone_id: str) -> TelemetryNormalized | None:
         if self._latest_position is None:
@@ -146,24 +191,29 @@ class MavlinkAdapter(FakeAdapter):
             return
 
         produced = 0
-        while self._max_samples is None or produced < self._max_samples:
-            timeout = max(self._telemetry_interval_seconds, 0.2)
-            message = await asyncio.to_thread(
-                self._master.recv_match,
-                type=["HEARTBEAT", "GLOBAL_POSITION_INT", "SYS_STATUS"],
-                blocking=True,
-                timeout=timeout,
-            )
-            if message is None:
-                if self._telemetry_interval_seconds > 0:
-                    await asyncio.sleep(self._telemetry_interval_seconds)
-                continue
-            self._consume_mavlink_message(message)
-            telemetry = self._build_mavlink_telemetry(drone_id)
-            if telemetry is None:
-                continue
-            produced += 1
-            yield telemetry
+        self._streaming = True
+        try:
+            while self._max_samples is None or produced < self._max_samples:
+                timeout = max(self._telemetry_interval_seconds, 0.2)
+                message = await asyncio.to_thread(
+                    self._recv_match,
+                    ["HEARTBEAT", "GLOBAL_POSITION_INT", "SYS_STATUS", "COMMAND_ACK"],
+                    timeout,
+                )
+                if message is None:
+                    if self._telemetry_interval_seconds > 0:
+                        await asyncio.sleep(self._telemetry_interval_seconds)
+                    continue
+                self._consume_mavlink_message(message)
+                telemetry = self._build_mavlink_telemetry(drone_id)
+                if telemetry is None:
+                    continue
+                produced += 1
+                yield telemetry
+        finally:
+            self._streaming = False
+            if self._pending_acks:
+                self._ensure_ack_reader()
 
     def _command_to_mavlink_id(self, command_type: CommandType) -> int | None:
         if self._mavutil is None:
@@ -187,6 +237,10 @@ class MavlinkAdapter(FakeAdapter):
         if mav_cmd is None:
             return Ack(ok=False, message=f"MAVLink command not supported: {command.type}")
 
+        pending: asyncio.Future[Ack] | None = None
+        if command.expect_ack:
+            pending = asyncio.get_running_loop().create_future()
+            self._pending_acks.setdefault(mav_cmd, deque()).append(pending)
         try:
             await asyncio.to_thread(
                 self._master.mav.command_long_send,
@@ -203,9 +257,51 @@ class MavlinkAdapter(FakeAdapter):
                 0,
             )
             self._latest_mode = command.type.value
-            return Ack(ok=True, message=f"MAVLink command sent: {command.type}")
+            if pending is None:
+                return Ack(ok=True, message=f"MAVLink command sent: {command.type}")
+            return await self._await_command_ack(pending)
         except Exception as exc:
             return Ack(ok=False, message=f"MAVLink command failed: {exc}")
+        finally:
+            if pending is not None:
+                self._discard_pending_ack(mav_cmd, pending)
+
+    def _discard_pending_ack(self, mav_cmd: int, pending: asyncio.Future[Ack]) -> None:
+        waiters = self._pending_acks.get(mav_cmd)
+        if waiters is None:
+            return
+        if pending in waiters:
+            waiters.remove(pending)
+        if not waiters:
+            del self._pending_acks[mav_cmd]
+
+    def _recv_match(self, msg_type: str | list[str], timeout: float) -> Any | None:
+        # The stream loop and the ack reader may overlap for one receive; never read concurrently.
+        master = self._master
+        if master is None:
+            return None
+        with self._recv_lock:
+            return master.recv_match(type=msg_type, blocking=True, timeout=timeout)
+
+    def _ensure_ack_reader(self) -> None:
+        reader = self._ack_reader
+        loop = asyncio.get_running_loop()
+        if reader is not None and not reader.done() and reader.get_loop() is loop:
+            return
+        self._ack_reader = loop.create_task(self._read_command_acks())
+
+    async def _read_command_acks(self) -> None:
+        # One reader per connection resolves every in-flight waiter; the telemetry stream
+        # takes over while it runs and hands back when it stops.
+        while self._pending_acks and not self._streaming and self._master is not None:
+            message = await asyncio.to_thread(self._recv_match, "COMMAND_ACK", 0.5)
+            if message is not None:
+                self._consume_mavlink_message(message)
+
+    async def _await_command_ack(self, pending: asyncio.Future[Ack]) -> Ack:
+        if not self._streaming:
+            self._ensure_ack_reader()
+        return await pending
 
     async def upload_mission_plan(self, drone_id: str, plan: MissionPlan) -> None:
         if self._simulation_mode or self._master is None:
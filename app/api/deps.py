@@ -1,39 +1,67 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Annotated, Any
+from collections.abc import Callable, Generator
+from operator import attrgetter
+from typing import Annotated, Any, TypeVar
 
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import Depends, HTTPException, Query, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 
-from app.domain.permissions import has_permission
-from app.infra.auth import decode_access_token
+from app.domain.permissions import PERM_PLATFORM_SUPER_ADMIN, PermissionSet
+from app.infra.auth import verify_access_token
+from app.infra.pagination import (
+    PAGINATION_DEFAULT_LIMIT,
+    PAGINATION_MAX_LIMIT,
+    InvalidCursorError,
+    PageRequest,
+    decode_cursor,
+    paginate_items,
+)
 from app.infra.tenant import set_request_context
+from app.infra.unit_of_work import UnitOfWork
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/identity/dev-login")
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+RowT = TypeVar("RowT")
+
 
 def get_current_claims(
     request: Request,
     token: str = Depends(oauth2_scheme),
 ) -> dict[str, Any]:
     try:
-        claims = decode_access_token(token)
+        verified = verify_access_token(token)
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token",
         ) from exc
+    claims = verified.copy_claims()
     request.state.claims = claims
+    request.state.permissions = verified.permissions
     set_request_context(claims.get("tenant_id"), claims.get("sub"))
     return claims
 
 
-def require_perm(permission: str) -> Callable[[dict[str, Any]], dict[str, Any]]:
+def get_current_permissions(
+    request: Request,
+    claims: Annotated[dict[str, Any], Depends(get_current_claims)],
+) -> PermissionSet:
+    permissions = getattr(request.state, "permissions", None)
+    if isinstance(permissions, PermissionSet):
+        return permissions
+    return PermissionSet.from_claims(claims)
+
+
+def require_perm(permission: str) -> Callable[..., dict[str, Any]]:
     def _checker(
         claims: Annotated[dict[str, Any], Depends(get_current_claims)],
+        granted: Annotated[PermissionSet, Depends(get_current_permissions)],
     ) -> dict[str, Any]:
-        if not has_permission(claims, permission):
+        if not granted.allows(permission):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Missing permission: {permission}",
@@ -43,15 +71,16 @@ def require_perm(permission: str) -> Callable[[dict[str, Any]], dict[str, Any]]:
     return _checker
 
 
-def require_any_perm(*permissions: str) -> Callable[[dict[str, Any]], dict[str, Any]]:
-    expected = [item for item in permissions if item]
+def require_any_perm(*permissions: str) -> Callable[..., dict[str, Any]]:
+    expected = tuple(item for item in permissions if item)
 
     def _checker(
         claims: Annotated[dict[str, Any], Depends(get_current_claims)],
+        granted: Annotated[PermissionSet, Depends(get_current_permissions)],
     ) -> dict[str, Any]:
         if not expected:
             return claims
-        if any(has_permission(claims, permission) for permission in expected):
+        if granted.allows_any(expected):
             return claims
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -59,3 +88,89 @@ def require_any_perm(*permissions: str) -> Callable[[dict[str, Any]], dict[str,
         )
 
     return _checker
+
+
+def require_platform_super_admin(
+    claims: Annotated[dict[str, Any], Depends(get_current_claims)],
+) -> dict[str, Any]:
+    # Cross-tenant endpoints need the explicit grant; the tenant admin wildcard is not enough.
+    permissions = claims.get("permissions", [])
+    if not isinstance(permissions, list) or PERM_PLATFORM_SUPER_ADMIN not in permissions:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Missing explicit permission: {PERM_PLATFORM_SUPER_ADMIN}",
+        )
+    return claims
+
+
+def build_page_request(
+    limit: int | None,
+    cursor: str | None,
+    include_total: bool,
+    *,
+    max_limit: int = PAGINATION_MAX_LIMIT,
+) -> PageRequest:
+    if cursor is not None:
+        try:
+            decode_cursor(cursor)
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return PageRequest(
+        limit=min(limit or PAGINATION_DEFAULT_LIMIT, max_limit),
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+
+def get_page_request(
+    limit: Annotated[int | None, Query(ge=1, le=PAGINATION_MAX_LIMIT)] = None,
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+    include_total: bool = False,
+) -> PageRequest:
+    # Lists are always bounded: without paging parameters the first PAGINATION_DEFAULT_LIMIT rows.
+    return build_page_request(limit, cursor, include_total)
+
+
+Page = Annotated[PageRequest, Depends(get_page_request)]
+
+
+def set_page_headers(response: Response, page: PageRequest | None) -> None:
+    if page is None:
+        return
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    if page.total is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(page.total)
+
+
+def paginate_response(
+    response: Response,
+    page: PageRequest | None,
+    rows: list[RowT],
+    *,
+    sort_attr: str = "created_at",
+    id_attr: str = "id",
+) -> list[RowT]:
+    paged = paginate_items(rows, page, sort_key=attrgetter(sort_attr), id_key=attrgetter(id_attr))
+    set_page_headers(response, page)
+    return paged
+
+
+def get_unit_of_work() -> Generator[UnitOfWork, None, None]:
+    uow = UnitOfWork()
+    try:
+        yield uow
+    finally:
+        uow.close()
+
+
+def get_read_unit_of_work() -> Generator[UnitOfWork, None, None]:
+    uow = UnitOfWork(read_only=True)
+    try:
+        yield uow
+    finally:
+        uow.close()
+
+
+UoW = Annotated[UnitOfWork, Depends(get_unit_of_work)]
+ReadUoW = Annotated[UnitOfWork, Depends(get_read_unit_of_work)]
@@ -3,9 +3,9 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from app.api.deps import get_current_claims, require_any_perm
+from app.api.deps import Page, get_current_claims, require_any_perm, set_page_headers
 from app.domain.models import (
     AiAnalysisJobBindModelVersionRequest,
     AiAnalysisJobCreate,
@@ -98,12 +98,17 @@ def list_model_catalogs(
     service: Service,
     model_key: str | None = None,
     provider: str | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[AiModelCatalogRead]:
     rows = service.list_model_catalogs(
         claims["tenant_id"],
         model_key=model_key,
         provider=provider,
+        page=page,
     )
+    set_page_headers(response, page)
     return [AiModelCatalogRead.model_validate(item) for item in rows]
 
 
@@ -144,9 +149,13 @@ def list_model_versions(
     claims: Claims,
     service: Service,
     status_filter: AiModelVersionStatus | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[AiModelVersionRead]:
     try:
-        rows = service.list_model_versions(claims["tenant_id"], model_id, status=status_filter)
+        rows = service.list_model_versions(claims["tenant_id"], model_id, status=status_filter, page=page)
+        set_page_headers(response, page)
         return [AiModelVersionRead.model_validate(item) for item in rows]
     except (NotFoundError, ConflictError) as exc:
         _handle_ai_error(exc)
@@ -398,13 +407,18 @@ def list_jobs(
     service: Service,
     task_id: str | None = None,
     mission_id: str | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[AiAnalysisJobRead]:
     rows = service.list_jobs(
         claims["tenant_id"],
         task_id=task_id,
         mission_id=mission_id,
         viewer_user_id=claims["sub"],
+        page=page,
     )
+    set_page_headers(response, page)
     return [AiAnalysisJobRead.model_validate(item) for item in rows]
 
 
@@ -433,9 +447,16 @@ def trigger_run(
     response_model=list[AiAnalysisRunRead],
     dependencies=[Depends(require_any_perm(PERM_AI_READ, PERM_REPORTING_READ))],
 )
-def list_runs(job_id: str, claims: Claims, service: Service) -> list[AiAnalysisRunRead]:
+def list_runs(
+    job_id: str,
+    claims: Claims,
+    service: Service,
+    response: Response,
+    page: Page,
+) -> list[AiAnalysisRunRead]:
     try:
-        rows = service.list_runs(claims["tenant_id"], job_id)
+        rows = service.list_runs(claims["tenant_id"], job_id, page=page)
+        set_page_headers(response, page)
         return [AiAnalysisRunRead.model_validate(item) for item in rows]
     except (NotFoundError, ConflictError) as exc:
         _handle_ai_error(exc)
@@ -472,6 +493,9 @@ def list_outputs(
     job_id: str | None = None,
     run_id: str | None = None,
     review_status: AiOutputReviewStatus | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[AiAnalysisOutputRead]:
     rows = service.list_outputs(
         claims["tenant_id"],
@@ -479,7 +503,9 @@ def list_outputs(
         run_id=run_id,
         review_status=review_status,
         viewer_user_id=claims["sub"],
+        page=page,
     )
+    set_page_headers(response, page)
     return [AiAnalysisOutputRead.model_validate(item) for item in rows]
 
 
@@ -3,9 +3,9 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, require_perm, set_page_headers
 from app.domain.models import (
     AlertActionRequest,
     AlertAggregationRuleCreate,
@@ -61,6 +61,8 @@ def _handle_alert_error(exc: Exception) -> None:
 def list_alerts(
     claims: Claims,
     service: Service,
+    response: Response,
+    page: Page,
     drone_id: str | None = None,
     alert_status: AlertStatus | None = None,
 ) -> list[AlertRead]:
@@ -68,7 +70,9 @@ def list_alerts(
         claims["tenant_id"],
         drone_id=drone_id,
         status=alert_status,
+        page=page,
     )
+    set_page_headers(response, page)
     return [AlertRead.model_validate(item) for item in rows]
 
 
@@ -164,13 +168,18 @@ def list_routing_rules(
     priority_level: AlertPriority | None = None,
     alert_type: AlertType | None = None,
     is_active: bool | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[AlertRoutingRuleRead]:
     rows = service.list_routing_rules(
         claims["tenant_id"],
         priority_level=priority_level,
         alert_type=alert_type,
         is_active=is_active,
+        page=page,
     )
+    set_page_headers(response, page)
     return [AlertRoutingRuleRead.model_validate(item) for item in rows]
 
 
@@ -202,8 +211,12 @@ def list_silence_rules(
     claims: Claims,
     service: Service,
     is_active: bool | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[AlertSilenceRuleRead]:
-    rows = service.list_silence_rules(claims["tenant_id"], is_active=is_active)
+    rows = service.list_silence_rules(claims["tenant_id"], is_active=is_active, page=page)
+    set_page_headers(response, page)
     return [AlertSilenceRuleRead.model_validate(item) for item in rows]
 
 
@@ -235,8 +248,12 @@ def list_aggregation_rules(
     claims: Claims,
     service: Service,
     is_active: bool | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[AlertAggregationRuleRead]:
-    rows = service.list_aggregation_rules(claims["tenant_id"], is_active=is_active)
+    rows = service.list_aggregation_rules(claims["tenant_id"], is_active=is_active, page=page)
+    set_page_headers(response, page)
     return [AlertAggregationRuleRead.model_validate(item) for item in rows]
 
 
@@ -268,11 +285,16 @@ def list_oncall_shifts(
     claims: Claims,
     service: Service,
     is_active: bool | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[AlertOncallShiftRead]:
     rows = service.list_oncall_shifts(
         claims["tenant_id"],
         is_active=is_active,
+        page=page,
     )
+    set_page_headers(response, page)
     return [AlertOncallShiftRead.model_validate(item) for item in rows]
 
 
@@ -304,8 +326,12 @@ def list_escalation_policies(
     claims: Claims,
     service: Service,
     is_active: bool | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[AlertEscalationPolicyRead]:
-    rows = service.list_escalation_policies(claims["tenant_id"], is_active=is_active)
+    rows = service.list_escalation_policies(claims["tenant_id"], is_active=is_active, page=page)
+    set_page_headers(response, page)
     return [AlertEscalationPolicyRead.model_validate(item) for item in rows]
 
 
@@ -349,9 +375,16 @@ def get_alert_sla_overview(
     response_model=list[AlertRouteLogRead],
     dependencies=[Depends(require_perm(PERM_ALERT_READ))],
 )
-def list_alert_routes(alert_id: str, claims: Claims, service: Service) -> list[AlertRouteLogRead]:
+def list_alert_routes(
+    alert_id: str,
+    claims: Claims,
+    service: Service,
+    response: Response,
+    page: Page,
+) -> list[AlertRouteLogRead]:
     try:
-        rows = service.list_alert_routes(claims["tenant_id"], alert_id)
+        rows = service.list_alert_routes(claims["tenant_id"], alert_id, page=page)
+        set_page_headers(response, page)
         return [AlertRouteLogRead.model_validate(item) for item in rows]
     except (NotFoundError, ConflictError) as exc:
         _handle_alert_error(exc)
@@ -406,9 +439,16 @@ def create_alert_action(
     response_model=list[AlertHandlingActionRead],
     dependencies=[Depends(require_perm(PERM_ALERT_READ))],
 )
-def list_alert_actions(alert_id: str, claims: Claims, service: Service) -> list[AlertHandlingActionRead]:
+def list_alert_actions(
+    alert_id: str,
+    claims: Claims,
+    service: Service,
+    response: Response,
+    page: Page,
+) -> list[AlertHandlingActionRead]:
     try:
-        rows = service.list_handling_actions(claims["tenant_id"], alert_id)
+        rows = service.list_handling_actions(claims["tenant_id"], alert_id, page=page)
+        set_page_headers(response, page)
         return [AlertHandlingActionRead.model_validate(item) for item in rows]
     except (NotFoundError, ConflictError) as exc:
         _handle_alert_error(exc)
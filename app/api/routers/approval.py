@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, require_perm, set_page_headers
 from app.domain.models import ApprovalRecordCreate, ApprovalRecordRead
 from app.domain.permissions import PERM_APPROVAL_READ, PERM_APPROVAL_WRITE
 from app.services.compliance_service import ComplianceService
@@ -40,8 +40,12 @@ def list_approvals(
     service: Service,
     entity_type: str | None = None,
     entity_id: str | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[ApprovalRecordRead]:
-    rows = service.list_approvals(claims["tenant_id"], entity_type=entity_type, entity_id=entity_id)
+    rows = service.list_approvals(claims["tenant_id"], entity_type=entity_type, entity_id=entity_id, page=page)
+    set_page_headers(response, page)
     return [ApprovalRecordRead.model_validate(item) for item in rows]
 
 
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, require_perm, set_page_headers
 from app.domain.models import (
     AssetAvailabilityStatus,
     AssetAvailabilityUpdateRequest,
@@ -68,6 +68,9 @@ def list_assets(
     availability_status: AssetAvailabilityStatus | None = None,
     health_status: AssetHealthStatus | None = None,
     region_code: str | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[AssetRead]:
     rows = service.list_assets(
         claims["tenant_id"],
@@ -77,7 +80,9 @@ def list_assets(
         health_status=health_status,
         region_code=region_code,
         viewer_user_id=claims["sub"],
+        page=page,
     )
+    set_page_headers(response, page)
     return [AssetRead.model_validate(item) for item in rows]
 
 
@@ -94,6 +99,9 @@ def list_resource_pool(
     health_status: AssetHealthStatus | None = None,
     region_code: str | None = None,
     min_health_score: int | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[AssetRead]:
     rows = service.list_resource_pool(
         claims["tenant_id"],
@@ -103,7 +111,9 @@ def list_resource_pool(
         region_code=region_code,
         min_health_score=min_health_score,
         viewer_user_id=claims["sub"],
+        page=page,
     )
+    set_page_headers(response, page)
     return [AssetRead.model_validate(item) for item in rows]
 
 
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, require_perm, set_page_headers
 from app.domain.models import (
     MaintenanceWorkOrderCloseRequest,
     MaintenanceWorkOrderCreate,
@@ -75,8 +75,12 @@ def list_workorders(
     service: Service,
     asset_id: str | None = None,
     status: MaintenanceWorkOrderStatus | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[MaintenanceWorkOrderRead]:
-    rows = service.list_workorders(claims["tenant_id"], asset_id=asset_id, status=status)
+    rows = service.list_workorders(claims["tenant_id"], asset_id=asset_id, status=status, page=page)
+    set_page_headers(response, page)
     return [MaintenanceWorkOrderRead.model_validate(item) for item in rows]
 
 
@@ -154,6 +158,8 @@ def list_workorder_history(
     request: Request,
     claims: Claims,
     service: Service,
+    response: Response,
+    page: Page,
 ) -> list[MaintenanceWorkOrderHistoryRead]:
     set_audit_context(
         request,
@@ -161,7 +167,8 @@ def list_workorder_history(
         detail={"what": {"workorder_id": workorder_id}},
     )
     try:
-        rows = service.list_history(claims["tenant_id"], workorder_id)
+        rows = service.list_history(claims["tenant_id"], workorder_id, page=page)
+        set_page_headers(response, page)
         return [MaintenanceWorkOrderHistoryRead.model_validate(item) for item in rows]
     except (NotFoundError, ConflictError) as exc:
         _handle_error(exc)
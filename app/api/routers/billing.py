@@ -3,9 +3,9 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, require_perm, set_page_headers
 from app.domain.models import (
     BillingInvoiceCloseRequest,
     BillingInvoiceDetailRead,
@@ -24,6 +24,8 @@ from app.domain.models import (
     BillingSubscriptionCreate,
     BillingSubscriptionRead,
     BillingTenantQuotaSnapshotRead,
+    BillingUsageBatchIngestRead,
+    BillingUsageBatchIngestRequest,
     BillingUsageEventRead,
     BillingUsageIngestRead,
     BillingUsageIngestRequest,
@@ -111,8 +113,12 @@ def list_plans(
     service: Service,
     plan_code: str | None = None,
     is_active: bool | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[BillingPlanRead]:
-    rows = service.list_plans(claims["tenant_id"], plan_code=plan_code, is_active=is_active)
+    rows = service.list_plans(claims["tenant_id"], plan_code=plan_code, is_active=is_active, page=page)
+    set_page_headers(response, page)
     return [_build_plan_read(plan, quotas) for plan, quotas in rows]
 
 
@@ -159,9 +165,12 @@ def list_subscriptions(
     tenant_id: str,
     claims: Claims,
     service: Service,
+    response: Response,
+    page: Page,
 ) -> list[BillingSubscriptionRead]:
     _ensure_tenant_scope(tenant_id, claims)
-    rows = service.list_subscriptions(tenant_id)
+    rows = service.list_subscriptions(tenant_id, page=page)
+    set_page_headers(response, page)
     return [BillingSubscriptionRead.model_validate(item) for item in rows]
 
 
@@ -201,9 +210,12 @@ def list_quota_overrides(
     tenant_id: str,
     claims: Claims,
     service: Service,
+    response: Response,
+    page: Page,
 ) -> list[BillingQuotaOverrideRead]:
     _ensure_tenant_scope(tenant_id, claims)
-    rows = service.list_quota_overrides(tenant_id)
+    rows = service.list_quota_overrides(tenant_id, page=page)
+    set_page_headers(response, page)
     return [BillingQuotaOverrideRead.model_validate(item) for item in rows]
 
 
@@ -257,6 +269,38 @@ def ingest_usage(
         raise
 
 
+@router.post(
+    "/usage:batch-ingest",
+    response_model=BillingUsageBatchIngestRead,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_perm(PERM_BILLING_WRITE))],
+)
+def ingest_usage_batch(
+    payload: BillingUsageBatchIngestRequest,
+    request: Request,
+    claims: Claims,
+    service: Service,
+) -> BillingUsageBatchIngestRead:
+    try:
+        result = service.ingest_usage_events(claims["tenant_id"], claims["sub"], payload.events)
+        set_audit_context(
+            request,
+            action="billing.usage.batch_ingest",
+            resource="/api/billing/usage:batch-ingest",
+            detail={
+                "what": {
+                    "total": result.total,
+                    "accepted": result.accepted,
+                    "deduplicated": result.deduplicated,
+                }
+            },
+        )
+        return result
+    except (NotFoundError, ConflictError) as exc:
+        _handle_billing_error(exc)
+        raise
+
+
 @router.get(
     "/tenants/{tenant_id}/usage/summary",
     response_model=list[BillingUsageSummaryRead],
@@ -349,6 +393,9 @@ def list_invoices(
     period_start: datetime | None = None,
     period_end: datetime | None = None,
     status: BillingInvoiceStatus | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[BillingInvoiceRead]:
     _ensure_tenant_scope(tenant_id, claims)
     rows = service.list_invoices(
@@ -356,7 +403,9 @@ def list_invoices(
         period_start=period_start,
         period_end=period_end,
         status=status,
+        page=page,
     )
+    set_page_headers(response, page)
     return [BillingInvoiceRead.model_validate(item) for item in rows]
 
 
@@ -2,25 +2,72 @@ from __future__ import annotations
 
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, UoW, get_current_claims, require_perm, set_page_headers
 from app.domain.models import CommandDispatchRequest, CommandRead
-from app.domain.permissions import PERM_COMMAND_READ, PERM_COMMAND_WRITE
+from app.domain.permissions import PERM_COMMAND_READ, PERM_COMMAND_WRITE, has_permission
+from app.infra.auth import decode_access_token
 from app.services.command_service import CommandService, ConflictError, NotFoundError
 from app.services.compliance_service import ComplianceViolationError
 
 router = APIRouter()
+ws_router = APIRouter()
+
+
+class CommandWsHub:
+    def __init__(self) -> None:
+        self._connections: dict[str, set[WebSocket]] = {}
+
+    async def connect(self, tenant_id: str, websocket: WebSocket) -> None:
+        await websocket.accept()
+        self._connections.setdefault(tenant_id, set()).add(websocket)
+
+    def disconnect(self, tenant_id: str, websocket: WebSocket) -> None:
+        tenant_conns = self._connections.get(tenant_id, set())
+        if websocket in tenant_conns:
+            tenant_conns.remove(websocket)
+        if not tenant_conns and tenant_id in self._connections:
+            del self._connections[tenant_id]
+
+    async def broadcast(self, tenant_id: str, payload: dict[str, Any]) -> None:
+        connections = list(self._connections.get(tenant_id, set()))
+        for connection in connections:
+            try:
+                await connection.send_json(payload)
+            except Exception:
+                self.disconnect(tenant_id, connection)
+
 
+command_ws_hub = CommandWsHub()
 
-def get_command_service() -> CommandService:
-    return CommandService()
+
+def get_command_service(uow: UoW) -> CommandService:
+    return CommandService(state_notifier=command_ws_hub.broadcast, uow=uow)
 
 
 Claims = Annotated[dict[str, Any], Depends(get_current_claims)]
 Service = Annotated[CommandService, Depends(get_command_service)]
 
 
+def _extract_ws_token(websocket: WebSocket, token: str | None) -> str | None:
+    if token:
+        return token
+    auth_header = websocket.headers.get("authorization", "")
+    if auth_header.lower().startswith("bearer "):
+        return auth_header[7:].strip()
+    return None
+
+
 def _handle_command_error(exc: Exception) -> None:
     if isinstance(exc, NotFoundError):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
@@ -69,8 +116,9 @@ async def dispatch_command(
     response_model=list[CommandRead],
     dependencies=[Depends(require_perm(PERM_COMMAND_READ))],
 )
-def list_commands(claims: Claims, service: Service) -> list[CommandRead]:
-    records = service.list_commands(claims["tenant_id"])
+def list_commands(claims: Claims, service: Service, response: Response, page: Page) -> list[CommandRead]:
+    records = service.list_commands(claims["tenant_id"], page=page)
+    set_page_headers(response, page)
     return [CommandRead.model_validate(item) for item in records]
 
 
@@ -86,3 +134,30 @@ def get_command(command_id: str, claims: Claims, service: Service) -> CommandRea
     except (NotFoundError, ConflictError, ComplianceViolationError) as exc:
         _handle_command_error(exc)
         raise
+
+
+@ws_router.websocket("/ws/commands")
+async def ws_commands(websocket: WebSocket, token: str | None = Query(default=None)) -> None:
+    resolved_token = _extract_ws_token(websocket, token)
+    if not resolved_token:
+        await websocket.close(code=4401)
+        return
+    try:
+        claims = decode_access_token(resolved_token)
+    except Exception:
+        await websocket.close(code=4401)
+        return
+    if not has_permission(claims, PERM_COMMAND_READ):
+        await websocket.close(code=4403)
+        return
+    tenant_id = claims.get("tenant_id")
+    if not isinstance(tenant_id, str) or not tenant_id:
+        await websocket.close(code=4401)
+        return
+
+    await command_ws_hub.connect(tenant_id, websocket)
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        command_ws_hub.disconnect(tenant_id, websocket)
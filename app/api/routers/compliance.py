@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, require_perm, set_page_headers
 from app.domain.models import (
     AirspacePolicyLayer,
     AirspaceZoneCreate,
@@ -96,6 +96,9 @@ def list_zones(
     policy_layer: AirspacePolicyLayer | None = None,
     org_unit_id: str | None = None,
     is_active: bool | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[AirspaceZoneRead]:
     rows = service.list_airspace_zones(
         claims["tenant_id"],
@@ -103,7 +106,9 @@ def list_zones(
         policy_layer=policy_layer,
         org_unit_id=org_unit_id,
         is_active=is_active,
+        page=page,
     )
+    set_page_headers(response, page)
     return [AirspaceZoneRead.model_validate(item) for item in rows]
 
 
@@ -156,12 +161,17 @@ def list_approval_flow_templates(
     service: Service,
     entity_type: str | None = None,
     is_active: bool | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[ComplianceApprovalFlowTemplateRead]:
     rows = service.list_approval_flow_templates(
         claims["tenant_id"],
         entity_type=entity_type,
         is_active=is_active,
+        page=page,
     )
+    set_page_headers(response, page)
     return [ComplianceApprovalFlowTemplateRead.model_validate(item) for item in rows]
 
 
@@ -244,13 +254,18 @@ def list_decision_records(
     source: str | None = None,
     entity_type: str | None = None,
     entity_id: str | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[ComplianceDecisionRecordRead]:
     rows = service.list_decision_records(
         claims["tenant_id"],
         source=source,
         entity_type=entity_type,
         entity_id=entity_id,
+        page=page,
     )
+    set_page_headers(response, page)
     return [ComplianceDecisionRecordRead.model_validate(item) for item in rows]
 
 
@@ -308,8 +323,12 @@ def list_preflight_templates(
     claims: Claims,
     service: Service,
     is_active: bool | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[PreflightChecklistTemplateRead]:
-    rows = service.list_preflight_templates(claims["tenant_id"], is_active=is_active)
+    rows = service.list_preflight_templates(claims["tenant_id"], is_active=is_active, page=page)
+    set_page_headers(response, page)
     return [PreflightChecklistTemplateRead.model_validate(item) for item in rows]
 
 
@@ -9,6 +9,7 @@ from app.api.deps import get_current_claims, require_perm
 from app.domain.models import DashboardStatsRead
 from app.domain.permissions import PERM_DASHBOARD_READ, has_permission
 from app.infra.auth import decode_access_token
+from app.infra.db import run_db
 from app.services.dashboard_service import DashboardService
 
 router = APIRouter()
@@ -84,8 +85,8 @@ async def ws_dashboard(websocket: WebSocket, token: str | None = Query(default=N
     service = DashboardService()
     try:
         while True:
-            stats = service.get_stats(tenant_id)
-            markers = service.latest_observations(tenant_id, limit=50)
+            stats = await run_db(service.get_stats, tenant_id)
+            markers = await run_db(service.latest_observations, tenant_id, limit=50)
             await websocket.send_json(
                 {
                     "stats": stats.model_dump(),
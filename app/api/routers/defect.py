@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, require_perm, set_page_headers
 from app.domain.models import (
     DefectActionRead,
     DefectAssignRequest,
@@ -63,6 +63,8 @@ def create_from_observation(
 def list_defects(
     claims: Claims,
     service: Service,
+    response: Response,
+    page: Page,
     defect_status: Annotated[DefectStatus | None, Query(alias="status")] = None,
     assigned_to: str | None = None,
 ) -> list[DefectCreateFromObservationRead]:
@@ -71,7 +73,9 @@ def list_defects(
         status=defect_status,
         assigned_to=assigned_to,
         viewer_user_id=claims["sub"],
+        page=page,
     )
+    set_page_headers(response, page)
     return [DefectCreateFromObservationRead.model_validate(item) for item in rows]
 
 
@@ -4,7 +4,14 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import (
+    Page,
+    get_current_claims,
+    paginate_response,
+    require_perm,
+    require_platform_super_admin,
+    set_page_headers,
+)
 from app.domain.models import (
     BootstrapAdminRequest,
     DataAccessPolicyEffectiveRead,
@@ -29,6 +36,8 @@ from app.domain.models import (
     TenantUpdate,
     TokenResponse,
     UserCreate,
+    UserEffectivePermissionsRead,
+    UserEffectivePermissionsRequest,
     UserOrgMembershipBindRequest,
     UserOrgMembershipLinkRead,
     UserRead,
@@ -39,7 +48,6 @@ from app.domain.models import (
 from app.domain.permissions import (
     PERM_IDENTITY_READ,
     PERM_IDENTITY_WRITE,
-    PERM_PLATFORM_SUPER_ADMIN,
 )
 from app.infra.audit import set_audit_context
 from app.infra.auth import create_access_token
@@ -94,16 +102,6 @@ def _set_scope_deny_audit(
     if target is not None:
         detail["what"] = {"target": target}
     set_audit_context(request, action=action, detail=detail)
-
-
-def require_platform_super_admin(claims: Claims) -> Claims:
-    permissions = claims.get("permissions", [])
-    if not isinstance(permissions, list) or PERM_PLATFORM_SUPER_ADMIN not in permissions:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Missing explicit permission: {PERM_PLATFORM_SUPER_ADMIN}",
-        )
-    return claims
 
 
 @router.post("/tenants", response_model=TenantRead, status_code=status.HTTP_201_CREATED)
@@ -121,9 +119,14 @@ def create_tenant(payload: TenantCreate, service: Service) -> TenantRead:
     response_model=list[TenantRead],
     dependencies=[Depends(require_perm(PERM_IDENTITY_READ))],
 )
-def list_tenants(claims: Claims, service: Service) -> list[TenantRead]:
+def list_tenants(
+    claims: Claims,
+    service: Service,
+    response: Response,
+    page: Page,
+) -> list[TenantRead]:
     tenants = service.list_tenants(claims["tenant_id"])
-    return [TenantRead.model_validate(item) for item in tenants]
+    return paginate_response(response, page, [TenantRead.model_validate(item) for item in tenants])
 
 
 @router.get(
@@ -131,14 +134,20 @@ def list_tenants(claims: Claims, service: Service) -> list[TenantRead]:
     response_model=list[TenantRead],
     dependencies=[Depends(require_platform_super_admin)],
 )
-def list_platform_tenants(service: Service, request: Request) -> list[TenantRead]:
+def list_platform_tenants(
+    service: Service,
+    request: Request,
+    response: Response,
+    page: Page,
+) -> list[TenantRead]:
     set_audit_context(
         request,
         action="identity.platform.tenants.list",
         detail={"what": {"target": {"scope": "global"}}},
     )
-    tenants = service.list_all_tenants()
+    tenants = service.list_all_tenants(page=page)
     set_audit_context(request, detail={"what": {"count": len(tenants)}})
+    set_page_headers(response, page)
     return [TenantRead.model_validate(item) for item in tenants]
 
 
@@ -151,14 +160,17 @@ def list_platform_tenant_users(
     tenant_id: str,
     service: Service,
     request: Request,
+    response: Response,
+    page: Page,
 ) -> list[UserRead]:
     set_audit_context(
         request,
         action="identity.platform.tenant_users.list",
         detail={"what": {"target": {"tenant_id": tenant_id}}},
     )
-    rows = service.list_users(tenant_id)
+    rows = service.list_users(tenant_id, page=page)
     set_audit_context(request, detail={"what": {"count": len(rows)}})
+    set_page_headers(response, page)
     return [UserRead.model_validate(item) for item in rows]
 
 
@@ -254,11 +266,29 @@ def create_user(payload: UserCreate, claims: Claims, service: Service) -> UserRe
     response_model=list[UserRead],
     dependencies=[Depends(require_perm(PERM_IDENTITY_READ))],
 )
-def list_users(claims: Claims, service: Service) -> list[UserRead]:
-    users = service.list_users(claims["tenant_id"])
+def list_users(claims: Claims, service: Service, response: Response, page: Page) -> list[UserRead]:
+    users = service.list_users(claims["tenant_id"], page=page)
+    set_page_headers(response, page)
     return [UserRead.model_validate(item) for item in users]
 
 
+@router.post(
+    "/users:effective-permissions",
+    response_model=list[UserEffectivePermissionsRead],
+    dependencies=[Depends(require_perm(PERM_IDENTITY_READ))],
+)
+def list_users_effective_permissions(
+    payload: UserEffectivePermissionsRequest,
+    claims: Claims,
+    service: Service,
+) -> list[UserEffectivePermissionsRead]:
+    permissions = service.collect_users_permissions(claims["tenant_id"], payload.user_ids)
+    return [
+        UserEffectivePermissionsRead(user_id=user_id, permissions=names)
+        for user_id, names in permissions.items()
+    ]
+
+
 @router.get(
     "/users/{user_id}",
     response_model=UserRead,
@@ -320,8 +350,9 @@ def create_role(payload: RoleCreate, claims: Claims, service: Service) -> RoleRe
     response_model=list[RoleRead],
     dependencies=[Depends(require_perm(PERM_IDENTITY_READ))],
 )
-def list_roles(claims: Claims, service: Service) -> list[RoleRead]:
-    roles = service.list_roles(claims["tenant_id"])
+def list_roles(claims: Claims, service: Service, response: Response, page: Page) -> list[RoleRead]:
+    roles = service.list_roles(claims["tenant_id"], page=page)
+    set_page_headers(response, page)
     return [RoleRead.model_validate(item) for item in roles]
 
 
@@ -419,8 +450,14 @@ def create_org_unit(payload: OrgUnitCreate, claims: Claims, service: Service) ->
     response_model=list[OrgUnitRead],
     dependencies=[Depends(require_perm(PERM_IDENTITY_READ))],
 )
-def list_org_units(claims: Claims, service: Service) -> list[OrgUnitRead]:
-    units = service.list_org_units(claims["tenant_id"])
+def list_org_units(
+    claims: Claims,
+    service: Service,
+    response: Response,
+    page: Page,
+) -> list[OrgUnitRead]:
+    units = service.list_org_units(claims["tenant_id"], page=page)
+    set_page_headers(response, page)
     return [OrgUnitRead.model_validate(item) for item in units]
 
 
@@ -517,9 +554,16 @@ def unbind_user_org_unit(user_id: str, org_unit_id: str, claims: Claims, service
     response_model=list[UserOrgMembershipLinkRead],
     dependencies=[Depends(require_perm(PERM_IDENTITY_READ))],
 )
-def list_user_org_units(user_id: str, claims: Claims, service: Service) -> list[UserOrgMembershipLinkRead]:
+def list_user_org_units(
+    user_id: str,
+    claims: Claims,
+    service: Service,
+    response: Response,
+    page: Page,
+) -> list[UserOrgMembershipLinkRead]:
     try:
-        links = service.list_user_org_units(claims["tenant_id"], user_id)
+        links = service.list_user_org_units(claims["tenant_id"], user_id, page=page)
+        set_page_headers(response, page)
         return [UserOrgMembershipLinkRead.model_validate(item) for item in links]
     except (NotFoundError, ConflictError, AuthError) as exc:
         _handle_identity_error(exc)
@@ -773,8 +817,9 @@ def create_permission(payload: PermissionCreate, service: Service) -> Permission
     response_model=list[PermissionRead],
     dependencies=[Depends(require_perm(PERM_IDENTITY_READ))],
 )
-def list_permissions(service: Service) -> list[PermissionRead]:
-    permissions = service.list_permissions()
+def list_permissions(service: Service, response: Response, page: Page) -> list[PermissionRead]:
+    permissions = service.list_permissions(page=page)
+    set_page_headers(response, page)
     return [PermissionRead.model_validate(item) for item in permissions]
 
 
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, require_perm, set_page_headers
 from app.domain.models import (
     IncidentCreate,
     IncidentCreateTaskRead,
@@ -49,8 +49,9 @@ def create_incident(payload: IncidentCreate, claims: Claims, service: Service) -
     response_model=list[IncidentRead],
     dependencies=[Depends(require_perm(PERM_INCIDENT_READ))],
 )
-def list_incidents(claims: Claims, service: Service) -> list[IncidentRead]:
-    rows = service.list_incidents(claims["tenant_id"], viewer_user_id=claims["sub"])
+def list_incidents(claims: Claims, service: Service, response: Response, page: Page) -> list[IncidentRead]:
+    rows = service.list_incidents(claims["tenant_id"], viewer_user_id=claims["sub"], page=page)
+    set_page_headers(response, page)
     return [IncidentRead.model_validate(item) for item in rows]
 
 
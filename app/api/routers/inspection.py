@@ -3,10 +3,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import FileResponse
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, require_perm, set_page_headers
 from app.domain.models import (
     InspectionExportRead,
     InspectionObservationCreate,
@@ -46,8 +46,14 @@ def _handle_inspection_error(exc: Exception) -> None:
     response_model=list[InspectionTemplateRead],
     dependencies=[Depends(require_perm(PERM_INSPECTION_READ))],
 )
-def list_templates(claims: Claims, service: Service) -> list[InspectionTemplateRead]:
-    rows = service.list_templates(claims["tenant_id"])
+def list_templates(
+    claims: Claims,
+    service: Service,
+    response: Response,
+    page: Page,
+) -> list[InspectionTemplateRead]:
+    rows = service.list_templates(claims["tenant_id"], page=page)
+    set_page_headers(response, page)
     return [InspectionTemplateRead.model_validate(item) for item in rows]
 
 
@@ -101,9 +107,16 @@ def create_template_item(
     response_model=list[InspectionTemplateItemRead],
     dependencies=[Depends(require_perm(PERM_INSPECTION_READ))],
 )
-def list_template_items(template_id: str, claims: Claims, service: Service) -> list[InspectionTemplateItemRead]:
+def list_template_items(
+    template_id: str,
+    claims: Claims,
+    service: Service,
+    response: Response,
+    page: Page,
+) -> list[InspectionTemplateItemRead]:
     try:
-        rows = service.list_template_items(claims["tenant_id"], template_id)
+        rows = service.list_template_items(claims["tenant_id"], template_id, page=page)
+        set_page_headers(response, page)
         return [InspectionTemplateItemRead.model_validate(item) for item in rows]
     except (NotFoundError, ConflictError) as exc:
         _handle_inspection_error(exc)
@@ -133,9 +146,12 @@ def create_task(payload: InspectionTaskCreate, claims: Claims, service: Service)
 def list_tasks(
     claims: Claims,
     service: Service,
+    response: Response,
+    page: Page,
     task_status: Annotated[InspectionTaskStatus | None, Query(alias="status")] = None,
 ) -> list[InspectionTaskRead]:
-    rows = service.list_tasks(claims["tenant_id"], task_status, viewer_user_id=claims["sub"])
+    rows = service.list_tasks(claims["tenant_id"], task_status, viewer_user_id=claims["sub"], page=page)
+    set_page_headers(response, page)
     return [InspectionTaskRead.model_validate(item) for item in rows]
 
 
@@ -178,9 +194,16 @@ def create_observation(
     response_model=list[InspectionObservationRead],
     dependencies=[Depends(require_perm(PERM_INSPECTION_READ))],
 )
-def list_observations(task_id: str, claims: Claims, service: Service) -> list[InspectionObservationRead]:
+def list_observations(
+    task_id: str,
+    claims: Claims,
+    service: Service,
+    response: Response,
+    page: Page,
+) -> list[InspectionObservationRead]:
     try:
-        rows = service.list_observations(claims["tenant_id"], task_id, viewer_user_id=claims["sub"])
+        rows = service.list_observations(claims["tenant_id"], task_id, viewer_user_id=claims["sub"], page=page)
+        set_page_headers(response, page)
         return [InspectionObservationRead.model_validate(item) for item in rows]
     except (NotFoundError, ConflictError) as exc:
         _handle_inspection_error(exc)
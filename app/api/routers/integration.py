@@ -4,7 +4,7 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, paginate_response, require_perm
 from app.domain.models import (
     DeviceIntegrationSessionRead,
     DeviceIntegrationStartRequest,
@@ -109,8 +109,19 @@ async def stop_device_session(
     response_model=list[DeviceIntegrationSessionRead],
     dependencies=[Depends(require_perm(PERM_REGISTRY_READ))],
 )
-def list_device_sessions(claims: Claims, service: Service) -> list[DeviceIntegrationSessionRead]:
-    return service.list_device_sessions(claims["tenant_id"])
+def list_device_sessions(
+    claims: Claims,
+    service: Service,
+    response: Response,
+    page: Page,
+) -> list[DeviceIntegrationSessionRead]:
+    return paginate_response(
+        response,
+        page,
+        service.list_device_sessions(claims["tenant_id"]),
+        sort_attr="started_at",
+        id_attr="session_id",
+    )
 
 
 @router.get(
@@ -168,8 +179,18 @@ def create_video_stream(
     response_model=list[VideoStreamRead],
     dependencies=[Depends(require_perm(PERM_DASHBOARD_READ))],
 )
-def list_video_streams(claims: Claims, service: Service) -> list[VideoStreamRead]:
-    return service.list_video_streams(claims["tenant_id"])
+def list_video_streams(
+    claims: Claims,
+    service: Service,
+    response: Response,
+    page: Page,
+) -> list[VideoStreamRead]:
+    return paginate_response(
+        response,
+        page,
+        service.list_video_streams(claims["tenant_id"]),
+        id_attr="stream_id",
+    )
 
 
 @router.get(
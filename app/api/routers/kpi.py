@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import math
 from datetime import datetime
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, require_perm, set_page_headers
+from app.domain.geo import BoundingBox
 from app.domain.models import (
+    KpiFlightRollupBackfillRead,
+    KpiFlightRollupBackfillRequest,
     KpiGovernanceExportRead,
     KpiGovernanceExportRequest,
     KpiHeatmapBinRead,
+    KpiHeatmapGridRebuildRead,
     KpiHeatmapSource,
     KpiSnapshotRead,
     KpiSnapshotRecomputeRequest,
@@ -36,6 +41,39 @@ def _handle_kpi_error(exc: Exception) -> None:
     raise exc
 
 
+def _parse_bbox(raw: str | None) -> BoundingBox | None:
+    if raw is None or not raw.strip():
+        return None
+    try:
+        min_lon, min_lat, max_lon, max_lat = (float(item) for item in raw.split(","))
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="bbox must be min_lon,min_lat,max_lon,max_lat",
+        ) from exc
+    if not all(math.isfinite(item) for item in (min_lon, min_lat, max_lon, max_lat)):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="bbox coordinates must be finite numbers",
+        )
+    if not (-180.0 <= min_lon <= 180.0 and -180.0 <= max_lon <= 180.0):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="bbox longitudes must be within [-180, 180]",
+        )
+    if not (-90.0 <= min_lat <= 90.0 and -90.0 <= max_lat <= 90.0):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="bbox latitudes must be within [-90, 90]",
+        )
+    if min_lon > max_lon or min_lat > max_lat:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="bbox minimums must not exceed maximums",
+        )
+    return BoundingBox(min_lat=min_lat, min_lon=min_lon, max_lat=max_lat, max_lon=max_lon)
+
+
 @router.post(
     "/snapshots/recompute",
     response_model=KpiSnapshotRead,
@@ -55,6 +93,32 @@ def recompute_snapshot(
         raise
 
 
+@router.post(
+    "/flight-rollups:backfill",
+    response_model=KpiFlightRollupBackfillRead,
+    dependencies=[Depends(require_perm(PERM_REPORTING_WRITE))],
+)
+def backfill_flight_rollups(
+    payload: KpiFlightRollupBackfillRequest,
+    claims: Claims,
+    service: Service,
+) -> KpiFlightRollupBackfillRead:
+    try:
+        return service.backfill_flight_rollups(claims["tenant_id"], payload)
+    except (NotFoundError, ConflictError) as exc:
+        _handle_kpi_error(exc)
+        raise
+
+
+@router.post(
+    "/heatmap-grid:rebuild",
+    response_model=KpiHeatmapGridRebuildRead,
+    dependencies=[Depends(require_perm(PERM_REPORTING_WRITE))],
+)
+def rebuild_heatmap_grid(claims: Claims, service: Service) -> KpiHeatmapGridRebuildRead:
+    return service.rebuild_heatmap_grid(claims["tenant_id"])
+
+
 @router.get(
     "/snapshots",
     response_model=list[KpiSnapshotRead],
@@ -65,8 +129,12 @@ def list_snapshots(
     service: Service,
     from_ts: datetime | None = None,
     to_ts: datetime | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[KpiSnapshotRead]:
-    rows = service.list_snapshots(claims["tenant_id"], from_ts=from_ts, to_ts=to_ts)
+    rows = service.list_snapshots(claims["tenant_id"], from_ts=from_ts, to_ts=to_ts, page=page)
+    set_page_headers(response, page)
     return [KpiSnapshotRead.model_validate(item) for item in rows]
 
 
@@ -94,9 +162,22 @@ def list_heatmap(
     service: Service,
     snapshot_id: str | None = None,
     source: KpiHeatmapSource | None = None,
+    zoom: int | None = Query(default=None, ge=0, le=22),
+    bbox: str | None = Query(default=None, description="min_lon,min_lat,max_lon,max_lat"),
+    *,
+    response: Response,
+    page: Page,
 ) -> list[KpiHeatmapBinRead]:
     try:
-        rows = service.list_heatmap_bins(claims["tenant_id"], snapshot_id=snapshot_id, source=source)
+        rows = service.list_heatmap_bins(
+            claims["tenant_id"],
+            snapshot_id=snapshot_id,
+            source=source,
+            zoom=zoom,
+            bbox=_parse_bbox(bbox),
+            page=page,
+        )
+        set_page_headers(response, page)
         return [KpiHeatmapBinRead.model_validate(item) for item in rows]
     except (NotFoundError, ConflictError) as exc:
         _handle_kpi_error(exc)
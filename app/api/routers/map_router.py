@@ -5,7 +5,7 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import ReadUoW, get_current_claims, require_perm
 from app.domain.models import MapLayerRead, MapOverviewRead, MapTrackReplayRead
 from app.domain.permissions import PERM_DASHBOARD_READ
 from app.services.map_service import MapService, NotFoundError
@@ -13,8 +13,8 @@ from app.services.map_service import MapService, NotFoundError
 router = APIRouter()
 
 
-def get_map_service() -> MapService:
-    return MapService()
+def get_map_service(uow: ReadUoW) -> MapService:
+    return MapService(uow=uow)
 
 
 Claims = Annotated[dict[str, Any], Depends(get_current_claims)]
@@ -4,7 +4,7 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, require_perm, set_page_headers
 from app.domain.models import (
     ApprovalRead,
     MissionApprovalRequest,
@@ -77,8 +77,9 @@ def create_mission(payload: MissionCreate, claims: Claims, service: Service) ->
     response_model=list[MissionRead],
     dependencies=[Depends(require_perm(PERM_MISSION_READ))],
 )
-def list_missions(claims: Claims, service: Service) -> list[MissionRead]:
-    missions = service.list_missions(claims["tenant_id"], viewer_user_id=claims["sub"])
+def list_missions(claims: Claims, service: Service, response: Response, page: Page) -> list[MissionRead]:
+    missions = service.list_missions(claims["tenant_id"], viewer_user_id=claims["sub"], page=page)
+    set_page_headers(response, page)
     return [MissionRead.model_validate(item) for item in missions]
 
 
@@ -165,9 +166,16 @@ def approve_mission(
     response_model=list[ApprovalRead],
     dependencies=[Depends(require_perm(PERM_MISSION_READ))],
 )
-def list_mission_approvals(mission_id: str, claims: Claims, service: Service) -> list[ApprovalRead]:
+def list_mission_approvals(
+    mission_id: str,
+    claims: Claims,
+    service: Service,
+    response: Response,
+    page: Page,
+) -> list[ApprovalRead]:
     try:
-        approvals = service.list_approvals(claims["tenant_id"], mission_id, viewer_user_id=claims["sub"])
+        approvals = service.list_approvals(claims["tenant_id"], mission_id, viewer_user_id=claims["sub"], page=page)
+        set_page_headers(response, page)
         return [ApprovalRead.model_validate(item) for item in approvals]
     except (NotFoundError, ConflictError, PermissionDeniedError, ComplianceViolationError) as exc:
         _handle_mission_error(exc)
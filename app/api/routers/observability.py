@@ -3,9 +3,16 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-
-from app.api.deps import get_current_claims, require_perm
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+
+from app.api.deps import (
+    Page,
+    build_page_request,
+    get_current_claims,
+    require_perm,
+    require_platform_super_admin,
+    set_page_headers,
+)
 from app.domain.models import (
     CapacityForecastRead,
     CapacityForecastRequest,
@@ -13,6 +20,7 @@ from app.domain.models import (
     CapacityPolicyUpsertRequest,
     ObservabilityAlertEventRead,
     ObservabilityAlertStatus,
+    ObservabilityDatabaseRead,
     ObservabilityOverviewRead,
     ObservabilitySignalIngestRead,
     ObservabilitySignalIngestRequest,
@@ -102,7 +110,12 @@ def list_signals(
     from_ts: datetime | None = None,
     to_ts: datetime | None = None,
     limit: int = Query(default=100, ge=1, le=1000),
+    cursor: str | None = Query(default=None, max_length=512),
+    include_total: bool = False,
+    *,
+    response: Response,
 ) -> list[ObservabilitySignalRead]:
+    page = build_page_request(limit, cursor, include_total, max_limit=1000)
     rows = service.list_signals(
         claims["tenant_id"],
         signal_type=signal_type,
@@ -113,7 +126,9 @@ def list_signals(
         from_ts=from_ts,
         to_ts=to_ts,
         limit=limit,
+        page=page,
     )
+    set_page_headers(response, page)
     return [ObservabilitySignalRead.model_validate(item) for item in rows]
 
 
@@ -130,6 +145,15 @@ def get_overview(
     return service.get_overview(claims["tenant_id"], window_minutes=window_minutes)
 
 
+@router.get(
+    "/database",
+    response_model=ObservabilityDatabaseRead,
+    dependencies=[Depends(require_platform_super_admin)],
+)
+def get_database_stats(service: Service) -> ObservabilityDatabaseRead:
+    return service.get_database_stats()
+
+
 @router.post(
     "/slo/policies",
     response_model=ObservabilitySloPolicyRead,
@@ -165,8 +189,12 @@ def list_slo_policies(
     claims: Claims,
     service: Service,
     is_active: bool | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[ObservabilitySloPolicyRead]:
-    rows = service.list_slo_policies(claims["tenant_id"], is_active=is_active)
+    rows = service.list_slo_policies(claims["tenant_id"], is_active=is_active, page=page)
+    set_page_headers(response, page)
     return [ObservabilitySloPolicyRead.model_validate(item) for item in rows]
 
 
@@ -416,8 +444,11 @@ def upsert_capacity_policy(
 def list_capacity_policies(
     claims: Claims,
     service: Service,
+    response: Response,
+    page: Page,
 ) -> list[CapacityPolicyRead]:
-    rows = service.list_capacity_policies(claims["tenant_id"])
+    rows = service.list_capacity_policies(claims["tenant_id"], page=page)
+    set_page_headers(response, page)
     return [CapacityPolicyRead.model_validate(item) for item in rows]
 
 
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, require_perm, set_page_headers
 from app.domain.models import (
     OpenAdapterIngressRead,
     OpenAdapterIngressRequest,
@@ -17,6 +17,7 @@ from app.domain.models import (
 )
 from app.domain.permissions import PERM_REPORTING_READ, PERM_REPORTING_WRITE
 from app.infra.audit import set_audit_context
+from app.infra.db import run_db
 from app.services.open_platform_service import (
     ConflictError,
     NotFoundError,
@@ -76,8 +77,14 @@ def create_credential(
     response_model=list[OpenPlatformCredentialRead],
     dependencies=[Depends(require_perm(PERM_REPORTING_READ))],
 )
-def list_credentials(claims: Claims, service: Service) -> list[OpenPlatformCredentialRead]:
-    rows = service.list_credentials(claims["tenant_id"])
+def list_credentials(
+    claims: Claims,
+    service: Service,
+    response: Response,
+    page: Page,
+) -> list[OpenPlatformCredentialRead]:
+    rows = service.list_credentials(claims["tenant_id"], page=page)
+    set_page_headers(response, page)
     return [OpenPlatformCredentialRead.model_validate(item) for item in rows]
 
 
@@ -116,8 +123,12 @@ def list_webhooks(
     claims: Claims,
     service: Service,
     event_type: str | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[OpenWebhookEndpointRead]:
-    rows = service.list_webhooks(claims["tenant_id"], event_type=event_type)
+    rows = service.list_webhooks(claims["tenant_id"], event_type=event_type, page=page)
+    set_page_headers(response, page)
     return [OpenWebhookEndpointRead.model_validate(item) for item in rows]
 
 
@@ -168,7 +179,8 @@ async def ingest_adapter_event(
 ) -> OpenAdapterIngressRead:
     raw_body = await request.body()
     try:
-        row = service.ingest_adapter_event(
+        row = await run_db(
+            service.ingest_adapter_event,
             key_id=x_open_key_id,
             api_key=x_open_api_key,
             signature=x_open_signature,
@@ -192,6 +204,12 @@ async def ingest_adapter_event(
     response_model=list[OpenAdapterIngressRead],
     dependencies=[Depends(require_perm(PERM_REPORTING_READ))],
 )
-def list_adapter_events(claims: Claims, service: Service) -> list[OpenAdapterIngressRead]:
-    rows = service.list_adapter_events(claims["tenant_id"])
+def list_adapter_events(
+    claims: Claims,
+    service: Service,
+    response: Response,
+    page: Page,
+) -> list[OpenAdapterIngressRead]:
+    rows = service.list_adapter_events(claims["tenant_id"], page=page)
+    set_page_headers(response, page)
     return [OpenAdapterIngressRead.model_validate(item) for item in rows]
@@ -3,10 +3,10 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
 from fastapi.responses import FileResponse
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, require_perm, set_page_headers
 from app.domain.models import (
     OutcomeCatalogCreate,
     OutcomeCatalogRead,
@@ -24,6 +24,7 @@ from app.domain.models import (
     RawUploadInitRequest,
 )
 from app.domain.permissions import PERM_INSPECTION_READ, PERM_INSPECTION_WRITE
+from app.infra.db import run_db
 from app.services.outcome_service import ConflictError, NotFoundError, OutcomeService
 
 router = APIRouter()
@@ -92,7 +93,8 @@ async def upload_raw_content(
 ) -> dict[str, Any]:
     try:
         content = await request.body()
-        return service.write_raw_upload_content(
+        return await run_db(
+            service.write_raw_upload_content,
             claims["tenant_id"],
             session_id,
             upload_token,
@@ -141,6 +143,9 @@ def list_raw_data(
     data_type: RawDataType | None = None,
     from_ts: datetime | None = None,
     to_ts: datetime | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[RawDataCatalogRead]:
     rows = service.list_raw_records(
         claims["tenant_id"],
@@ -150,7 +155,9 @@ def list_raw_data(
         from_ts=from_ts,
         to_ts=to_ts,
         viewer_user_id=claims["sub"],
+        page=page,
     )
+    set_page_headers(response, page)
     return [RawDataCatalogRead.model_validate(item) for item in rows]
 
 
@@ -248,6 +255,9 @@ def list_outcome_records(
     outcome_status: OutcomeStatus | None = None,
     from_ts: datetime | None = None,
     to_ts: datetime | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[OutcomeCatalogRead]:
     rows = service.list_outcome_records(
         claims["tenant_id"],
@@ -259,7 +269,9 @@ def list_outcome_records(
         from_ts=from_ts,
         to_ts=to_ts,
         viewer_user_id=claims["sub"],
+        page=page,
     )
+    set_page_headers(response, page)
     return [OutcomeCatalogRead.model_validate(item) for item in rows]
 
 
@@ -272,13 +284,17 @@ def list_outcome_versions(
     outcome_id: str,
     claims: Claims,
     service: Service,
+    response: Response,
+    page: Page,
 ) -> list[OutcomeCatalogVersionRead]:
     try:
         rows = service.list_outcome_versions(
             claims["tenant_id"],
             outcome_id,
             viewer_user_id=claims["sub"],
+            page=page,
         )
+        set_page_headers(response, page)
         return [OutcomeCatalogVersionRead.model_validate(item) for item in rows]
     except (NotFoundError, ConflictError) as exc:
         _handle_outcome_error(exc)
@@ -4,7 +4,7 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, require_perm, set_page_headers
 from app.domain.models import DroneCreate, DroneRead, DroneUpdate
 from app.domain.permissions import PERM_REGISTRY_READ, PERM_REGISTRY_WRITE
 from app.services.registry_service import ConflictError, NotFoundError, RegistryService
@@ -48,8 +48,9 @@ def create_drone(payload: DroneCreate, claims: Claims, service: Service) -> Dron
     response_model=list[DroneRead],
     dependencies=[Depends(require_perm(PERM_REGISTRY_READ))],
 )
-def list_drones(claims: Claims, service: Service) -> list[DroneRead]:
-    drones = service.list_drones(claims["tenant_id"], viewer_user_id=claims["sub"])
+def list_drones(claims: Claims, service: Service, response: Response, page: Page) -> list[DroneRead]:
+    drones = service.list_drones(claims["tenant_id"], viewer_user_id=claims["sub"], page=page)
+    set_page_headers(response, page)
     return [DroneRead.model_validate(item) for item in drones]
 
 
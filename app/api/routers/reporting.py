@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Request, Response
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, require_perm, set_page_headers
 from app.domain.models import (
     DeviceUtilizationRead,
     OutcomeReportExportCreateRequest,
@@ -119,8 +119,11 @@ def create_outcome_report_template(
 def list_outcome_report_templates(
     claims: Claims,
     service: Service,
+    response: Response,
+    page: Page,
 ) -> list[OutcomeReportTemplateRead]:
-    rows = service.list_outcome_report_templates(claims["tenant_id"])
+    rows = service.list_outcome_report_templates(claims["tenant_id"], page=page)
+    set_page_headers(response, page)
     return [OutcomeReportTemplateRead.model_validate(item) for item in rows]
 
 
@@ -147,6 +150,7 @@ def create_outcome_report_export(
                 "from_ts": payload.from_ts.isoformat() if payload.from_ts else None,
                 "to_ts": payload.to_ts.isoformat() if payload.to_ts else None,
                 "topic": payload.topic,
+                "background": payload.background,
             }
         },
     )
@@ -202,6 +206,54 @@ def get_outcome_report_export(
         raise
 
 
+@router.post(
+    "/outcome-report-exports/{export_id}:cancel",
+    response_model=OutcomeReportExportRead,
+    dependencies=[Depends(require_perm(PERM_REPORTING_WRITE))],
+)
+def cancel_outcome_report_export(
+    export_id: str,
+    claims: Claims,
+    service: Service,
+    request: Request,
+) -> OutcomeReportExportRead:
+    set_audit_context(
+        request,
+        action="reporting.outcome_report.export.cancel",
+        detail={"what": {"export_id": export_id}},
+    )
+    try:
+        row = service.cancel_outcome_report_export(claims["tenant_id"], export_id)
+        return OutcomeReportExportRead.model_validate(row)
+    except (NotFoundError, ConflictError) as exc:
+        _handle_reporting_error(exc)
+        raise
+
+
+@router.post(
+    "/outcome-report-exports/{export_id}:resume",
+    response_model=OutcomeReportExportRead,
+    dependencies=[Depends(require_perm(PERM_REPORTING_WRITE))],
+)
+def resume_outcome_report_export(
+    export_id: str,
+    claims: Claims,
+    service: Service,
+    request: Request,
+) -> OutcomeReportExportRead:
+    set_audit_context(
+        request,
+        action="reporting.outcome_report.export.resume",
+        detail={"what": {"export_id": export_id}},
+    )
+    try:
+        row = service.resume_outcome_report_export(claims["tenant_id"], export_id)
+        return OutcomeReportExportRead.model_validate(row)
+    except (NotFoundError, ConflictError) as exc:
+        _handle_reporting_error(exc)
+        raise
+
+
 @router.post(
     "/outcome-report-exports:retention",
     response_model=OutcomeReportRetentionRunRead,
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
-from app.api.deps import get_current_claims, require_perm
+from app.api.deps import Page, get_current_claims, paginate_response, require_perm, set_page_headers
 from app.domain.models import (
     TaskCenterAttachmentAddRequest,
     TaskCenterCandidateScoreRead,
@@ -98,8 +98,12 @@ def list_task_types(
     claims: Claims,
     service: Service,
     is_active: bool | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[TaskTypeCatalogRead]:
-    rows = service.list_task_types(claims["tenant_id"], is_active=is_active)
+    rows = service.list_task_types(claims["tenant_id"], is_active=is_active, page=page)
+    set_page_headers(response, page)
     return [TaskTypeCatalogRead.model_validate(item) for item in rows]
 
 
@@ -138,12 +142,17 @@ def list_templates(
     service: Service,
     task_type_id: str | None = None,
     is_active: bool | None = None,
+    *,
+    response: Response,
+    page: Page,
 ) -> list[TaskTemplateRead]:
     rows = service.list_templates(
         claims["tenant_id"],
         task_type_id=task_type_id,
         is_active=is_active,
+        page=page,
     )
+    set_page_headers(response, page)
     return [_template_read(item) for item in rows]
 
 
@@ -240,9 +249,12 @@ def create_tasks_batch(
 def list_tasks(
     claims: Claims,
     service: Service,
+    response: Response,
+    page: Page,
     state: Annotated[TaskCenterState | None, Query(alias="state")] = None,
 ) -> list[TaskCenterTaskRead]:
-    rows = service.list_tasks(claims["tenant_id"], state=state, viewer_user_id=claims["sub"])
+    rows = service.list_tasks(claims["tenant_id"], state=state, viewer_user_id=claims["sub"], page=page)
+    set_page_headers(response, page)
     return [TaskCenterTaskRead.model_validate(item) for item in rows]
 
 
@@ -524,6 +536,8 @@ def list_comments(
     request: Request,
     claims: Claims,
     service: Service,
+    response: Response,
+    page: Page,
 ) -> list[TaskCenterCommentRead]:
     set_audit_context(
         request,
@@ -532,7 +546,11 @@ def list_comments(
     )
     try:
         rows = service.list_comments(claims["tenant_id"], task_id, viewer_user_id=claims["sub"])
-        return [TaskCenterCommentRead.model_validate(item) for item in rows]
+        return paginate_response(
+            response,
+            page,
+            [TaskCenterCommentRead.model_validate(item) for item in rows],
+        )
     except (NotFoundError, ConflictError) as exc:
         _handle_error(exc)
         raise
@@ -548,6 +566,8 @@ def list_task_history(
     request: Request,
     claims: Claims,
     service: Service,
+    response: Response,
+    page: Page,
 ) -> list[TaskCenterTaskHistoryRead]:
     set_audit_context(
         request,
@@ -555,7 +575,8 @@ def list_task_history(
         detail={"what": {"task_id": task_id}},
     )
     try:
-        rows = service.list_history(claims["tenant_id"], task_id, viewer_user_id=claims["sub"])
+        rows = service.list_history(claims["tenant_id"], task_id, viewer_user_id=claims["sub"], page=page)
+        set_page_headers(response, page)
         return [TaskCenterTaskHistoryRead.model_validate(item) for item in rows]
     except (NotFoundError, ConflictError) as exc:
         _handle_error(exc)
@@ -8,6 +8,7 @@ from app.api.deps import get_current_claims, require_perm
 from app.domain.models import TelemetryNormalized
 from app.domain.permissions import PERM_TELEMETRY_READ, PERM_TELEMETRY_WRITE, has_permission
 from app.infra.auth import decode_access_token
+from app.infra.db import run_db
 from app.services.telemetry_service import NotFoundError, TelemetryService
 
 router = APIRouter()
@@ -72,7 +73,7 @@ async def ingest_telemetry(
     claims: Claims,
     service: Service,
 ) -> TelemetryNormalized:
-    normalized = service.ingest(claims["tenant_id"], payload)
+    normalized = await run_db(service.ingest, claims["tenant_id"], payload)
     await telemetry_ws_hub.broadcast(claims["tenant_id"], normalized.model_dump(mode="json"))
     return normalized
 
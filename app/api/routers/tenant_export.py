@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import FileResponse
@@ -9,7 +9,7 @@ from pydantic import BaseModel
 
 from app.api.deps import get_current_claims, require_perm
 from app.domain.permissions import PERM_WILDCARD
-from app.services.tenant_export_service import NotFoundError, TenantExportService
+from app.services.tenant_export_service import NotFoundError, TenantExportService, ValidationError
 
 router = APIRouter()
 
@@ -34,6 +34,9 @@ class TenantExportStatusResponse(BaseModel):
     tenant_id: str
     status: str
     export_version: str
+    format: str = "jsonl"
+    mode: str = "full"
+    base_export_id: str | None = None
     created_at: str
     tables: list[dict[str, Any]]
     global_tables_skipped: list[str]
@@ -56,14 +59,25 @@ def create_tenant_export(
     claims: Claims,
     service: Service,
     include_zip: Annotated[bool, Query()] = False,
+    export_format: Annotated[Literal["jsonl", "columnar"], Query(alias="format")] = "jsonl",
+    tables: Annotated[list[str] | None, Query()] = None,
+    since_export_id: Annotated[str | None, Query()] = None,
 ) -> TenantExportCreateResponse:
     _enforce_tenant_match(claims, tenant_id)
     try:
         return TenantExportCreateResponse.model_validate(
-            service.create_export(tenant_id, include_zip=include_zip)
+            service.create_export(
+                tenant_id,
+                include_zip=include_zip,
+                export_format=export_format,
+                tables=tables,
+                since_export_id=since_export_id,
+            )
         )
     except NotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except ValidationError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
 @router.get(
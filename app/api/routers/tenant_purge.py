@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.api.deps import get_current_claims, require_perm
 from app.domain.permissions import PERM_WILDCARD
@@ -45,6 +45,9 @@ class TenantPurgeExecuteRequest(BaseModel):
     confirm_token: str | None = None
     confirm_phrase: str | None = None
     mode: str = "hard"
+    batch_size: int | None = Field(default=None, ge=1)
+    max_rows_per_second: float | None = Field(default=None, ge=0)
+    workers: int | None = Field(default=None, ge=1, le=32)
 
 
 class TenantPurgeExecuteResponse(BaseModel):
@@ -64,15 +67,21 @@ class TenantPurgeStatusResponse(BaseModel):
     status: str
     purge_version: str
     executed_at: str
+    completed_at: str | None = None
+    updated_at: str | None = None
     mode: str
     confirm_method: str
     plan: list[str]
+    settings: dict[str, Any] = Field(default_factory=dict)
     dry_run_counts: dict[str, int]
-    pre_delete_counts: dict[str, int]
+    pre_delete_counts: dict[str, int] | None = None
     deleted_counts: dict[str, int]
     post_delete_counts: dict[str, int]
     deleted_rows: int
     dry_run_drift_detected: bool
+    progress: dict[str, Any] = Field(default_factory=dict)
+    checkpoint: dict[str, dict[str, Any]] = Field(default_factory=dict)
+    error: str | None = None
 
 
 def _enforce_tenant_match(claims: dict[str, Any], tenant_id: str) -> None:
@@ -117,6 +126,9 @@ def execute_tenant_purge(
             confirm_token=payload.confirm_token,
             confirm_phrase=payload.confirm_phrase,
             mode=payload.mode,
+            batch_size=payload.batch_size,
+            max_rows_per_second=payload.max_rows_per_second,
+            workers=payload.workers,
         )
         return TenantPurgeExecuteResponse.model_validate(result)
     except NotFoundError as exc:
@@ -127,6 +139,28 @@ def execute_tenant_purge(
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
 
 
+@router.post(
+    "/tenants/{tenant_id}/purge/{purge_id}:resume",
+    response_model=TenantPurgeExecuteResponse,
+    dependencies=[Depends(require_perm(PERM_WILDCARD))],
+)
+def resume_tenant_purge(
+    tenant_id: str,
+    purge_id: str,
+    claims: Claims,
+    service: Service,
+) -> TenantPurgeExecuteResponse:
+    _enforce_tenant_match(claims, tenant_id)
+    try:
+        return TenantPurgeExecuteResponse.model_validate(service.resume_purge(tenant_id, purge_id))
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except ValidationError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except ConflictError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+
+
 @router.get(
     "/tenants/{tenant_id}/purge/{purge_id}",
     response_model=TenantPurgeStatusResponse,
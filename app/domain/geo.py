@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import math
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional accelerator
+    np = None
+
+EARTH_RADIUS_KM = 6371.0
+# Below this many points the pure-Python loop beats the cost of building arrays.
+GEO_VECTORIZE_MIN_POINTS = int(os.getenv("GEO_VECTORIZE_MIN_POINTS", "64"))
+
+Polygon = Sequence[tuple[float, float]]
+
+
+def vectorized_available() -> bool:
+    return np is not None
+
+
+def _use_numpy(count: int, vectorized: bool | None) -> bool:
+    if np is None or vectorized is False:
+        return False
+    return vectorized is True or count >= GEO_VECTORIZE_MIN_POINTS
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    d_lat = math.radians(lat2 - lat1)
+    d_lon = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_lat / 2) ** 2
+        + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(d_lon / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def _segment_distances_numpy(lats: Sequence[float], lons: Sequence[float]) -> list[float]:
+    assert np is not None
+    lat = np.radians(np.asarray(lats, dtype=np.float64))
+    lon = np.radians(np.asarray(lons, dtype=np.float64))
+    d_lat = np.diff(lat)
+    d_lon = np.diff(lon)
+    a = np.sin(d_lat / 2) ** 2 + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(d_lon / 2) ** 2
+    distances: Any = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+    return [float(value) for value in distances.tolist()]
+
+
+def segment_distances_km(
+    lats: Sequence[float],
+    lons: Sequence[float],
+    *,
+    vectorized: bool | None = None,
+) -> list[float]:
+    """Great-circle length of each leg between consecutive points.
+
+    `vectorized` forces (True) or disables (False) the numpy path; by default numpy is
+    used for tracks of at least `GEO_VECTORIZE_MIN_POINTS` points when it is installed.
+    """
+    if len(lats) != len(lons):
+        raise ValueError("lats and lons must have the same length")
+    if len(lats) < 2:
+        return []
+    if _use_numpy(len(lats), vectorized):
+        return _segment_distances_numpy(lats, lons)
+    return [
+        haversine_km(lats[idx - 1], lons[idx - 1], lats[idx], lons[idx]) for idx in range(1, len(lats))
+    ]
+
+
+def track_length_km(
+    lats: Sequence[float],
+    lons: Sequence[float],
+    *,
+    vectorized: bool | None = None,
+) -> float:
+    return math.fsum(segment_distances_km(lats, lons, vectorized=vectorized))
+
+
+def cumulative_distance_km(
+    lats: Sequence[float],
+    lons: Sequence[float],
+    *,
+    vectorized: bool | None = None,
+) -> list[float]:
+    """Distance flown up to each point; the first point is always 0."""
+    if not lats:
+        return []
+    totals = [0.0]
+    for leg in segment_distances_km(lats, lons, vectorized=vectorized):
+        totals.append(totals[-1] + leg)
+    return totals
+
+
+def segment_speeds_mps(
+    timestamps: Sequence[datetime],
+    lats: Sequence[float],
+    lons: Sequence[float],
+    *,
+    vectorized: bool | None = None,
+) -> list[float]:
+    """Ground speed of each leg; legs without elapsed time report 0."""
+    if len(timestamps) != len(lats):
+        raise ValueError("timestamps and coordinates must have the same length")
+    legs = segment_distances_km(lats, lons, vectorized=vectorized)
+    speeds: list[float] = []
+    for idx, leg_km in enumerate(legs):
+        seconds = (timestamps[idx + 1] - timestamps[idx]).total_seconds()
+        speeds.append(leg_km * 1000 / seconds if seconds > 0 else 0.0)
+    return speeds
+
+
+@dataclass(frozen=True)
+class Dwell:
+    start_index: int
+    end_index: int
+    start_ts: datetime
+    end_ts: datetime
+    lat: float
+    lon: float
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.end_ts - self.start_ts).total_seconds()
+
+
+def detect_dwells(
+    timestamps: Sequence[datetime],
+    lats: Sequence[float],
+    lons: Sequence[float],
+    *,
+    radius_m: float,
+    min_duration_seconds: float,
+) -> list[Dwell]:
+    """Stretches of consecutive points that stay within `radius_m` of where they started.
+
+    A dwell is reported at its anchor point when it lasts at least `min_duration_seconds`.
+    Points are expected in time order.
+    """
+    if len(timestamps) != len(lats) or len(lats) != len(lons):
+        raise ValueError("timestamps and coordinates must have the same length")
+    radius_km = radius_m / 1000
+    dwells: list[Dwell] = []
+    start = 0
+    count = len(lats)
+    while start < count:
+        end = start
+        while end + 1 < count:
+            if haversine_km(lats[start], lons[start], lats[end + 1], lons[end + 1]) > radius_km:
+                break
+            end += 1
+        if end > start and (timestamps[end] - timestamps[start]).total_seconds() >= min_duration_seconds:
+            dwells.append(
+                Dwell(
+                    start_index=start,
+                    end_index=end,
+                    start_ts=timestamps[start],
+                    end_ts=timestamps[end],
+                    lat=lats[start],
+                    lon=lons[start],
+                )
+            )
+        start = end + 1
+    return dwells
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    min_lat: float
+    min_lon: float
+    max_lat: float
+    max_lon: float
+
+    def contains(self, lat: float, lon: float) -> bool:
+        return self.min_lat <= lat <= self.max_lat and self.min_lon <= lon <= self.max_lon
+
+
+def bounding_box(lats: Sequence[float], lons: Sequence[float]) -> BoundingBox | None:
+    if len(lats) != len(lons):
+        raise ValueError("lats and lons must have the same length")
+    if not lats:
+        return None
+    return BoundingBox(min_lat=min(lats), min_lon=min(lons), max_lat=max(lats), max_lon=max(lons))
+
+
+def polygon_bounding_box(polygon: Polygon) -> BoundingBox | None:
+    return bounding_box([lat for _lon, lat in polygon], [lon for lon, _lat in polygon])
+
+
+def point_in_polygon(lon: float, lat: float, polygon: Polygon) -> bool:
+    """Ray-casting test; `polygon` holds (lon, lat) vertices as parsed from WKT."""
+    inside = False
+    j = len(polygon) - 1
+    for i in range(len(polygon)):
+        xi, yi = polygon[i]
+        xj, yj = polygon[j]
+        intersects = ((yi > lat) != (yj > lat)) and (
+            lon < (xj - xi) * (lat - yi) / ((yj - yi) or 1e-12) + xi
+        )
+        if intersects:
+            inside = not inside
+        j = i
+    return inside
+
+
+@dataclass(frozen=True)
+class PreparedPolygon:
+    """Polygon with its bounding box, for testing many points against the same zone."""
+
+    vertices: tuple[tuple[float, float], ...]
+    bbox: BoundingBox | None
+
+    @classmethod
+    def from_vertices(cls, polygon: Polygon) -> PreparedPolygon:
+        vertices = tuple(polygon)
+        return cls(vertices=vertices, bbox=polygon_bounding_box(vertices))
+
+    def contains(self, lon: float, lat: float) -> bool:
+        if self.bbox is None or not self.bbox.contains(lat, lon):
+            return False
+        return point_in_polygon(lon, lat, self.vertices)
+
+
+def sample_indices(count: int, *, step: int, limit: int) -> range:
+    """Indices kept when taking every `step`-th point and then the last `limit` of those."""
+    step = max(step, 1)
+    kept = range(0, count, step)
+    if limit >= 0 and len(kept) > limit:
+        kept = kept[len(kept) - limit :]
+    return kept
+
+
+# Web Mercator tiles (the slippy-map / quadkey scheme); latitudes beyond this are clamped.
+MERCATOR_MAX_LAT = 85.05112878
+
+
+def tile_xy(lat: float, lon: float, zoom: int) -> tuple[int, int]:
+    scale = 1 << zoom
+    lat_rad = math.radians(max(min(lat, MERCATOR_MAX_LAT), -MERCATOR_MAX_LAT))
+    x = int((lon + 180.0) / 360.0 * scale)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * scale)
+    return min(max(x, 0), scale - 1), min(max(y, 0), scale - 1)
+
+
+def tile_bounds(tile_x: int, tile_y: int, zoom: int) -> BoundingBox:
+    scale = 1 << zoom
+
+    def _lat(y: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y / scale))))
+
+    return BoundingBox(
+        min_lat=_lat(tile_y + 1),
+        min_lon=tile_x / scale * 360.0 - 180.0,
+        max_lat=_lat(tile_y),
+        max_lon=(tile_x + 1) / scale * 360.0 - 180.0,
+    )
+
+
+def tile_quadkey(tile_x: int, tile_y: int, zoom: int) -> str:
+    digits: list[str] = []
+    for level in range(zoom, 0, -1):
+        mask = 1 << (level - 1)
+        digits.append(str((1 if tile_x & mask else 0) + (2 if tile_y & mask else 0)))
+    return "".join(digits)
+
+
+def tile_range(bbox: BoundingBox, zoom: int) -> tuple[int, int, int, int]:
+    """Inclusive (min_x, min_y, max_x, max_y) of the tiles covering `bbox`."""
+    min_x, min_y = tile_xy(bbox.max_lat, bbox.min_lon, zoom)
+    max_x, max_y = tile_xy(bbox.min_lat, bbox.max_lon, zoom)
+    return min_x, min_y, max_x, max_y
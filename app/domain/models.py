@@ -8,10 +8,14 @@ from uuid import uuid4
 from pydantic import BaseModel, ConfigDict
 from pydantic import Field as PydanticField
 from sqlalchemy import JSON, Column, ForeignKeyConstraint, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 
 from app.domain.state_machine import MissionState, TaskCenterState
 
+# Large JSON documents on hot tables; JSONB on Postgres so they can be GIN-indexed.
+JSON_DOCUMENT = JSON().with_variant(JSONB(), "postgresql")
+
 
 def now_utc() -> datetime:
     return datetime.now(UTC)
@@ -19,6 +23,7 @@ def now_utc() -> datetime:
 
 class EventRecord(SQLModel, table=True):
     __tablename__ = "events"
+    __table_args__ = (Index("ix_events_ts_event_id", "ts", "event_id"),)
 
     event_id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
     event_type: str = Field(index=True)
@@ -28,10 +33,20 @@ class EventRecord(SQLModel, table=True):
     correlation_id: str | None = Field(default=None, index=True)
     payload: dict[str, Any] = Field(
         default_factory=dict,
-        sa_column=Column(JSON, nullable=False),
+        sa_column=Column(JSON_DOCUMENT, nullable=False),
     )
 
 
+class EventConsumerOffset(SQLModel, table=True):
+    __tablename__ = "event_consumer_offsets"
+
+    group_name: str = Field(primary_key=True, max_length=100)
+    last_ts: datetime | None = Field(default=None)
+    last_event_id: str | None = Field(default=None)
+    delivered_count: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=now_utc, index=True)
+
+
 class AuditLog(SQLModel, table=True):
     __tablename__ = "audit_logs"
 
@@ -45,7 +60,7 @@ class AuditLog(SQLModel, table=True):
     ts: datetime = Field(default_factory=now_utc, index=True)
     detail: dict[str, Any] = Field(
         default_factory=dict,
-        sa_column=Column(JSON, nullable=False),
+        sa_column=Column(JSON_DOCUMENT, nullable=False),
     )
 
 
@@ -301,6 +316,7 @@ class Drone(SQLModel, table=True):
     __table_args__ = (
         UniqueConstraint("tenant_id", "name", name="uq_drones_tenant_name"),
         UniqueConstraint("tenant_id", "id", name="uq_drones_tenant_id_id"),
+        Index("ix_drones_tenant_created_at_id", "tenant_id", "created_at", "id"),
     )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
@@ -381,6 +397,7 @@ class Asset(SQLModel, table=True):
         Index("ix_assets_tenant_availability", "tenant_id", "availability_status"),
         Index("ix_assets_tenant_health", "tenant_id", "health_status"),
         Index("ix_assets_tenant_region", "tenant_id", "region_code"),
+        Index("ix_assets_tenant_created_at_id", "tenant_id", "created_at", "id"),
     )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
@@ -496,6 +513,7 @@ class Mission(SQLModel, table=True):
         Index("ix_missions_tenant_drone_id", "tenant_id", "drone_id"),
         Index("ix_missions_tenant_state", "tenant_id", "state"),
         Index("ix_missions_tenant_org_unit", "tenant_id", "org_unit_id"),
+        Index("ix_missions_tenant_created_at_id", "tenant_id", "created_at", "id"),
     )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
@@ -647,6 +665,7 @@ class TaskCenterTask(SQLModel, table=True):
         Index("ix_task_center_tasks_tenant_assigned", "tenant_id", "assigned_to"),
         Index("ix_task_center_tasks_tenant_org_unit", "tenant_id", "org_unit_id"),
         Index("ix_task_center_tasks_tenant_task_type", "tenant_id", "task_type_id"),
+        Index("ix_task_center_tasks_tenant_created_at_id", "tenant_id", "created_at", "id"),
     )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
@@ -1050,6 +1069,7 @@ class CommandRequestRecord(SQLModel, table=True):
         Index("ix_command_requests_tenant_drone_id", "tenant_id", "drone_id"),
         Index("ix_command_requests_tenant_compliance", "tenant_id", "compliance_passed"),
         Index("ix_command_requests_tenant_reason", "tenant_id", "compliance_reason_code"),
+        Index("ix_command_requests_tenant_issued_at_id", "tenant_id", "issued_at", "id"),
     )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
@@ -1177,12 +1197,15 @@ class OutcomeVersionChangeType(StrEnum):
 class ReportFileFormat(StrEnum):
     PDF = "PDF"
     WORD = "WORD"
+    CSV = "CSV"
 
 
 class ReportExportStatus(StrEnum):
+    QUEUED = "QUEUED"
     RUNNING = "RUNNING"
     SUCCEEDED = "SUCCEEDED"
     FAILED = "FAILED"
+    CANCELED = "CANCELED"
 
 
 class AiModelVersionStatus(StrEnum):
@@ -1355,6 +1378,8 @@ class AlertRecord(SQLModel, table=True):
     __table_args__ = (
         UniqueConstraint("tenant_id", "id", name="uq_alerts_tenant_id_id"),
         Index("ix_alerts_tenant_id_id", "tenant_id", "id"),
+        Index("ix_alerts_tenant_first_seen_at_id", "tenant_id", "first_seen_at", "id"),
+        Index("ix_alerts_tenant_position", "tenant_id", "position_lat", "position_lon"),
     )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
@@ -1368,8 +1393,10 @@ class AlertRecord(SQLModel, table=True):
     message: str
     detail: dict[str, Any] = Field(
         default_factory=dict,
-        sa_column=Column(JSON, nullable=False),
+        sa_column=Column(JSON_DOCUMENT, nullable=False),
     )
+    position_lat: float | None = None
+    position_lon: float | None = None
     first_seen_at: datetime = Field(default_factory=now_utc, index=True)
     last_seen_at: datetime = Field(default_factory=now_utc, index=True)
     acked_by: str | None = Field(default=None, index=True)
@@ -1588,6 +1615,7 @@ class RawDataCatalogRecord(SQLModel, table=True):
         Index("ix_raw_data_catalog_records_tenant_type", "tenant_id", "data_type"),
         Index("ix_raw_data_catalog_records_tenant_task", "tenant_id", "task_id"),
         Index("ix_raw_data_catalog_records_tenant_mission", "tenant_id", "mission_id"),
+        Index("ix_raw_data_catalog_records_tenant_captured_at_id", "tenant_id", "captured_at", "id"),
     )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
@@ -1672,6 +1700,7 @@ class OutcomeCatalogRecord(SQLModel, table=True):
         Index("ix_outcome_catalog_records_tenant_task", "tenant_id", "task_id"),
         Index("ix_outcome_catalog_records_tenant_mission", "tenant_id", "mission_id"),
         Index("ix_outcome_catalog_records_tenant_source", "tenant_id", "source_type", "source_id"),
+        Index("ix_outcome_catalog_records_tenant_created_at_id", "tenant_id", "created_at", "id"),
     )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
@@ -1688,7 +1717,7 @@ class OutcomeCatalogRecord(SQLModel, table=True):
     confidence: float | None = Field(default=None, ge=0, le=1)
     payload: dict[str, Any] = Field(
         default_factory=dict,
-        sa_column=Column(JSON, nullable=False),
+        sa_column=Column(JSON_DOCUMENT, nullable=False),
     )
     reviewed_by: str | None = Field(default=None, index=True)
     reviewed_at: datetime | None = Field(default=None, index=True)
@@ -1957,7 +1986,7 @@ class AiEvidenceRecord(SQLModel, table=True):
     content_hash: str = Field(max_length=200, index=True)
     payload: dict[str, Any] = Field(
         default_factory=dict,
-        sa_column=Column(JSON, nullable=False),
+        sa_column=Column(JSON_DOCUMENT, nullable=False),
     )
     created_at: datetime = Field(default_factory=now_utc, index=True)
 
@@ -2031,6 +2060,65 @@ class KpiHeatmapBinRecord(SQLModel, table=True):
     created_at: datetime = Field(default_factory=now_utc, index=True)
 
 
+class KpiHeatmapGridCell(SQLModel, table=True):
+    __tablename__ = "kpi_heatmap_grid_cells"
+    __table_args__ = (
+        UniqueConstraint(
+            "tenant_id",
+            "source",
+            "zoom",
+            "tile_x",
+            "tile_y",
+            "bucket_start",
+            name="uq_kpi_heatmap_grid_cells_cell",
+        ),
+        Index(
+            "ix_kpi_heatmap_grid_cells_tenant_zoom_bucket",
+            "tenant_id",
+            "zoom",
+            "bucket_start",
+        ),
+    )
+
+    id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
+    tenant_id: str = Field(foreign_key="tenants.id", index=True)
+    source: KpiHeatmapSource
+    zoom: int
+    tile_x: int
+    tile_y: int
+    bucket_start: datetime
+    count: int = Field(default=0, ge=0)
+    updated_at: datetime = Field(default_factory=now_utc)
+
+
+class KpiFlightRollupHourly(SQLModel, table=True):
+    __tablename__ = "kpi_flight_rollups_hourly"
+    __table_args__ = (
+        UniqueConstraint(
+            "tenant_id",
+            "drone_id",
+            "bucket_start",
+            name="uq_kpi_flight_rollups_hourly_bucket",
+        ),
+        Index("ix_kpi_flight_rollups_hourly_tenant_bucket", "tenant_id", "bucket_start"),
+    )
+
+    id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
+    tenant_id: str = Field(foreign_key="tenants.id", index=True)
+    drone_id: str = Field(index=True)
+    bucket_start: datetime = Field(index=True)
+    first_ts: datetime
+    last_ts: datetime
+    first_lat: float
+    first_lon: float
+    last_lat: float
+    last_lon: float
+    sample_count: int = Field(default=0, ge=0)
+    distance_km: float = Field(default=0.0, ge=0)
+    needs_rebuild: bool = Field(default=False, index=True)
+    updated_at: datetime = Field(default_factory=now_utc)
+
+
 class OpenPlatformCredential(SQLModel, table=True):
     __tablename__ = "open_platform_credentials"
     __table_args__ = (
@@ -2111,6 +2199,7 @@ class OpenAdapterIngressEvent(SQLModel, table=True):
         UniqueConstraint("tenant_id", "id", name="uq_open_adapter_ingress_events_tenant_id_id"),
         Index("ix_open_adapter_ingress_events_tenant_id_id", "tenant_id", "id"),
         Index("ix_open_adapter_ingress_events_tenant_key", "tenant_id", "key_id"),
+        Index("ix_open_adapter_ingress_events_tenant_created_at_id", "tenant_id", "created_at", "id"),
     )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
@@ -2378,6 +2467,7 @@ class ObservabilitySignal(SQLModel, table=True):
         Index("ix_observability_signals_tenant_type", "tenant_id", "signal_type"),
         Index("ix_observability_signals_tenant_service_ts", "tenant_id", "service_name", "created_at"),
         Index("ix_observability_signals_tenant_trace", "tenant_id", "trace_id"),
+        Index("ix_observability_signals_tenant_created_at_id", "tenant_id", "created_at", "id"),
     )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
@@ -2395,7 +2485,7 @@ class ObservabilitySignal(SQLModel, table=True):
     message: str | None = Field(default=None, max_length=500)
     detail: dict[str, Any] = Field(
         default_factory=dict,
-        sa_column=Column(JSON, nullable=False),
+        sa_column=Column(JSON_DOCUMENT, nullable=False),
     )
     created_by: str = Field(index=True)
     created_at: datetime = Field(default_factory=now_utc, index=True)
@@ -2769,6 +2859,15 @@ class UserRoleBatchBindRead(BaseModel):
     results: list[UserRoleBatchBindItemRead]
 
 
+class UserEffectivePermissionsRequest(BaseModel):
+    user_ids: list[str] = PydanticField(default_factory=list, max_length=500)
+
+
+class UserEffectivePermissionsRead(BaseModel):
+    user_id: str
+    permissions: list[str]
+
+
 class OrgUnitCreate(BaseModel):
     name: str
     code: str
@@ -3415,6 +3514,7 @@ class CommandDispatchRequest(BaseModel):
     params: dict[str, Any] = PydanticField(default_factory=dict)
     idempotency_key: str
     expect_ack: bool = True
+    wait_for_ack: bool = True
 
 
 class CommandRead(ORMReadModel):
@@ -3503,6 +3603,8 @@ class AlertRead(ORMReadModel):
     route_status: AlertRouteStatus
     message: str
     detail: dict[str, Any]
+    position_lat: float | None = None
+    position_lon: float | None = None
     first_seen_at: datetime
     last_seen_at: datetime
     acked_by: str | None
@@ -4210,6 +4312,24 @@ class BillingUsageIngestRead(BaseModel):
     deduplicated: bool
 
 
+class BillingUsageBatchIngestRequest(BaseModel):
+    events: list[BillingUsageIngestRequest] = PydanticField(default_factory=list, min_length=1, max_length=5000)
+
+
+class BillingUsageBatchItemRead(BaseModel):
+    event_id: str
+    meter_key: str
+    source_event_id: str
+    deduplicated: bool
+
+
+class BillingUsageBatchIngestRead(BaseModel):
+    total: int
+    accepted: int
+    deduplicated: int
+    results: list[BillingUsageBatchItemRead]
+
+
 class BillingUsageSummaryRead(BaseModel):
     meter_key: str
     total_quantity: int
@@ -4346,6 +4466,25 @@ class ObservabilityOverviewRead(BaseModel):
     computed_at: datetime = PydanticField(default_factory=now_utc)
 
 
+class ObservabilityDatabaseEngineRead(BaseModel):
+    role: str
+    pool_size: int | None
+    checked_out: int | None
+    overflow: int | None
+    checkouts: int
+    checkout_wait_avg_ms: float
+    checkout_wait_max_ms: float
+    queries: int
+    query_avg_ms: float
+    query_max_ms: float
+    slow_queries: int
+
+
+class ObservabilityDatabaseRead(BaseModel):
+    engines: list[ObservabilityDatabaseEngineRead]
+    computed_at: datetime = PydanticField(default_factory=now_utc)
+
+
 class ObservabilitySloPolicyCreate(BaseModel):
     policy_key: str
     service_name: str
@@ -4580,6 +4719,25 @@ class KpiHeatmapBinRead(ORMReadModel):
     created_at: datetime
 
 
+class KpiHeatmapGridRebuildRead(BaseModel):
+    alerts_scanned: int
+    outcomes_scanned: int
+    cells_written: int
+
+
+class KpiFlightRollupBackfillRequest(BaseModel):
+    from_ts: datetime
+    to_ts: datetime
+
+
+class KpiFlightRollupBackfillRead(BaseModel):
+    from_ts: datetime
+    to_ts: datetime
+    hours_scanned: int
+    events_scanned: int
+    buckets_written: int
+
+
 class KpiGovernanceExportRequest(BaseModel):
     title: str = "UAV Governance Monthly Report"
     window_type: KpiWindowType = KpiWindowType.MONTHLY
@@ -4752,6 +4910,7 @@ class InspectionTask(SQLModel, table=True):
         Index("ix_inspection_tasks_tenant_id_id", "tenant_id", "id"),
         Index("ix_inspection_tasks_tenant_template_id", "tenant_id", "template_id"),
         Index("ix_inspection_tasks_tenant_org_unit", "tenant_id", "org_unit_id"),
+        Index("ix_inspection_tasks_tenant_created_at_id", "tenant_id", "created_at", "id"),
     )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
@@ -4826,6 +4985,7 @@ class OutcomeReportExport(SQLModel, table=True):
         Index("ix_outcome_report_exports_tenant_id_id", "tenant_id", "id"),
         Index("ix_outcome_report_exports_tenant_template", "tenant_id", "template_id"),
         Index("ix_outcome_report_exports_tenant_status", "tenant_id", "status"),
+        Index("ix_outcome_report_exports_status_created_at", "status", "created_at"),
     )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
@@ -4843,6 +5003,19 @@ class OutcomeReportExport(SQLModel, table=True):
         sa_column=Column(JSON, nullable=False),
     )
     requested_by: str = Field(index=True)
+    viewer_user_id: str | None = Field(default=None)
+    rows_total: int | None = Field(default=None)
+    rows_scanned: int = Field(default=0)
+    rows_written: int = Field(default=0)
+    cancel_requested: bool = Field(default=False)
+    worker_id: str | None = Field(default=None, max_length=200)
+    heartbeat_at: datetime | None = Field(default=None)
+    started_at: datetime | None = Field(default=None)
+    # Keyset cursor of the last streamed row plus the writer state needed to resume.
+    checkpoint: dict[str, Any] = Field(
+        default_factory=dict,
+        sa_column=Column(JSON, nullable=False),
+    )
     created_at: datetime = Field(default_factory=now_utc, index=True)
     updated_at: datetime = Field(default_factory=now_utc, index=True)
     completed_at: datetime | None = Field(default=None, index=True)
@@ -4866,6 +5039,7 @@ class Defect(SQLModel, table=True):
         Index("ix_defects_tenant_observation_id", "tenant_id", "observation_id"),
         Index("ix_defects_tenant_task_id", "tenant_id", "task_id"),
         Index("ix_defects_tenant_org_unit", "tenant_id", "org_unit_id"),
+        Index("ix_defects_tenant_created_at_id", "tenant_id", "created_at", "id"),
     )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
@@ -4921,6 +5095,7 @@ class Incident(SQLModel, table=True):
         Index("ix_incidents_tenant_id_id", "tenant_id", "id"),
         Index("ix_incidents_tenant_linked_task_id", "tenant_id", "linked_task_id"),
         Index("ix_incidents_tenant_org_unit", "tenant_id", "org_unit_id"),
+        Index("ix_incidents_tenant_created_at_id", "tenant_id", "created_at", "id"),
     )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
@@ -5204,6 +5379,8 @@ class MapTrackReplayRead(BaseModel):
     drone_id: str
     from_ts: datetime | None = None
     to_ts: datetime | None = None
+    distance_km: float = 0.0
+    max_speed_mps: float = 0.0
     points: list[MapTrackPointRead]
 
 
@@ -5339,6 +5516,8 @@ class OutcomeReportExportCreateRequest(BaseModel):
     from_ts: datetime | None = None
     to_ts: datetime | None = None
     topic: str | None = None
+    # None follows REPORT_EXPORT_MODE; True only queues the job for a report export worker.
+    background: bool | None = None
 
 
 class OutcomeReportExportRead(ORMReadModel):
@@ -5354,6 +5533,12 @@ class OutcomeReportExportRead(ORMReadModel):
     file_path: str | None
     detail: dict[str, Any]
     requested_by: str
+    rows_total: int | None = None
+    rows_scanned: int = 0
+    rows_written: int = 0
+    cancel_requested: bool = False
+    started_at: datetime | None = None
+    heartbeat_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
     completed_at: datetime | None
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 PERM_WILDCARD = "*"
@@ -72,8 +74,35 @@ DEFAULT_PERMISSION_NAMES = [
 ]
 
 
+@dataclass(frozen=True)
+class PermissionSet:
+    """Permissions of one token, compiled once for constant-time checks."""
+
+    names: frozenset[str]
+    wildcard: bool
+
+    def allows(self, permission: str) -> bool:
+        return self.wildcard or permission in self.names
+
+    def allows_any(self, permissions: tuple[str, ...]) -> bool:
+        return self.wildcard or not self.names.isdisjoint(permissions)
+
+    @classmethod
+    def from_claims(cls, claims: dict[str, Any]) -> PermissionSet:
+        permissions = claims.get("permissions", [])
+        if not isinstance(permissions, list):
+            return EMPTY_PERMISSION_SET
+        return _compile_permissions(tuple(item for item in permissions if isinstance(item, str)))
+
+
+EMPTY_PERMISSION_SET = PermissionSet(names=frozenset(), wildcard=False)
+
+
+@lru_cache(maxsize=1024)
+def _compile_permissions(permissions: tuple[str, ...]) -> PermissionSet:
+    names = frozenset(permissions)
+    return PermissionSet(names=names, wildcard=PERM_WILDCARD in names)
+
+
 def has_permission(claims: dict[str, Any], permission: str) -> bool:
-    permissions = claims.get("permissions", [])
-    if not isinstance(permissions, list):
-        return False
-    return permission in permissions or PERM_WILDCARD in permissions
+    return PermissionSet.from_claims(claims).allows(permission)
@@ -1,19 +1,226 @@
 from __future__ import annotations
 
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
 from typing import Any
+from uuid import uuid4
 
 from sqlmodel import Session
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.domain.models import AuditLog, now_utc
 from app.infra.db import engine
 
 WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
 AUDITED_READ_PATH_KEYWORDS = ("/export", "-export", "/download")
+UNAUDITED_PATHS = frozenset({"/healthz", "/readyz"})
+UNAUDITED_PATH_PREFIXES = ("/static/",)
 AUDIT_CONTEXT_STATE_KEY = "_audit_context"
 
+AUDIT_SINK_QUEUE_SIZE = int(os.getenv("AUDIT_SINK_QUEUE_SIZE", "10000"))
+AUDIT_SINK_BATCH_SIZE = int(os.getenv("AUDIT_SINK_BATCH_SIZE", "200"))
+AUDIT_SINK_FLUSH_INTERVAL_MS = int(os.getenv("AUDIT_SINK_FLUSH_INTERVAL_MS", "200"))
+AUDIT_SPILL_DIR = os.getenv("AUDIT_SPILL_DIR", "/tmp/uav-audit-spill")
+AUDIT_SINK_OVERFLOW_SIZE = int(os.getenv("AUDIT_SINK_OVERFLOW_SIZE", "10000"))
+AUDIT_SPILL_FILE_MAX_BYTES = int(os.getenv("AUDIT_SPILL_FILE_MAX_BYTES", str(16 * 1024 * 1024)))
+
+logger = logging.getLogger(__name__)
+
+
+def _insert_audit_logs(logs: list[AuditLog]) -> None:
+    with Session(engine) as session:
+        session.add_all(logs)
+        session.commit()
+
+
+def _log_to_json(log: AuditLog) -> dict[str, Any]:
+    return {
+        "id": log.id,
+        "tenant_id": log.tenant_id,
+        "actor_id": log.actor_id,
+        "action": log.action,
+        "resource": log.resource,
+        "method": log.method,
+        "status_code": log.status_code,
+        "ts": log.ts.isoformat(),
+        "detail": log.detail,
+    }
+
+
+def _log_from_json(raw: dict[str, Any]) -> AuditLog:
+    return AuditLog(**{**raw, "ts": datetime.fromisoformat(raw["ts"])})
+
+
+class AuditSink:
+    """Batched audit writer.
+
+    Records go onto a bounded queue that a background thread drains, bulk-inserting
+    every ``batch_size`` records or ``flush_interval_ms``. Batches that cannot be
+    written are appended to a rolling JSONL spill file and re-ingested on a later
+    successful cycle. When the queue is full, records wait in a bounded overflow buffer
+    that the background thread appends to the same spill file, so the request path never
+    touches the disk. When the sink is not running, records are written inline.
+    """
+
+    def __init__(
+        self,
+        *,
+        queue_size: int | None = None,
+        batch_size: int | None = None,
+        flush_interval_ms: int | None = None,
+        spill_dir: str | Path | None = None,
+        overflow_size: int | None = None,
+        spill_file_max_bytes: int | None = None,
+    ) -> None:
+        self._queue: queue.Queue[AuditLog] = queue.Queue(
+            maxsize=max(queue_size or AUDIT_SINK_QUEUE_SIZE, 1),
+        )
+        self._batch_size = max(batch_size or AUDIT_SINK_BATCH_SIZE, 1)
+        flush_interval = flush_interval_ms or AUDIT_SINK_FLUSH_INTERVAL_MS
+        self._flush_interval_seconds = max(flush_interval, 1) / 1000.0
+        self._spill_dir = Path(spill_dir or AUDIT_SPILL_DIR)
+        self._spill_lock = threading.Lock()
+        self._spill_pending = False
+        self._spill_file: Path | None = None
+        self._spill_file_max_bytes = max(spill_file_max_bytes or AUDIT_SPILL_FILE_MAX_BYTES, 1)
+        self._overflow: list[AuditLog] = []
+        self._overflow_size = max(overflow_size or AUDIT_SINK_OVERFLOW_SIZE, 1)
+        self._overflow_lock = threading.Lock()
+        self._overflow_dropped = 0
+        self.dropped = 0
+        self._stopping = threading.Event()
+        self._worker: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    def submit(self, log: AuditLog) -> None:
+        if not self.is_running:
+            self._write([log])
+            return
+        try:
+            self._queue.put_nowait(log)
+        except queue.Full:
+            with self._overflow_lock:
+                if len(self._overflow) < self._overflow_size:
+                    self._overflow.append(log)
+                else:
+                    self._overflow_dropped += 1
+                    self.dropped += 1
+
+    def _drain(self, *, wait: bool) -> list[AuditLog]:
+        batch: list[AuditLog] = []
+        deadline = time.monotonic() + self._flush_interval_seconds
+        while len(batch) < self._batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                if wait and timeout > 0:
+                    batch.append(self._queue.get(timeout=timeout))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def flush(self) -> int:
+        self._spill_overflow()
+        written = 0
+        while True:
+            batch = self._drain(wait=False)
+            if not batch:
+                break
+            written += self._write(batch)
+        return written
+
+    def _write(self, batch: list[AuditLog]) -> int:
+        try:
+            _insert_audit_logs(batch)
+        except Exception:
+            self._spill(batch)
+            return 0
+        if self._spill_pending:
+            self.replay_spilled()
+        return len(batch)
+
+    def _spill_overflow(self) -> None:
+        with self._overflow_lock:
+            batch, self._overflow = self._overflow, []
+            dropped, self._overflow_dropped = self._overflow_dropped, 0
+        if dropped:
+            logger.warning("audit overflow buffer full; dropped %d audit records", dropped)
+        if batch:
+            self._spill(batch)
+
+    def _spill(self, batch: list[AuditLog]) -> None:
+        with self._spill_lock:
+            target = self._spill_file
+            if target is None or not target.exists() or target.stat().st_size >= self._spill_file_max_bytes:
+                self._spill_dir.mkdir(parents=True, exist_ok=True)
+                target = self._spill_dir / f"audit-{int(time.time() * 1000)}-{uuid4().hex}.jsonl"
+                self._spill_file = target
+            with target.open("a", encoding="utf-8") as handle:
+                for log in batch:
+                    handle.write(json.dumps(_log_to_json(log), ensure_ascii=False, default=str))
+                    handle.write("\n")
+            self._spill_pending = True
+
+    def spilled_files(self) -> list[Path]:
+        if not self._spill_dir.exists():
+            return []
+        return sorted(self._spill_dir.glob("audit-*.jsonl"))
+
+    def replay_spilled(self) -> int:
+        replayed = 0
+        with self._spill_lock:
+            for path in self.spilled_files():
+                lines = path.read_text(encoding="utf-8").splitlines()
+                logs = [_log_from_json(json.loads(line)) for line in lines if line.strip()]
+                try:
+                    if logs:
+                        _insert_audit_logs(logs)
+                except Exception:
+                    return replayed
+                path.unlink()
+                replayed += len(logs)
+            self._spill_pending = False
+        return replayed
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stopping.clear()
+        self._spill_pending = bool(self.spilled_files())
+        self._worker = threading.Thread(target=self._run, name="audit-sink", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        worker = self._worker
+        if worker is None:
+            return
+        self._stopping.set()
+        worker.join()
+        self._worker = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            batch = self._drain(wait=True)
+            # Overflow lands on disk first, so a successful write below replays it too.
+            self._spill_overflow()
+            if batch:
+                self._write(batch)
+
+
+audit_sink = AuditSink()
+
 
 def write_audit_log(
     *,
@@ -34,9 +241,7 @@ def write_audit_log(
         status_code=status_code,
         detail=detail or {},
     )
-    with Session(engine) as session:
-        session.add(log)
-        session.commit()
+    audit_sink.submit(log)
 
 
 def _deep_merge(base: dict[str, Any], extra: dict[str, Any]) -> dict[str, Any]:
@@ -90,20 +295,50 @@ def set_audit_context(
     setattr(request.state, AUDIT_CONTEXT_STATE_KEY, context)
 
 
-class AuditMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        response = await call_next(request)
-        path = request.url.path
-        method = request.method
-        if path in {"/healthz", "/readyz"}:
-            return response
-        context_raw = getattr(request.state, AUDIT_CONTEXT_STATE_KEY, {})
+def is_unaudited_path(path: str) -> bool:
+    return path in UNAUDITED_PATHS or path.startswith(UNAUDITED_PATH_PREFIXES)
+
+
+class AuditMiddleware:
+    """Pure ASGI audit middleware.
+
+    Non-HTTP scopes and unaudited paths are passed straight through. For everything else
+    the status code is captured from ``http.response.start`` and the audit record is
+    written once the response has been sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or is_unaudited_path(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        # Share one state dict with downstream requests so set_audit_context is visible here.
+        state: dict[str, Any] = scope.setdefault("state", {})
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = int(message["status"])
+            await send(message)
+
+        await self.app(scope, receive, send_with_status)
+        self._audit(scope, state, status_code)
+
+    def _audit(self, scope: Scope, state: dict[str, Any], status_code: int) -> None:
+        path: str = scope["path"]
+        method: str = scope["method"]
+        context_raw = state.get(AUDIT_CONTEXT_STATE_KEY, {})
         context = context_raw if isinstance(context_raw, dict) else {}
         has_explicit_context = any(key in context for key in ("action", "resource", "detail"))
         if not should_audit_request(method, path) and not has_explicit_context:
-            return response
+            return
 
-        claims = getattr(request.state, "claims", {})
+        claims_raw = state.get("claims", {})
+        claims = claims_raw if isinstance(claims_raw, dict) else {}
         tenant_id = claims.get("tenant_id", "system")
         actor_id = claims.get("sub")
         raw_action = context.get("action")
@@ -111,8 +346,9 @@ class AuditMiddleware(BaseHTTPMiddleware):
         action: str = raw_action if isinstance(raw_action, str) else f"{method}:{path}"
         resource: str = raw_resource if isinstance(raw_resource, str) else path
 
-        route = request.scope.get("route")
+        route = scope.get("route")
         route_path = getattr(route, "path", path)
+        client = scope.get("client")
         base_detail: dict[str, Any] = {
             "who": {
                 "tenant_id": tenant_id,
@@ -124,8 +360,8 @@ class AuditMiddleware(BaseHTTPMiddleware):
             "where": {
                 "path": path,
                 "route": route_path,
-                "query": request.url.query,
-                "client_ip": request.client.host if request.client is not None else None,
+                "query": scope.get("query_string", b"").decode("latin-1"),
+                "client_ip": client[0] if client else None,
             },
             "what": {
                 "action": action,
@@ -133,8 +369,8 @@ class AuditMiddleware(BaseHTTPMiddleware):
                 "method": method,
             },
             "result": {
-                "status_code": response.status_code,
-                "outcome": _status_outcome(response.status_code),
+                "status_code": status_code,
+                "outcome": _status_outcome(status_code),
             },
         }
         context_detail = context.get("detail")
@@ -147,10 +383,9 @@ class AuditMiddleware(BaseHTTPMiddleware):
                 action=action,
                 resource=resource,
                 method=method,
-                status_code=response.status_code,
+                status_code=status_code,
                 detail=detail,
             )
         except Exception:
             # Audit must not block request flow in Phase 0.
-            return response
-        return response
+            return
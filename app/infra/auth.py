@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import copy
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import jwt
 
+from app.domain.permissions import PermissionSet
+
 JWT_SECRET = os.getenv("JWT_SECRET", "dev-secret-change-me")
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 JWT_EXPIRES_MIN = int(os.getenv("JWT_EXPIRES_MIN", "60"))
+TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "4096"))
 
 
 def create_access_token(
@@ -30,8 +39,79 @@ def create_access_token(
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 
-def decode_access_token(token: str) -> dict[str, Any]:
+@dataclass(frozen=True)
+class VerifiedToken:
+    claims: dict[str, Any]
+    permissions: PermissionSet
+    expires_at: float
+
+    def copy_claims(self) -> dict[str, Any]:
+        """The claims as a deep copy, since the cached entry is shared between requests."""
+        return copy.deepcopy(self.claims)
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of verified tokens keyed by token hash; entries never outlive `exp`."""
+
+    def __init__(self, *, max_entries: int | None = None) -> None:
+        self._max_entries = TOKEN_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, VerifiedToken] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> VerifiedToken | None:
+        if self._max_entries <= 0:
+            return None
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, token: str, verified: VerifiedToken) -> None:
+        if self._max_entries <= 0:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = verified
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = VerifiedTokenCache()
+
+
+def verify_access_token(token: str) -> VerifiedToken:
+    """Verify `token`, skipping the signature check for tokens verified before."""
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached
     decoded = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
     if not isinstance(decoded, dict):
         raise ValueError("Invalid token payload")
-    return decoded
+    verified = VerifiedToken(
+        claims=decoded,
+        permissions=PermissionSet.from_claims(decoded),
+        expires_at=float(decoded["exp"]) if isinstance(decoded.get("exp"), int | float) else 0.0,
+    )
+    # Tokens without an expiry are verified every time.
+    if verified.expires_at > 0:
+        token_cache.put(token, verified)
+    return verified
+
+
+def decode_access_token(token: str) -> dict[str, Any]:
+    return verify_access_token(token).copy_claims()
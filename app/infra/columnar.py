@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import enum
+import hashlib
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any, BinaryIO, Protocol
+
+import sqlalchemy as sa
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; the built-in format needs only the stdlib
+    pa = None
+    pq = None
+
+# `auto` writes Parquet when pyarrow is installed and the built-in format otherwise.
+COLUMNAR_ENGINE = os.getenv("TENANT_EXPORT_COLUMNAR_ENGINE", "auto").strip().lower()
+COLUMNAR_ROW_GROUP_SIZE = max(int(os.getenv("TENANT_EXPORT_ROW_GROUP_SIZE", "50000")), 1)
+
+BUILTIN_ENCODING = "uavcol-1"
+BUILTIN_SUFFIX = "ucol"
+_MAGIC = b"UAVCOL1\n"
+_FOOTER_LENGTH = struct.Struct("<Q")
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_EPOCH_DAY = date(1970, 1, 1)
+
+
+class ColumnarFormatError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    name: str
+    type: str
+    nullable: bool
+
+
+def logical_type(column_type: sa.types.TypeEngine[Any]) -> str:
+    if isinstance(column_type, sa.Boolean):
+        return "bool"
+    if isinstance(column_type, sa.Integer):
+        return "int64"
+    if isinstance(column_type, sa.Float | sa.Numeric):
+        return "float64"
+    if isinstance(column_type, sa.DateTime):
+        return "timestamp"
+    if isinstance(column_type, sa.Date):
+        return "date"
+    if isinstance(column_type, sa.JSON):
+        return "json"
+    return "string"
+
+
+def table_schema(table: sa.Table) -> list[ColumnSpec]:
+    return [
+        ColumnSpec(name=column.key, type=logical_type(column.type), nullable=bool(column.nullable))
+        for column in table.columns
+    ]
+
+
+def asdict_schema(schema: Sequence[ColumnSpec]) -> list[dict[str, Any]]:
+    return [asdict(spec) for spec in schema]
+
+
+def _utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def _coerce(value: Any, kind: str) -> Any:
+    """Python value of `kind` for one cell; None stays None."""
+    if value is None:
+        return None
+    if kind == "int64":
+        return int(value)
+    if kind == "float64":
+        return float(value)
+    if kind == "bool":
+        return bool(value)
+    if kind == "timestamp":
+        return _utc(value)
+    if kind == "date":
+        return value.date() if isinstance(value, datetime) else value
+    if kind == "json":
+        return json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    if isinstance(value, enum.Enum):
+        return str(value.value)
+    return str(value)
+
+
+def _little_endian(values: array[Any]) -> bytes:
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _encode_column(values: Sequence[Any], kind: str) -> bytes:
+    validity = bytearray((len(values) + 7) // 8)
+    for index, value in enumerate(values):
+        if value is not None:
+            validity[index >> 3] |= 1 << (index & 7)
+    if kind in {"string", "json"}:
+        offsets = array("q", [0])
+        data = bytearray()
+        for value in values:
+            if value is not None:
+                data.extend(value.encode("utf-8"))
+            offsets.append(len(data))
+        return bytes(validity) + _little_endian(offsets) + bytes(data)
+    if kind == "bool":
+        return bytes(validity) + bytes(1 if value else 0 for value in values)
+    if kind == "float64":
+        return bytes(validity) + _little_endian(array("d", (0.0 if value is None else value for value in values)))
+    if kind == "timestamp":
+        micros = (0 if value is None else (value - _EPOCH) // timedelta(microseconds=1) for value in values)
+        return bytes(validity) + _little_endian(array("q", micros))
+    if kind == "date":
+        days = (0 if value is None else (value - _EPOCH_DAY).days for value in values)
+        return bytes(validity) + _little_endian(array("q", days))
+    return bytes(validity) + _little_endian(array("q", (0 if value is None else value for value in values)))
+
+
+def _fixed_values(payload: memoryview, typecode: str, count: int) -> array[Any]:
+    values = array(typecode)
+    values.frombytes(payload[: count * values.itemsize])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _decode_column(payload: bytes, kind: str, count: int) -> list[Any]:
+    view = memoryview(payload)
+    validity = view[: (count + 7) // 8]
+    body = view[(count + 7) // 8 :]
+    present = [bool(validity[index >> 3] & (1 << (index & 7))) for index in range(count)]
+    decoded: list[Any]
+    if kind in {"string", "json"}:
+        offsets = _fixed_values(body, "q", count + 1)
+        data = bytes(body[(count + 1) * 8 :])
+        decoded = [data[offsets[index] : offsets[index + 1]].decode("utf-8") for index in range(count)]
+        if kind == "json":
+            decoded = [json.loads(item) if present[index] else None for index, item in enumerate(decoded)]
+    elif kind == "bool":
+        decoded = [bool(item) for item in body[:count]]
+    elif kind == "float64":
+        decoded = list(_fixed_values(body, "d", count))
+    elif kind == "timestamp":
+        decoded = [_EPOCH + timedelta(microseconds=item) for item in _fixed_values(body, "q", count)]
+    elif kind == "date":
+        decoded = [_EPOCH_DAY + timedelta(days=item) for item in _fixed_values(body, "q", count)]
+    else:
+        decoded = list(_fixed_values(body, "q", count))
+    return [item if present[index] else None for index, item in enumerate(decoded)]
+
+
+class ColumnarTableWriter(Protocol):
+    encoding: str
+
+    def write_batch(self, rows: Sequence[Mapping[Any, Any]]) -> None: ...
+
+    def close(self) -> dict[str, Any]: ...
+
+
+class _HashingFile:
+    def __init__(self, handle: BinaryIO) -> None:
+        self._handle = handle
+        self.digest = hashlib.sha256()
+        self.position = 0
+
+    def write(self, data: bytes) -> None:
+        self._handle.write(data)
+        self.digest.update(data)
+        self.position += len(data)
+
+
+class BuiltinColumnarWriter:
+    """Stdlib-only columnar file: zlib-compressed, typed column chunks per row group.
+
+    Layout follows Parquet's shape: magic, row groups of column chunks, then a JSON
+    footer with the schema and per-chunk offsets and CRC32s, its length and the magic.
+    Each chunk holds a validity bitmap followed by little-endian fixed-width values, or
+    int64 offsets plus UTF-8 bytes for strings and JSON.
+    """
+
+    encoding = BUILTIN_ENCODING
+
+    def __init__(self, path: Path, schema: Sequence[ColumnSpec], *, row_group_size: int | None = None) -> None:
+        self._path = path
+        self._schema = list(schema)
+        self._row_group_size = row_group_size or COLUMNAR_ROW_GROUP_SIZE
+        self._handle = path.open("wb")
+        self._out = _HashingFile(self._handle)
+        self._out.write(_MAGIC)
+        self._buffer: list[list[Any]] = [[] for _ in self._schema]
+        self._buffered = 0
+        self._row_groups: list[dict[str, Any]] = []
+        self._row_count = 0
+
+    def write_batch(self, rows: Sequence[Mapping[Any, Any]]) -> None:
+        for row in rows:
+            for column, spec in zip(self._buffer, self._schema, strict=True):
+                column.append(_coerce(row[spec.name], spec.type))
+            self._buffered += 1
+            if self._buffered >= self._row_group_size:
+                self._flush_row_group()
+
+    def _flush_row_group(self) -> None:
+        if self._buffered == 0:
+            return
+        chunks: list[dict[str, Any]] = []
+        for values, spec in zip(self._buffer, self._schema, strict=True):
+            compressed = zlib.compress(_encode_column(values, spec.type), 6)
+            chunks.append(
+                {
+                    "offset": self._out.position,
+                    "length": len(compressed),
+                    "crc32": zlib.crc32(compressed),
+                }
+            )
+            self._out.write(compressed)
+        self._row_groups.append({"rows": self._buffered, "columns": chunks})
+        self._row_count += self._buffered
+        self._buffer = [[] for _ in self._schema]
+        self._buffered = 0
+
+    def close(self) -> dict[str, Any]:
+        self._flush_row_group()
+        footer = json.dumps(
+            {
+                "encoding": self.encoding,
+                "codec": "zlib",
+                "schema": asdict_schema(self._schema),
+                "row_groups": self._row_groups,
+            },
+            sort_keys=True,
+        ).encode("utf-8")
+        self._out.write(footer)
+        self._out.write(_FOOTER_LENGTH.pack(len(footer)))
+        self._out.write(_MAGIC)
+        self._handle.close()
+        return {
+            "encoding": self.encoding,
+            "compression": "zlib",
+            "row_count": self._row_count,
+            "row_groups": len(self._row_groups),
+            "bytes": self._out.position,
+            "sha256": self._out.digest.hexdigest(),
+        }
+
+
+def _arrow_type(kind: str) -> Any:
+    assert pa is not None
+    return {
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+        "date": pa.date32(),
+    }.get(kind, pa.string())
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ParquetColumnarWriter:
+    """Parquet via pyarrow, zstd-compressed, one row group per `row_group_size` rows."""
+
+    encoding = "parquet"
+
+    def __init__(self, path: Path, schema: Sequence[ColumnSpec], *, row_group_size: int | None = None) -> None:
+        if pa is None or pq is None:
+            raise ColumnarFormatError("pyarrow is not installed")
+        self._path = path
+        self._schema = list(schema)
+        self._row_group_size = row_group_size or COLUMNAR_ROW_GROUP_SIZE
+        self._arrow_schema = pa.schema(
+            [pa.field(spec.name, _arrow_type(spec.type), nullable=spec.nullable) for spec in self._schema]
+        )
+        self._writer = pq.ParquetWriter(str(path), self._arrow_schema, compression="zstd")
+        self._buffer: list[list[Any]] = [[] for _ in self._schema]
+        self._buffered = 0
+        self._row_groups = 0
+        self._row_count = 0
+
+    def write_batch(self, rows: Sequence[Mapping[Any, Any]]) -> None:
+        for row in rows:
+            for column, spec in zip(self._buffer, self._schema, strict=True):
+                column.append(_coerce(row[spec.name], spec.type))
+            self._buffered += 1
+            if self._buffered >= self._row_group_size:
+                self._flush_row_group()
+
+    def _flush_row_group(self) -> None:
+        if self._buffered == 0:
+            return
+        assert pa is not None
+        batch = pa.table(
+            {spec.name: values for spec, values in zip(self._schema, self._buffer, strict=True)},
+            schema=self._arrow_schema,
+        )
+        self._writer.write_table(batch, row_group_size=self._buffered)
+        self._row_groups += 1
+        self._row_count += self._buffered
+        self._buffer = [[] for _ in self._schema]
+        self._buffered = 0
+
+    def close(self) -> dict[str, Any]:
+        self._flush_row_group()
+        self._writer.close()
+        return {
+            "encoding": self.encoding,
+            "compression": "zstd",
+            "row_count": self._row_count,
+            "row_groups": self._row_groups,
+            "bytes": self._path.stat().st_size,
+            "sha256": _file_sha256(self._path),
+        }
+
+
+def parquet_available() -> bool:
+    return pq is not None
+
+
+def open_columnar_writer(
+    path_stem: Path,
+    schema: Sequence[ColumnSpec],
+    *,
+    engine: str | None = None,
+    row_group_size: int | None = None,
+) -> tuple[Path, ColumnarTableWriter]:
+    """Writer for one table; `path_stem` gets the suffix of the chosen engine."""
+    selected = engine or COLUMNAR_ENGINE
+    if selected == "parquet" or (selected == "auto" and parquet_available()):
+        path = path_stem.with_name(f"{path_stem.name}.parquet")
+        return path, ParquetColumnarWriter(path, schema, row_group_size=row_group_size)
+    path = path_stem.with_name(f"{path_stem.name}.{BUILTIN_SUFFIX}")
+    return path, BuiltinColumnarWriter(path, schema, row_group_size=row_group_size)
+
+
+def read_builtin_columnar(path: Path) -> tuple[list[ColumnSpec], Iterator[dict[str, Any]]]:
+    """Schema and rows of a built-in columnar file, one row group in memory at a time."""
+    with path.open("rb") as handle:
+        if handle.read(len(_MAGIC)) != _MAGIC:
+            raise ColumnarFormatError(f"{path.name} is not a {BUILTIN_ENCODING} file")
+        handle.seek(-(len(_MAGIC) + _FOOTER_LENGTH.size), os.SEEK_END)
+        (footer_length,) = _FOOTER_LENGTH.unpack(handle.read(_FOOTER_LENGTH.size))
+        if handle.read(len(_MAGIC)) != _MAGIC:
+            raise ColumnarFormatError(f"{path.name} is truncated")
+        handle.seek(-(len(_MAGIC) + _FOOTER_LENGTH.size + footer_length), os.SEEK_END)
+        footer = json.loads(handle.read(footer_length))
+    schema = [ColumnSpec(**item) for item in footer["schema"]]
+
+    def _rows() -> Iterator[dict[str, Any]]:
+        with path.open("rb") as handle:
+            for group in footer["row_groups"]:
+                columns: list[list[Any]] = []
+                for spec, chunk in zip(schema, group["columns"], strict=True):
+                    handle.seek(chunk["offset"])
+                    compressed = handle.read(chunk["length"])
+                    if zlib.crc32(compressed) != chunk["crc32"]:
+                        raise ColumnarFormatError(f"{path.name}: checksum mismatch in column {spec.name}")
+                    columns.append(_decode_column(zlib.decompress(compressed), spec.type, group["rows"]))
+                for index in range(group["rows"]):
+                    yield {spec.name: values[index] for spec, values in zip(schema, columns, strict=True)}
+
+    return schema, _rows()
@@ -1,29 +1,264 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
-from collections.abc import Generator
+import threading
+import time
+import weakref
+from collections.abc import Callable, Generator
+from typing import Any, ParamSpec, TypeVar
 
-from sqlalchemy import text
-from sqlalchemy.engine import Engine
+import anyio
+from sqlalchemy import event as sa_event
+from sqlalchemy import make_url, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import QueuePool
 from sqlmodel import Session, create_engine
 
 DATABASE_URL = os.getenv(
     "DATABASE_URL",
     "postgresql+psycopg://uav:uav@db:5432/uav_platform",
 )
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL", "").strip()
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "500"))
+DB_THREADPOOL_SIZE = int(os.getenv("DB_THREADPOOL_SIZE", str(DB_POOL_SIZE + DB_MAX_OVERFLOW)))
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+ROLE_PRIMARY = "primary"
+ROLE_REPLICA = "replica"
+_ROLE_OPTION = "db_role"
+_QUERY_STARTED_KEY = "query_started_at"
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class DatabaseMetrics:
+    """Process-wide pool checkout and query timings, grouped by engine role."""
+
+    def __init__(self, *, slow_query_ms: float | None = None) -> None:
+        self._slow_query_ms = DB_SLOW_QUERY_MS if slow_query_ms is None else slow_query_ms
+        self._lock = threading.Lock()
+        self._roles: dict[str, dict[str, float]] = {}
+
+    def _bucket(self, role: str) -> dict[str, float]:
+        bucket = self._roles.get(role)
+        if bucket is None:
+            bucket = {
+                "checkouts": 0,
+                "checkout_wait_total_ms": 0.0,
+                "checkout_wait_max_ms": 0.0,
+                "queries": 0,
+                "query_total_ms": 0.0,
+                "query_max_ms": 0.0,
+                "slow_queries": 0,
+            }
+            self._roles[role] = bucket
+        return bucket
+
+    def observe_checkout(self, role: str, wait_ms: float) -> None:
+        with self._lock:
+            bucket = self._bucket(role)
+            bucket["checkouts"] += 1
+            bucket["checkout_wait_total_ms"] += wait_ms
+            bucket["checkout_wait_max_ms"] = max(bucket["checkout_wait_max_ms"], wait_ms)
+
+    def observe_query(self, role: str, elapsed_ms: float) -> None:
+        with self._lock:
+            bucket = self._bucket(role)
+            bucket["queries"] += 1
+            bucket["query_total_ms"] += elapsed_ms
+            bucket["query_max_ms"] = max(bucket["query_max_ms"], elapsed_ms)
+            if elapsed_ms >= self._slow_query_ms:
+                bucket["slow_queries"] += 1
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {role: dict(bucket) for role, bucket in self._roles.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._roles.clear()
+
+
+db_metrics = DatabaseMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that reports how long callers waited for a connection."""
+
+    role = ROLE_PRIMARY
+
+    def recreate(self) -> QueuePool:
+        pool = super().recreate()
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.role = self.role
+        return pool
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_metrics.observe_checkout(self.role, (time.perf_counter() - started) * 1000)
+
+
+def _engine_options(url: str, role: str) -> dict[str, Any]:
+    options: dict[str, Any] = {
+        "pool_pre_ping": True,
+        "execution_options": {_ROLE_OPTION: role},
+    }
+    backend = make_url(url).get_backend_name()
+    if backend == "sqlite":
+        # SQLite picks its own pool per database type; sizing options do not apply.
+        return options
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=max(DB_POOL_SIZE, 1),
+        max_overflow=max(DB_MAX_OVERFLOW, 0),
+        pool_timeout=DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=DB_POOL_RECYCLE_SECONDS,
+    )
+    if backend == "postgresql" and DB_STATEMENT_TIMEOUT_MS > 0:
+        options["connect_args"] = {"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"}
+    return options
+
+
+def build_engine(url: str, *, role: str = ROLE_PRIMARY) -> Engine:
+    built = create_engine(url, **_engine_options(url, role))
+    if isinstance(built.pool, InstrumentedQueuePool):
+        built.pool.role = role
+    return built
+
+
+engine = build_engine(DATABASE_URL)
+read_engine: Engine | None = (
+    build_engine(DATABASE_READ_URL, role=ROLE_REPLICA) if DATABASE_READ_URL else None
+)
+
+
+@sa_event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(
+    conn: Connection,
+    _cursor: Any,
+    _statement: str,
+    _parameters: Any,
+    _context: Any,
+    _executemany: bool,
+) -> None:
+    conn.info.setdefault(_QUERY_STARTED_KEY, []).append(time.perf_counter())
+
+
+@sa_event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(
+    conn: Connection,
+    _cursor: Any,
+    _statement: str,
+    _parameters: Any,
+    _context: Any,
+    _executemany: bool,
+) -> None:
+    started: list[float] = conn.info.get(_QUERY_STARTED_KEY, [])
+    if not started:
+        return
+    elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+    role = str(conn.get_execution_options().get(_ROLE_OPTION, ROLE_PRIMARY))
+    db_metrics.observe_query(role, elapsed_ms)
 
 
 def get_engine() -> Engine:
     return engine
 
 
+def get_read_engine() -> Engine:
+    """Replica engine for read-only work; falls back to the primary when none is configured."""
+    return read_engine if read_engine is not None else get_engine()
+
+
+def create_session(*, read_only: bool = False) -> Session:
+    """Session factory used by services.
+
+    Read-only sessions go to the replica and may lag behind the primary, so only use
+    them for queries that tolerate slightly stale data.
+    """
+    return Session(get_read_engine() if read_only else get_engine(), expire_on_commit=False)
+
+
 def get_session() -> Generator[Session, None, None]:
     with Session(get_engine()) as session:
         yield session
 
 
+_db_thread_limiters: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, anyio.CapacityLimiter] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _db_thread_limiter() -> anyio.CapacityLimiter:
+    loop = asyncio.get_running_loop()
+    limiter = _db_thread_limiters.get(loop)
+    if limiter is None:
+        limiter = anyio.CapacityLimiter(max(DB_THREADPOOL_SIZE, 1))
+        _db_thread_limiters[loop] = limiter
+    return limiter
+
+
+async def run_db(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Run blocking database work from async code without stalling the event loop.
+
+    Calls share a dedicated thread limiter sized to the connection pool, so a burst of
+    database work queues here instead of starving the default threadpool.
+    """
+    return await anyio.to_thread.run_sync(
+        functools.partial(func, *args, **kwargs),
+        limiter=_db_thread_limiter(),
+    )
+
+
+def _pool_status(bound: Engine) -> dict[str, int | None]:
+    pool = bound.pool
+    if not isinstance(pool, QueuePool):
+        return {"pool_size": None, "checked_out": None, "overflow": None}
+    return {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
+def database_stats() -> list[dict[str, Any]]:
+    metrics = db_metrics.snapshot()
+    engines: list[tuple[str, Engine]] = [(ROLE_PRIMARY, get_engine())]
+    if read_engine is not None:
+        engines.append((ROLE_REPLICA, read_engine))
+    result: list[dict[str, Any]] = []
+    for role, bound in engines:
+        bucket = metrics.get(role, {})
+        checkouts = int(bucket.get("checkouts", 0))
+        queries = int(bucket.get("queries", 0))
+        result.append(
+            {
+                "role": role,
+                **_pool_status(bound),
+                "checkouts": checkouts,
+                "checkout_wait_avg_ms": (
+                    round(bucket["checkout_wait_total_ms"] / checkouts, 3) if checkouts else 0.0
+                ),
+                "checkout_wait_max_ms": round(bucket.get("checkout_wait_max_ms", 0.0), 3),
+                "queries": queries,
+                "query_avg_ms": round(bucket["query_total_ms"] / queries, 3) if queries else 0.0,
+                "query_max_ms": round(bucket.get("query_max_ms", 0.0), 3),
+                "slow_queries": int(bucket.get("slow_queries", 0)),
+            }
+        )
+    return result
+
+
 def check_db_ready() -> bool:
     try:
         with get_engine().connect() as conn:
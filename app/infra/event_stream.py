@@ -0,0 +1,391 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Protocol
+
+from sqlalchemy import and_, or_
+from sqlmodel import Session, col, select
+
+from app.domain.models import EventConsumerOffset, EventEnvelope, EventRecord, now_utc
+from app.infra import db
+
+EVENT_STREAM_BACKEND = os.getenv("EVENT_STREAM_BACKEND", "sql").strip().lower()
+EVENT_STREAM_KEY = os.getenv("EVENT_STREAM_KEY", "events:stream")
+EVENT_STREAM_MAXLEN = int(os.getenv("EVENT_STREAM_MAXLEN", "1000000"))
+EVENT_STREAM_SETTLE_SECONDS = float(os.getenv("EVENT_STREAM_SETTLE_SECONDS", "2.0"))
+
+
+class EventStreamError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class StreamEntry:
+    cursor: str
+    event: EventEnvelope
+
+
+class EventStream(Protocol):
+    def append(self, events: list[EventEnvelope]) -> None: ...
+
+    def read_group(
+        self,
+        group: str,
+        *,
+        consumer: str = "default",
+        count: int = 100,
+    ) -> list[StreamEntry]: ...
+
+    def ack(self, group: str, entries: list[StreamEntry]) -> None: ...
+
+    def seek_group(
+        self,
+        group: str,
+        *,
+        since_ts: datetime | None = None,
+        after_event_id: str | None = None,
+    ) -> None: ...
+
+    def replay(
+        self,
+        *,
+        since_ts: datetime | None = None,
+        after_event_id: str | None = None,
+        tenant_id: str | None = None,
+        event_types: list[str] | None = None,
+        limit: int = 500,
+    ) -> list[StreamEntry]: ...
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+def _to_envelope(row: EventRecord) -> EventEnvelope:
+    return EventEnvelope(
+        event_id=row.event_id,
+        event_type=row.event_type,
+        tenant_id=row.tenant_id,
+        ts=row.ts,
+        actor_id=row.actor_id,
+        correlation_id=row.correlation_id,
+        payload=row.payload,
+    )
+
+
+def _sql_cursor(row: EventRecord) -> str:
+    return f"{_as_naive_utc(row.ts).isoformat()}|{row.event_id}"
+
+
+def _parse_sql_cursor(cursor: str) -> tuple[datetime, str]:
+    raw_ts, _, event_id = cursor.partition("|")
+    return datetime.fromisoformat(raw_ts), event_id
+
+
+class SqlEventStream:
+    """Event stream over the append-only ``events`` table.
+
+    Consumer-group offsets are stored in ``event_consumer_offsets`` and only move on
+    ``ack``, so unacknowledged entries are redelivered (at-least-once). Each group is
+    intended for a single consumer; events younger than the settle window are held back
+    so that late-committing transactions are not skipped by the (ts, event_id) cursor.
+    """
+
+    def __init__(self, *, settle_seconds: float | None = None) -> None:
+        settle = EVENT_STREAM_SETTLE_SECONDS if settle_seconds is None else settle_seconds
+        self._settle_seconds = max(settle, 0.0)
+
+    def _session(self) -> Session:
+        return Session(db.engine, expire_on_commit=False)
+
+    def append(self, events: list[EventEnvelope]) -> None:
+        # The outbox already wrote these rows to ``events``.
+        return None
+
+    def _after(self, since_ts: datetime | None, after_event_id: str | None) -> Any:
+        if since_ts is not None:
+            return col(EventRecord.ts) >= _as_naive_utc(since_ts)
+        if after_event_id is None:
+            return None
+        with self._session() as session:
+            anchor = session.get(EventRecord, after_event_id)
+        if anchor is None:
+            raise EventStreamError(f"event not found: {after_event_id}")
+        return self._after_position(_as_naive_utc(anchor.ts), anchor.event_id)
+
+    @staticmethod
+    def _after_position(last_ts: datetime, last_event_id: str) -> Any:
+        return or_(
+            col(EventRecord.ts) > last_ts,
+            and_(col(EventRecord.ts) == last_ts, col(EventRecord.event_id) > last_event_id),
+        )
+
+    def read_group(
+        self,
+        group: str,
+        *,
+        consumer: str = "default",
+        count: int = 100,
+    ) -> list[StreamEntry]:
+        with self._session() as session:
+            offset = session.get(EventConsumerOffset, group)
+            statement = select(EventRecord)
+            if offset is not None and offset.last_ts is not None and offset.last_event_id is not None:
+                statement = statement.where(
+                    self._after_position(_as_naive_utc(offset.last_ts), offset.last_event_id)
+                )
+            if self._settle_seconds > 0:
+                settled_before = _as_naive_utc(now_utc() - timedelta(seconds=self._settle_seconds))
+                statement = statement.where(col(EventRecord.ts) <= settled_before)
+            rows = session.exec(
+                statement.order_by(col(EventRecord.ts), col(EventRecord.event_id)).limit(max(count, 1))
+            ).all()
+        return [StreamEntry(cursor=_sql_cursor(row), event=_to_envelope(row)) for row in rows]
+
+    def ack(self, group: str, entries: list[StreamEntry]) -> None:
+        if not entries:
+            return
+        last_ts, last_event_id = max(_parse_sql_cursor(item.cursor) for item in entries)
+        with self._session() as session:
+            offset = session.get(EventConsumerOffset, group)
+            if offset is None:
+                offset = EventConsumerOffset(group_name=group)
+            current = (
+                (_as_naive_utc(offset.last_ts), offset.last_event_id or "")
+                if offset.last_ts is not None
+                else None
+            )
+            if current is None or (last_ts, last_event_id) > current:
+                offset.last_ts = last_ts
+                offset.last_event_id = last_event_id
+            offset.delivered_count += len(entries)
+            offset.updated_at = now_utc()
+            session.add(offset)
+            session.commit()
+
+    def seek_group(
+        self,
+        group: str,
+        *,
+        since_ts: datetime | None = None,
+        after_event_id: str | None = None,
+    ) -> None:
+        last_ts: datetime | None = None
+        last_event_id: str | None = None
+        if after_event_id is not None:
+            with self._session() as session:
+                anchor = session.get(EventRecord, after_event_id)
+            if anchor is None:
+                raise EventStreamError(f"event not found: {after_event_id}")
+            last_ts, last_event_id = _as_naive_utc(anchor.ts), anchor.event_id
+        elif since_ts is not None:
+            # Position just before ``since_ts`` so events at exactly that instant are redelivered.
+            last_ts, last_event_id = _as_naive_utc(since_ts) - timedelta(microseconds=1), ""
+        with self._session() as session:
+            offset = session.get(EventConsumerOffset, group) or EventConsumerOffset(group_name=group)
+            offset.last_ts = last_ts
+            offset.last_event_id = last_event_id
+            offset.updated_at = now_utc()
+            session.add(offset)
+            session.commit()
+
+    def replay(
+        self,
+        *,
+        since_ts: datetime | None = None,
+        after_event_id: str | None = None,
+        tenant_id: str | None = None,
+        event_types: list[str] | None = None,
+        limit: int = 500,
+    ) -> list[StreamEntry]:
+        statement = select(EventRecord)
+        after_clause = self._after(since_ts, after_event_id)
+        if after_clause is not None:
+            statement = statement.where(after_clause)
+        if tenant_id is not None:
+            statement = statement.where(EventRecord.tenant_id == tenant_id)
+        if event_types:
+            statement = statement.where(col(EventRecord.event_type).in_(event_types))
+        with self._session() as session:
+            rows = session.exec(
+                statement.order_by(col(EventRecord.ts), col(EventRecord.event_id)).limit(max(limit, 1))
+            ).all()
+        return [StreamEntry(cursor=_sql_cursor(row), event=_to_envelope(row)) for row in rows]
+
+
+class RedisEventStream:
+    """Redis Streams backend: XADD on publish, XREADGROUP/XACK for consumer groups.
+
+    Pending (delivered but unacknowledged) entries are re-read before new ones, which
+    gives at-least-once delivery per consumer. Event-id replay resolves the anchor
+    timestamp from the ``events`` table.
+    """
+
+    def __init__(self, *, key: str | None = None, maxlen: int | None = None) -> None:
+        self._key = key or EVENT_STREAM_KEY
+        self._maxlen = maxlen or EVENT_STREAM_MAXLEN
+        self._known_groups: set[str] = set()
+
+    def _redis(self) -> Any:
+        from app.infra.redis_state import get_redis
+
+        return get_redis()
+
+    @staticmethod
+    def _encode(event: EventEnvelope) -> dict[str, str]:
+        return {"event": event.model_dump_json()}
+
+    @staticmethod
+    def _decode(stream_id: str, fields: dict[str, str]) -> StreamEntry:
+        return StreamEntry(cursor=stream_id, event=EventEnvelope.model_validate_json(fields["event"]))
+
+    @staticmethod
+    def _stream_id_for(ts: datetime) -> str:
+        return f"{int(ts.replace(tzinfo=ts.tzinfo or UTC).timestamp() * 1000)}-0"
+
+    def append(self, events: list[EventEnvelope]) -> None:
+        if not events:
+            return
+        pipeline = self._redis().pipeline(transaction=False)
+        for item in events:
+            pipeline.xadd(self._key, self._encode(item), maxlen=self._maxlen, approximate=True)
+        pipeline.execute()
+
+    def _ensure_group(self, group: str) -> None:
+        if group in self._known_groups:
+            return
+        try:
+            self._redis().xgroup_create(self._key, group, id="0", mkstream=True)
+        except Exception as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+        self._known_groups.add(group)
+
+    def read_group(
+        self,
+        group: str,
+        *,
+        consumer: str = "default",
+        count: int = 100,
+    ) -> list[StreamEntry]:
+        self._ensure_group(group)
+        redis = self._redis()
+        entries: list[StreamEntry] = []
+        for start_id in ("0", ">"):
+            response = redis.xreadgroup(group, consumer, {self._key: start_id}, count=max(count, 1))
+            for _, messages in response or []:
+                entries.extend(self._decode(stream_id, fields) for stream_id, fields in messages)
+            if entries:
+                break
+        return entries
+
+    def ack(self, group: str, entries: list[StreamEntry]) -> None:
+        if entries:
+            self._redis().xack(self._key, group, *[item.cursor for item in entries])
+
+    def _anchor_id(self, since_ts: datetime | None, after_event_id: str | None) -> str:
+        if after_event_id is not None:
+            with Session(db.engine) as session:
+                anchor = session.get(EventRecord, after_event_id)
+            if anchor is None:
+                raise EventStreamError(f"event not found: {after_event_id}")
+            return self._stream_id_for(anchor.ts)
+        if since_ts is not None:
+            return self._stream_id_for(since_ts)
+        return "0"
+
+    def _find_stream_id(self, event_id: str) -> str:
+        start = self._anchor_id(None, event_id)
+        redis = self._redis()
+        while True:
+            batch = redis.xrange(self._key, min=start, max="+", count=500)
+            if not batch:
+                raise EventStreamError(f"event not in stream: {event_id}")
+            for stream_id, fields in batch:
+                if self._decode(stream_id, fields).event.event_id == event_id:
+                    return str(stream_id)
+            start = f"({batch[-1][0]}"
+
+    def seek_group(
+        self,
+        group: str,
+        *,
+        since_ts: datetime | None = None,
+        after_event_id: str | None = None,
+    ) -> None:
+        self._ensure_group(group)
+        if after_event_id is not None:
+            last_delivered = self._find_stream_id(after_event_id)
+        elif since_ts is not None:
+            millis = int(self._stream_id_for(since_ts).split("-", 1)[0])
+            last_delivered = f"{max(millis - 1, 0)}-0"
+        else:
+            last_delivered = "0"
+        self._redis().xgroup_setid(self._key, group, id=last_delivered)
+
+    def replay(
+        self,
+        *,
+        since_ts: datetime | None = None,
+        after_event_id: str | None = None,
+        tenant_id: str | None = None,
+        event_types: list[str] | None = None,
+        limit: int = 500,
+    ) -> list[StreamEntry]:
+        redis = self._redis()
+        start = self._anchor_id(since_ts, after_event_id)
+        skipping = after_event_id is not None
+        wanted_types = set(event_types or [])
+        entries: list[StreamEntry] = []
+        while len(entries) < limit:
+            batch = redis.xrange(self._key, min=start, max="+", count=max(limit, 100))
+            if not batch:
+                break
+            for stream_id, fields in batch:
+                entry = self._decode(stream_id, fields)
+                if skipping:
+                    if entry.event.event_id == after_event_id:
+                        skipping = False
+                    continue
+                if tenant_id is not None and entry.event.tenant_id != tenant_id:
+                    continue
+                if wanted_types and entry.event.event_type not in wanted_types:
+                    continue
+                entries.append(entry)
+                if len(entries) >= limit:
+                    break
+            start = f"({batch[-1][0]}"
+        return entries
+
+
+def consume_group(
+    stream: EventStream,
+    group: str,
+    handler: Callable[[EventEnvelope], None],
+    *,
+    consumer: str = "default",
+    count: int = 100,
+) -> int:
+    """Deliver one batch to ``handler`` and ack the prefix that was handled successfully."""
+    entries = stream.read_group(group, consumer=consumer, count=count)
+    handled: list[StreamEntry] = []
+    try:
+        for entry in entries:
+            handler(entry.event)
+            handled.append(entry)
+    finally:
+        stream.ack(group, handled)
+    return len(handled)
+
+
+@lru_cache(maxsize=1)
+def get_event_stream() -> EventStream:
+    if EVENT_STREAM_BACKEND == "redis":
+        return RedisEventStream()
+    return SqlEventStream()
@@ -1,20 +1,69 @@
 from __future__ import annotations
 
+import os
+import threading
 from collections import defaultdict
 from collections.abc import Callable
 from typing import Any
 
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session as OrmSession
 from sqlmodel import Session
 
 from app.domain.models import EventEnvelope, EventRecord
 from app.infra.db import engine
+from app.infra.event_stream import EventStream, get_event_stream
 
 EventHandler = Callable[[EventEnvelope], None]
 
+EVENT_OUTBOX_BATCH_SIZE = int(os.getenv("EVENT_OUTBOX_BATCH_SIZE", "200"))
+EVENT_OUTBOX_FLUSH_INTERVAL_SECONDS = float(os.getenv("EVENT_OUTBOX_FLUSH_INTERVAL_SECONDS", "0.2"))
+SESSION_OUTBOX_KEY = "event_outbox"
+
+
+def _to_record(event: EventEnvelope) -> EventRecord:
+    return EventRecord(
+        event_id=event.event_id,
+        event_type=event.event_type,
+        tenant_id=event.tenant_id,
+        ts=event.ts,
+        actor_id=event.actor_id,
+        correlation_id=event.correlation_id,
+        payload=event.payload,
+    )
+
 
 class EventBus:
-    def __init__(self) -> None:
+    """Event outbox.
+
+    Events published with a session join the caller's transaction and are dispatched
+    after it commits. Events published without one are buffered and bulk-inserted by
+    the background flusher; when the flusher is not running they are flushed inline.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int | None = None,
+        flush_interval_seconds: float | None = None,
+        stream: EventStream | None = None,
+    ) -> None:
         self._subscribers: dict[str, list[EventHandler]] = defaultdict(list)
+        self._batch_size = max(batch_size or EVENT_OUTBOX_BATCH_SIZE, 1)
+        self._flush_interval_seconds = max(
+            flush_interval_seconds or EVENT_OUTBOX_FLUSH_INTERVAL_SECONDS,
+            0.01,
+        )
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._buffer: list[EventEnvelope] = []
+        self._committed: list[EventEnvelope] = []
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self._handler_errors = 0
+        self._stream = stream
+        self._stream_errors = 0
 
     def subscribe(self, event_type: str, handler: EventHandler) -> None:
         self._subscribers[event_type].append(handler)
@@ -23,40 +72,143 @@ class EventBus:
         if event_type in self._subscribers and handler in self._subscribers[event_type]:
             self._subscribers[event_type].remove(handler)
 
+    @property
+    def is_running(self) -> bool:
+        return self._flusher is not None and self._flusher.is_alive()
+
     def publish(self, event: EventEnvelope, session: Session | None = None) -> None:
-        should_commit = session is None
-        if session is None:
-            session = Session(engine)
-        try:
-            record = EventRecord(
-                event_id=event.event_id,
-                event_type=event.event_type,
-                tenant_id=event.tenant_id,
-                ts=event.ts,
-                actor_id=event.actor_id,
-                correlation_id=event.correlation_id,
-                payload=event.payload,
-            )
-            session.add(record)
-            if should_commit:
-                session.commit()
-        finally:
-            if should_commit:
-                session.close()
-
-        handlers = [*self._subscribers.get(event.event_type, []), *self._subscribers.get("*", [])]
-        for handler in handlers:
-            handler(event)
-
-    def publish_dict(self, event_type: str, tenant_id: str, payload: dict[str, Any]) -> EventEnvelope:
+        if session is not None:
+            self._enlist(session, event)
+            return
+        with self._lock:
+            self._buffer.append(event)
+            buffered = len(self._buffer)
+        if not self.is_running:
+            self.flush()
+            return
+        if buffered >= self._batch_size:
+            self._wakeup.set()
+
+    def publish_dict(
+        self,
+        event_type: str,
+        tenant_id: str,
+        payload: dict[str, Any],
+        *,
+        session: Session | None = None,
+    ) -> EventEnvelope:
         event = EventEnvelope(
             event_type=event_type,
             tenant_id=tenant_id,
             payload=payload,
         )
-        self.publish(event)
+        self.publish(event, session=session)
         return event
 
+    def _enlist(self, session: Session, event: EventEnvelope) -> None:
+        session.add(_to_record(event))
+        session.info.setdefault(SESSION_OUTBOX_KEY, []).append((self, event))
 
-event_bus = EventBus()
+    def _append_to_stream(self, events: list[EventEnvelope]) -> None:
+        if not events:
+            return
+        stream = self._stream or get_event_stream()
+        try:
+            stream.append(events)
+        except Exception:
+            # The events table stays the source of truth; stream consumers can replay from it.
+            self._stream_errors += 1
+
+    def _committed_events(self, events: list[EventEnvelope]) -> None:
+        self._append_to_stream(events)
+        if not self.is_running:
+            self._dispatch(events)
+            return
+        with self._lock:
+            self._committed.extend(events)
+        self._wakeup.set()
 
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+                committed, self._committed = self._committed, []
+            if batch:
+                try:
+                    with Session(engine) as session:
+                        session.add_all([_to_record(item) for item in batch])
+                        session.commit()
+                except Exception:
+                    with self._lock:
+                        self._buffer[:0] = batch
+                    raise
+                self._append_to_stream(batch)
+            self._dispatch([*committed, *batch])
+            return len(batch)
+
+    def _dispatch(self, events: list[EventEnvelope]) -> None:
+        for item in events:
+            handlers = [*self._subscribers.get(item.event_type, []), *self._subscribers.get("*", [])]
+            for handler in handlers:
+                try:
+                    handler(item)
+                except Exception:
+                    # A failing subscriber must not block other subscribers or the outbox.
+                    self._handler_errors += 1
+
+    def stats(self) -> dict[str, int | bool]:
+        with self._lock:
+            buffered = len(self._buffer)
+            committed = len(self._committed)
+        return {
+            "running": self.is_running,
+            "buffered": buffered,
+            "pending_dispatch": committed,
+            "handler_errors": self._handler_errors,
+            "stream_errors": self._stream_errors,
+        }
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stopping.clear()
+        self._flusher = threading.Thread(target=self._run, name="event-outbox-flusher", daemon=True)
+        self._flusher.start()
+
+    def stop(self) -> None:
+        flusher = self._flusher
+        if flusher is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        flusher.join()
+        self._flusher = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self._flush_interval_seconds)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                # Keep buffered events for the next cycle while the database is unavailable.
+                continue
+
+
+@sa_event.listens_for(OrmSession, "after_commit")
+def _dispatch_session_outbox(session: OrmSession) -> None:
+    enlisted: list[tuple[EventBus, EventEnvelope]] = session.info.pop(SESSION_OUTBOX_KEY, [])
+    by_bus: dict[EventBus, list[EventEnvelope]] = {}
+    for bus, item in enlisted:
+        by_bus.setdefault(bus, []).append(item)
+    for bus, items in by_bus.items():
+        bus._committed_events(items)
+
+
+@sa_event.listens_for(OrmSession, "after_rollback")
+def _discard_session_outbox(session: OrmSession) -> None:
+    session.info.pop(SESSION_OUTBOX_KEY, None)
+
+
+event_bus = EventBus()
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any, TypeVar
+
+from sqlalchemy import and_, func, or_
+from sqlmodel import Session, select
+from sqlmodel.sql.expression import SelectOfScalar
+
+PAGINATION_DEFAULT_LIMIT = int(os.getenv("PAGINATION_DEFAULT_LIMIT", "100"))
+PAGINATION_MAX_LIMIT = int(os.getenv("PAGINATION_MAX_LIMIT", "500"))
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+@dataclass
+class PageRequest:
+    """Keyset page over (sort_key, id), newest first.
+
+    `next_cursor` and `total` are filled in by the paginate helpers.
+    """
+
+    limit: int = PAGINATION_DEFAULT_LIMIT
+    cursor: str | None = None
+    include_total: bool = False
+    next_cursor: str | None = None
+    total: int | None = None
+
+    def __post_init__(self) -> None:
+        self.limit = max(self.limit, 1)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and isinstance(value.get("dt"), str):
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(sort_value: Any, row_id: str) -> str:
+    raw = json.dumps([_encode_value(sort_value), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise InvalidCursorError("invalid cursor") from exc
+    if not isinstance(row_id, str):
+        raise InvalidCursorError("invalid cursor")
+    try:
+        return _decode_value(sort_value), row_id
+    except ValueError as exc:
+        raise InvalidCursorError("invalid cursor") from exc
+
+
+def _coerce_datetime(value: Any, *, aware: bool) -> datetime:
+    if not isinstance(value, datetime):
+        raise InvalidCursorError("invalid cursor")
+    if aware:
+        # Naive cursor values are UTC, like every timestamp the platform writes.
+        return value.replace(tzinfo=UTC) if value.tzinfo is None else value
+    return value if value.tzinfo is None else value.astimezone(UTC).replace(tzinfo=None)
+
+
+def _coerce_sort_value(value: Any, reference: Any) -> Any:
+    """Check a decoded cursor value against a sort key of the rows being paged."""
+    if isinstance(reference, datetime):
+        return _coerce_datetime(value, aware=reference.tzinfo is not None)
+    if isinstance(reference, Enum):
+        try:
+            return type(reference)(value)
+        except ValueError as exc:
+            raise InvalidCursorError("invalid cursor") from exc
+    if isinstance(reference, bool) or isinstance(value, bool):
+        if type(value) is not type(reference):
+            raise InvalidCursorError("invalid cursor")
+        return value
+    if isinstance(reference, int | float):
+        if not isinstance(value, int | float):
+            raise InvalidCursorError("invalid cursor")
+        return value
+    if isinstance(reference, str) and not isinstance(value, str):
+        raise InvalidCursorError("invalid cursor")
+    return value
+
+
+def _coerce_column_value(value: Any, sort_column: Any) -> Any:
+    """Check a decoded cursor value against the SQL type of the sort column."""
+    column_type = sort_column.type
+    try:
+        python_type = column_type.python_type
+    except NotImplementedError:
+        return value
+    if issubclass(python_type, datetime):
+        # Aware UTC binds compare correctly against timestamptz and SQLite's naive UTC text.
+        return _coerce_datetime(value, aware=True).astimezone(UTC)
+    if issubclass(python_type, Enum):
+        try:
+            return python_type(value)
+        except ValueError as exc:
+            raise InvalidCursorError("invalid cursor") from exc
+    if issubclass(python_type, int | float) and not issubclass(python_type, bool):
+        if isinstance(value, bool) or not isinstance(value, int | float):
+            raise InvalidCursorError("invalid cursor")
+        return value
+    if not isinstance(value, python_type):
+        raise InvalidCursorError("invalid cursor")
+    return value
+
+
+def paginate_query(
+    session: Session,
+    statement: SelectOfScalar[T],
+    page: PageRequest | None,
+    *,
+    sort_column: Any,
+    id_column: Any,
+) -> list[T]:
+    """Execute `statement`, applying the keyset page when one is requested.
+
+    Without a page the statement runs unchanged so existing callers keep their ordering.
+    A cursor whose sort value does not fit `sort_column` raises `InvalidCursorError`.
+    """
+    if page is None:
+        return list(session.exec(statement).all())
+    if page.include_total:
+        count_statement = select(func.count()).select_from(statement.order_by(None).subquery())
+        page.total = int(session.exec(count_statement).one())
+    if page.cursor is not None:
+        sort_value, last_id = decode_cursor(page.cursor)
+        sort_value = _coerce_column_value(sort_value, sort_column)
+        statement = statement.where(
+            or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, id_column < last_id),
+            )
+        )
+    statement = statement.order_by(None).order_by(sort_column.desc(), id_column.desc())
+    rows = list(session.exec(statement.limit(page.limit + 1)).all())
+    page.next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        last = rows[-1]
+        page.next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    return rows
+
+
+def paginate_items(
+    items: Iterable[T],
+    page: PageRequest | None,
+    *,
+    sort_key: Callable[[T], Any],
+    id_key: Callable[[T], str],
+) -> list[T]:
+    """In-memory counterpart of `paginate_query` for lists assembled in Python."""
+    rows = list(items)
+    if page is None:
+        return rows
+    if page.include_total:
+        page.total = len(rows)
+    rows.sort(key=lambda item: (sort_key(item), id_key(item)), reverse=True)
+    if page.cursor is not None and rows:
+        sort_value, last_id = decode_cursor(page.cursor)
+        sort_value = _coerce_sort_value(sort_value, sort_key(rows[0]))
+        rows = [item for item in rows if (sort_key(item), id_key(item)) < (sort_value, last_id)]
+    page.next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        last = rows[-1]
+        page.next_cursor = encode_cursor(sort_key(last), id_key(last))
+    return rows
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import suppress
+from functools import lru_cache
+from typing import Any, Generic, Protocol, TypeVar
+
+from app.infra import redis_state
+
+# Empty means `redis` when REDIS_URL is configured and `memory` otherwise: only Redis shares
+# version bumps across workers, so memory stays opt-in for single-process runs.
+POLICY_CACHE_BACKEND = os.getenv("POLICY_CACHE_BACKEND", "").strip().lower()
+POLICY_CACHE_TTL_SECONDS = float(os.getenv("POLICY_CACHE_TTL_SECONDS", "30"))
+POLICY_CACHE_MAX_ENTRIES = int(os.getenv("POLICY_CACHE_MAX_ENTRIES", "10000"))
+POLICY_CACHE_KEY_PREFIX = os.getenv("POLICY_CACHE_KEY_PREFIX", "policy-cache")
+
+T = TypeVar("T")
+
+
+class PolicyCacheBackend(Protocol):
+    def version(self, tenant_id: str) -> int: ...
+
+    def bump(self, tenant_id: str) -> int: ...
+
+    def get(self, namespace: str, tenant_id: str, key: str) -> tuple[int, str] | None: ...
+
+    def set(
+        self,
+        namespace: str,
+        tenant_id: str,
+        key: str,
+        version: int,
+        payload: str,
+        ttl_seconds: float,
+    ) -> None: ...
+
+
+class NullPolicyCacheBackend:
+    def version(self, tenant_id: str) -> int:
+        return 0
+
+    def bump(self, tenant_id: str) -> int:
+        return 0
+
+    def get(self, namespace: str, tenant_id: str, key: str) -> tuple[int, str] | None:
+        return None
+
+    def set(
+        self,
+        namespace: str,
+        tenant_id: str,
+        key: str,
+        version: int,
+        payload: str,
+        ttl_seconds: float,
+    ) -> None:
+        return None
+
+
+class MemoryPolicyCacheBackend:
+    """Process-local backend; other workers only see a bump once their entries expire."""
+
+    def __init__(self, *, max_entries: int | None = None) -> None:
+        self._max_entries = max(max_entries or POLICY_CACHE_MAX_ENTRIES, 1)
+        self._lock = threading.Lock()
+        self._versions: dict[str, int] = {}
+        self._entries: OrderedDict[tuple[str, str, str], tuple[float, int, str]] = OrderedDict()
+
+    def version(self, tenant_id: str) -> int:
+        with self._lock:
+            return self._versions.get(tenant_id, 0)
+
+    def bump(self, tenant_id: str) -> int:
+        with self._lock:
+            version = self._versions.get(tenant_id, 0) + 1
+            self._versions[tenant_id] = version
+            return version
+
+    def get(self, namespace: str, tenant_id: str, key: str) -> tuple[int, str] | None:
+        entry_key = (namespace, tenant_id, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                return None
+            expires_at, version, payload = entry
+            if expires_at <= time.monotonic():
+                del self._entries[entry_key]
+                return None
+            self._entries.move_to_end(entry_key)
+            return version, payload
+
+    def set(
+        self,
+        namespace: str,
+        tenant_id: str,
+        key: str,
+        version: int,
+        payload: str,
+        ttl_seconds: float,
+    ) -> None:
+        entry_key = (namespace, tenant_id, key)
+        with self._lock:
+            self._entries[entry_key] = (time.monotonic() + ttl_seconds, version, payload)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+class RedisPolicyCacheBackend:
+    """Shared backend: the tenant version and cached entries live in Redis."""
+
+    def __init__(self, *, key_prefix: str | None = None) -> None:
+        self._key_prefix = key_prefix or POLICY_CACHE_KEY_PREFIX
+
+    def _redis(self) -> Any:
+        return redis_state.get_redis()
+
+    def _version_key(self, tenant_id: str) -> str:
+        return f"{self._key_prefix}:version:{tenant_id}"
+
+    def _entry_key(self, namespace: str, tenant_id: str, key: str) -> str:
+        return f"{self._key_prefix}:{namespace}:{tenant_id}:{key}"
+
+    def version(self, tenant_id: str) -> int:
+        raw = self._redis().get(self._version_key(tenant_id))
+        return int(raw) if raw is not None else 0
+
+    def bump(self, tenant_id: str) -> int:
+        return int(self._redis().incr(self._version_key(tenant_id)))
+
+    def get(self, namespace: str, tenant_id: str, key: str) -> tuple[int, str] | None:
+        raw = self._redis().get(self._entry_key(namespace, tenant_id, key))
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return int(data["version"]), str(data["payload"])
+
+    def set(
+        self,
+        namespace: str,
+        tenant_id: str,
+        key: str,
+        version: int,
+        payload: str,
+        ttl_seconds: float,
+    ) -> None:
+        self._redis().set(
+            self._entry_key(namespace, tenant_id, key),
+            json.dumps({"version": version, "payload": payload}),
+            px=max(int(ttl_seconds * 1000), 1),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_policy_cache_backend() -> PolicyCacheBackend:
+    backend = POLICY_CACHE_BACKEND or ("redis" if os.getenv("REDIS_URL", "").strip() else "memory")
+    if backend == "redis":
+        return RedisPolicyCacheBackend()
+    if backend == "off":
+        return NullPolicyCacheBackend()
+    return MemoryPolicyCacheBackend()
+
+
+def bump_policy_version(tenant_id: str) -> None:
+    """Invalidate every cached authorization artifact of the tenant."""
+    try:
+        get_policy_cache_backend().bump(tenant_id)
+    except Exception:
+        # Entries still expire after the TTL when the cache backend is unreachable.
+        return
+
+
+class PolicyCache(Generic[T]):
+    """Per-tenant cache whose entries are only valid for the tenant's current policy version."""
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        dump: Callable[[T], str],
+        load: Callable[[str], T],
+        backend: PolicyCacheBackend | None = None,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        self._namespace = namespace
+        self._dump = dump
+        self._load = load
+        self._backend = backend
+        self._ttl_seconds = POLICY_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+
+    @property
+    def backend(self) -> PolicyCacheBackend:
+        return self._backend or get_policy_cache_backend()
+
+    def get_or_load(self, tenant_id: str, key: str, loader: Callable[[], T]) -> T:
+        if self._ttl_seconds <= 0:
+            return loader()
+        backend = self.backend
+        try:
+            # Read the version before loading so a concurrent bump marks this entry stale.
+            version = backend.version(tenant_id)
+            cached = backend.get(self._namespace, tenant_id, key)
+        except Exception:
+            return loader()
+        if cached is not None and cached[0] == version:
+            try:
+                return self._load(cached[1])
+            except (KeyError, TypeError, ValueError):
+                pass
+        value = loader()
+        # Caching is best effort; the loaded value is still correct.
+        with suppress(Exception):
+            backend.set(self._namespace, tenant_id, key, version, self._dump(value), self._ttl_seconds)
+        return value
+
+    def get_many_or_load(
+        self,
+        tenant_id: str,
+        keys: list[str],
+        loader: Callable[[list[str]], dict[str, T]],
+    ) -> dict[str, T]:
+        """Bulk `get_or_load`: `loader` is called once with every key that missed."""
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return {}
+        if self._ttl_seconds <= 0:
+            return loader(unique_keys)
+        backend = self.backend
+        try:
+            version = backend.version(tenant_id)
+            cached = {key: backend.get(self._namespace, tenant_id, key) for key in unique_keys}
+        except Exception:
+            return loader(unique_keys)
+        result: dict[str, T] = {}
+        missing: list[str] = []
+        for key in unique_keys:
+            entry = cached[key]
+            if entry is not None and entry[0] == version:
+                try:
+                    result[key] = self._load(entry[1])
+                    continue
+                except (KeyError, TypeError, ValueError):
+                    pass
+            missing.append(key)
+        if missing:
+            loaded = loader(missing)
+            for key, value in loaded.items():
+                result[key] = value
+                with suppress(Exception):
+                    backend.set(
+                        self._namespace,
+                        tenant_id,
+                        key,
+                        version,
+                        self._dump(value),
+                        self._ttl_seconds,
+                    )
+        return {key: result[key] for key in unique_keys if key in result}
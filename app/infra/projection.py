@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from enum import Enum
+from functools import cache
+from typing import Any
+
+from sqlalchemy import JSON, Text, cast, false, func, or_
+from sqlalchemy.orm import class_mapper, defer
+from sqlalchemy.orm.strategy_options import _AbstractLoad
+from sqlalchemy.sql.elements import ColumnElement
+from sqlmodel import Session, SQLModel, col, select
+
+
+@cache
+def json_column_names(model: type[SQLModel]) -> tuple[str, ...]:
+    return tuple(
+        attr.key for attr in class_mapper(model).column_attrs if isinstance(attr.columns[0].type, JSON)
+    )
+
+
+def without_json(model: type[SQLModel]) -> list[_AbstractLoad]:
+    """Loader options that skip the model's JSON columns.
+
+    Deferred attributes are loaded on first access while the session is open, so only use
+    this when the caller never touches the blobs; services close their sessions before
+    routers serialize rows.
+    """
+    return [defer(getattr(model, name)) for name in json_column_names(model)]
+
+
+def count_rows(session: Session, model: type[SQLModel], *criteria: Any) -> int:
+    statement = select(func.count()).select_from(model)
+    for criterion in criteria:
+        statement = statement.where(criterion)
+    return int(session.exec(statement).one())
+
+
+def supports_json_search(session: Session) -> bool:
+    """Whether JSON text search can run in SQL.
+
+    Postgres renders JSONB as plain text; SQLite stores JSON with ASCII escapes, so
+    non-ASCII topics would not match there and the filter stays in Python.
+    """
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def enum_members_containing(enum_type: type[Enum], needle: str) -> list[Enum]:
+    return [member for member in enum_type if needle in str(member.value).lower()]
+
+
+def json_text_contains(value: Any, needle: str) -> bool:
+    """Python side of the JSON topic match; `needle` is lower-cased.
+
+    Searches the JSON text the way Postgres renders JSONB (`", "`/`": "` separators,
+    unescaped non-ASCII), so `topic_clause` never drops a row this check would keep.
+    """
+    return needle in json.dumps(value, ensure_ascii=False, default=str).lower()
+
+
+def topic_clause(
+    enum_column: Any,
+    enum_type: type[Enum],
+    needle: str,
+    *,
+    text_columns: Iterable[Any] = (),
+    json_columns: Iterable[Any] = (),
+) -> ColumnElement[bool]:
+    """SQL counterpart of the case-insensitive topic filters; `needle` is lower-cased.
+
+    JSON columns match on their text form, like `json_text_contains`.
+    """
+    members = enum_members_containing(enum_type, needle)
+    conditions: list[ColumnElement[bool]] = [col(enum_column).in_(members) if members else false()]
+    conditions.extend(func.lower(column).contains(needle, autoescape=True) for column in text_columns)
+    conditions.extend(
+        func.lower(cast(column, Text)).contains(needle, autoescape=True) for column in json_columns
+    )
+    return or_(*conditions)
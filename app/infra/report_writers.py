@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import csv
+import io
+import re
+import shutil
+import textwrap
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any, BinaryIO, Protocol
+from zipfile import ZIP_DEFLATED, ZipFile
+
+# Letter page, 10pt Helvetica with 14pt leading from y=760 down to the bottom margin.
+PDF_LINES_PER_PAGE = 50
+PDF_LINE_CHARS = 100
+
+_PDF_CATALOG = 1
+_PDF_PAGES = 2
+_PDF_FONT = 3
+_PDF_FIRST_BODY_OBJECT = 4
+_PDF_OBJECT_LINE = re.compile(rb"^(\d+) 0 obj\b")
+
+
+class ReportWriter(Protocol):
+    """Renders report rows to a part file that can be checkpointed and resumed.
+
+    Everything up to `checkpoint()["bytes_written"]` is final on disk; a resumed writer
+    truncates the part file back to that size and continues from the saved state.
+    """
+
+    suffix: str
+
+    def write_rows(self, rows: Iterable[Sequence[str]]) -> None: ...
+
+    def checkpoint(self) -> dict[str, Any]: ...
+
+    def finish(self, header_lines: Sequence[str], output_path: Path) -> None: ...
+
+    def close(self) -> None: ...
+
+
+def _open_part(part_path: Path, bytes_written: int) -> BinaryIO:
+    handle = part_path.open("r+b" if part_path.exists() else "w+b")
+    handle.truncate(bytes_written)
+    handle.seek(bytes_written)
+    return handle
+
+
+def _text_line(columns: Sequence[str], row: Sequence[str]) -> str:
+    return "- " + " ".join(f"{name}={value}" for name, value in zip(columns, row, strict=True))
+
+
+class PdfReportWriter:
+    """Paginated PDF appended to disk one page at a time.
+
+    Body pages are written as soon as they fill up. The header pages, page tree, catalog
+    and xref table are appended by `finish`, so the header can carry totals that are only
+    known once every row has been streamed; header pages still come first in reading order.
+    """
+
+    suffix = "pdf"
+
+    def __init__(
+        self,
+        part_path: Path,
+        columns: Sequence[str],
+        state: dict[str, Any] | None = None,
+        *,
+        heading: str | None = None,
+    ) -> None:
+        self._columns = tuple(columns)
+        self._part_path = part_path
+        self._bytes_written = int((state or {}).get("bytes_written", 0))
+        self._next_object = int((state or {}).get("next_object", _PDF_FIRST_BODY_OBJECT))
+        self._pending: list[str] = list((state or {}).get("pending_lines", []))
+        self._handle = _open_part(part_path, self._bytes_written)
+        if state is None:
+            self._write(b"%PDF-1.4\n")
+            if heading is not None:
+                self._append_lines([heading])
+
+    def _write(self, data: bytes) -> None:
+        self._handle.write(data)
+        self._bytes_written += len(data)
+
+    @staticmethod
+    def _wrap(line: str) -> list[str]:
+        flat = line.replace("\r", " ").replace("\n", " ")
+        return textwrap.wrap(flat, PDF_LINE_CHARS, drop_whitespace=False) or [""]
+
+    @staticmethod
+    def _escape(line: str) -> bytes:
+        escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+        return escaped.encode("latin-1", errors="replace")
+
+    def _write_page(self, lines: Sequence[str]) -> int:
+        content_id = self._next_object
+        page_id = content_id + 1
+        self._next_object += 2
+        stream = bytearray(b"BT /F1 10 Tf 14 TL 50 760 Td\n")
+        for line in lines:
+            stream.extend(b"(" + self._escape(line) + b") Tj T*\n")
+        stream.extend(b"ET")
+        self._write(
+            f"{content_id} 0 obj << /Length {len(stream)} >> stream\n".encode("ascii")
+            + bytes(stream)
+            + b"\nendstream endobj\n"
+        )
+        self._write(
+            (
+                f"{page_id} 0 obj << /Type /Page /Parent {_PDF_PAGES} 0 R /MediaBox [0 0 612 792] "
+                f"/Resources << /Font << /F1 {_PDF_FONT} 0 R >> >> /Contents {content_id} 0 R >> endobj\n"
+            ).encode("ascii")
+        )
+        return page_id
+
+    def _append_lines(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self._pending.extend(self._wrap(line))
+        while len(self._pending) >= PDF_LINES_PER_PAGE:
+            self._write_page(self._pending[:PDF_LINES_PER_PAGE])
+            del self._pending[:PDF_LINES_PER_PAGE]
+
+    def write_rows(self, rows: Iterable[Sequence[str]]) -> None:
+        self._append_lines(_text_line(self._columns, row) for row in rows)
+        self._handle.flush()
+
+    def checkpoint(self) -> dict[str, Any]:
+        return {
+            "bytes_written": self._bytes_written,
+            "next_object": self._next_object,
+            "pending_lines": list(self._pending),
+        }
+
+    def finish(self, header_lines: Sequence[str], output_path: Path) -> None:
+        if self._pending:
+            self._write_page(self._pending)
+            self._pending = []
+        body_pages = list(range(_PDF_FIRST_BODY_OBJECT + 1, self._next_object, 2))
+        header = [wrapped for line in header_lines for wrapped in self._wrap(line)] or [""]
+        header_pages = [
+            self._write_page(header[start : start + PDF_LINES_PER_PAGE])
+            for start in range(0, len(header), PDF_LINES_PER_PAGE)
+        ]
+        kids = " ".join(f"{page_id} 0 R" for page_id in header_pages + body_pages)
+        self._write(
+            f"{_PDF_FONT} 0 obj << /Type /Font /Subtype /Type1 /BaseFont /Helvetica >> endobj\n".encode("ascii")
+        )
+        self._write(
+            (
+                f"{_PDF_PAGES} 0 obj << /Type /Pages /Kids [{kids}] "
+                f"/Count {len(header_pages) + len(body_pages)} >> endobj\n"
+            ).encode("ascii")
+        )
+        self._write(f"{_PDF_CATALOG} 0 obj << /Type /Catalog /Pages {_PDF_PAGES} 0 R >> endobj\n".encode("ascii"))
+        self._handle.flush()
+
+        offsets = self._object_offsets()
+        self._handle.seek(self._bytes_written)
+        size = self._next_object
+        xref = bytearray(f"xref\n0 {size}\n".encode("ascii"))
+        xref.extend(b"0000000000 65535 f \n")
+        for object_id in range(1, size):
+            xref.extend(f"{offsets[object_id]:010d} 00000 n \n".encode("ascii"))
+        xref_pos = self._bytes_written
+        self._write(bytes(xref))
+        self._write(f"trailer << /Size {size} /Root {_PDF_CATALOG} 0 R >>\nstartxref\n{xref_pos}\n%%EOF\n".encode("ascii"))
+        self.close()
+        self._part_path.replace(output_path)
+
+    def _object_offsets(self) -> dict[int, int]:
+        # Rescanning the part file keeps the checkpoint small; content lines never start
+        # with digits, so only object headers match.
+        offsets: dict[int, int] = {}
+        self._handle.seek(0)
+        position = 0
+        for line in self._handle:
+            matched = _PDF_OBJECT_LINE.match(line)
+            if matched is not None:
+                offsets[int(matched.group(1))] = position
+            position += len(line)
+        return offsets
+
+    def close(self) -> None:
+        if not self._handle.closed:
+            self._handle.close()
+
+
+_DOCX_NAMESPACES = (
+    "xmlns:wpc=\"http://schemas.microsoft.com/office/word/2010/wordprocessingCanvas\" "
+    "xmlns:mc=\"http://schemas.openxmlformats.org/markup-compatibility/2006\" "
+    "xmlns:o=\"urn:schemas-microsoft-com:office:office\" "
+    "xmlns:r=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships\" "
+    "xmlns:m=\"http://schemas.openxmlformats.org/officeDocument/2006/math\" "
+    "xmlns:v=\"urn:schemas-microsoft-com:vml\" "
+    "xmlns:wp14=\"http://schemas.microsoft.com/office/word/2010/wordprocessingDrawing\" "
+    "xmlns:wp=\"http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing\" "
+    "xmlns:w10=\"urn:schemas-microsoft-com:office:word\" "
+    "xmlns:w=\"http://schemas.openxmlformats.org/wordprocessingml/2006/main\" "
+    "xmlns:w14=\"http://schemas.microsoft.com/office/word/2010/wordml\" "
+    "xmlns:wpg=\"http://schemas.microsoft.com/office/word/2010/wordprocessingGroup\" "
+    "xmlns:wpi=\"http://schemas.microsoft.com/office/word/2010/wordprocessingInk\" "
+    "xmlns:wne=\"http://schemas.microsoft.com/office/word/2006/wordml\" "
+    "xmlns:wps=\"http://schemas.microsoft.com/office/word/2010/wordprocessingShape\" "
+    "mc:Ignorable=\"w14 wp14\""
+)
+_DOCX_CONTENT_TYPES = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    "<Types xmlns=\"http://schemas.openxmlformats.org/package/2006/content-types\">"
+    "<Default Extension=\"rels\" ContentType=\"application/vnd.openxmlformats-package.relationships+xml\"/>"
+    "<Default Extension=\"xml\" ContentType=\"application/xml\"/>"
+    "<Override PartName=\"/word/document.xml\" "
+    "ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml\"/>"
+    "</Types>"
+)
+_DOCX_PACKAGE_RELS = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    "<Relationships xmlns=\"http://schemas.openxmlformats.org/package/2006/relationships\">"
+    "<Relationship Id=\"rId1\" "
+    "Type=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument\" "
+    "Target=\"word/document.xml\"/>"
+    "</Relationships>"
+)
+_DOCX_DOCUMENT_RELS = (
+    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+    "<Relationships xmlns=\"http://schemas.openxmlformats.org/package/2006/relationships\"/>"
+)
+_DOCX_SECTION = (
+    "<w:sectPr><w:pgSz w:w=\"12240\" w:h=\"15840\"/>"
+    "<w:pgMar w:top=\"1440\" w:right=\"1440\" w:bottom=\"1440\" w:left=\"1440\" "
+    "w:header=\"708\" w:footer=\"708\" w:gutter=\"0\"/></w:sectPr>"
+)
+
+
+def docx_paragraph(line: str) -> str:
+    escaped = line.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return f"<w:p><w:r><w:t xml:space=\"preserve\">{escaped}</w:t></w:r></w:p>"
+
+
+def write_docx(path: Path, header_lines: Sequence[str], body_path: Path | None = None) -> None:
+    """Package a .docx whose body is the header paragraphs plus a pre-rendered fragment.
+
+    The fragment file is copied into the archive in blocks, never loaded whole.
+    """
+    with ZipFile(path, mode="w", compression=ZIP_DEFLATED) as docx:
+        docx.writestr("[Content_Types].xml", _DOCX_CONTENT_TYPES)
+        docx.writestr("_rels/.rels", _DOCX_PACKAGE_RELS)
+        docx.writestr("word/_rels/document.xml.rels", _DOCX_DOCUMENT_RELS)
+        with docx.open("word/document.xml", mode="w", force_zip64=True) as document:
+            document.write(
+                (
+                    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+                    f"<w:document {_DOCX_NAMESPACES}><w:body>"
+                ).encode()
+            )
+            document.write("".join(docx_paragraph(line) for line in header_lines or [""]).encode())
+            if body_path is not None:
+                with body_path.open("rb") as body:
+                    shutil.copyfileobj(body, document)
+            document.write(f"{_DOCX_SECTION}</w:body></w:document>".encode())
+
+
+class DocxReportWriter:
+    """Streams body paragraphs to an XML fragment; `finish` packages it behind the header."""
+
+    suffix = "docx"
+
+    def __init__(
+        self,
+        part_path: Path,
+        columns: Sequence[str],
+        state: dict[str, Any] | None = None,
+        *,
+        heading: str | None = None,
+    ) -> None:
+        self._columns = tuple(columns)
+        self._part_path = part_path
+        self._bytes_written = int((state or {}).get("bytes_written", 0))
+        self._handle = _open_part(part_path, self._bytes_written)
+        if state is None and heading is not None:
+            self._write_paragraphs([heading])
+
+    def _write_paragraphs(self, lines: Iterable[str]) -> None:
+        data = "".join(docx_paragraph(line) for line in lines).encode()
+        self._handle.write(data)
+        self._bytes_written += len(data)
+
+    def write_rows(self, rows: Iterable[Sequence[str]]) -> None:
+        self._write_paragraphs(_text_line(self._columns, row) for row in rows)
+        self._handle.flush()
+
+    def checkpoint(self) -> dict[str, Any]:
+        return {"bytes_written": self._bytes_written}
+
+    def finish(self, header_lines: Sequence[str], output_path: Path) -> None:
+        self.close()
+        write_docx(output_path, header_lines, self._part_path)
+        self._part_path.unlink()
+
+    def close(self) -> None:
+        if not self._handle.closed:
+            self._handle.close()
+
+
+class CsvReportWriter:
+    """Plain CSV rows under a column header; the report title, body and heading are omitted."""
+
+    suffix = "csv"
+
+    def __init__(
+        self,
+        part_path: Path,
+        columns: Sequence[str],
+        state: dict[str, Any] | None = None,
+        *,
+        heading: str | None = None,
+    ) -> None:
+        self._part_path = part_path
+        self._bytes_written = int((state or {}).get("bytes_written", 0))
+        self._handle = _open_part(part_path, self._bytes_written)
+        if state is None:
+            self._write_csv([columns])
+
+    def _write_csv(self, rows: Iterable[Sequence[str]]) -> None:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        data = buffer.getvalue().encode()
+        self._handle.write(data)
+        self._bytes_written += len(data)
+
+    def write_rows(self, rows: Iterable[Sequence[str]]) -> None:
+        self._write_csv(rows)
+        self._handle.flush()
+
+    def checkpoint(self) -> dict[str, Any]:
+        return {"bytes_written": self._bytes_written}
+
+    def finish(self, header_lines: Sequence[str], output_path: Path) -> None:
+        self.close()
+        self._part_path.replace(output_path)
+
+    def close(self) -> None:
+        if not self._handle.closed:
+            self._handle.close()
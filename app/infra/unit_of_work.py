@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from sqlmodel import Session, SQLModel
+
+from app.infra.db import create_session
+
+T = TypeVar("T")
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+
+class UnitOfWork:
+    """Request-scoped session shared by the services handling one request.
+
+    The first service that borrows the session opens it and it stays open until the
+    request finishes, so rows loaded by one service are served from the session identity
+    map for the next. Services still commit their own work; each commit releases the
+    connection back to the pool until the next statement.
+    """
+
+    def __init__(self, *, read_only: bool = False) -> None:
+        self._read_only = read_only
+        self._session: Session | None = None
+        self._memo: dict[Hashable, Any] = {}
+        self._closed = False
+
+    @property
+    def read_only(self) -> bool:
+        return self._read_only
+
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        if self._closed:
+            # Late callers after the request finished get a short-lived session of their own.
+            with create_session(read_only=self._read_only) as session:
+                yield session
+            return
+        if self._session is None:
+            self._session = create_session(read_only=self._read_only)
+        try:
+            yield self._session
+        except Exception:
+            self._session.rollback()
+            raise
+
+    def memo(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """Compute `loader` once per request for `key`."""
+        if self._closed:
+            return loader()
+        if key not in self._memo:
+            self._memo[key] = loader()
+        value: T = self._memo[key]
+        return value
+
+    def close(self) -> None:
+        self._closed = True
+        self._memo.clear()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+def get_scoped(session: Session, model: type[ModelT], tenant_id: str, row_id: str) -> ModelT | None:
+    """Tenant-scoped primary key lookup, served from the session identity map when loaded."""
+    row = session.get(model, row_id)
+    if row is None or getattr(row, "tenant_id", None) != tenant_id:
+        return None
+    return row
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, SQLModel
+
+
+def _dialect_insert(session: Session, model: type[SQLModel] | Table, rows: Sequence[dict[str, Any]]) -> Any:
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model).values(list(rows))
+    if dialect == "sqlite":
+        return sqlite.insert(model).values(list(rows))
+    raise NotImplementedError(f"upsert is not supported on {dialect}")
+
+
+def upsert_rows(
+    session: Session,
+    model: type[SQLModel] | Table,
+    rows: Sequence[dict[str, Any]],
+    *,
+    conflict_columns: Sequence[str],
+    increment: Sequence[str] = (),
+    replace: Sequence[str] = (),
+    merge: Mapping[str, Callable[[Any, Any], Any]] | None = None,
+) -> None:
+    """INSERT ... ON CONFLICT DO UPDATE for PostgreSQL and SQLite.
+
+    On a conflict `increment` columns are added to the stored value and `replace` columns
+    take the new value, in one statement, so concurrent writers never lose updates.
+    `merge` maps a column to a function of (stored columns, new columns) returning the
+    SQL expression to store; every expression sees the row as it was before the update.
+    """
+    if not rows:
+        return
+    statement = _dialect_insert(session, model, rows)
+    table = model if isinstance(model, Table) else model.__table__  # type: ignore[attr-defined]
+    updates: dict[str, Any] = {name: table.c[name] + statement.excluded[name] for name in increment}
+    updates.update({name: statement.excluded[name] for name in replace})
+    updates.update({name: build(table.c, statement.excluded) for name, build in (merge or {}).items()})
+    session.execute(statement.on_conflict_do_update(index_elements=list(conflict_columns), set_=updates))
+
+
+def insert_missing_rows(
+    session: Session,
+    model: type[SQLModel] | Table,
+    rows: Sequence[dict[str, Any]],
+    *,
+    conflict_columns: Sequence[str],
+    returning: Sequence[str],
+) -> list[Any]:
+    """INSERT ... ON CONFLICT DO NOTHING RETURNING, for PostgreSQL and SQLite.
+
+    Returns the `returning` columns of the rows actually inserted; rows that collide with
+    an existing (or concurrently inserted) row are skipped without an error.
+    """
+    if not rows:
+        return []
+    table = model if isinstance(model, Table) else model.__table__  # type: ignore[attr-defined]
+    statement = (
+        _dialect_insert(session, model, rows)
+        .on_conflict_do_nothing(index_elements=list(conflict_columns))
+        .returning(*[table.c[name] for name in returning])
+    )
+    return list(session.execute(statement).all())
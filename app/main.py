@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.api.routers import (
@@ -34,18 +37,43 @@ from app.api.routers import (
     tenant_purge,
     ui,
 )
-from app.infra.audit import AuditMiddleware
+from app.infra.audit import AuditMiddleware, audit_sink
 from app.infra.db import check_db_ready
+from app.infra.events import event_bus
+from app.infra.pagination import InvalidCursorError
 from app.infra.redis_state import check_redis_ready
+from app.services.command_service import command_ack_tracker, command_adapter_pool
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    event_bus.start()
+    audit_sink.start()
+    try:
+        yield
+    finally:
+        await command_ack_tracker.drain()
+        await command_adapter_pool.close()
+        audit_sink.stop()
+        event_bus.stop()
+
 
 app = FastAPI(
     title="uav-platform",
     description="Monolith + Adapter plugin architecture for UAV operations.",
     version="0.1.0-phase0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(AuditMiddleware)
 
+
+@app.exception_handler(InvalidCursorError)
+async def _invalid_cursor_handler(_: Request, exc: InvalidCursorError) -> JSONResponse:
+    # The cursor shape is checked up front; its sort value only against the rows being paged.
+    return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)})
+
+
 app.include_router(identity.router, prefix="/api/identity", tags=["identity"])
 app.include_router(asset.router, prefix="/api/assets", tags=["assets"])
 app.include_router(
@@ -58,6 +86,7 @@ app.include_router(mission.router, prefix="/api/mission", tags=["mission"])
 app.include_router(telemetry.router, prefix="/api/telemetry", tags=["telemetry"])
 app.include_router(telemetry.ws_router, tags=["telemetry-ws"])
 app.include_router(command.router, prefix="/api/command", tags=["command"])
+app.include_router(command.ws_router, tags=["command-ws"])
 app.include_router(compliance.router, prefix="/api/compliance", tags=["compliance"])
 app.include_router(alert.router, prefix="/api/alert", tags=["alert"])
 app.include_router(outcomes.router, prefix="/api/outcomes", tags=["outcomes"])
@@ -47,7 +47,15 @@ from app.domain.models import (
 )
 from app.infra.db import get_engine
 from app.infra.events import event_bus
+from app.infra.pagination import PageRequest, paginate_query
+from app.infra.projection import supports_json_search
 from app.services.data_perimeter_service import DataPerimeterService
+from app.services.reporting_service import (
+    alert_matches_topic,
+    alert_topic_clause,
+    outcome_matches_topic,
+    outcome_topic_clause,
+)
 
 
 class AiAssistantError(Exception):
@@ -554,6 +562,15 @@ class AiAssistantService:
             return self._data_perimeter.mission_visible(mission, scope)
         return True
 
+    def _visible_jobs_clause(self, session: Session, tenant_id: str, viewer_user_id: str) -> Any:
+        scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
+        return self._data_perimeter.linked_clause(
+            scope,
+            tenant_id,
+            task_id=col(AiAnalysisJob.task_id),
+            mission_id=col(AiAnalysisJob.mission_id),
+        )
+
     def create_model_catalog(
         self,
         tenant_id: str,
@@ -590,6 +607,7 @@ class AiAssistantService:
         *,
         model_key: str | None = None,
         provider: str | None = None,
+        page: PageRequest | None = None,
     ) -> list[AiModelCatalog]:
         with self._session() as session:
             statement = select(AiModelCatalog).where(AiModelCatalog.tenant_id == tenant_id)
@@ -597,8 +615,14 @@ class AiAssistantService:
                 statement = statement.where(AiModelCatalog.model_key == model_key.strip().lower())
             if provider is not None:
                 statement = statement.where(AiModelCatalog.provider == provider.strip())
-            rows = list(session.exec(statement).all())
-            return sorted(rows, key=lambda item: item.created_at, reverse=True)
+            statement = statement.order_by(col(AiModelCatalog.created_at).desc())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AiModelCatalog.created_at),
+                id_column=col(AiModelCatalog.id),
+            )
 
     def create_model_version(
         self,
@@ -655,6 +679,7 @@ class AiAssistantService:
         model_id: str,
         *,
         status: AiModelVersionStatus | None = None,
+        page: PageRequest | None = None,
     ) -> list[AiModelVersion]:
         with self._session() as session:
             _ = self._get_scoped_model_catalog(session, tenant_id, model_id)
@@ -665,8 +690,14 @@ class AiAssistantService:
             )
             if status is not None:
                 statement = statement.where(AiModelVersion.status == status)
-            rows = list(session.exec(statement).all())
-            return sorted(rows, key=lambda item: item.created_at, reverse=True)
+            statement = statement.order_by(col(AiModelVersion.created_at).desc())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AiModelVersion.created_at),
+                id_column=col(AiModelVersion.id),
+            )
 
     def promote_model_version(
         self,
@@ -1147,6 +1178,7 @@ class AiAssistantService:
         task_id: str | None = None,
         mission_id: str | None = None,
         viewer_user_id: str | None = None,
+        page: PageRequest | None = None,
     ) -> list[AiAnalysisJob]:
         with self._session() as session:
             statement = select(AiAnalysisJob).where(AiAnalysisJob.tenant_id == tenant_id)
@@ -1154,19 +1186,16 @@ class AiAssistantService:
                 statement = statement.where(AiAnalysisJob.task_id == task_id)
             if mission_id is not None:
                 statement = statement.where(AiAnalysisJob.mission_id == mission_id)
-            rows = list(session.exec(statement).all())
-            visible = [
-                item
-                for item in rows
-                if self._is_visible(
-                    session,
-                    tenant_id,
-                    viewer_user_id,
-                    task_id=item.task_id,
-                    mission_id=item.mission_id,
-                )
-            ]
-            return sorted(visible, key=lambda item: item.created_at, reverse=True)
+            if viewer_user_id is not None:
+                statement = statement.where(self._visible_jobs_clause(session, tenant_id, viewer_user_id))
+            statement = statement.order_by(col(AiAnalysisJob.created_at).desc())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AiAnalysisJob.created_at),
+                id_column=col(AiAnalysisJob.id),
+            )
 
     def _build_input_context(
         self,
@@ -1180,25 +1209,18 @@ class AiAssistantService:
             outcomes_statement = outcomes_statement.where(OutcomeCatalogRecord.task_id == job.task_id)
         if job.mission_id is not None:
             outcomes_statement = outcomes_statement.where(OutcomeCatalogRecord.mission_id == job.mission_id)
-        outcomes = list(session.exec(outcomes_statement).all())
-
         alerts_statement = select(AlertRecord).where(AlertRecord.tenant_id == tenant_id)
+        if job.topic and supports_json_search(session):
+            topic = job.topic.strip().lower()
+            outcomes_statement = outcomes_statement.where(outcome_topic_clause(topic))
+            alerts_statement = alerts_statement.where(alert_topic_clause(topic))
+        outcomes = list(session.exec(outcomes_statement).all())
         alerts = list(session.exec(alerts_statement).all())
 
         if job.topic:
             topic = job.topic.strip().lower()
-            outcomes = [
-                item
-                for item in outcomes
-                if topic in item.outcome_type.value.lower() or topic in str(item.payload).lower()
-            ]
-            alerts = [
-                item
-                for item in alerts
-                if topic in item.alert_type.value.lower()
-                or topic in item.message.lower()
-                or topic in str(item.detail).lower()
-            ]
+            outcomes = [item for item in outcomes if outcome_matches_topic(item, topic)]
+            alerts = [item for item in alerts if alert_matches_topic(item, topic)]
 
         open_alerts = [item for item in alerts if item.status != AlertStatus.CLOSED]
         input_payload = {
@@ -1524,17 +1546,28 @@ class AiAssistantService:
             )
         return run
 
-    def list_runs(self, tenant_id: str, job_id: str) -> list[AiAnalysisRun]:
+    def list_runs(
+        self,
+        tenant_id: str,
+        job_id: str,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[AiAnalysisRun]:
         with self._session() as session:
             _ = self._get_scoped_job(session, tenant_id, job_id)
-            rows = list(
-                session.exec(
-                    select(AiAnalysisRun)
-                    .where(AiAnalysisRun.tenant_id == tenant_id)
-                    .where(AiAnalysisRun.job_id == job_id)
-                ).all()
+            statement = (
+                select(AiAnalysisRun)
+                .where(AiAnalysisRun.tenant_id == tenant_id)
+                .where(AiAnalysisRun.job_id == job_id)
+                .order_by(col(AiAnalysisRun.created_at).desc())
+            )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AiAnalysisRun.created_at),
+                id_column=col(AiAnalysisRun.id),
             )
-            return sorted(rows, key=lambda item: item.created_at, reverse=True)
 
     def list_outputs(
         self,
@@ -1544,6 +1577,7 @@ class AiAssistantService:
         run_id: str | None = None,
         review_status: AiOutputReviewStatus | None = None,
         viewer_user_id: str | None = None,
+        page: PageRequest | None = None,
     ) -> list[AiAnalysisOutput]:
         with self._session() as session:
             statement = select(AiAnalysisOutput).where(AiAnalysisOutput.tenant_id == tenant_id)
@@ -1553,25 +1587,19 @@ class AiAssistantService:
                 statement = statement.where(AiAnalysisOutput.run_id == run_id)
             if review_status is not None:
                 statement = statement.where(AiAnalysisOutput.review_status == review_status)
-            rows = list(session.exec(statement).all())
-            jobs = {
-                item.id: item
-                for item in session.exec(select(AiAnalysisJob).where(AiAnalysisJob.tenant_id == tenant_id)).all()
-            }
-            visible = []
-            for item in rows:
-                job = jobs.get(item.job_id)
-                if job is None:
-                    continue
-                if self._is_visible(
-                    session,
-                    tenant_id,
-                    viewer_user_id,
-                    task_id=job.task_id,
-                    mission_id=job.mission_id,
-                ):
-                    visible.append(item)
-            return sorted(visible, key=lambda item: item.created_at, reverse=True)
+            visible_jobs = select(AiAnalysisJob.id).where(AiAnalysisJob.tenant_id == tenant_id)
+            if viewer_user_id is not None:
+                visible_jobs = visible_jobs.where(self._visible_jobs_clause(session, tenant_id, viewer_user_id))
+            statement = statement.where(col(AiAnalysisOutput.job_id).in_(visible_jobs)).order_by(
+                col(AiAnalysisOutput.created_at).desc()
+            )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AiAnalysisOutput.created_at),
+                id_column=col(AiAnalysisOutput.id),
+            )
 
     def get_output(self, tenant_id: str, output_id: str, viewer_user_id: str | None = None) -> AiAnalysisOutput:
         with self._session() as session:
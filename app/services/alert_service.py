@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
@@ -7,7 +8,7 @@ from uuid import uuid4
 
 from sqlalchemy import true
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.domain.models import (
     AlertAggregationRule,
@@ -39,10 +40,13 @@ from app.domain.models import (
     AlertSlaOverviewRead,
     AlertStatus,
     AlertType,
+    KpiHeatmapSource,
     TelemetryNormalized,
 )
-from app.infra.db import get_engine
+from app.infra.db import create_session, get_engine
 from app.infra.events import event_bus
+from app.infra.pagination import PageRequest, paginate_query
+from app.services.kpi_service import record_heatmap_points
 
 
 @dataclass
@@ -72,6 +76,9 @@ class AlertService:
     def _session(self) -> Session:
         return Session(get_engine(), expire_on_commit=False)
 
+    def _read_session(self) -> Session:
+        return create_session(read_only=True)
+
     def _get_scoped_alert(
         self,
         session: Session,
@@ -94,6 +101,23 @@ class AlertService:
             return value.strip().lower() in {"1", "true", "yes", "on"}
         return False
 
+    @staticmethod
+    def _position_of(detail: dict[str, Any]) -> tuple[float, float] | None:
+        position = detail.get("position")
+        if not isinstance(position, dict):
+            return None
+        lat = position.get("lat")
+        lon = position.get("lon")
+        if isinstance(lat, bool) or isinstance(lon, bool):
+            return None
+        if not isinstance(lat, int | float) or not isinstance(lon, int | float):
+            return None
+        if not (math.isfinite(lat) and math.isfinite(lon)):
+            return None
+        if not (-90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0):
+            return None
+        return float(lat), float(lon)
+
     @staticmethod
     def _as_utc(value: datetime) -> datetime:
         if value.tzinfo is None:
@@ -501,6 +525,21 @@ class AlertService:
                                         }
                                     )
                     active.detail = next_detail
+                    previous_position = (
+                        (active.position_lat, active.position_lon)
+                        if active.position_lat is not None and active.position_lon is not None
+                        else None
+                    )
+                    next_position = self._position_of(next_detail)
+                    if next_position != previous_position:
+                        # Keep the heatmap grid on the alert's current position.
+                        moves: list[tuple[datetime, float, float, int]] = []
+                        if previous_position is not None:
+                            moves.append((active.first_seen_at, *previous_position, -1))
+                        if next_position is not None:
+                            moves.append((active.first_seen_at, *next_position, 1))
+                        record_heatmap_points(session, tenant_id, KpiHeatmapSource.ALERT, moves)
+                        active.position_lat, active.position_lon = next_position or (None, None)
                     if (
                         active.severity != AlertSeverity.CRITICAL
                         and triggered_alert.severity == AlertSeverity.CRITICAL
@@ -529,6 +568,10 @@ class AlertService:
                     first_seen_at=now,
                     last_seen_at=now,
                 )
+                position = self._position_of(triggered_alert.detail)
+                if position is not None:
+                    record.position_lat, record.position_lon = position
+                    record_heatmap_points(session, tenant_id, KpiHeatmapSource.ALERT, [(now, *position, 1)])
                 if aggregation_rule is not None:
                     detail = dict(record.detail)
                     detail["aggregation"] = {
@@ -543,38 +586,45 @@ class AlertService:
                 created.append(record)
                 routed.append(record)
 
+            for created_alert in created:
+                event_bus.publish_dict(
+                    "alert.created",
+                    tenant_id,
+                    {
+                        "alert_id": created_alert.id,
+                        "drone_id": created_alert.drone_id,
+                        "alert_type": created_alert.alert_type,
+                        "severity": created_alert.severity,
+                        "priority_level": created_alert.priority_level,
+                        "status": created_alert.status,
+                    },
+                    session=session,
+                )
+            for routed_alert in routed:
+                event_bus.publish_dict(
+                    "alert.routed",
+                    tenant_id,
+                    {
+                        "alert_id": routed_alert.id,
+                        "alert_type": routed_alert.alert_type,
+                        "priority_level": routed_alert.priority_level,
+                        "route_status": routed_alert.route_status,
+                    },
+                    session=session,
+                )
+            for suppressed_item in suppressed:
+                event_bus.publish_dict(
+                    "alert.suppressed", tenant_id, suppressed_item, session=session
+                )
+            for noise_item in noise_suppressed:
+                event_bus.publish_dict(
+                    "alert.noise_suppressed", tenant_id, noise_item, session=session
+                )
+
             session.commit()
             for created_alert in created:
                 session.refresh(created_alert)
 
-        for created_alert in created:
-            event_bus.publish_dict(
-                "alert.created",
-                tenant_id,
-                {
-                    "alert_id": created_alert.id,
-                    "drone_id": created_alert.drone_id,
-                    "alert_type": created_alert.alert_type,
-                    "severity": created_alert.severity,
-                    "priority_level": created_alert.priority_level,
-                    "status": created_alert.status,
-                },
-            )
-        for routed_alert in routed:
-            event_bus.publish_dict(
-                "alert.routed",
-                tenant_id,
-                {
-                    "alert_id": routed_alert.id,
-                    "alert_type": routed_alert.alert_type,
-                    "priority_level": routed_alert.priority_level,
-                    "route_status": routed_alert.route_status,
-                },
-            )
-        for suppressed_item in suppressed:
-            event_bus.publish_dict("alert.suppressed", tenant_id, suppressed_item)
-        for noise_item in noise_suppressed:
-            event_bus.publish_dict("alert.noise_suppressed", tenant_id, noise_item)
         return created
 
     def create_routing_rule(
@@ -610,6 +660,7 @@ class AlertService:
         priority_level: AlertPriority | None = None,
         alert_type: AlertType | None = None,
         is_active: bool | None = None,
+        page: PageRequest | None = None,
     ) -> list[AlertRoutingRule]:
         with self._session() as session:
             statement = select(AlertRoutingRule).where(AlertRoutingRule.tenant_id == tenant_id)
@@ -619,7 +670,13 @@ class AlertService:
                 statement = statement.where(AlertRoutingRule.alert_type == alert_type)
             if is_active is not None:
                 statement = statement.where(AlertRoutingRule.is_active == is_active)
-            return list(session.exec(statement).all())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AlertRoutingRule.created_at),
+                id_column=col(AlertRoutingRule.id),
+            )
 
     def create_silence_rule(
         self,
@@ -653,13 +710,20 @@ class AlertService:
         tenant_id: str,
         *,
         is_active: bool | None = None,
+        page: PageRequest | None = None,
     ) -> list[AlertSilenceRule]:
         with self._session() as session:
             statement = select(AlertSilenceRule).where(AlertSilenceRule.tenant_id == tenant_id)
             if is_active is not None:
                 statement = statement.where(AlertSilenceRule.is_active == is_active)
-            rows = list(session.exec(statement).all())
-            return sorted(rows, key=lambda item: item.created_at, reverse=True)
+            statement = statement.order_by(col(AlertSilenceRule.created_at).desc())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AlertSilenceRule.created_at),
+                id_column=col(AlertSilenceRule.id),
+            )
 
     def create_aggregation_rule(
         self,
@@ -691,13 +755,20 @@ class AlertService:
         tenant_id: str,
         *,
         is_active: bool | None = None,
+        page: PageRequest | None = None,
     ) -> list[AlertAggregationRule]:
         with self._session() as session:
             statement = select(AlertAggregationRule).where(AlertAggregationRule.tenant_id == tenant_id)
             if is_active is not None:
                 statement = statement.where(AlertAggregationRule.is_active == is_active)
-            rows = list(session.exec(statement).all())
-            return sorted(rows, key=lambda item: item.created_at, reverse=True)
+            statement = statement.order_by(col(AlertAggregationRule.created_at).desc())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AlertAggregationRule.created_at),
+                id_column=col(AlertAggregationRule.id),
+            )
 
     def create_oncall_shift(
         self,
@@ -732,20 +803,25 @@ class AlertService:
         *,
         active_at: datetime | None = None,
         is_active: bool | None = None,
+        page: PageRequest | None = None,
     ) -> list[AlertOncallShift]:
         with self._session() as session:
             statement = select(AlertOncallShift).where(AlertOncallShift.tenant_id == tenant_id)
             if is_active is not None:
                 statement = statement.where(AlertOncallShift.is_active == is_active)
-            rows = list(session.exec(statement).all())
             if active_at is not None:
                 active_at_utc = self._as_utc(active_at)
-                rows = [
-                    item
-                    for item in rows
-                    if self._as_utc(item.starts_at) <= active_at_utc < self._as_utc(item.ends_at)
-                ]
-            return sorted(rows, key=lambda item: item.starts_at, reverse=True)
+                statement = statement.where(col(AlertOncallShift.starts_at) <= active_at_utc).where(
+                    col(AlertOncallShift.ends_at) > active_at_utc
+                )
+            statement = statement.order_by(col(AlertOncallShift.starts_at).desc())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AlertOncallShift.starts_at),
+                id_column=col(AlertOncallShift.id),
+            )
 
     def create_escalation_policy(
         self,
@@ -795,13 +871,20 @@ class AlertService:
         tenant_id: str,
         *,
         is_active: bool | None = None,
+        page: PageRequest | None = None,
     ) -> list[AlertEscalationPolicy]:
         with self._session() as session:
             statement = select(AlertEscalationPolicy).where(AlertEscalationPolicy.tenant_id == tenant_id)
             if is_active is not None:
                 statement = statement.where(AlertEscalationPolicy.is_active == is_active)
-            rows = list(session.exec(statement).all())
-            return sorted(rows, key=lambda item: item.priority_level.value)
+            statement = statement.order_by(col(AlertEscalationPolicy.priority_level))
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AlertEscalationPolicy.created_at),
+                id_column=col(AlertEscalationPolicy.id),
+            )
 
     @staticmethod
     def _as_int(value: object, *, default: int = 0) -> int:
@@ -1150,7 +1233,13 @@ class AlertService:
             timeout_escalation_rate=timeout_escalation_rate,
         )
 
-    def list_alert_routes(self, tenant_id: str, alert_id: str) -> list[AlertRouteLog]:
+    def list_alert_routes(
+        self,
+        tenant_id: str,
+        alert_id: str,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[AlertRouteLog]:
         with self._session() as session:
             record = self._get_scoped_alert(session, tenant_id, alert_id)
             if record is None:
@@ -1159,9 +1248,15 @@ class AlertService:
                 select(AlertRouteLog)
                 .where(AlertRouteLog.tenant_id == tenant_id)
                 .where(AlertRouteLog.alert_id == alert_id)
+                .order_by(col(AlertRouteLog.created_at))
+            )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AlertRouteLog.created_at),
+                id_column=col(AlertRouteLog.id),
             )
-            rows = list(session.exec(statement).all())
-            return sorted(rows, key=lambda item: item.created_at)
 
     def list_alerts(
         self,
@@ -1169,15 +1264,24 @@ class AlertService:
         *,
         drone_id: str | None = None,
         status: AlertStatus | None = None,
+        page: PageRequest | None = None,
     ) -> list[AlertRecord]:
-        with self._session() as session:
+        with self._read_session() as session:
             statement = select(AlertRecord).where(AlertRecord.tenant_id == tenant_id)
             if drone_id is not None:
                 statement = statement.where(AlertRecord.drone_id == drone_id)
             if status is not None:
                 statement = statement.where(AlertRecord.status == status)
-            rows = list(session.exec(statement).all())
-            return sorted(rows, key=lambda item: item.last_seen_at, reverse=True)
+            # Keyset on the immutable first_seen_at: re-triggers move last_seen_at, which would
+            # shift alerts across pages while a client walks them.
+            statement = statement.order_by(col(AlertRecord.first_seen_at).desc(), col(AlertRecord.id).desc())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AlertRecord.first_seen_at),
+                id_column=col(AlertRecord.id),
+            )
 
     def get_alert(self, tenant_id: str, alert_id: str) -> AlertRecord:
         with self._session() as session:
@@ -1314,19 +1418,30 @@ class AlertService:
             session.refresh(row)
             return row
 
-    def list_handling_actions(self, tenant_id: str, alert_id: str) -> list[AlertHandlingAction]:
+    def list_handling_actions(
+        self,
+        tenant_id: str,
+        alert_id: str,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[AlertHandlingAction]:
         with self._session() as session:
             record = self._get_scoped_alert(session, tenant_id, alert_id)
             if record is None:
                 raise NotFoundError("alert not found")
-            rows = list(
-                session.exec(
-                    select(AlertHandlingAction)
-                    .where(AlertHandlingAction.tenant_id == tenant_id)
-                    .where(AlertHandlingAction.alert_id == alert_id)
-                ).all()
+            statement = (
+                select(AlertHandlingAction)
+                .where(AlertHandlingAction.tenant_id == tenant_id)
+                .where(AlertHandlingAction.alert_id == alert_id)
+                .order_by(col(AlertHandlingAction.created_at))
+            )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AlertHandlingAction.created_at),
+                id_column=col(AlertHandlingAction.id),
             )
-            return sorted(rows, key=lambda item: item.created_at)
 
     def get_alert_review(
         self,
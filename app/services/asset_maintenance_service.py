@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.domain.models import (
     Asset,
@@ -17,6 +17,7 @@ from app.domain.models import (
 )
 from app.infra.db import get_engine
 from app.infra.events import event_bus
+from app.infra.pagination import PageRequest, paginate_query
 
 
 class AssetMaintenanceError(Exception):
@@ -133,6 +134,7 @@ class AssetMaintenanceService:
         *,
         asset_id: str | None = None,
         status: MaintenanceWorkOrderStatus | None = None,
+        page: PageRequest | None = None,
     ) -> list[AssetMaintenanceWorkOrder]:
         with self._session() as session:
             statement = select(AssetMaintenanceWorkOrder).where(AssetMaintenanceWorkOrder.tenant_id == tenant_id)
@@ -140,7 +142,13 @@ class AssetMaintenanceService:
                 statement = statement.where(AssetMaintenanceWorkOrder.asset_id == asset_id)
             if status is not None:
                 statement = statement.where(AssetMaintenanceWorkOrder.status == status)
-            return list(session.exec(statement).all())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AssetMaintenanceWorkOrder.created_at),
+                id_column=col(AssetMaintenanceWorkOrder.id),
+            )
 
     def get_workorder(self, tenant_id: str, workorder_id: str) -> AssetMaintenanceWorkOrder:
         with self._session() as session:
@@ -237,14 +245,25 @@ class AssetMaintenanceService:
         )
         return workorder
 
-    def list_history(self, tenant_id: str, workorder_id: str) -> list[AssetMaintenanceHistory]:
+    def list_history(
+        self,
+        tenant_id: str,
+        workorder_id: str,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[AssetMaintenanceHistory]:
         with self._session() as session:
             self._get_scoped_workorder(session, tenant_id, workorder_id)
             statement = (
                 select(AssetMaintenanceHistory)
                 .where(AssetMaintenanceHistory.tenant_id == tenant_id)
                 .where(AssetMaintenanceHistory.workorder_id == workorder_id)
+                .order_by(col(AssetMaintenanceHistory.created_at))
+            )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AssetMaintenanceHistory.created_at),
+                id_column=col(AssetMaintenanceHistory.id),
             )
-            rows = list(session.exec(statement).all())
-        rows.sort(key=lambda item: item.created_at)
-        return rows
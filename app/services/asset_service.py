@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.domain.models import (
     Asset,
@@ -20,8 +20,9 @@ from app.domain.models import (
     Drone,
     Tenant,
 )
-from app.infra.db import get_engine
+from app.infra.db import create_session, get_engine
 from app.infra.events import event_bus
+from app.infra.pagination import PageRequest, paginate_query
 from app.services.data_perimeter_service import DataPerimeterService
 
 
@@ -44,6 +45,9 @@ class AssetService:
     def _session(self) -> Session:
         return Session(get_engine(), expire_on_commit=False)
 
+    def _read_session(self) -> Session:
+        return create_session(read_only=True)
+
     def _get_scoped_asset(self, session: Session, tenant_id: str, asset_id: str) -> Asset:
         asset = session.exec(select(Asset).where(Asset.tenant_id == tenant_id).where(Asset.id == asset_id)).first()
         if asset is None:
@@ -111,8 +115,9 @@ class AssetService:
         health_status: AssetHealthStatus | None = None,
         region_code: str | None = None,
         viewer_user_id: str | None = None,
+        page: PageRequest | None = None,
     ) -> list[Asset]:
-        with self._session() as session:
+        with self._read_session() as session:
             statement = select(Asset).where(Asset.tenant_id == tenant_id)
             if asset_type is not None:
                 statement = statement.where(Asset.asset_type == asset_type)
@@ -124,11 +129,18 @@ class AssetService:
                 statement = statement.where(Asset.health_status == health_status)
             if region_code is not None:
                 statement = statement.where(Asset.region_code == region_code)
-            rows = list(session.exec(statement).all())
-            if viewer_user_id is None:
-                return rows
-            scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
-            return [item for item in rows if self._data_perimeter.asset_visible(item, scope)]
+            if viewer_user_id is not None:
+                scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
+                statement = self._data_perimeter.restrict(
+                    statement, self._data_perimeter.asset_clause(scope)
+                )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(Asset.created_at),
+                id_column=col(Asset.id),
+            )
 
     def list_resource_pool(
         self,
@@ -140,6 +152,7 @@ class AssetService:
         region_code: str | None = None,
         min_health_score: int | None = None,
         viewer_user_id: str | None = None,
+        page: PageRequest | None = None,
     ) -> list[Asset]:
         with self._session() as session:
             statement = select(Asset).where(Asset.tenant_id == tenant_id)
@@ -151,17 +164,22 @@ class AssetService:
                 statement = statement.where(Asset.health_status == health_status)
             if region_code is not None:
                 statement = statement.where(Asset.region_code == region_code)
-            rows = list(session.exec(statement).all())
             if viewer_user_id is not None:
                 scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
-                rows = [item for item in rows if self._data_perimeter.asset_visible(item, scope)]
+                statement = self._data_perimeter.restrict(
+                    statement, self._data_perimeter.asset_clause(scope)
+                )
             if min_health_score is not None:
-                rows = [
-                    item
-                    for item in rows
-                    if item.health_score is not None and item.health_score >= min_health_score
-                ]
-            return rows
+                statement = statement.where(col(Asset.health_score).is_not(None)).where(
+                    col(Asset.health_score) >= min_health_score
+                )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(Asset.created_at),
+                id_column=col(Asset.id),
+            )
 
     def summarize_resource_pool(
         self,
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, TypeVar
+from uuid import uuid4
 
-from sqlalchemy import or_
+from sqlalchemy import or_, tuple_
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, col, select
 
@@ -25,6 +27,8 @@ from app.domain.models import (
     BillingSubscriptionStatus,
     BillingTenantQuotaSnapshotRead,
     BillingUsageAggregateDaily,
+    BillingUsageBatchIngestRead,
+    BillingUsageBatchItemRead,
     BillingUsageEvent,
     BillingUsageIngestRequest,
     BillingUsageSummaryRead,
@@ -32,6 +36,21 @@ from app.domain.models import (
     TenantSubscription,
 )
 from app.infra.db import get_engine
+from app.infra.pagination import PageRequest, paginate_query
+from app.infra.upsert import insert_missing_rows, upsert_rows
+
+T = TypeVar("T")
+
+# Keys per dedup lookup and rows per insert, below the bind-parameter limits of SQLite and PostgreSQL.
+_USAGE_LOOKUP_CHUNK = 5000
+_USAGE_INSERT_CHUNK = 2000
+_USAGE_EVENT_KEY = ("tenant_id", "meter_key", "source_event_id")
+_USAGE_AGGREGATE_KEY = ("tenant_id", "meter_key", "usage_date")
+
+
+def _chunks(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
 
 
 class BillingError(Exception):
@@ -190,6 +209,7 @@ class BillingService:
         *,
         plan_code: str | None = None,
         is_active: bool | None = None,
+        page: PageRequest | None = None,
     ) -> list[tuple[BillingPlanCatalog, list[BillingPlanQuota]]]:
         with self._session() as session:
             statement = select(BillingPlanCatalog).where(BillingPlanCatalog.tenant_id == tenant_id)
@@ -197,10 +217,12 @@ class BillingService:
                 statement = statement.where(BillingPlanCatalog.plan_code == plan_code.strip())
             if is_active is not None:
                 statement = statement.where(BillingPlanCatalog.is_active == is_active)
-            plans = sorted(
-                list(session.exec(statement).all()),
-                key=lambda item: item.created_at,
-                reverse=True,
+            plans = paginate_query(
+                session,
+                statement.order_by(col(BillingPlanCatalog.created_at).desc()),
+                page,
+                sort_column=col(BillingPlanCatalog.created_at),
+                id_column=col(BillingPlanCatalog.id),
             )
 
             if not plans:
@@ -267,14 +289,25 @@ class BillingService:
             session.refresh(row)
             return row
 
-    def list_subscriptions(self, tenant_id: str) -> list[TenantSubscription]:
+    def list_subscriptions(
+        self,
+        tenant_id: str,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[TenantSubscription]:
         with self._session() as session:
-            rows = list(
-                session.exec(
-                    select(TenantSubscription).where(TenantSubscription.tenant_id == tenant_id)
-                ).all()
+            statement = (
+                select(TenantSubscription)
+                .where(TenantSubscription.tenant_id == tenant_id)
+                .order_by(col(TenantSubscription.start_at).desc())
+            )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(TenantSubscription.created_at),
+                id_column=col(TenantSubscription.id),
             )
-            return sorted(rows, key=lambda item: item.start_at, reverse=True)
 
     def upsert_quota_overrides(
         self,
@@ -330,14 +363,25 @@ class BillingService:
 
         return self.list_quota_overrides(tenant_id)
 
-    def list_quota_overrides(self, tenant_id: str) -> list[TenantQuotaOverride]:
+    def list_quota_overrides(
+        self,
+        tenant_id: str,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[TenantQuotaOverride]:
         with self._session() as session:
-            rows = list(
-                session.exec(
-                    select(TenantQuotaOverride).where(TenantQuotaOverride.tenant_id == tenant_id)
-                ).all()
+            statement = (
+                select(TenantQuotaOverride)
+                .where(TenantQuotaOverride.tenant_id == tenant_id)
+                .order_by(col(TenantQuotaOverride.quota_key))
+            )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(TenantQuotaOverride.created_at),
+                id_column=col(TenantQuotaOverride.id),
             )
-            return sorted(rows, key=lambda item: item.quota_key)
 
     def get_effective_quotas(self, tenant_id: str) -> BillingTenantQuotaSnapshotRead:
         with self._session() as session:
@@ -395,75 +439,145 @@ class BillingService:
                 quotas=quota_values,
             )
 
-    def ingest_usage_event(
+    def _usage_event_ids(
         self,
+        session: Session,
         tenant_id: str,
-        actor_id: str,
-        payload: BillingUsageIngestRequest,
-    ) -> tuple[BillingUsageEvent, bool]:
-        meter_key = self._normalize_non_empty(payload.meter_key, "meter_key")
-        source_event_id = self._normalize_non_empty(payload.source_event_id, "source_event_id")
-        occurred_at = self._as_utc(payload.occurred_at)
-        day_bucket = self._day_bucket(occurred_at)
-
-        with self._session() as session:
-            existing = session.exec(
-                select(BillingUsageEvent)
+        keys: Sequence[tuple[str, str]],
+    ) -> dict[tuple[str, str], str]:
+        found: dict[tuple[str, str], str] = {}
+        for chunk in _chunks(keys, _USAGE_LOOKUP_CHUNK):
+            rows = session.exec(
+                select(BillingUsageEvent.id, BillingUsageEvent.meter_key, BillingUsageEvent.source_event_id)
                 .where(BillingUsageEvent.tenant_id == tenant_id)
-                .where(BillingUsageEvent.meter_key == meter_key)
-                .where(BillingUsageEvent.source_event_id == source_event_id)
-            ).first()
-            if existing is not None:
-                return existing, True
+                .where(tuple_(col(BillingUsageEvent.meter_key), col(BillingUsageEvent.source_event_id)).in_(chunk))
+            ).all()
+            found.update({(meter_key, source_event_id): event_id for event_id, meter_key, source_event_id in rows})
+        return found
 
-            now = datetime.now(UTC)
-            event = BillingUsageEvent(
-                tenant_id=tenant_id,
-                meter_key=meter_key,
-                quantity=payload.quantity,
-                occurred_at=occurred_at,
-                source_event_id=source_event_id,
-                detail=payload.detail,
-                created_by=actor_id,
-                created_at=now,
+    def ingest_usage_events(
+        self,
+        tenant_id: str,
+        actor_id: str,
+        payloads: Sequence[BillingUsageIngestRequest],
+    ) -> BillingUsageBatchIngestRead:
+        """Ingest a batch of usage events in one transaction.
+
+        Events are deduplicated by `(meter_key, source_event_id)` within the batch and against
+        stored events in one query. New events are bulk-inserted with ON CONFLICT DO NOTHING,
+        so an event that a concurrent batch inserts first is reported as a duplicate rather
+        than counted twice. The daily aggregates of the events actually inserted are then
+        applied as a single atomic `total_quantity + delta` upsert.
+        """
+        items: list[tuple[str, str, BillingUsageIngestRequest]] = [
+            (
+                self._normalize_non_empty(payload.meter_key, "meter_key"),
+                self._normalize_non_empty(payload.source_event_id, "source_event_id"),
+                payload,
             )
-            session.add(event)
+            for payload in payloads
+        ]
+        now = datetime.now(UTC)
+        with self._session() as session:
+            event_ids = self._usage_event_ids(session, tenant_id, sorted({(item[0], item[1]) for item in items}))
+            new_rows: dict[tuple[str, str], dict[str, Any]] = {}
+            for meter_key, source_event_id, payload in items:
+                key = (meter_key, source_event_id)
+                if key in event_ids or key in new_rows:
+                    continue
+                new_rows[key] = {
+                    "id": str(uuid4()),
+                    "tenant_id": tenant_id,
+                    "meter_key": meter_key,
+                    "quantity": payload.quantity,
+                    "occurred_at": self._as_utc(payload.occurred_at),
+                    "source_event_id": source_event_id,
+                    "detail": payload.detail,
+                    "created_by": actor_id,
+                    "created_at": now,
+                }
+
+            # Rows go in key order so concurrent batches lock index entries in the same order.
+            inserted: set[tuple[str, str]] = set()
+            ordered_rows = [new_rows[key] for key in sorted(new_rows)]
+            for chunk in _chunks(ordered_rows, _USAGE_INSERT_CHUNK):
+                for meter_key, source_event_id in insert_missing_rows(
+                    session,
+                    BillingUsageEvent,
+                    chunk,
+                    conflict_columns=_USAGE_EVENT_KEY,
+                    returning=("meter_key", "source_event_id"),
+                ):
+                    inserted.add((meter_key, source_event_id))
+            raced = sorted(key for key in new_rows if key not in inserted)
+            if raced:
+                event_ids.update(self._usage_event_ids(session, tenant_id, raced))
+            for key in raced:
+                if key not in event_ids:
+                    raise ConflictError("failed to ingest usage event")
+                del new_rows[key]
+
+            deltas: dict[tuple[str, datetime], int] = {}
+            for row in new_rows.values():
+                bucket = (row["meter_key"], self._day_bucket(row["occurred_at"]))
+                deltas[bucket] = deltas.get(bucket, 0) + row["quantity"]
+            aggregate_rows = [
+                {
+                    "id": str(uuid4()),
+                    "tenant_id": tenant_id,
+                    "meter_key": meter_key,
+                    "usage_date": usage_date,
+                    "total_quantity": quantity,
+                    "updated_at": now,
+                }
+                for (meter_key, usage_date), quantity in sorted(deltas.items())
+            ]
+            for chunk in _chunks(aggregate_rows, _USAGE_INSERT_CHUNK):
+                upsert_rows(
+                    session,
+                    BillingUsageAggregateDaily,
+                    chunk,
+                    conflict_columns=_USAGE_AGGREGATE_KEY,
+                    increment=("total_quantity",),
+                    replace=("updated_at",),
+                )
+            session.commit()
 
-            aggregate = session.exec(
-                select(BillingUsageAggregateDaily)
-                .where(BillingUsageAggregateDaily.tenant_id == tenant_id)
-                .where(BillingUsageAggregateDaily.meter_key == meter_key)
-                .where(BillingUsageAggregateDaily.usage_date == day_bucket)
-            ).first()
-            if aggregate is None:
-                aggregate = BillingUsageAggregateDaily(
-                    tenant_id=tenant_id,
+        results: list[BillingUsageBatchItemRead] = []
+        for meter_key, source_event_id, _payload in items:
+            key = (meter_key, source_event_id)
+            created = new_rows.pop(key, None)
+            results.append(
+                BillingUsageBatchItemRead(
+                    event_id=created["id"] if created is not None else event_ids[key],
                     meter_key=meter_key,
-                    usage_date=day_bucket,
-                    total_quantity=payload.quantity,
-                    updated_at=now,
+                    source_event_id=source_event_id,
+                    deduplicated=created is None,
                 )
-            else:
-                aggregate.total_quantity += payload.quantity
-                aggregate.updated_at = now
-            session.add(aggregate)
-
-            try:
-                session.commit()
-            except IntegrityError as exc:
-                session.rollback()
-                dedup = session.exec(
-                    select(BillingUsageEvent)
-                    .where(BillingUsageEvent.tenant_id == tenant_id)
-                    .where(BillingUsageEvent.meter_key == meter_key)
-                    .where(BillingUsageEvent.source_event_id == source_event_id)
-                ).first()
-                if dedup is None:
-                    raise ConflictError("failed to ingest usage event") from exc
-                return dedup, True
+            )
+            if created is not None:
+                # Later copies of the same event in this batch point at the row just created.
+                event_ids[key] = created["id"]
+        accepted = sum(1 for item in results if not item.deduplicated)
+        return BillingUsageBatchIngestRead(
+            total=len(results),
+            accepted=accepted,
+            deduplicated=len(results) - accepted,
+            results=results,
+        )
 
-            session.refresh(event)
-            return event, False
+    def ingest_usage_event(
+        self,
+        tenant_id: str,
+        actor_id: str,
+        payload: BillingUsageIngestRequest,
+    ) -> tuple[BillingUsageEvent, bool]:
+        (item,) = self.ingest_usage_events(tenant_id, actor_id, [payload]).results
+        with self._session() as session:
+            event = session.get(BillingUsageEvent, item.event_id)
+        if event is None:
+            raise ConflictError("failed to ingest usage event")
+        return event, item.deduplicated
 
     def list_usage_summary(
         self,
@@ -750,6 +864,7 @@ class BillingService:
         period_start: datetime | None = None,
         period_end: datetime | None = None,
         status: BillingInvoiceStatus | None = None,
+        page: PageRequest | None = None,
     ) -> list[BillingInvoice]:
         with self._session() as session:
             statement = select(BillingInvoice).where(BillingInvoice.tenant_id == tenant_id)
@@ -759,8 +874,14 @@ class BillingService:
                 statement = statement.where(BillingInvoice.period_end <= self._as_utc(period_end))
             if status is not None:
                 statement = statement.where(BillingInvoice.status == status)
-            rows = list(session.exec(statement).all())
-            return sorted(rows, key=lambda item: item.period_start, reverse=True)
+            statement = statement.order_by(col(BillingInvoice.period_start).desc())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(BillingInvoice.created_at),
+                id_column=col(BillingInvoice.id),
+            )
 
     def get_invoice_detail(
         self,
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import os
-from collections.abc import Callable
+import threading
+from collections.abc import Awaitable, Callable, Coroutine
+from contextlib import AbstractContextManager
 from datetime import UTC, datetime
-from typing import Protocol
+from typing import Any, Protocol
 
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.adapters.dji_adapter import DjiAdapter
 from app.adapters.fake_adapter import FakeAdapter
@@ -15,14 +17,18 @@ from app.adapters.mavlink_adapter import MavlinkAdapter
 from app.domain.models import (
     Command,
     CommandDispatchRequest,
+    CommandRead,
     CommandRequestRecord,
     CommandStatus,
+    CommandType,
     ComplianceReasonCode,
     Drone,
     DroneVendor,
 )
-from app.infra.db import get_engine
+from app.infra.db import create_session, get_engine, run_db
 from app.infra.events import event_bus
+from app.infra.pagination import PageRequest, paginate_query
+from app.infra.unit_of_work import UnitOfWork, get_scoped
 from app.services.compliance_service import ComplianceService, ComplianceViolationError
 
 
@@ -31,6 +37,25 @@ class CommandAdapter(Protocol):
 
 
 AdapterFactory = Callable[[], CommandAdapter]
+CommandStateNotifier = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+
+# Mission-level commands ack once the autopilot has accepted the plan, so they get longer
+# deadlines than the immediate flight-mode switches, which fall back to COMMAND_ACK_TIMEOUT_SECONDS.
+COMMAND_ACK_DEADLINE_DEFAULTS_SECONDS: dict[CommandType, float] = {
+    CommandType.GOTO: 10.0,
+    CommandType.START_MISSION: 30.0,
+    CommandType.ABORT_MISSION: 10.0,
+}
+
+
+def _command_ack_deadlines(base_seconds: float) -> dict[CommandType, float]:
+    deadlines: dict[CommandType, float] = {}
+    for command_type in CommandType:
+        default = COMMAND_ACK_DEADLINE_DEFAULTS_SECONDS.get(command_type, base_seconds)
+        raw = os.getenv(f"COMMAND_ACK_TIMEOUT_{command_type.value}_SECONDS", "").strip()
+        deadlines[command_type] = float(raw) if raw else default
+    return deadlines
 
 
 class CommandError(Exception):
@@ -45,30 +70,134 @@ class ConflictError(CommandError):
     pass
 
 
+class CommandAckTracker:
+    """Keeps in-flight non-blocking commands alive until they ack or hit their deadline."""
+
+    def __init__(self) -> None:
+        self._pending: dict[str, asyncio.Task[CommandRequestRecord]] = {}
+
+    def track(
+        self,
+        command_id: str,
+        delivery: Coroutine[Any, Any, CommandRequestRecord],
+    ) -> asyncio.Task[CommandRequestRecord]:
+        task = asyncio.get_running_loop().create_task(delivery)
+        self._pending[command_id] = task
+
+        def _release(_: asyncio.Task[CommandRequestRecord]) -> None:
+            if self._pending.get(command_id) is task:
+                del self._pending[command_id]
+
+        task.add_done_callback(_release)
+        return task
+
+    def is_pending(self, command_id: str) -> bool:
+        return command_id in self._pending
+
+    def pending_command_ids(self) -> list[str]:
+        return sorted(self._pending)
+
+    async def drain(self) -> None:
+        tasks = list(self._pending.values())
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+command_ack_tracker = CommandAckTracker()
+
+
+def _default_adapter_factories() -> dict[DroneVendor, AdapterFactory]:
+    return {
+        DroneVendor.FAKE: lambda: FakeAdapter(),
+        DroneVendor.MAVLINK: lambda: MavlinkAdapter(),
+        DroneVendor.DJI: lambda: DjiAdapter(),
+    }
+
+
+class CommandAdapterPool:
+    """One long-lived, connected adapter per vendor, shared by every dispatch.
+
+    Acks are correlated by the adapter's receive loop, which only exists on a connection
+    that outlives a single request.
+    """
+
+    def __init__(self, factories: dict[DroneVendor, AdapterFactory] | None = None) -> None:
+        self._factories = factories or _default_adapter_factories()
+        self._adapters: dict[DroneVendor, CommandAdapter] = {}
+        self._connecting: dict[DroneVendor, asyncio.Task[None]] = {}
+        self._lock = threading.Lock()
+
+    async def acquire(self, vendor: DroneVendor) -> CommandAdapter:
+        factory = self._factories.get(vendor)
+        if factory is None:
+            raise ConflictError(f"adapter not available for vendor: {vendor}")
+        with self._lock:
+            adapter = self._adapters.get(vendor)
+            if adapter is None:
+                adapter = factory()
+                self._adapters[vendor] = adapter
+                self._connecting[vendor] = asyncio.get_running_loop().create_task(self._connect(adapter))
+            connecting = self._connecting.get(vendor)
+        if connecting is not None and connecting.get_loop() is asyncio.get_running_loop():
+            await asyncio.shield(connecting)
+        return adapter
+
+    async def _connect(self, adapter: CommandAdapter) -> None:
+        connect = getattr(adapter, "connect", None)
+        if connect is not None:
+            await connect()
+
+    async def close(self) -> None:
+        with self._lock:
+            adapters = list(self._adapters.values())
+            self._adapters.clear()
+            self._connecting.clear()
+        for adapter in adapters:
+            disconnect = getattr(adapter, "disconnect", None)
+            if disconnect is None:
+                continue
+            try:
+                await disconnect()
+            except Exception:
+                continue
+
+
+command_adapter_pool = CommandAdapterPool()
+
+
 class CommandService:
     def __init__(
         self,
         *,
         ack_timeout_seconds: float | None = None,
+        ack_deadlines: dict[CommandType, float] | None = None,
         adapter_factories: dict[DroneVendor, AdapterFactory] | None = None,
+        ack_tracker: CommandAckTracker | None = None,
+        state_notifier: CommandStateNotifier | None = None,
+        uow: UnitOfWork | None = None,
     ) -> None:
         timeout = ack_timeout_seconds or float(os.getenv("COMMAND_ACK_TIMEOUT_SECONDS", "1.0"))
         self._ack_timeout_seconds = max(timeout, 0.01)
-        self._adapter_factories: dict[DroneVendor, AdapterFactory] = adapter_factories or {
-            DroneVendor.FAKE: lambda: FakeAdapter(),
-            DroneVendor.MAVLINK: lambda: MavlinkAdapter(),
-            DroneVendor.DJI: lambda: DjiAdapter(),
-        }
-        self._compliance = ComplianceService()
-
-    def _session(self) -> Session:
+        self._ack_deadlines = _command_ack_deadlines(self._ack_timeout_seconds)
+        self._ack_deadlines.update(ack_deadlines or {})
+        self._adapters = (
+            CommandAdapterPool(adapter_factories) if adapter_factories is not None else command_adapter_pool
+        )
+        self._uow = uow
+        self._compliance = ComplianceService(uow=uow)
+        self._ack_tracker = ack_tracker or command_ack_tracker
+        self._state_notifier = state_notifier
+
+    def _session(self) -> AbstractContextManager[Session]:
+        if self._uow is not None:
+            return self._uow.session()
         return Session(get_engine(), expire_on_commit=False)
 
-    def _resolve_adapter(self, vendor: DroneVendor) -> CommandAdapter:
-        factory = self._adapter_factories.get(vendor)
-        if factory is None:
-            raise ConflictError(f"adapter not available for vendor: {vendor}")
-        return factory()
+    def _read_session(self) -> Session:
+        return create_session(read_only=True)
+
+    def _ack_deadline_seconds(self, command_type: CommandType) -> float:
+        return max(self._ack_deadlines.get(command_type, self._ack_timeout_seconds), 0.01)
 
     def _get_scoped_command(
         self,
@@ -91,11 +220,7 @@ class CommandService:
         tenant_id: str,
         drone_id: str,
     ) -> Drone:
-        drone = session.exec(
-            select(Drone)
-            .where(Drone.tenant_id == tenant_id)
-            .where(Drone.id == drone_id)
-        ).first()
+        drone = get_scoped(session, Drone, tenant_id, drone_id)
         if drone is None:
             raise NotFoundError("drone not found")
         return drone
@@ -109,7 +234,8 @@ class CommandService:
         ack_ok: bool,
         ack_message: str,
     ) -> CommandRequestRecord:
-        with self._session() as session:
+        # Acks may land after the request finished, so never borrow the request session here.
+        with Session(get_engine(), expire_on_commit=False) as session:
             record = self._get_scoped_command(session, tenant_id, command_id)
             record.status = status
             record.ack_ok = ack_ok
@@ -121,6 +247,19 @@ class CommandService:
             session.refresh(record)
             return record
 
+    async def _notify_state(self, record: CommandRequestRecord) -> None:
+        if self._state_notifier is None:
+            return
+        payload = {
+            "type": "command.status",
+            "command": CommandRead.model_validate(record).model_dump(mode="json"),
+        }
+        try:
+            await self._state_notifier(record.tenant_id, payload)
+        except Exception:
+            # State pushes are best effort; the persisted record stays authoritative.
+            return
+
     def _raise_blocked_if_needed(self, record: CommandRequestRecord) -> None:
         if record.compliance_passed is not False:
             return
@@ -134,13 +273,14 @@ class CommandService:
             detail=detail,
         )
 
-    async def dispatch_command(
+    def _record_dispatch(
         self,
         *,
         tenant_id: str,
         actor_id: str,
         payload: CommandDispatchRequest,
-    ) -> tuple[CommandRequestRecord, bool]:
+    ) -> tuple[CommandRequestRecord, DroneVendor | None]:
+        """Persist the command request; the vendor is None when nothing new must be delivered."""
         with self._session() as session:
             existing = session.exec(
                 select(CommandRequestRecord)
@@ -149,7 +289,7 @@ class CommandService:
             ).first()
             if existing is not None:
                 self._raise_blocked_if_needed(existing)
-                return existing, False
+                return existing, None
 
             drone = self._get_scoped_drone(session, tenant_id, payload.drone_id)
             compliance_passed = True
@@ -195,6 +335,33 @@ class CommandService:
                 record.compliance_detail.setdefault("drone_id", record.drone_id)
                 record.compliance_detail.setdefault("command_type", payload.type.value)
             session.add(record)
+            if compliance_passed:
+                event_bus.publish_dict(
+                    "command.requested",
+                    tenant_id,
+                    {
+                        "command_id": record.id,
+                        "drone_id": record.drone_id,
+                        "type": payload.type,
+                        "idempotency_key": payload.idempotency_key,
+                    },
+                    session=session,
+                )
+            else:
+                event_bus.publish_dict(
+                    "command.blocked",
+                    tenant_id,
+                    {
+                        "command_id": record.id,
+                        "drone_id": record.drone_id,
+                        "status": record.status,
+                        "reason_code": (
+                            record.compliance_reason_code.value if record.compliance_reason_code else None
+                        ),
+                        "detail": record.compliance_detail,
+                    },
+                    session=session,
+                )
             try:
                 session.commit()
             except IntegrityError:
@@ -207,57 +374,66 @@ class CommandService:
                 if fallback is None:
                     raise ConflictError("command idempotency conflict") from None
                 self._raise_blocked_if_needed(fallback)
-                return fallback, False
+                return fallback, None
             session.refresh(record)
-            command_id = record.id
-            drone_vendor = drone.vendor
-            drone_id = drone.id
-
             if not compliance_passed:
-                event_bus.publish_dict(
-                    "command.blocked",
-                    tenant_id,
-                    {
-                        "command_id": record.id,
-                        "drone_id": record.drone_id,
-                        "status": record.status,
-                        "reason_code": (
-                            record.compliance_reason_code.value if record.compliance_reason_code else None
-                        ),
-                        "detail": record.compliance_detail,
-                    },
-                )
                 self._raise_blocked_if_needed(record)
+            return record, drone.vendor
 
-        event_bus.publish_dict(
-            "command.requested",
-            tenant_id,
-            {
-                "command_id": command_id,
-                "drone_id": drone_id,
-                "type": payload.type,
-                "idempotency_key": payload.idempotency_key,
-            },
+    async def dispatch_command(
+        self,
+        *,
+        tenant_id: str,
+        actor_id: str,
+        payload: CommandDispatchRequest,
+    ) -> tuple[CommandRequestRecord, bool]:
+        record, drone_vendor = await run_db(
+            self._record_dispatch,
+            tenant_id=tenant_id,
+            actor_id=actor_id,
+            payload=payload,
         )
+        if drone_vendor is None:
+            return record, False
 
-        adapter = self._resolve_adapter(drone_vendor)
+        adapter = await self._adapters.acquire(drone_vendor)
         command = Command(
             tenant_id=tenant_id,
-            command_id=command_id,
-            drone_id=drone_id,
+            command_id=record.id,
+            drone_id=record.drone_id,
             type=payload.type,
             params=payload.params,
             idempotency_key=payload.idempotency_key,
             expect_ack=payload.expect_ack,
         )
 
+        if not payload.wait_for_ack:
+            self._ack_tracker.track(
+                record.id,
+                self._deliver(tenant_id=tenant_id, adapter=adapter, command=command),
+            )
+            return record, True
+
+        record = await self._deliver(tenant_id=tenant_id, adapter=adapter, command=command)
+        return record, True
+
+    async def _deliver(
+        self,
+        *,
+        tenant_id: str,
+        adapter: CommandAdapter,
+        command: Command,
+    ) -> CommandRequestRecord:
+        command_id = command.command_id
+        drone_id = command.drone_id
         try:
             ack = await asyncio.wait_for(
                 adapter.send_command(drone_id=drone_id, command=command),
-                timeout=self._ack_timeout_seconds,
+                timeout=self._ack_deadline_seconds(command.type),
             )
         except TimeoutError:
-            record = self._persist_outcome(
+            record = await run_db(
+                self._persist_outcome,
                 tenant_id=tenant_id,
                 command_id=command_id,
                 status=CommandStatus.TIMEOUT,
@@ -269,9 +445,11 @@ class CommandService:
                 tenant_id,
                 {"command_id": record.id, "drone_id": record.drone_id, "status": record.status},
             )
-            return record, True
+            await self._notify_state(record)
+            return record
         except Exception as exc:
-            record = self._persist_outcome(
+            record = await run_db(
+                self._persist_outcome,
                 tenant_id=tenant_id,
                 command_id=command_id,
                 status=CommandStatus.FAILED,
@@ -288,12 +466,14 @@ class CommandService:
                     "message": record.ack_message,
                 },
             )
-            return record, True
+            await self._notify_state(record)
+            return record
 
         ack_ok = bool(getattr(ack, "ok", False))
         ack_message = str(getattr(ack, "message", ""))
         status = CommandStatus.ACKED if ack_ok else CommandStatus.FAILED
-        record = self._persist_outcome(
+        record = await run_db(
+            self._persist_outcome,
             tenant_id=tenant_id,
             command_id=command_id,
             status=status,
@@ -312,13 +492,25 @@ class CommandService:
                 "ack_message": record.ack_message,
             },
         )
-        return record, True
+        await self._notify_state(record)
+        return record
 
     def get_command(self, tenant_id: str, command_id: str) -> CommandRequestRecord:
         with self._session() as session:
             return self._get_scoped_command(session, tenant_id, command_id)
 
-    def list_commands(self, tenant_id: str) -> list[CommandRequestRecord]:
-        with self._session() as session:
+    def list_commands(
+        self,
+        tenant_id: str,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[CommandRequestRecord]:
+        with self._read_session() as session:
             statement = select(CommandRequestRecord).where(CommandRequestRecord.tenant_id == tenant_id)
-            return list(session.exec(statement).all())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(CommandRequestRecord.issued_at),
+                id_column=col(CommandRequestRecord.id),
+            )
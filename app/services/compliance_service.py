@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import re
+from contextlib import AbstractContextManager
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -9,8 +10,9 @@ from typing import Any
 
 from sqlalchemy import true
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
+from app.domain.geo import PreparedPolygon, point_in_polygon
 from app.domain.models import (
     AirspacePolicyEffect,
     AirspacePolicyLayer,
@@ -42,6 +44,8 @@ from app.domain.models import (
 )
 from app.domain.state_machine import MissionState, can_transition
 from app.infra.db import get_engine
+from app.infra.pagination import PageRequest, paginate_query
+from app.infra.unit_of_work import UnitOfWork, get_scoped
 
 POLYGON_WKT_PATTERN = re.compile(r"^POLYGON\s*\(\((.+)\)\)$", re.IGNORECASE)
 
@@ -78,15 +82,16 @@ class _Point:
 
 
 class ComplianceService:
-    def _session(self) -> Session:
+    def __init__(self, *, uow: UnitOfWork | None = None) -> None:
+        self._uow = uow
+
+    def _session(self) -> AbstractContextManager[Session]:
+        if self._uow is not None:
+            return self._uow.session()
         return Session(get_engine(), expire_on_commit=False)
 
     def _get_scoped_mission(self, session: Session, tenant_id: str, mission_id: str) -> Mission:
-        mission = session.exec(
-            select(Mission)
-            .where(Mission.tenant_id == tenant_id)
-            .where(Mission.id == mission_id)
-        ).first()
+        mission = get_scoped(session, Mission, tenant_id, mission_id)
         if mission is None:
             raise NotFoundError("mission not found")
         return mission
@@ -159,17 +164,7 @@ class ComplianceService:
         return points
 
     def _point_in_polygon(self, lon: float, lat: float, polygon: list[tuple[float, float]]) -> bool:
-        inside = False
-        j = len(polygon) - 1
-        for i, (xi, yi) in enumerate(polygon):
-            xj, yj = polygon[j]
-            intersects = ((yi > lat) != (yj > lat)) and (
-                lon < (xj - xi) * (lat - yi) / ((yj - yi) if (yj - yi) != 0 else 1e-12) + xi
-            )
-            if intersects:
-                inside = not inside
-            j = i
-        return inside
+        return point_in_polygon(lon, lat, polygon)
 
     def _extract_plan_points(self, plan_type: MissionPlanType, payload: dict[str, Any]) -> list[_Point]:
         points: list[_Point] = []
@@ -305,6 +300,7 @@ class ComplianceService:
         *,
         entity_type: str | None = None,
         entity_id: str | None = None,
+        page: PageRequest | None = None,
     ) -> list[ApprovalRecord]:
         with self._session() as session:
             statement = select(ApprovalRecord).where(ApprovalRecord.tenant_id == tenant_id)
@@ -312,7 +308,13 @@ class ComplianceService:
                 statement = statement.where(ApprovalRecord.entity_type == entity_type)
             if entity_id is not None:
                 statement = statement.where(ApprovalRecord.entity_id == entity_id)
-            return list(session.exec(statement).all())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(ApprovalRecord.created_at),
+                id_column=col(ApprovalRecord.id),
+            )
 
     def export_audit(self, tenant_id: str) -> str:
         rows = self.list_approvals(tenant_id)
@@ -394,6 +396,7 @@ class ComplianceService:
         *,
         entity_type: str | None = None,
         is_active: bool | None = None,
+        page: PageRequest | None = None,
     ) -> list[ComplianceApprovalFlowTemplate]:
         with self._session() as session:
             statement = select(ComplianceApprovalFlowTemplate).where(ComplianceApprovalFlowTemplate.tenant_id == tenant_id)
@@ -401,7 +404,13 @@ class ComplianceService:
                 statement = statement.where(ComplianceApprovalFlowTemplate.entity_type == entity_type)
             if is_active is not None:
                 statement = statement.where(ComplianceApprovalFlowTemplate.is_active == is_active)
-            return list(session.exec(statement).all())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(ComplianceApprovalFlowTemplate.created_at),
+                id_column=col(ComplianceApprovalFlowTemplate.id),
+            )
 
     def create_approval_flow_instance(
         self,
@@ -582,6 +591,7 @@ class ComplianceService:
         source: str | None = None,
         entity_type: str | None = None,
         entity_id: str | None = None,
+        page: PageRequest | None = None,
     ) -> list[ComplianceDecisionRecord]:
         with self._session() as session:
             statement = select(ComplianceDecisionRecord).where(ComplianceDecisionRecord.tenant_id == tenant_id)
@@ -591,8 +601,14 @@ class ComplianceService:
                 statement = statement.where(ComplianceDecisionRecord.entity_type == entity_type)
             if entity_id is not None:
                 statement = statement.where(ComplianceDecisionRecord.entity_id == entity_id)
-            rows = list(session.exec(statement).all())
-            return sorted(rows, key=lambda item: item.created_at)
+            statement = statement.order_by(col(ComplianceDecisionRecord.created_at))
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(ComplianceDecisionRecord.created_at),
+                id_column=col(ComplianceDecisionRecord.id),
+            )
 
     def export_decision_records(
         self,
@@ -785,19 +801,24 @@ class ComplianceService:
         sensitive_override = bool(constraints.get("sensitive_override", False))
         emergency_fastlane = bool(constraints.get("emergency_fastlane", False))
 
+        if not points:
+            return
+        layers = sorted(
+            {zone.policy_layer for zone in zones},
+            key=self._layer_rank,
+            reverse=True,
+        )
+        # Parse each zone once; the bounding box rejects most points before ray casting.
+        polygons = {
+            zone.id: PreparedPolygon.from_vertices(self._parse_polygon_wkt(zone.geom_wkt)) for zone in zones
+        }
         for point in points:
-            layers = sorted(
-                {zone.policy_layer for zone in zones},
-                key=self._layer_rank,
-                reverse=True,
-            )
             for layer in layers:
                 layer_hits: list[AirspaceZone] = []
                 for zone in zones:
                     if zone.policy_layer != layer:
                         continue
-                    polygon = self._parse_polygon_wkt(zone.geom_wkt)
-                    if self._point_in_polygon(point.lon, point.lat, polygon):
+                    if polygons[zone.id].contains(point.lon, point.lat):
                         layer_hits.append(zone)
                 if not layer_hits:
                     continue
@@ -904,6 +925,7 @@ class ComplianceService:
         policy_layer: AirspacePolicyLayer | None = None,
         org_unit_id: str | None = None,
         is_active: bool | None = None,
+        page: PageRequest | None = None,
     ) -> list[AirspaceZone]:
         with self._session() as session:
             statement = select(AirspaceZone).where(AirspaceZone.tenant_id == tenant_id)
@@ -915,7 +937,13 @@ class ComplianceService:
                 statement = statement.where(AirspaceZone.org_unit_id == org_unit_id)
             if is_active is not None:
                 statement = statement.where(AirspaceZone.is_active == is_active)
-            return list(session.exec(statement).all())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(AirspaceZone.created_at),
+                id_column=col(AirspaceZone.id),
+            )
 
     def get_airspace_zone(self, tenant_id: str, zone_id: str) -> AirspaceZone:
         with self._session() as session:
@@ -953,12 +981,19 @@ class ComplianceService:
         tenant_id: str,
         *,
         is_active: bool | None = None,
+        page: PageRequest | None = None,
     ) -> list[PreflightChecklistTemplate]:
         with self._session() as session:
             statement = select(PreflightChecklistTemplate).where(PreflightChecklistTemplate.tenant_id == tenant_id)
             if is_active is not None:
                 statement = statement.where(PreflightChecklistTemplate.is_active == is_active)
-            return list(session.exec(statement).all())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(PreflightChecklistTemplate.created_at),
+                id_column=col(PreflightChecklistTemplate.id),
+            )
 
     def init_mission_preflight_checklist(
         self,
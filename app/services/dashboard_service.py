@@ -13,36 +13,41 @@ from app.domain.models import (
     InspectionObservation,
     InspectionTask,
 )
-from app.infra.db import get_engine
+from app.infra.db import create_session, get_engine
+from app.infra.projection import count_rows
 
 
 class DashboardService:
     def _session(self) -> Session:
         return Session(get_engine(), expire_on_commit=False)
 
+    def _read_session(self) -> Session:
+        return create_session(read_only=True)
+
     def get_stats(self, tenant_id: str) -> DashboardStatsRead:
-        with self._session() as session:
-            drones = list(session.exec(select(Drone).where(Drone.tenant_id == tenant_id)).all())
-            tasks = list(session.exec(select(InspectionTask).where(InspectionTask.tenant_id == tenant_id)).all())
-            defects = list(session.exec(select(Defect).where(Defect.tenant_id == tenant_id)).all())
-            alerts = list(
-                session.exec(
-                    select(AlertRecord)
-                    .where(AlertRecord.tenant_id == tenant_id)
-                    .where(AlertRecord.status == AlertStatus.OPEN)
-                ).all()
+        with self._read_session() as session:
+            online_devices = count_rows(session, Drone, Drone.tenant_id == tenant_id)
+            task_created_at = list(
+                session.exec(select(InspectionTask.created_at).where(InspectionTask.tenant_id == tenant_id)).all()
+            )
+            defects_total = count_rows(session, Defect, Defect.tenant_id == tenant_id)
+            realtime_alerts = count_rows(
+                session,
+                AlertRecord,
+                AlertRecord.tenant_id == tenant_id,
+                AlertRecord.status == AlertStatus.OPEN,
             )
         today = datetime.now(UTC).date()
-        today_inspections = len([item for item in tasks if item.created_at.date() == today])
+        today_inspections = len([item for item in task_created_at if item.date() == today])
         return DashboardStatsRead(
-            online_devices=len(drones),
+            online_devices=online_devices,
             today_inspections=today_inspections,
-            defects_total=len(defects),
-            realtime_alerts=len(alerts),
+            defects_total=defects_total,
+            realtime_alerts=realtime_alerts,
         )
 
     def latest_observations(self, tenant_id: str, limit: int = 100) -> list[InspectionObservation]:
-        with self._session() as session:
+        with self._read_session() as session:
             statement = select(InspectionObservation).where(InspectionObservation.tenant_id == tenant_id)
             rows = list(session.exec(statement).all())
         return rows[:limit]
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import json
 from collections.abc import Iterable
 from dataclasses import dataclass, field
+from typing import Any, Protocol, TypeVar
 
+from sqlalchemy import and_, false, not_, or_, true
+from sqlalchemy.sql.elements import ColumnElement
 from sqlmodel import Session, col, select
 
 from app.domain.models import (
@@ -18,6 +22,14 @@ from app.domain.models import (
     TaskCenterTask,
     UserRole,
 )
+from app.infra.policy_cache import PolicyCache
+from app.infra.unit_of_work import UnitOfWork
+
+SelectT = TypeVar("SelectT")
+LinkedRowT = TypeVar("LinkedRowT", bound="LinkedRow")
+LINKED_VISIBILITY_CHUNK_SIZE = 500
+
+_PerimeterAttrs = tuple[str | None, str | None, str | None]
 
 
 @dataclass(frozen=True)
@@ -52,7 +64,65 @@ class DataPerimeterScope:
         return self.mode == DataScopeMode.ALL
 
 
+class LinkedRow(Protocol):
+    @property
+    def task_id(self) -> str | None: ...
+
+    @property
+    def mission_id(self) -> str | None: ...
+
+
+_RULE_FIELDS = ("org_unit_ids", "project_codes", "area_codes", "task_ids", "resource_ids")
+
+
+def _rule_to_dict(rule: DataPerimeterRule) -> dict[str, list[str]]:
+    return {name: sorted(getattr(rule, name)) for name in _RULE_FIELDS}
+
+
+def _rule_from_dict(data: dict[str, list[str]]) -> DataPerimeterRule:
+    return DataPerimeterRule(**{name: frozenset(data.get(name, [])) for name in _RULE_FIELDS})
+
+
+def dump_scope(scope: DataPerimeterScope) -> str:
+    return json.dumps(
+        {
+            "mode": scope.mode.value,
+            "explicit_deny": _rule_to_dict(scope.explicit_deny),
+            "explicit_allow": _rule_to_dict(scope.explicit_allow),
+            "inherited_allow": _rule_to_dict(scope.inherited_allow),
+            "inherited_allow_all": scope.inherited_allow_all,
+        }
+    )
+
+
+def load_scope(raw: str) -> DataPerimeterScope:
+    data = json.loads(raw)
+    return DataPerimeterScope(
+        mode=DataScopeMode(data["mode"]),
+        explicit_deny=_rule_from_dict(data["explicit_deny"]),
+        explicit_allow=_rule_from_dict(data["explicit_allow"]),
+        inherited_allow=_rule_from_dict(data["inherited_allow"]),
+        inherited_allow_all=bool(data["inherited_allow_all"]),
+    )
+
+
+scope_cache: PolicyCache[DataPerimeterScope] = PolicyCache(
+    "data-perimeter",
+    dump=dump_scope,
+    load=load_scope,
+)
+
+
 class DataPerimeterService:
+    def __init__(
+        self,
+        cache: PolicyCache[DataPerimeterScope] | None = None,
+        *,
+        uow: UnitOfWork | None = None,
+    ) -> None:
+        self._cache = cache or scope_cache
+        self._uow = uow
+
     def _normalize_values(self, values: Iterable[str]) -> frozenset[str]:
         normalized = {item.strip() for item in values if isinstance(item, str) and item.strip()}
         return frozenset(normalized)
@@ -94,10 +164,175 @@ class DataPerimeterService:
             return False
         return not (rule.resource_ids and resource_id is not None and resource_id not in rule.resource_ids)
 
+    def _rule_clause(
+        self,
+        rule: DataPerimeterRule,
+        *,
+        org_unit_id: Any = None,
+        project_code: Any = None,
+        area_code: Any = None,
+        task_id: Any = None,
+        resource_id: Any = None,
+    ) -> ColumnElement[bool]:
+        # Mirrors _rule_matches: NULL or unmapped dimensions never exclude a row.
+        conditions: list[ColumnElement[bool]] = []
+        for column, values in (
+            (org_unit_id, rule.org_unit_ids),
+            (project_code, rule.project_codes),
+            (area_code, rule.area_codes),
+            (task_id, rule.task_ids),
+            (resource_id, rule.resource_ids),
+        ):
+            if values and column is not None:
+                conditions.append(or_(column.is_(None), column.in_(sorted(values))))
+        return and_(true(), *conditions)
+
+    def scope_clause(
+        self,
+        scope: DataPerimeterScope,
+        *,
+        org_unit_id: Any = None,
+        project_code: Any = None,
+        area_code: Any = None,
+        task_id: Any = None,
+        resource_id: Any = None,
+    ) -> ColumnElement[bool] | None:
+        """Compile the scope into a WHERE predicate equivalent to `allows`.
+
+        Columns left as None are treated like the None arguments of `allows`. Returns
+        None when the scope does not restrict rows at all.
+        """
+        columns = {
+            "org_unit_id": org_unit_id,
+            "project_code": project_code,
+            "area_code": area_code,
+            "task_id": task_id,
+            "resource_id": resource_id,
+        }
+        deny: ColumnElement[bool] | None = None
+        if scope.explicit_deny.has_constraints():
+            deny = not_(self._rule_clause(scope.explicit_deny, **columns))
+
+        if scope.mode == DataScopeMode.ALL or scope.inherited_allow_all:
+            return deny
+
+        allowed: list[ColumnElement[bool]] = []
+        if scope.explicit_allow.has_constraints():
+            allowed.append(self._rule_clause(scope.explicit_allow, **columns))
+        if scope.inherited_allow.has_constraints():
+            allowed.append(self._rule_clause(scope.inherited_allow, **columns))
+        allow = or_(*allowed) if allowed else false()
+        return allow if deny is None else and_(deny, allow)
+
+    def restrict(self, statement: SelectT, clause: ColumnElement[bool] | None) -> SelectT:
+        if clause is None:
+            return statement
+        return statement.where(clause)  # type: ignore[attr-defined,no-any-return]
+
+    def mission_clause(self, scope: DataPerimeterScope) -> ColumnElement[bool] | None:
+        return self.scope_clause(
+            scope,
+            org_unit_id=col(Mission.org_unit_id),
+            project_code=col(Mission.project_code),
+            area_code=col(Mission.area_code),
+            task_id=col(Mission.id),
+        )
+
+    def inspection_task_clause(self, scope: DataPerimeterScope) -> ColumnElement[bool] | None:
+        return self.scope_clause(
+            scope,
+            org_unit_id=col(InspectionTask.org_unit_id),
+            project_code=col(InspectionTask.project_code),
+            area_code=col(InspectionTask.area_code),
+            task_id=col(InspectionTask.id),
+        )
+
+    def defect_clause(self, scope: DataPerimeterScope) -> ColumnElement[bool] | None:
+        return self.scope_clause(
+            scope,
+            org_unit_id=col(Defect.org_unit_id),
+            project_code=col(Defect.project_code),
+            area_code=col(Defect.area_code),
+            task_id=col(Defect.task_id),
+        )
+
+    def incident_clause(self, scope: DataPerimeterScope) -> ColumnElement[bool] | None:
+        return self.scope_clause(
+            scope,
+            org_unit_id=col(Incident.org_unit_id),
+            project_code=col(Incident.project_code),
+            area_code=col(Incident.area_code),
+            task_id=col(Incident.linked_task_id),
+        )
+
+    def task_center_clause(self, scope: DataPerimeterScope) -> ColumnElement[bool] | None:
+        return self.scope_clause(
+            scope,
+            org_unit_id=col(TaskCenterTask.org_unit_id),
+            project_code=col(TaskCenterTask.project_code),
+            area_code=col(TaskCenterTask.area_code),
+            task_id=col(TaskCenterTask.id),
+        )
+
+    def asset_clause(self, scope: DataPerimeterScope) -> ColumnElement[bool] | None:
+        return self.scope_clause(
+            scope,
+            area_code=col(Asset.region_code),
+            resource_id=col(Asset.id),
+        )
+
+    def drone_clause(self, scope: DataPerimeterScope) -> ColumnElement[bool] | None:
+        return self.scope_clause(scope, resource_id=col(Drone.id))
+
+    def linked_clause(
+        self,
+        scope: DataPerimeterScope,
+        tenant_id: str,
+        *,
+        task_id: Any,
+        mission_id: Any,
+    ) -> ColumnElement[bool]:
+        """SQL counterpart of LinkedVisibilityResolver for rows linked to a task or mission."""
+        visible_tasks = self.restrict(
+            select(InspectionTask.id).where(InspectionTask.tenant_id == tenant_id),
+            self.inspection_task_clause(scope),
+        )
+        visible_missions = self.restrict(
+            select(Mission.id).where(Mission.tenant_id == tenant_id),
+            self.mission_clause(scope),
+        )
+        return or_(
+            and_(task_id.is_not(None), task_id.in_(visible_tasks)),
+            and_(task_id.is_(None), mission_id.is_not(None), mission_id.in_(visible_missions)),
+            and_(task_id.is_(None), mission_id.is_(None)),
+        )
+
+    def linked_visibility(
+        self,
+        session: Session,
+        tenant_id: str,
+        scope: DataPerimeterScope,
+    ) -> LinkedVisibilityResolver:
+        return LinkedVisibilityResolver(self, session, tenant_id, scope)
+
     def resolve_scope(self, session: Session, tenant_id: str, user_id: str | None) -> DataPerimeterScope:
         if user_id is None:
             return DataPerimeterScope(mode=DataScopeMode.ALL)
+        if self._uow is not None:
+            return self._uow.memo(
+                ("data-perimeter-scope", tenant_id, user_id),
+                lambda: self._cached_scope(session, tenant_id, user_id),
+            )
+        return self._cached_scope(session, tenant_id, user_id)
 
+    def _cached_scope(self, session: Session, tenant_id: str, user_id: str) -> DataPerimeterScope:
+        return self._cache.get_or_load(
+            tenant_id,
+            user_id,
+            lambda: self._load_scope(session, tenant_id, user_id),
+        )
+
+    def _load_scope(self, session: Session, tenant_id: str, user_id: str) -> DataPerimeterScope:
         user_policy = session.exec(
             select(DataAccessPolicy)
             .where(DataAccessPolicy.tenant_id == tenant_id)
@@ -263,3 +498,84 @@ class DataPerimeterService:
             task_id=None,
             resource_id=drone.id,
         )
+
+
+class LinkedVisibilityResolver:
+    """Batch visibility for rows linked to an inspection task or a mission.
+
+    The linked tasks and missions are loaded with one IN query per chunk and the
+    scope is evaluated over the preloaded attributes. A link to a task or mission
+    that does not exist is not visible.
+    """
+
+    def __init__(
+        self,
+        data_perimeter: DataPerimeterService,
+        session: Session,
+        tenant_id: str,
+        scope: DataPerimeterScope,
+    ) -> None:
+        self._data_perimeter = data_perimeter
+        self._session = session
+        self._tenant_id = tenant_id
+        self._scope = scope
+        self._tasks: dict[str, _PerimeterAttrs | None] = {}
+        self._missions: dict[str, _PerimeterAttrs | None] = {}
+
+    def _load(
+        self,
+        model: type[InspectionTask] | type[Mission],
+        ids: set[str],
+        cache: dict[str, _PerimeterAttrs | None],
+    ) -> None:
+        pending = sorted(ids - cache.keys())
+        for start in range(0, len(pending), LINKED_VISIBILITY_CHUNK_SIZE):
+            chunk = pending[start : start + LINKED_VISIBILITY_CHUNK_SIZE]
+            rows = self._session.exec(
+                select(model.id, model.org_unit_id, model.project_code, model.area_code)
+                .where(model.tenant_id == self._tenant_id)
+                .where(col(model.id).in_(chunk))
+            ).all()
+            for row_id, org_unit_id, project_code, area_code in rows:
+                cache[row_id] = (org_unit_id, project_code, area_code)
+            for row_id in chunk:
+                cache.setdefault(row_id, None)
+
+    def prefetch(self, links: Iterable[tuple[str | None, str | None]]) -> None:
+        task_ids: set[str] = set()
+        mission_ids: set[str] = set()
+        for task_id, mission_id in links:
+            if task_id is not None:
+                task_ids.add(task_id)
+            elif mission_id is not None:
+                mission_ids.add(mission_id)
+        self._load(InspectionTask, task_ids, self._tasks)
+        self._load(Mission, mission_ids, self._missions)
+
+    def _allows(self, attrs: _PerimeterAttrs | None, task_id: str) -> bool:
+        if attrs is None:
+            return False
+        org_unit_id, project_code, area_code = attrs
+        return self._data_perimeter.allows(
+            self._scope,
+            org_unit_id=org_unit_id,
+            project_code=project_code,
+            area_code=area_code,
+            task_id=task_id,
+        )
+
+    def is_visible(self, *, task_id: str | None, mission_id: str | None) -> bool:
+        if task_id is not None:
+            if task_id not in self._tasks:
+                self._load(InspectionTask, {task_id}, self._tasks)
+            return self._allows(self._tasks[task_id], task_id)
+        if mission_id is not None:
+            if mission_id not in self._missions:
+                self._load(Mission, {mission_id}, self._missions)
+            return self._allows(self._missions[mission_id], mission_id)
+        return True
+
+    def filter(self, rows: Iterable[LinkedRowT]) -> list[LinkedRowT]:
+        items = list(rows)
+        self.prefetch((item.task_id, item.mission_id) for item in items)
+        return [item for item in items if self.is_visible(task_id=item.task_id, mission_id=item.mission_id)]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import ClassVar
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.domain.models import (
     Defect,
@@ -15,8 +15,9 @@ from app.domain.models import (
     InspectionTask,
     InspectionTaskStatus,
 )
-from app.infra.db import get_engine
+from app.infra.db import create_session, get_engine
 from app.infra.events import event_bus
+from app.infra.pagination import PageRequest, paginate_query
 from app.services.data_perimeter_service import DataPerimeterScope, DataPerimeterService
 
 
@@ -48,6 +49,9 @@ class DefectService:
     def _session(self) -> Session:
         return Session(get_engine(), expire_on_commit=False)
 
+    def _read_session(self) -> Session:
+        return create_session(read_only=True)
+
     def _scope(
         self,
         session: Session,
@@ -172,16 +176,26 @@ class DefectService:
         status: DefectStatus | None = None,
         assigned_to: str | None = None,
         viewer_user_id: str | None = None,
+        *,
+        page: PageRequest | None = None,
     ) -> list[Defect]:
-        with self._session() as session:
+        with self._read_session() as session:
             statement = select(Defect).where(Defect.tenant_id == tenant_id)
             if status is not None:
                 statement = statement.where(Defect.status == status)
             if assigned_to is not None:
                 statement = statement.where(Defect.assigned_to == assigned_to)
-            rows = list(session.exec(statement).all())
             scope = self._scope(session, tenant_id, viewer_user_id)
-            return [item for item in rows if self._data_perimeter.defect_visible(item, scope)]
+            statement = self._data_perimeter.restrict(
+                statement, self._data_perimeter.defect_clause(scope)
+            )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(Defect.created_at),
+                id_column=col(Defect.id),
+            )
 
     def get_defect(
         self,
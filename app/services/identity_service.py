@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import os
 from typing import Any
 
@@ -52,6 +53,8 @@ from app.domain.permissions import (
     PERM_WILDCARD,
 )
 from app.infra.db import get_engine
+from app.infra.pagination import PageRequest, paginate_query
+from app.infra.policy_cache import PolicyCache, bump_policy_version
 
 
 class IdentityError(Exception):
@@ -70,6 +73,20 @@ class AuthError(IdentityError):
     pass
 
 
+def _load_permission_names(raw: str) -> list[str]:
+    data = json.loads(raw)
+    if not isinstance(data, list):
+        raise ValueError("cached permissions must be a list")
+    return [str(item) for item in data]
+
+
+permission_cache: PolicyCache[list[str]] = PolicyCache(
+    "user-permissions",
+    dump=json.dumps,
+    load=_load_permission_names,
+)
+
+
 class IdentityService:
     ROLE_TEMPLATES: tuple[dict[str, Any], ...] = (
         {
@@ -126,6 +143,9 @@ class IdentityService:
         },
     )
 
+    def __init__(self, cache: PolicyCache[list[str]] | None = None) -> None:
+        self._permission_cache = cache or permission_cache
+
     def _session(self) -> Session:
         return Session(get_engine(), expire_on_commit=False)
 
@@ -230,9 +250,16 @@ class IdentityService:
             tenant = session.get(Tenant, tenant_id)
             return [tenant] if tenant is not None else []
 
-    def list_all_tenants(self) -> list[Tenant]:
+    def list_all_tenants(self, *, page: PageRequest | None = None) -> list[Tenant]:
         with self._session() as session:
-            return list(session.exec(select(Tenant)).all())
+            statement = select(Tenant)
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(Tenant.created_at),
+                id_column=col(Tenant.id),
+            )
 
     def get_tenant(self, tenant_id: str) -> Tenant:
         with self._session() as session:
@@ -324,9 +351,16 @@ class IdentityService:
             session.commit()
             return admin_user
 
-    def list_users(self, tenant_id: str) -> list[User]:
+    def list_users(self, tenant_id: str, *, page: PageRequest | None = None) -> list[User]:
         with self._session() as session:
-            return list(session.exec(select(User).where(User.tenant_id == tenant_id)).all())
+            statement = select(User).where(User.tenant_id == tenant_id)
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(User.created_at),
+                id_column=col(User.id),
+            )
 
     def get_user(self, tenant_id: str, user_id: str) -> User:
         with self._session() as session:
@@ -356,6 +390,7 @@ class IdentityService:
                 raise NotFoundError("user not found")
             session.delete(user)
             session.commit()
+            bump_policy_version(tenant_id)
 
     def create_role(self, tenant_id: str, payload: RoleCreate) -> Role:
         with self._session() as session:
@@ -369,9 +404,16 @@ class IdentityService:
             session.refresh(role)
             return role
 
-    def list_roles(self, tenant_id: str) -> list[Role]:
+    def list_roles(self, tenant_id: str, *, page: PageRequest | None = None) -> list[Role]:
         with self._session() as session:
-            return list(session.exec(select(Role).where(Role.tenant_id == tenant_id)).all())
+            statement = select(Role).where(Role.tenant_id == tenant_id)
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(Role.created_at),
+                id_column=col(Role.id),
+            )
 
     def get_role(self, tenant_id: str, role_id: str) -> Role:
         with self._session() as session:
@@ -405,6 +447,7 @@ class IdentityService:
                 raise NotFoundError("role not found")
             session.delete(role)
             session.commit()
+            bump_policy_version(tenant_id)
 
     def list_role_templates(self) -> list[dict[str, Any]]:
         return [
@@ -490,10 +533,16 @@ class IdentityService:
             session.refresh(org_unit)
             return org_unit
 
-    def list_org_units(self, tenant_id: str) -> list[OrgUnit]:
+    def list_org_units(self, tenant_id: str, *, page: PageRequest | None = None) -> list[OrgUnit]:
         with self._session() as session:
-            units = list(session.exec(select(OrgUnit).where(OrgUnit.tenant_id == tenant_id)).all())
-            return sorted(units, key=lambda item: item.path)
+            statement = select(OrgUnit).where(OrgUnit.tenant_id == tenant_id).order_by(col(OrgUnit.path))
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(OrgUnit.created_at),
+                id_column=col(OrgUnit.id),
+            )
 
     def get_org_unit(self, tenant_id: str, org_unit_id: str) -> OrgUnit:
         with self._session() as session:
@@ -645,19 +694,30 @@ class IdentityService:
             session.delete(link)
             session.commit()
 
-    def list_user_org_units(self, tenant_id: str, user_id: str) -> list[UserOrgMembership]:
+    def list_user_org_units(
+        self,
+        tenant_id: str,
+        user_id: str,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[UserOrgMembership]:
         with self._session() as session:
             user = self._get_scoped_user(session, tenant_id, user_id)
             if user is None:
                 raise NotFoundError("user not found")
-            links = list(
-                session.exec(
-                    select(UserOrgMembership)
-                    .where(UserOrgMembership.tenant_id == tenant_id)
-                    .where(UserOrgMembership.user_id == user_id)
-                ).all()
+            statement = (
+                select(UserOrgMembership)
+                .where(UserOrgMembership.tenant_id == tenant_id)
+                .where(UserOrgMembership.user_id == user_id)
+                .order_by(col(UserOrgMembership.is_primary).desc(), col(UserOrgMembership.org_unit_id))
+            )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(UserOrgMembership.created_at),
+                id_column=col(UserOrgMembership.org_unit_id),
             )
-            return sorted(links, key=lambda item: (not item.is_primary, item.org_unit_id))
 
     def get_user_data_policy(self, tenant_id: str, user_id: str) -> DataAccessPolicy:
         with self._session() as session:
@@ -722,6 +782,7 @@ class IdentityService:
             policy.updated_at = now_utc()
             session.add(policy)
             session.commit()
+            bump_policy_version(tenant_id)
             session.refresh(policy)
             return policy
 
@@ -778,6 +839,7 @@ class IdentityService:
             policy.updated_at = now_utc()
             session.add(policy)
             session.commit()
+            bump_policy_version(tenant_id)
             session.refresh(policy)
             return policy
 
@@ -886,9 +948,16 @@ class IdentityService:
             session.refresh(permission)
             return permission
 
-    def list_permissions(self) -> list[Permission]:
+    def list_permissions(self, *, page: PageRequest | None = None) -> list[Permission]:
         with self._session() as session:
-            return list(session.exec(select(Permission)).all())
+            statement = select(Permission)
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(Permission.created_at),
+                id_column=col(Permission.id),
+            )
 
     def get_permission(self, permission_id: str) -> Permission:
         with self._session() as session:
@@ -906,6 +975,7 @@ class IdentityService:
                 permission.name = payload.name
             if payload.description is not None:
                 permission.description = payload.description
+            affected_tenant_ids = self._tenants_granted_permission(session, permission_id)
             session.add(permission)
             try:
                 session.commit()
@@ -913,15 +983,30 @@ class IdentityService:
                 session.rollback()
                 raise ConflictError("permission name already exists") from exc
             session.refresh(permission)
-            return permission
+        if payload.name is not None:
+            for tenant_id in affected_tenant_ids:
+                bump_policy_version(tenant_id)
+        return permission
 
     def delete_permission(self, permission_id: str) -> None:
         with self._session() as session:
             permission = session.get(Permission, permission_id)
             if permission is None:
                 raise NotFoundError("permission not found")
+            affected_tenant_ids = self._tenants_granted_permission(session, permission_id)
             session.delete(permission)
             session.commit()
+        for tenant_id in affected_tenant_ids:
+            bump_policy_version(tenant_id)
+
+    def _tenants_granted_permission(self, session: Session, permission_id: str) -> list[str]:
+        statement = (
+            select(Role.tenant_id)
+            .join(RolePermission, col(RolePermission.role_id) == col(Role.id))
+            .where(RolePermission.permission_id == permission_id)
+            .distinct()
+        )
+        return list(session.exec(statement).all())
 
     def bind_user_role(self, tenant_id: str, user_id: str, role_id: str) -> None:
         with self._session() as session:
@@ -933,6 +1018,7 @@ class IdentityService:
                 return
             session.add(UserRole(tenant_id=tenant_id, user_id=user_id, role_id=role_id))
             session.commit()
+            bump_policy_version(tenant_id)
 
     def bind_user_roles_batch(
         self,
@@ -993,6 +1079,7 @@ class IdentityService:
 
             if any(item["status"] == "bound" for item in results):
                 session.commit()
+                bump_policy_version(tenant_id)
 
             return {
                 "user_id": user_id,
@@ -1015,6 +1102,7 @@ class IdentityService:
                 return
             session.delete(user_role)
             session.commit()
+            bump_policy_version(tenant_id)
 
     def bind_role_permission(self, tenant_id: str, role_id: str, permission_id: str) -> None:
         with self._session() as session:
@@ -1026,6 +1114,7 @@ class IdentityService:
                 return
             session.add(RolePermission(role_id=role_id, permission_id=permission_id))
             session.commit()
+            bump_policy_version(tenant_id)
 
     def unbind_role_permission(self, tenant_id: str, role_id: str, permission_id: str) -> None:
         with self._session() as session:
@@ -1038,43 +1127,40 @@ class IdentityService:
                 return
             session.delete(role_permission)
             session.commit()
+            bump_policy_version(tenant_id)
 
     def collect_user_permissions(self, tenant_id: str, user_id: str) -> list[str]:
+        return self.collect_users_permissions(tenant_id, [user_id]).get(user_id, [])
+
+    def collect_users_permissions(self, tenant_id: str, user_ids: list[str]) -> dict[str, list[str]]:
+        """Effective permission names per user, served from the tenant's policy cache.
+
+        Users outside the tenant or without roles map to an empty list.
+        """
+        normalized_ids = [item for item in user_ids if isinstance(item, str) and item]
+        return self._permission_cache.get_many_or_load(
+            tenant_id,
+            normalized_ids,
+            lambda missing: self._load_users_permissions(tenant_id, missing),
+        )
+
+    def _load_users_permissions(self, tenant_id: str, user_ids: list[str]) -> dict[str, list[str]]:
+        names_by_user: dict[str, set[str]] = {user_id: set() for user_id in user_ids}
         with self._session() as session:
-            user = self._get_scoped_user(session, tenant_id, user_id)
-            if user is None:
-                return []
-
-            user_role_links = list(
-                session.exec(
-                    select(UserRole)
-                    .where(UserRole.tenant_id == tenant_id)
-                    .where(UserRole.user_id == user_id)
-                ).all()
-            )
-            role_ids = [item.role_id for item in user_role_links]
-            if not role_ids:
-                return []
-
-            scoped_roles = list(
-                session.exec(
-                    select(Role).where(Role.tenant_id == tenant_id).where(col(Role.id).in_(role_ids))
-                ).all()
+            statement = (
+                select(UserRole.user_id, Permission.name)
+                .join(
+                    Role,
+                    (col(Role.id) == col(UserRole.role_id)) & (col(Role.tenant_id) == tenant_id),
+                )
+                .join(RolePermission, col(RolePermission.role_id) == col(Role.id))
+                .join(Permission, col(Permission.id) == col(RolePermission.permission_id))
+                .where(UserRole.tenant_id == tenant_id)
+                .where(col(UserRole.user_id).in_(user_ids))
             )
-            scoped_role_ids = [role.id for role in scoped_roles]
-            if not scoped_role_ids:
-                return []
-
-            all_role_permissions = list(session.exec(select(RolePermission)).all())
-            role_perm_links = [item for item in all_role_permissions if item.role_id in scoped_role_ids]
-            permission_ids = [item.permission_id for item in role_perm_links]
-            if not permission_ids:
-                return []
-
-            all_permissions = list(session.exec(select(Permission)).all())
-            permissions = [permission for permission in all_permissions if permission.id in permission_ids]
-            names = [permission.name for permission in permissions]
-            return sorted(set(names))
+            for user_id, name in session.exec(statement).all():
+                names_by_user[user_id].add(name)
+        return {user_id: sorted(names) for user_id, names in names_by_user.items()}
 
     def dev_login(self, tenant_id: str, username: str, password: str) -> tuple[User, list[str]]:
         with self._session() as session:
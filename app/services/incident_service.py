@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.domain.models import (
     Incident,
@@ -16,8 +16,9 @@ from app.domain.models import (
     OrgUnit,
 )
 from app.domain.state_machine import MissionState
-from app.infra.db import get_engine
+from app.infra.db import create_session, get_engine
 from app.infra.events import event_bus
+from app.infra.pagination import PageRequest, paginate_query
 from app.services.data_perimeter_service import DataPerimeterService
 
 
@@ -40,6 +41,9 @@ class IncidentService:
     def _session(self) -> Session:
         return Session(get_engine(), expire_on_commit=False)
 
+    def _read_session(self) -> Session:
+        return create_session(read_only=True)
+
     def _get_scoped_incident(
         self,
         session: Session,
@@ -96,13 +100,27 @@ class IncidentService:
         )
         return incident
 
-    def list_incidents(self, tenant_id: str, viewer_user_id: str | None = None) -> list[Incident]:
-        with self._session() as session:
-            rows = list(session.exec(select(Incident).where(Incident.tenant_id == tenant_id)).all())
-            if viewer_user_id is None:
-                return rows
-            scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
-            return [item for item in rows if self._data_perimeter.incident_visible(item, scope)]
+    def list_incidents(
+        self,
+        tenant_id: str,
+        viewer_user_id: str | None = None,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[Incident]:
+        with self._read_session() as session:
+            statement = select(Incident).where(Incident.tenant_id == tenant_id)
+            if viewer_user_id is not None:
+                scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
+                statement = self._data_perimeter.restrict(
+                    statement, self._data_perimeter.incident_clause(scope)
+                )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(Incident.created_at),
+                id_column=col(Incident.id),
+            )
 
     def create_task_for_incident(
         self,
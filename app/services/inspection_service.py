@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from pathlib import Path
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.domain.models import (
     InspectionExport,
@@ -18,8 +18,9 @@ from app.domain.models import (
     InspectionTemplateItemCreate,
     OrgUnit,
 )
-from app.infra.db import get_engine
+from app.infra.db import create_session, get_engine
 from app.infra.events import event_bus
+from app.infra.pagination import PageRequest, paginate_query
 from app.services.data_perimeter_service import DataPerimeterService
 from app.services.outcome_service import OutcomeService
 
@@ -44,6 +45,9 @@ class InspectionService:
     def _session(self) -> Session:
         return Session(get_engine(), expire_on_commit=False)
 
+    def _read_session(self) -> Session:
+        return create_session(read_only=True)
+
     def _get_scoped_template(self, session: Session, tenant_id: str, template_id: str) -> InspectionTemplate:
         template = session.exec(
             select(InspectionTemplate)
@@ -113,10 +117,21 @@ class InspectionService:
         )
         return template
 
-    def list_templates(self, tenant_id: str) -> list[InspectionTemplate]:
+    def list_templates(
+        self,
+        tenant_id: str,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[InspectionTemplate]:
         with self._session() as session:
             statement = select(InspectionTemplate).where(InspectionTemplate.tenant_id == tenant_id)
-            return list(session.exec(statement).all())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(InspectionTemplate.created_at),
+                id_column=col(InspectionTemplate.id),
+            )
 
     def get_template(self, tenant_id: str, template_id: str) -> InspectionTemplate:
         with self._session() as session:
@@ -145,7 +160,13 @@ class InspectionService:
             session.refresh(item)
             return item
 
-    def list_template_items(self, tenant_id: str, template_id: str) -> list[InspectionTemplateItem]:
+    def list_template_items(
+        self,
+        tenant_id: str,
+        template_id: str,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[InspectionTemplateItem]:
         with self._session() as session:
             _ = self._get_scoped_template(session, tenant_id, template_id)
             statement = (
@@ -153,7 +174,13 @@ class InspectionService:
                 .where(InspectionTemplateItem.tenant_id == tenant_id)
                 .where(InspectionTemplateItem.template_id == template_id)
             )
-            return list(session.exec(statement).all())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(InspectionTemplateItem.created_at),
+                id_column=col(InspectionTemplateItem.id),
+            )
 
     def create_task(self, tenant_id: str, payload: InspectionTaskCreate) -> InspectionTask:
         with self._session() as session:
@@ -187,16 +214,25 @@ class InspectionService:
         tenant_id: str,
         status: InspectionTaskStatus | None = None,
         viewer_user_id: str | None = None,
+        *,
+        page: PageRequest | None = None,
     ) -> list[InspectionTask]:
-        with self._session() as session:
+        with self._read_session() as session:
             statement = select(InspectionTask).where(InspectionTask.tenant_id == tenant_id)
             if status is not None:
                 statement = statement.where(InspectionTask.status == status)
-            rows = list(session.exec(statement).all())
-            if viewer_user_id is None:
-                return rows
-            scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
-            return [item for item in rows if self._data_perimeter.inspection_task_visible(item, scope)]
+            if viewer_user_id is not None:
+                scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
+                statement = self._data_perimeter.restrict(
+                    statement, self._data_perimeter.inspection_task_clause(scope)
+                )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(InspectionTask.created_at),
+                id_column=col(InspectionTask.id),
+            )
 
     def get_task(self, tenant_id: str, task_id: str, viewer_user_id: str | None = None) -> InspectionTask:
         with self._session() as session:
@@ -248,6 +284,8 @@ class InspectionService:
         tenant_id: str,
         task_id: str,
         viewer_user_id: str | None = None,
+        *,
+        page: PageRequest | None = None,
     ) -> list[InspectionObservation]:
         with self._session() as session:
             task = self._get_scoped_task(session, tenant_id, task_id)
@@ -257,7 +295,13 @@ class InspectionService:
                 .where(InspectionObservation.tenant_id == tenant_id)
                 .where(InspectionObservation.task_id == task_id)
             )
-            return list(session.exec(statement).all())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(InspectionObservation.created_at),
+                id_column=col(InspectionObservation.id),
+            )
 
     def create_export(
         self,
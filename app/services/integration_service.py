@@ -28,7 +28,7 @@ from app.domain.models import (
     VideoStreamStatus,
     VideoStreamUpdateRequest,
 )
-from app.infra.db import get_engine
+from app.infra.db import get_engine, run_db
 from app.infra.events import event_bus
 from app.services.telemetry_service import NotFoundError as TelemetryNotFoundError
 from app.services.telemetry_service import TelemetryService
@@ -105,6 +105,10 @@ class IntegrationService:
             raise NotFoundError("drone not found")
         return drone
 
+    def _load_drone(self, tenant_id: str, drone_id: str) -> Drone:
+        with self._session() as session:
+            return self._get_scoped_drone(session, tenant_id, drone_id)
+
     def _build_adapter(self, state: _DeviceSessionState) -> _IntegrationAdapter:
         if state.adapter_vendor == DroneVendor.FAKE:
             return FakeAdapter(
@@ -162,7 +166,7 @@ class IntegrationService:
                     if current.status != DeviceIntegrationSessionStatus.RUNNING:
                         break
                     current.samples_ingested += 1
-                self._telemetry_service.ingest(state.tenant_id, sample)
+                await run_db(self._telemetry_service.ingest, state.tenant_id, sample)
 
             publish_done = False
             with self._lock:
@@ -211,8 +215,7 @@ class IntegrationService:
         tenant_id: str,
         payload: DeviceIntegrationStartRequest,
     ) -> DeviceIntegrationSessionRead:
-        with self._session() as session:
-            drone = self._get_scoped_drone(session, tenant_id, payload.drone_id)
+        drone = await run_db(self._load_drone, tenant_id, payload.drone_id)
         adapter_vendor = payload.adapter_vendor or drone.vendor
 
         with self._lock:
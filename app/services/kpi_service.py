@@ -1,24 +1,168 @@
 from __future__ import annotations
 
-import math
-from datetime import datetime
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import Any
+from uuid import uuid4
 
-from sqlmodel import Session, select
+from sqlalchemy import Float, and_, case, delete, func, or_, update
+from sqlalchemy import select as sa_select
+from sqlmodel import Session, col, select
 
+from app.domain.geo import (
+    EARTH_RADIUS_KM,
+    BoundingBox,
+    haversine_km,
+    tile_bounds,
+    tile_quadkey,
+    tile_range,
+    tile_xy,
+    track_length_km,
+)
 from app.domain.models import (
     AlertRecord,
     EventRecord,
+    KpiFlightRollupBackfillRead,
+    KpiFlightRollupBackfillRequest,
+    KpiFlightRollupHourly,
     KpiGovernanceExportRequest,
     KpiHeatmapBinRecord,
+    KpiHeatmapGridCell,
+    KpiHeatmapGridRebuildRead,
     KpiHeatmapSource,
     KpiSnapshotRecomputeRequest,
     KpiSnapshotRecord,
     Mission,
     MissionRun,
     OutcomeCatalogRecord,
+    now_utc,
 )
-from app.infra.db import get_engine
+from app.infra.db import create_session, get_engine
+from app.infra.pagination import PageRequest, paginate_items, paginate_query
+from app.infra.projection import without_json
+from app.infra.upsert import insert_missing_rows, upsert_rows
+
+_ROLLUP_BUCKET = timedelta(hours=1)
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def _hour_floor(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def _hour_ceil(value: datetime) -> datetime:
+    floor = _hour_floor(value)
+    return floor if floor == value else floor + _ROLLUP_BUCKET
+
+
+def _day_floor(value: datetime) -> datetime:
+    return _as_utc(value).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _heatmap_zoom_levels(raw: str) -> tuple[int, ...]:
+    levels = {int(item) for item in raw.split(",") if item.strip()}
+    return tuple(sorted(level for level in levels if 0 <= level <= 22)) or (12,)
+
+
+KPI_HEATMAP_ZOOM_LEVELS = _heatmap_zoom_levels(os.getenv("KPI_HEATMAP_ZOOM_LEVELS", "6,8,10,12,14"))
+_HEATMAP_CELL_KEY = ("tenant_id", "source", "zoom", "tile_x", "tile_y", "bucket_start")
+
+
+def heatmap_cell_deltas(
+    tenant_id: str,
+    source: KpiHeatmapSource,
+    points: Iterable[tuple[datetime, float, float, int]],
+) -> list[dict[str, Any]]:
+    """Grid cell increments for `(at, lat, lon, delta)` points at every precomputed zoom level."""
+    counter: dict[tuple[int, int, int, datetime], int] = {}
+    for at, lat, lon, delta in points:
+        bucket_start = _day_floor(at)
+        for zoom in KPI_HEATMAP_ZOOM_LEVELS:
+            tile_x, tile_y = tile_xy(lat, lon, zoom)
+            key = (zoom, tile_x, tile_y, bucket_start)
+            counter[key] = counter.get(key, 0) + delta
+    updated_at = now_utc()
+    return [
+        {
+            "id": str(uuid4()),
+            "tenant_id": tenant_id,
+            "source": source,
+            "zoom": zoom,
+            "tile_x": tile_x,
+            "tile_y": tile_y,
+            "bucket_start": bucket_start,
+            "count": count,
+            "updated_at": updated_at,
+        }
+        for (zoom, tile_x, tile_y, bucket_start), count in counter.items()
+        if count != 0
+    ]
+
+
+def record_heatmap_points(
+    session: Session,
+    tenant_id: str,
+    source: KpiHeatmapSource,
+    points: Iterable[tuple[datetime, float, float, int]],
+) -> int:
+    """Apply heatmap increments inside the caller's transaction; returns the cells touched."""
+    rows = heatmap_cell_deltas(tenant_id, source, points)
+    upsert_rows(
+        session,
+        KpiHeatmapGridCell,
+        rows,
+        conflict_columns=_HEATMAP_CELL_KEY,
+        increment=("count",),
+        replace=("updated_at",),
+    )
+    return len(rows)
+
+
+@dataclass
+class _FlightSegment:
+    """A drone's consecutive telemetry points, summarized."""
+
+    first_ts: datetime
+    first_lat: float
+    first_lon: float
+    last_ts: datetime
+    last_lat: float
+    last_lon: float
+    sample_count: int
+    distance_km: float
+
+    @classmethod
+    def from_rollup(cls, rollup: KpiFlightRollupHourly) -> _FlightSegment:
+        return cls(
+            first_ts=_as_utc(rollup.first_ts),
+            first_lat=rollup.first_lat,
+            first_lon=rollup.first_lon,
+            last_ts=_as_utc(rollup.last_ts),
+            last_lat=rollup.last_lat,
+            last_lon=rollup.last_lon,
+            sample_count=rollup.sample_count,
+            distance_km=rollup.distance_km,
+        )
+
+    def apply_to(self, rollup: KpiFlightRollupHourly) -> None:
+        rollup.first_ts = self.first_ts
+        rollup.first_lat = self.first_lat
+        rollup.first_lon = self.first_lon
+        rollup.last_ts = self.last_ts
+        rollup.last_lat = self.last_lat
+        rollup.last_lon = self.last_lon
+        rollup.sample_count = self.sample_count
+        rollup.distance_km = self.distance_km
+        rollup.needs_rebuild = False
+        rollup.updated_at = now_utc()
 
 
 class KpiError(Exception):
@@ -33,37 +177,51 @@ class ConflictError(KpiError):
     pass
 
 
+def _haversine_km_sql(lat1: Any, lon1: Any, lat2: Any, lon2: Any) -> Any:
+    """SQL form of `haversine_km` for folding samples inside an upsert."""
+
+    def _radians(value: Any) -> Any:
+        return func.radians(value, type_=Float)
+
+    half_d_lat = func.sin(_radians(lat2 - lat1) * 0.5, type_=Float)
+    half_d_lon = func.sin(_radians(lon2 - lon1) * 0.5, type_=Float)
+    a = half_d_lat * half_d_lat + func.cos(_radians(lat1), type_=Float) * func.cos(
+        _radians(lat2), type_=Float
+    ) * (half_d_lon * half_d_lon)
+    bounded = case((a > 1.0, 1.0), else_=a)
+    return 2 * EARTH_RADIUS_KM * func.asin(func.sqrt(bounded, type_=Float), type_=Float)
+
+
 class KpiService:
     def _session(self) -> Session:
         return Session(get_engine(), expire_on_commit=False)
 
+    def _read_session(self) -> Session:
+        return create_session(read_only=True)
+
     @staticmethod
     def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        radius_km = 6371.0
-        d_lat = math.radians(lat2 - lat1)
-        d_lon = math.radians(lon2 - lon1)
-        a = (
-            math.sin(d_lat / 2) ** 2
-            + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(d_lon / 2) ** 2
-        )
-        return 2 * radius_km * math.asin(math.sqrt(a))
+        return haversine_km(lat1, lon1, lat2, lon2)
 
-    def _aggregate_telemetry(
+    def _telemetry_rows(
         self,
         session: Session,
         tenant_id: str,
         from_ts: datetime,
         to_ts: datetime,
-    ) -> tuple[float, float]:
-        rows = list(
-            session.exec(
-                select(EventRecord)
-                .where(EventRecord.tenant_id == tenant_id)
-                .where(EventRecord.event_type == "telemetry.normalized")
-                .where(EventRecord.ts >= from_ts)
-                .where(EventRecord.ts <= to_ts)
-            ).all()
+        *,
+        include_end: bool = True,
+    ) -> list[EventRecord]:
+        statement = (
+            select(EventRecord)
+            .where(EventRecord.tenant_id == tenant_id)
+            .where(EventRecord.event_type == "telemetry.normalized")
+            .where(EventRecord.ts >= from_ts)
         )
+        statement = statement.where(EventRecord.ts <= to_ts if include_end else EventRecord.ts < to_ts)
+        return list(session.exec(statement).all())
+
+    def _group_points(self, rows: list[EventRecord]) -> dict[str, list[tuple[datetime, float, float]]]:
         grouped: dict[str, list[tuple[datetime, float, float]]] = {}
         for row in rows:
             drone_id_raw = row.payload.get("drone_id")
@@ -84,20 +242,328 @@ class KpiService:
                     ts = row.ts
             else:
                 ts = row.ts
-            grouped.setdefault(drone_id_raw, []).append((ts, float(lat), float(lon)))
+            grouped.setdefault(drone_id_raw, []).append((_as_utc(ts), float(lat), float(lon)))
+        for points in grouped.values():
+            points.sort(key=lambda item: item[0])
+        return grouped
+
+    def _segment(self, points: list[tuple[datetime, float, float]]) -> _FlightSegment:
+        distance_km = track_length_km([lat for _ts, lat, _lon in points], [lon for _ts, _lat, lon in points])
+        first_ts, first_lat, first_lon = points[0]
+        last_ts, last_lat, last_lon = points[-1]
+        return _FlightSegment(
+            first_ts=first_ts,
+            first_lat=first_lat,
+            first_lon=first_lon,
+            last_ts=last_ts,
+            last_lat=last_lat,
+            last_lon=last_lon,
+            sample_count=len(points),
+            distance_km=distance_km,
+        )
+
+    def _raw_segments(
+        self,
+        session: Session,
+        tenant_id: str,
+        from_ts: datetime,
+        to_ts: datetime,
+        *,
+        include_end: bool,
+    ) -> dict[str, _FlightSegment]:
+        rows = self._telemetry_rows(session, tenant_id, from_ts, to_ts, include_end=include_end)
+        return {drone_id: self._segment(points) for drone_id, points in self._group_points(rows).items()}
+
+    def _aggregate_telemetry(
+        self,
+        session: Session,
+        tenant_id: str,
+        from_ts: datetime,
+        to_ts: datetime,
+    ) -> tuple[float, float]:
+        """Flight duration and mileage for the window.
+
+        Whole hours come from the hourly rollups; only the partial hours at either end of
+        the window are read from raw telemetry events.
+        """
+        from_ts = _as_utc(from_ts)
+        to_ts = _as_utc(to_ts)
+        first_full = _hour_ceil(from_ts)
+        end_full = _hour_floor(to_ts)
+        per_drone: dict[str, list[_FlightSegment]] = {}
+        if first_full >= end_full:
+            for drone_id, segment in self._raw_segments(
+                session, tenant_id, from_ts, to_ts, include_end=True
+            ).items():
+                per_drone.setdefault(drone_id, []).append(segment)
+        else:
+            head = self._raw_segments(session, tenant_id, from_ts, first_full, include_end=False)
+            for drone_id, segment in head.items():
+                per_drone.setdefault(drone_id, []).append(segment)
+            for rollup in self._rollups_in_range(session, tenant_id, first_full, end_full):
+                per_drone.setdefault(rollup.drone_id, []).append(_FlightSegment.from_rollup(rollup))
+            tail = self._raw_segments(session, tenant_id, end_full, to_ts, include_end=True)
+            for drone_id, segment in tail.items():
+                per_drone.setdefault(drone_id, []).append(segment)
 
         duration_seconds = 0.0
         mileage_km = 0.0
-        for points in grouped.values():
-            points.sort(key=lambda item: item[0])
-            if len(points) >= 2:
-                duration_seconds += (points[-1][0] - points[0][0]).total_seconds()
-            for idx in range(1, len(points)):
-                _ts1, lat1, lon1 = points[idx - 1]
-                _ts2, lat2, lon2 = points[idx]
-                mileage_km += self._haversine_km(lat1, lon1, lat2, lon2)
+        for segments in per_drone.values():
+            if sum(item.sample_count for item in segments) >= 2:
+                duration_seconds += (segments[-1].last_ts - segments[0].first_ts).total_seconds()
+            for idx, segment in enumerate(segments):
+                mileage_km += segment.distance_km
+                if idx > 0:
+                    previous = segments[idx - 1]
+                    mileage_km += self._haversine_km(
+                        previous.last_lat,
+                        previous.last_lon,
+                        segment.first_lat,
+                        segment.first_lon,
+                    )
         return duration_seconds, mileage_km
 
+    def _rollups_in_range(
+        self,
+        session: Session,
+        tenant_id: str,
+        from_bucket: datetime,
+        to_bucket: datetime,
+    ) -> list[KpiFlightRollupHourly]:
+        statement = (
+            select(KpiFlightRollupHourly)
+            .where(KpiFlightRollupHourly.tenant_id == tenant_id)
+            .where(KpiFlightRollupHourly.bucket_start >= from_bucket)
+            .where(KpiFlightRollupHourly.bucket_start < to_bucket)
+        )
+        stale_buckets = session.exec(
+            select(KpiFlightRollupHourly.bucket_start)
+            .where(KpiFlightRollupHourly.tenant_id == tenant_id)
+            .where(KpiFlightRollupHourly.bucket_start >= from_bucket)
+            .where(KpiFlightRollupHourly.bucket_start < to_bucket)
+            .where(col(KpiFlightRollupHourly.needs_rebuild).is_(True))
+            .distinct()
+        ).all()
+        # Each hour is rebuilt and committed on its own, so the row locks are held only for
+        # that hour and never across the rest of the report.
+        for bucket_start in sorted({_as_utc(item) for item in stale_buckets}):
+            with self._session() as rebuild_session:
+                self._rebuild_hour(rebuild_session, tenant_id, bucket_start)
+                rebuild_session.commit()
+        return list(
+            session.exec(
+                statement.order_by(
+                    col(KpiFlightRollupHourly.drone_id),
+                    col(KpiFlightRollupHourly.bucket_start),
+                )
+            ).all()
+        )
+
+    def _rebuild_hour(self, session: Session, tenant_id: str, bucket_start: datetime) -> tuple[int, int]:
+        """Recompute the rollups of one hour from committed raw events; returns (events, buckets).
+
+        The hour's rollup rows are locked before the events are read, so a sample folded in
+        concurrently waits and then applies on top of the rebuilt row instead of being
+        overwritten. A row holding more samples than the events table has for it (events
+        pruned or not written yet) keeps its values and its rebuild flag.
+        """
+        existing = {
+            item.drone_id: item
+            for item in session.exec(
+                select(KpiFlightRollupHourly)
+                .where(KpiFlightRollupHourly.tenant_id == tenant_id)
+                .where(KpiFlightRollupHourly.bucket_start == bucket_start)
+                .with_for_update()
+            ).all()
+        }
+        rows = self._telemetry_rows(
+            session,
+            tenant_id,
+            bucket_start,
+            bucket_start + _ROLLUP_BUCKET,
+            include_end=False,
+        )
+        grouped = self._group_points(rows)
+        buckets_written = 0
+        for drone_id, rollup in existing.items():
+            points = grouped.get(drone_id, [])
+            if not points or len(points) < rollup.sample_count:
+                continue
+            self._segment(points).apply_to(rollup)
+            session.add(rollup)
+            buckets_written += 1
+        missing: list[dict[str, Any]] = []
+        for drone_id, points in grouped.items():
+            if drone_id in existing:
+                continue
+            segment = self._segment(points)
+            missing.append(
+                {
+                    "id": str(uuid4()),
+                    "tenant_id": tenant_id,
+                    "drone_id": drone_id,
+                    "bucket_start": bucket_start,
+                    "first_ts": segment.first_ts,
+                    "last_ts": segment.last_ts,
+                    "first_lat": segment.first_lat,
+                    "first_lon": segment.first_lon,
+                    "last_lat": segment.last_lat,
+                    "last_lon": segment.last_lon,
+                    "sample_count": segment.sample_count,
+                    "distance_km": segment.distance_km,
+                    "needs_rebuild": False,
+                    "updated_at": now_utc(),
+                }
+            )
+        if missing:
+            inserted = insert_missing_rows(
+                session,
+                KpiFlightRollupHourly,
+                missing,
+                conflict_columns=("tenant_id", "drone_id", "bucket_start"),
+                returning=("drone_id",),
+            )
+            buckets_written += len(inserted)
+            # A sample created the row after the lock was taken; leave it for the next rebuild.
+            raced = {item["drone_id"] for item in missing} - {item.drone_id for item in inserted}
+            if raced:
+                session.execute(
+                    update(KpiFlightRollupHourly)
+                    .where(col(KpiFlightRollupHourly.tenant_id) == tenant_id)
+                    .where(col(KpiFlightRollupHourly.bucket_start) == bucket_start)
+                    .where(col(KpiFlightRollupHourly.drone_id).in_(raced))
+                    .values(needs_rebuild=True)
+                    .execution_options(synchronize_session=False)
+                )
+        return len(rows), buckets_written
+
+    def record_flight_sample(
+        self,
+        tenant_id: str,
+        drone_id: str,
+        *,
+        event_ts: datetime,
+        sample_ts: datetime,
+        lat: float,
+        lon: float,
+        session: Session | None = None,
+    ) -> None:
+        """Fold one telemetry sample into its drone's hourly rollup.
+
+        Rollups are bucketed by event time, like the raw-event windows they replace. The
+        fold is a single upsert evaluated against the stored row, so concurrent samples
+        never wait on a row lock held across round trips. A sample that lands between
+        points already folded in cannot be applied incrementally, so the bucket is flagged
+        and rebuilt from raw events on next read.
+
+        Pass the session that writes the sample's telemetry event so both commit together;
+        without one the fold commits on its own.
+        """
+        if session is None:
+            with self._session() as own_session:
+                self.record_flight_sample(
+                    tenant_id,
+                    drone_id,
+                    event_ts=event_ts,
+                    sample_ts=sample_ts,
+                    lat=lat,
+                    lon=lon,
+                    session=own_session,
+                )
+                own_session.commit()
+            return
+        sample_ts = _as_utc(sample_ts)
+        row = {
+            "id": str(uuid4()),
+            "tenant_id": tenant_id,
+            "drone_id": drone_id,
+            "bucket_start": _hour_floor(_as_utc(event_ts)),
+            "first_ts": sample_ts,
+            "last_ts": sample_ts,
+            "first_lat": lat,
+            "first_lon": lon,
+            "last_lat": lat,
+            "last_lon": lon,
+            "sample_count": 1,
+            "distance_km": 0.0,
+            "needs_rebuild": False,
+            "updated_at": now_utc(),
+        }
+
+        def _appends(stored: Any, new: Any) -> Any:
+            return new.last_ts >= stored.last_ts
+
+        def _prepends(stored: Any, new: Any) -> Any:
+            return new.first_ts < stored.first_ts
+
+        def _pick(name: str, when: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+            return lambda stored, new: case((when(stored, new), new[name]), else_=stored[name])
+
+        upsert_rows(
+            session,
+            KpiFlightRollupHourly,
+            [row],
+            conflict_columns=("tenant_id", "drone_id", "bucket_start"),
+            increment=("sample_count",),
+            replace=("updated_at",),
+            merge={
+                "distance_km": lambda stored, new: stored.distance_km
+                + case(
+                    (
+                        _appends(stored, new),
+                        _haversine_km_sql(stored.last_lat, stored.last_lon, new.last_lat, new.last_lon),
+                    ),
+                    (
+                        _prepends(stored, new),
+                        _haversine_km_sql(new.first_lat, new.first_lon, stored.first_lat, stored.first_lon),
+                    ),
+                    else_=0.0,
+                ),
+                "last_ts": _pick("last_ts", _appends),
+                "last_lat": _pick("last_lat", _appends),
+                "last_lon": _pick("last_lon", _appends),
+                "first_ts": _pick("first_ts", _prepends),
+                "first_lat": _pick("first_lat", _prepends),
+                "first_lon": _pick("first_lon", _prepends),
+                "needs_rebuild": lambda stored, new: or_(
+                    stored.needs_rebuild,
+                    and_(new.last_ts < stored.last_ts, new.first_ts >= stored.first_ts),
+                ),
+            },
+        )
+
+    def backfill_flight_rollups(
+        self,
+        tenant_id: str,
+        payload: KpiFlightRollupBackfillRequest,
+    ) -> KpiFlightRollupBackfillRead:
+        """Rebuild the hourly rollups of every hour touching the window from raw events.
+
+        Works one hour per transaction so memory stays bounded for long histories.
+        """
+        if payload.to_ts <= payload.from_ts:
+            raise ConflictError("to_ts must be greater than from_ts")
+        bucket_start = _hour_floor(_as_utc(payload.from_ts))
+        to_ts = _as_utc(payload.to_ts)
+        hours_scanned = 0
+        events_scanned = 0
+        buckets_written = 0
+        while bucket_start <= to_ts:
+            with self._session() as session:
+                events, buckets = self._rebuild_hour(session, tenant_id, bucket_start)
+                session.commit()
+            hours_scanned += 1
+            events_scanned += events
+            buckets_written += buckets
+            bucket_start += _ROLLUP_BUCKET
+        return KpiFlightRollupBackfillRead(
+            from_ts=payload.from_ts,
+            to_ts=payload.to_ts,
+            hours_scanned=hours_scanned,
+            events_scanned=events_scanned,
+            buckets_written=buckets_written,
+        )
+
     def recompute_snapshot(
         self,
         tenant_id: str,
@@ -130,6 +596,7 @@ class KpiService:
                     .where(AlertRecord.tenant_id == tenant_id)
                     .where(AlertRecord.first_seen_at >= payload.from_ts)
                     .where(AlertRecord.first_seen_at <= payload.to_ts)
+                    .options(*without_json(AlertRecord))
                 ).all()
             )
             outcomes = list(
@@ -138,6 +605,7 @@ class KpiService:
                     .where(OutcomeCatalogRecord.tenant_id == tenant_id)
                     .where(OutcomeCatalogRecord.created_at >= payload.from_ts)
                     .where(OutcomeCatalogRecord.created_at <= payload.to_ts)
+                    .options(*without_json(OutcomeCatalogRecord))
                 ).all()
             )
 
@@ -211,17 +679,12 @@ class KpiService:
             counter[key] = counter.get(key, 0) + 1
 
         for alert in alerts:
-            position_raw = alert.detail.get("position")
-            if not isinstance(position_raw, dict):
-                continue
-            lat = position_raw.get("lat")
-            lon = position_raw.get("lon")
-            if not isinstance(lat, int | float) or not isinstance(lon, int | float):
+            if alert.position_lat is None or alert.position_lon is None:
                 continue
             key = (
                 KpiHeatmapSource.ALERT,
-                round(float(lat), 2),
-                round(float(lon), 2),
+                round(alert.position_lat, 2),
+                round(alert.position_lon, 2),
             )
             counter[key] = counter.get(key, 0) + 1
 
@@ -246,15 +709,22 @@ class KpiService:
         *,
         from_ts: datetime | None = None,
         to_ts: datetime | None = None,
+        page: PageRequest | None = None,
     ) -> list[KpiSnapshotRecord]:
-        with self._session() as session:
+        with self._read_session() as session:
             statement = select(KpiSnapshotRecord).where(KpiSnapshotRecord.tenant_id == tenant_id)
             if from_ts is not None:
                 statement = statement.where(KpiSnapshotRecord.from_ts >= from_ts)
             if to_ts is not None:
                 statement = statement.where(KpiSnapshotRecord.to_ts <= to_ts)
-            rows = list(session.exec(statement).all())
-            return sorted(rows, key=lambda item: item.generated_at, reverse=True)
+            statement = statement.order_by(col(KpiSnapshotRecord.generated_at).desc())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(KpiSnapshotRecord.generated_at),
+                id_column=col(KpiSnapshotRecord.id),
+            )
 
     def get_latest_snapshot(self, tenant_id: str) -> KpiSnapshotRecord:
         rows = self.list_snapshots(tenant_id)
@@ -268,20 +738,176 @@ class KpiService:
         *,
         snapshot_id: str | None = None,
         source: KpiHeatmapSource | None = None,
+        zoom: int | None = None,
+        bbox: BoundingBox | None = None,
+        page: PageRequest | None = None,
     ) -> list[KpiHeatmapBinRecord]:
-        with self._session() as session:
+        """Heatmap bins of a snapshot (the latest by default).
+
+        Without `zoom` these are the snapshot's fixed 0.01 degree bins. With `zoom` the counts
+        come from the incrementally maintained tile grid over the days the snapshot window
+        touches, so any zoom level is served without rescanning alerts and outcomes.
+        """
+        with self._read_session() as session:
             if snapshot_id is None:
-                latest = self.get_latest_snapshot(tenant_id)
-                snapshot_id = latest.id
+                snapshot = self.get_latest_snapshot(tenant_id)
+            else:
+                found = session.get(KpiSnapshotRecord, snapshot_id)
+                if found is None or found.tenant_id != tenant_id:
+                    raise NotFoundError("kpi snapshot not found")
+                snapshot = found
+            if zoom is not None:
+                # Grid bins are aggregated per request, so they are paged in memory on their
+                # deterministic tile ids.
+                return paginate_items(
+                    self._grid_heatmap_bins(session, tenant_id, snapshot, source, zoom, bbox),
+                    page,
+                    sort_key=lambda item: item.id,
+                    id_key=lambda item: item.id,
+                )
             statement = (
                 select(KpiHeatmapBinRecord)
                 .where(KpiHeatmapBinRecord.tenant_id == tenant_id)
-                .where(KpiHeatmapBinRecord.snapshot_id == snapshot_id)
+                .where(KpiHeatmapBinRecord.snapshot_id == snapshot.id)
             )
             if source is not None:
                 statement = statement.where(KpiHeatmapBinRecord.source == source)
-            rows = list(session.exec(statement).all())
-            return sorted(rows, key=lambda item: (item.source, item.grid_lat, item.grid_lon))
+            if bbox is not None:
+                statement = (
+                    statement.where(col(KpiHeatmapBinRecord.grid_lat) >= bbox.min_lat)
+                    .where(col(KpiHeatmapBinRecord.grid_lat) <= bbox.max_lat)
+                    .where(col(KpiHeatmapBinRecord.grid_lon) >= bbox.min_lon)
+                    .where(col(KpiHeatmapBinRecord.grid_lon) <= bbox.max_lon)
+                )
+            statement = statement.order_by(
+                col(KpiHeatmapBinRecord.source),
+                col(KpiHeatmapBinRecord.grid_lat),
+                col(KpiHeatmapBinRecord.grid_lon),
+            )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(KpiHeatmapBinRecord.created_at),
+                id_column=col(KpiHeatmapBinRecord.id),
+            )
+
+    @staticmethod
+    def _heatmap_zoom_level(zoom: int) -> int:
+        """The precomputed level `zoom` is served from.
+
+        This is the finest level not finer than `zoom`. Below the coarsest precomputed level it
+        is that coarsest level, whose tiles the caller folds up into their `zoom` ancestors.
+        """
+        coarser = [level for level in KPI_HEATMAP_ZOOM_LEVELS if level <= zoom]
+        return coarser[-1] if coarser else KPI_HEATMAP_ZOOM_LEVELS[0]
+
+    def _grid_heatmap_bins(
+        self,
+        session: Session,
+        tenant_id: str,
+        snapshot: KpiSnapshotRecord,
+        source: KpiHeatmapSource | None,
+        zoom: int,
+        bbox: BoundingBox | None,
+    ) -> list[KpiHeatmapBinRecord]:
+        stored_level = self._heatmap_zoom_level(zoom)
+        level = min(zoom, stored_level)
+        # Tiles of a finer stored level are folded into their ancestor at `level`.
+        factor = 1 << (stored_level - level)
+        tile_x_expr: Any = col(KpiHeatmapGridCell.tile_x)
+        tile_y_expr: Any = col(KpiHeatmapGridCell.tile_y)
+        if factor > 1:
+            tile_x_expr = tile_x_expr // factor
+            tile_y_expr = tile_y_expr // factor
+        total = func.sum(col(KpiHeatmapGridCell.count))
+        statement = (
+            sa_select(
+                col(KpiHeatmapGridCell.source),
+                tile_x_expr,
+                tile_y_expr,
+                total,
+                func.max(col(KpiHeatmapGridCell.updated_at)),
+            )
+            .where(col(KpiHeatmapGridCell.tenant_id) == tenant_id)
+            .where(col(KpiHeatmapGridCell.zoom) == stored_level)
+            .where(col(KpiHeatmapGridCell.bucket_start) >= _day_floor(snapshot.from_ts))
+            .where(col(KpiHeatmapGridCell.bucket_start) <= _as_utc(snapshot.to_ts))
+            .group_by(col(KpiHeatmapGridCell.source), tile_x_expr, tile_y_expr)
+            .having(total > 0)
+        )
+        if source is not None:
+            statement = statement.where(col(KpiHeatmapGridCell.source) == source)
+        if bbox is not None:
+            min_x, min_y, max_x, max_y = tile_range(bbox, level)
+            statement = (
+                statement.where(tile_x_expr >= min_x)
+                .where(tile_x_expr <= max_x)
+                .where(tile_y_expr >= min_y)
+                .where(tile_y_expr <= max_y)
+            )
+        rows: list[KpiHeatmapBinRecord] = []
+        for cell_source, tile_x, tile_y, count, updated_at in session.execute(statement).all():
+            bounds = tile_bounds(tile_x, tile_y, level)
+            rows.append(
+                KpiHeatmapBinRecord(
+                    id=f"{snapshot.id}:{cell_source.value}:{level}:{tile_x}:{tile_y}",
+                    tenant_id=tenant_id,
+                    snapshot_id=snapshot.id,
+                    source=cell_source,
+                    grid_lat=(bounds.min_lat + bounds.max_lat) / 2,
+                    grid_lon=(bounds.min_lon + bounds.max_lon) / 2,
+                    count=int(count),
+                    detail={
+                        "zoom": level,
+                        "tile_x": tile_x,
+                        "tile_y": tile_y,
+                        "quadkey": tile_quadkey(tile_x, tile_y, level),
+                        "bbox": [bounds.min_lon, bounds.min_lat, bounds.max_lon, bounds.max_lat],
+                    },
+                    created_at=updated_at,
+                )
+            )
+        return sorted(rows, key=lambda item: (item.source, item.grid_lat, item.grid_lon))
+
+    def rebuild_heatmap_grid(self, tenant_id: str) -> KpiHeatmapGridRebuildRead:
+        """Recount the tenant's heatmap grid from alert and outcome positions."""
+        with self._session() as session:
+            session.execute(delete(KpiHeatmapGridCell).where(col(KpiHeatmapGridCell.tenant_id) == tenant_id))
+            alert_points = [
+                (first_seen_at, lat, lon, 1)
+                for first_seen_at, lat, lon in session.exec(
+                    select(AlertRecord.first_seen_at, AlertRecord.position_lat, AlertRecord.position_lon)
+                    .where(AlertRecord.tenant_id == tenant_id)
+                    .where(col(AlertRecord.position_lat).is_not(None))
+                    .where(col(AlertRecord.position_lon).is_not(None))
+                ).all()
+                if lat is not None and lon is not None
+            ]
+            outcome_points = [
+                (created_at, lat, lon, 1)
+                for created_at, lat, lon in session.exec(
+                    select(
+                        OutcomeCatalogRecord.created_at,
+                        OutcomeCatalogRecord.point_lat,
+                        OutcomeCatalogRecord.point_lon,
+                    )
+                    .where(OutcomeCatalogRecord.tenant_id == tenant_id)
+                    .where(col(OutcomeCatalogRecord.point_lat).is_not(None))
+                    .where(col(OutcomeCatalogRecord.point_lon).is_not(None))
+                ).all()
+                if lat is not None and lon is not None
+            ]
+            cells_written = record_heatmap_points(session, tenant_id, KpiHeatmapSource.ALERT, alert_points)
+            cells_written += record_heatmap_points(
+                session, tenant_id, KpiHeatmapSource.OUTCOME, outcome_points
+            )
+            session.commit()
+        return KpiHeatmapGridRebuildRead(
+            alerts_scanned=len(alert_points),
+            outcomes_scanned=len(outcome_points),
+            cells_written=cells_written,
+        )
 
     def export_governance_report(
         self,
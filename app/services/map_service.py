@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import re
+from contextlib import AbstractContextManager
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
+from app.domain.geo import sample_indices, segment_speeds_mps, track_length_km
 from app.domain.models import (
     AirspaceZone,
     AlertRecord,
@@ -27,7 +29,8 @@ from app.domain.models import (
     OutcomeCatalogRecord,
     TelemetryNormalized,
 )
-from app.infra.db import get_engine
+from app.infra.db import create_session
+from app.infra.unit_of_work import UnitOfWork, get_scoped
 from app.services.data_perimeter_service import DataPerimeterService
 
 POINT_WKT_PATTERN = re.compile(
@@ -56,17 +59,17 @@ class _TelemetryPoint:
 
 
 class MapService:
-    def __init__(self) -> None:
-        self._data_perimeter = DataPerimeterService()
+    def __init__(self, *, uow: UnitOfWork | None = None) -> None:
+        self._uow = uow
+        self._data_perimeter = DataPerimeterService(uow=uow)
 
-    def _session(self) -> Session:
-        return Session(get_engine(), expire_on_commit=False)
+    def _read_session(self) -> AbstractContextManager[Session]:
+        if self._uow is not None:
+            return self._uow.session()
+        return create_session(read_only=True)
 
     def _ensure_scoped_drone(self, session: Session, tenant_id: str, drone_id: str) -> None:
-        drone = session.exec(
-            select(Drone).where(Drone.tenant_id == tenant_id).where(Drone.id == drone_id)
-        ).first()
-        if drone is None:
+        if get_scoped(session, Drone, tenant_id, drone_id) is None:
             raise NotFoundError("drone not found")
 
     def _parse_wkt_focus_point(self, value: str | None) -> MapPointRead | None:
@@ -121,7 +124,7 @@ class MapService:
         return latest
 
     def resources_layer(self, tenant_id: str, *, limit: int = 100) -> MapLayerRead:
-        with self._session() as session:
+        with self._read_session() as session:
             telemetry = self._latest_telemetry_by_drone(session, tenant_id)
             drones = list(session.exec(select(Drone).where(Drone.tenant_id == tenant_id)).all())
             assets = list(session.exec(select(Asset).where(Asset.tenant_id == tenant_id)).all())
@@ -168,23 +171,32 @@ class MapService:
         return MapLayerRead(layer=MapLayerName.RESOURCES, total=len(items), items=items[:limit])
 
     def tasks_layer(self, tenant_id: str, *, viewer_user_id: str | None, limit: int = 100) -> MapLayerRead:
-        with self._session() as session:
+        with self._read_session() as session:
             scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
-            missions = [
-                item
-                for item in session.exec(select(Mission).where(Mission.tenant_id == tenant_id)).all()
-                if self._data_perimeter.mission_visible(item, scope)
-            ]
-            inspection_tasks = [
-                item
-                for item in session.exec(select(InspectionTask).where(InspectionTask.tenant_id == tenant_id)).all()
-                if self._data_perimeter.inspection_task_visible(item, scope)
-            ]
-            incidents = [
-                item
-                for item in session.exec(select(Incident).where(Incident.tenant_id == tenant_id)).all()
-                if self._data_perimeter.incident_visible(item, scope)
-            ]
+            missions = list(
+                session.exec(
+                    self._data_perimeter.restrict(
+                        select(Mission).where(Mission.tenant_id == tenant_id),
+                        self._data_perimeter.mission_clause(scope),
+                    )
+                ).all()
+            )
+            inspection_tasks = list(
+                session.exec(
+                    self._data_perimeter.restrict(
+                        select(InspectionTask).where(InspectionTask.tenant_id == tenant_id),
+                        self._data_perimeter.inspection_task_clause(scope),
+                    )
+                ).all()
+            )
+            incidents = list(
+                session.exec(
+                    self._data_perimeter.restrict(
+                        select(Incident).where(Incident.tenant_id == tenant_id),
+                        self._data_perimeter.incident_clause(scope),
+                    )
+                ).all()
+            )
 
         items: list[MapLayerItemRead] = []
         for mission in missions:
@@ -241,21 +253,18 @@ class MapService:
         return MapLayerRead(layer=MapLayerName.TASKS, total=len(items), items=items[:limit])
 
     def airspace_layer(self, tenant_id: str, *, viewer_user_id: str | None, limit: int = 100) -> MapLayerRead:
-        with self._session() as session:
+        with self._read_session() as session:
             scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
-            rows = list(session.exec(select(AirspaceZone).where(AirspaceZone.tenant_id == tenant_id)).all())
-
-        visible = [
-            item
-            for item in rows
-            if self._data_perimeter.allows(
-                scope,
-                org_unit_id=item.org_unit_id,
-                project_code=None,
-                area_code=item.area_code,
-                task_id=None,
+            statement = self._data_perimeter.restrict(
+                select(AirspaceZone).where(AirspaceZone.tenant_id == tenant_id),
+                self._data_perimeter.scope_clause(
+                    scope,
+                    org_unit_id=col(AirspaceZone.org_unit_id),
+                    area_code=col(AirspaceZone.area_code),
+                ),
             )
-        ]
+            visible = list(session.exec(statement).all())
+
         items = [
             MapLayerItemRead(
                 id=row.id,
@@ -277,7 +286,7 @@ class MapService:
         return MapLayerRead(layer=MapLayerName.AIRSPACE, total=len(items), items=items[:limit])
 
     def alerts_layer(self, tenant_id: str, *, limit: int = 100) -> MapLayerRead:
-        with self._session() as session:
+        with self._read_session() as session:
             telemetry = self._latest_telemetry_by_drone(session, tenant_id)
             rows = list(session.exec(select(AlertRecord).where(AlertRecord.tenant_id == tenant_id)).all())
 
@@ -312,7 +321,7 @@ class MapService:
         return MapLayerRead(layer=MapLayerName.ALERTS, total=len(items), items=items[:limit])
 
     def events_layer(self, tenant_id: str, *, viewer_user_id: str | None, limit: int = 100) -> MapLayerRead:
-        with self._session() as session:
+        with self._read_session() as session:
             scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
             if not scope.is_all():
                 return MapLayerRead(layer=MapLayerName.EVENTS, total=0, items=[])
@@ -350,7 +359,7 @@ class MapService:
         return MapLayerRead(layer=MapLayerName.EVENTS, total=len(items), items=items[:limit])
 
     def outcomes_layer(self, tenant_id: str, *, limit: int = 100) -> MapLayerRead:
-        with self._session() as session:
+        with self._read_session() as session:
             rows = list(session.exec(select(OutcomeCatalogRecord).where(OutcomeCatalogRecord.tenant_id == tenant_id)).all())
 
         ordered = sorted(rows, key=lambda item: item.updated_at, reverse=True)
@@ -408,7 +417,7 @@ class MapService:
         sample_step: int = 1,
         limit: int = 500,
     ) -> MapTrackReplayRead:
-        with self._session() as session:
+        with self._read_session() as session:
             self._ensure_scoped_drone(session, tenant_id, drone_id)
             rows = list(
                 session.exec(
@@ -433,9 +442,10 @@ class MapService:
         if not points:
             raise NotFoundError("track replay not found")
 
-        sampled = points[::sample_step]
-        if len(sampled) > limit:
-            sampled = sampled[-limit:]
+        lats = [item.lat for item in points]
+        lons = [item.lon for item in points]
+        speeds = segment_speeds_mps([item.ts for item in points], lats, lons)
+        sampled = [points[idx] for idx in sample_indices(len(points), step=sample_step, limit=limit)]
         replay_points = [
             MapTrackPointRead(
                 drone_id=item.drone_id,
@@ -451,5 +461,7 @@ class MapService:
             drone_id=drone_id,
             from_ts=replay_points[0].ts if replay_points else None,
             to_ts=replay_points[-1].ts if replay_points else None,
+            distance_km=round(track_length_km(lats, lons), 3),
+            max_speed_mps=round(max(speeds, default=0.0), 3),
             points=replay_points,
         )
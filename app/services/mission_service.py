@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.domain.models import (
     Approval,
@@ -19,8 +19,9 @@ from app.domain.models import (
 )
 from app.domain.permissions import PERM_MISSION_FASTLANE, PERM_WILDCARD
 from app.domain.state_machine import MissionState, can_transition
-from app.infra.db import get_engine
+from app.infra.db import create_session, get_engine
 from app.infra.events import event_bus
+from app.infra.pagination import PageRequest, paginate_query
 from app.services.compliance_service import ComplianceService
 from app.services.data_perimeter_service import DataPerimeterService
 
@@ -49,6 +50,9 @@ class MissionService:
     def _session(self) -> Session:
         return Session(get_engine(), expire_on_commit=False)
 
+    def _read_session(self) -> Session:
+        return create_session(read_only=True)
+
     def _get_scoped_mission(self, session: Session, tenant_id: str, mission_id: str) -> Mission:
         mission = session.exec(
             select(Mission).where(Mission.tenant_id == tenant_id).where(Mission.id == mission_id)
@@ -158,13 +162,27 @@ class MissionService:
         )
         return mission
 
-    def list_missions(self, tenant_id: str, viewer_user_id: str | None = None) -> list[Mission]:
-        with self._session() as session:
-            rows = list(session.exec(select(Mission).where(Mission.tenant_id == tenant_id)).all())
-            if viewer_user_id is None:
-                return rows
-            scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
-            return [item for item in rows if self._data_perimeter.mission_visible(item, scope)]
+    def list_missions(
+        self,
+        tenant_id: str,
+        viewer_user_id: str | None = None,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[Mission]:
+        with self._read_session() as session:
+            statement = select(Mission).where(Mission.tenant_id == tenant_id)
+            if viewer_user_id is not None:
+                scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
+                statement = self._data_perimeter.restrict(
+                    statement, self._data_perimeter.mission_clause(scope)
+                )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(Mission.created_at),
+                id_column=col(Mission.id),
+            )
 
     def get_mission(self, tenant_id: str, mission_id: str, viewer_user_id: str | None = None) -> Mission:
         with self._session() as session:
@@ -298,6 +316,8 @@ class MissionService:
         tenant_id: str,
         mission_id: str,
         viewer_user_id: str | None = None,
+        *,
+        page: PageRequest | None = None,
     ) -> list[Approval]:
         with self._session() as session:
             mission = self._get_scoped_mission(session, tenant_id, mission_id)
@@ -305,7 +325,13 @@ class MissionService:
             statement = select(Approval).where(Approval.tenant_id == tenant_id).where(
                 Approval.mission_id == mission_id
             )
-            return list(session.exec(statement).all())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(Approval.created_at),
+                id_column=col(Approval.id),
+            )
 
     def transition_mission(
         self,
@@ -18,6 +18,8 @@ from app.domain.models import (
     ObservabilityAlertEvent,
     ObservabilityAlertSeverity,
     ObservabilityAlertStatus,
+    ObservabilityDatabaseEngineRead,
+    ObservabilityDatabaseRead,
     ObservabilityOverviewRead,
     ObservabilitySignal,
     ObservabilitySignalIngestRequest,
@@ -43,7 +45,9 @@ from app.domain.models import (
     User,
     now_utc,
 )
-from app.infra.db import get_engine
+from app.infra.db import create_session, database_stats, get_engine
+from app.infra.pagination import PageRequest, paginate_query
+from app.infra.projection import count_rows, without_json
 
 
 class ObservabilityError(Exception):
@@ -62,6 +66,9 @@ class ObservabilityService:
     def _session(self) -> Session:
         return Session(get_engine(), expire_on_commit=False)
 
+    def _read_session(self) -> Session:
+        return create_session(read_only=True)
+
     @staticmethod
     def _normalize_non_empty(value: str, field_name: str) -> str:
         normalized = value.strip()
@@ -134,10 +141,15 @@ class ObservabilityService:
         from_ts: datetime | None = None,
         to_ts: datetime | None = None,
         limit: int = 100,
+        page: PageRequest | None = None,
+        include_detail: bool = True,
     ) -> list[ObservabilitySignal]:
         scoped_limit = min(max(limit, 1), 1000)
-        with self._session() as session:
+        with self._read_session() as session:
             statement = select(ObservabilitySignal).where(ObservabilitySignal.tenant_id == tenant_id)
+            if not include_detail:
+                # Callers that only aggregate typed columns never read the detail blob.
+                statement = statement.options(*without_json(ObservabilitySignal))
             if signal_type is not None:
                 statement = statement.where(ObservabilitySignal.signal_type == signal_type)
             if level is not None:
@@ -152,9 +164,17 @@ class ObservabilityService:
                 statement = statement.where(ObservabilitySignal.created_at >= self._as_utc(from_ts))
             if to_ts is not None:
                 statement = statement.where(ObservabilitySignal.created_at <= self._as_utc(to_ts))
-            rows = list(session.exec(statement).all())
-        rows_sorted = sorted(rows, key=lambda item: item.created_at, reverse=True)
-        return rows_sorted[:scoped_limit]
+            if page is None:
+                page = PageRequest(limit=scoped_limit)
+            else:
+                page.limit = min(page.limit, scoped_limit)
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(ObservabilitySignal.created_at),
+                id_column=col(ObservabilitySignal.id),
+            )
 
     def get_overview(self, tenant_id: str, *, window_minutes: int = 60) -> ObservabilityOverviewRead:
         scoped_window = min(max(window_minutes, 1), 1440)
@@ -163,6 +183,7 @@ class ObservabilityService:
             tenant_id,
             from_ts=from_ts,
             limit=1000,
+            include_detail=False,
         )
         by_type = {
             ObservabilitySignalType.LOG.value: 0,
@@ -226,18 +247,30 @@ class ObservabilityService:
             session.refresh(row)
             return row
 
+    def get_database_stats(self) -> ObservabilityDatabaseRead:
+        return ObservabilityDatabaseRead(
+            engines=[ObservabilityDatabaseEngineRead.model_validate(item) for item in database_stats()]
+        )
+
     def list_slo_policies(
         self,
         tenant_id: str,
         *,
         is_active: bool | None = None,
+        page: PageRequest | None = None,
     ) -> list[ObservabilitySloPolicy]:
         with self._session() as session:
             statement = select(ObservabilitySloPolicy).where(ObservabilitySloPolicy.tenant_id == tenant_id)
             if is_active is not None:
                 statement = statement.where(ObservabilitySloPolicy.is_active == is_active)
-            rows = list(session.exec(statement).all())
-        return sorted(rows, key=lambda item: item.created_at, reverse=True)
+            statement = statement.order_by(col(ObservabilitySloPolicy.created_at).desc())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(ObservabilitySloPolicy.created_at),
+                id_column=col(ObservabilitySloPolicy.id),
+            )
 
     def _resolve_oncall_target(
         self,
@@ -291,6 +324,7 @@ class ObservabilityService:
                         .where(ObservabilitySignal.signal_name == policy.signal_name)
                         .where(ObservabilitySignal.created_at >= window_start)
                         .where(ObservabilitySignal.created_at <= now)
+                        .options(*without_json(ObservabilitySignal))
                     ).all()
                 )
                 total_samples = len(signal_rows)
@@ -434,19 +468,18 @@ class ObservabilityService:
         payload: ReliabilityBackupRunRequest,
     ) -> ReliabilityBackupRun:
         with self._session() as session:
-            signal_count = session.exec(
-                select(ObservabilitySignal.id).where(ObservabilitySignal.tenant_id == tenant_id)
-            ).all()
-            policy_count = session.exec(
-                select(ObservabilitySloPolicy.id).where(ObservabilitySloPolicy.tenant_id == tenant_id)
-            ).all()
-            alert_count = session.exec(
-                select(ObservabilityAlertEvent.id).where(ObservabilityAlertEvent.tenant_id == tenant_id)
-            ).all()
             snapshot = {
-                "signals": len(signal_count),
-                "slo_policies": len(policy_count),
-                "observability_alerts": len(alert_count),
+                "signals": count_rows(session, ObservabilitySignal, ObservabilitySignal.tenant_id == tenant_id),
+                "slo_policies": count_rows(
+                    session,
+                    ObservabilitySloPolicy,
+                    ObservabilitySloPolicy.tenant_id == tenant_id,
+                ),
+                "observability_alerts": count_rows(
+                    session,
+                    ObservabilityAlertEvent,
+                    ObservabilityAlertEvent.tenant_id == tenant_id,
+                ),
                 "generated_at": now_utc().isoformat(),
             }
             checksum = hashlib.sha256(
@@ -821,10 +854,25 @@ class ObservabilityService:
             session.refresh(row)
             return row
 
-    def list_capacity_policies(self, tenant_id: str) -> list[CapacityPolicy]:
+    def list_capacity_policies(
+        self,
+        tenant_id: str,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[CapacityPolicy]:
         with self._session() as session:
-            rows = list(session.exec(select(CapacityPolicy).where(CapacityPolicy.tenant_id == tenant_id)).all())
-        return sorted(rows, key=lambda item: item.meter_key)
+            statement = (
+                select(CapacityPolicy)
+                .where(CapacityPolicy.tenant_id == tenant_id)
+                .order_by(col(CapacityPolicy.meter_key))
+            )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(CapacityPolicy.created_at),
+                id_column=col(CapacityPolicy.id),
+            )
 
     def _get_capacity_policy(self, session: Session, tenant_id: str, meter_key: str) -> CapacityPolicy:
         row = session.exec(
@@ -847,17 +895,18 @@ class ObservabilityService:
             policy = self._get_capacity_policy(session, tenant_id, meter_key)
             now = now_utc()
             sample_start = now - timedelta(minutes=payload.sample_minutes)
-            signal_rows = list(
-                session.exec(
-                    select(ObservabilitySignal)
+            numeric_values = [
+                value
+                for value in session.exec(
+                    select(ObservabilitySignal.numeric_value)
                     .where(ObservabilitySignal.tenant_id == tenant_id)
                     .where(ObservabilitySignal.signal_type == ObservabilitySignalType.METRIC)
                     .where(ObservabilitySignal.signal_name == meter_key)
                     .where(ObservabilitySignal.created_at >= sample_start)
                     .where(ObservabilitySignal.created_at <= now)
                 ).all()
-            )
-            numeric_values = [item.numeric_value for item in signal_rows if item.numeric_value is not None]
+                if value is not None
+            ]
             predicted_usage = round(sum(numeric_values) / len(numeric_values), 4) if numeric_values else 0.0
 
             if predicted_usage >= float(policy.scale_out_threshold_pct):
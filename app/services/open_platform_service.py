@@ -7,7 +7,7 @@ from datetime import UTC, datetime
 from uuid import uuid4
 
 from sqlalchemy import true
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.domain.models import (
     OpenAdapterIngressEvent,
@@ -23,6 +23,7 @@ from app.domain.models import (
 )
 from app.infra.db import get_engine
 from app.infra.events import event_bus
+from app.infra.pagination import PageRequest, paginate_query
 
 
 class OpenPlatformError(Exception):
@@ -110,12 +111,25 @@ class OpenPlatformService:
             session.refresh(row)
             return row
 
-    def list_credentials(self, tenant_id: str) -> list[OpenPlatformCredential]:
+    def list_credentials(
+        self,
+        tenant_id: str,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[OpenPlatformCredential]:
         with self._session() as session:
-            rows = list(
-                session.exec(select(OpenPlatformCredential).where(OpenPlatformCredential.tenant_id == tenant_id)).all()
+            statement = (
+                select(OpenPlatformCredential)
+                .where(OpenPlatformCredential.tenant_id == tenant_id)
+                .order_by(col(OpenPlatformCredential.created_at).desc())
+            )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(OpenPlatformCredential.created_at),
+                id_column=col(OpenPlatformCredential.id),
             )
-            return sorted(rows, key=lambda item: item.created_at, reverse=True)
 
     def create_webhook(
         self,
@@ -143,13 +157,25 @@ class OpenPlatformService:
             session.refresh(row)
             return row
 
-    def list_webhooks(self, tenant_id: str, *, event_type: str | None = None) -> list[OpenWebhookEndpoint]:
+    def list_webhooks(
+        self,
+        tenant_id: str,
+        *,
+        event_type: str | None = None,
+        page: PageRequest | None = None,
+    ) -> list[OpenWebhookEndpoint]:
         with self._session() as session:
             statement = select(OpenWebhookEndpoint).where(OpenWebhookEndpoint.tenant_id == tenant_id)
             if event_type is not None:
                 statement = statement.where(OpenWebhookEndpoint.event_type == event_type)
-            rows = list(session.exec(statement).all())
-            return sorted(rows, key=lambda item: item.created_at, reverse=True)
+            statement = statement.order_by(col(OpenWebhookEndpoint.created_at).desc())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(OpenWebhookEndpoint.created_at),
+                id_column=col(OpenWebhookEndpoint.id),
+            )
 
     def dispatch_webhook_test(
         self,
@@ -265,11 +291,22 @@ class OpenPlatformService:
         )
         return row
 
-    def list_adapter_events(self, tenant_id: str) -> list[OpenAdapterIngressEvent]:
+    def list_adapter_events(
+        self,
+        tenant_id: str,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[OpenAdapterIngressEvent]:
         with self._session() as session:
-            rows = list(
-                session.exec(
-                    select(OpenAdapterIngressEvent).where(OpenAdapterIngressEvent.tenant_id == tenant_id)
-                ).all()
+            statement = (
+                select(OpenAdapterIngressEvent)
+                .where(OpenAdapterIngressEvent.tenant_id == tenant_id)
+                .order_by(col(OpenAdapterIngressEvent.created_at).desc(), col(OpenAdapterIngressEvent.id).desc())
+            )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(OpenAdapterIngressEvent.created_at),
+                id_column=col(OpenAdapterIngressEvent.id),
             )
-            return sorted(rows, key=lambda item: item.created_at, reverse=True)
@@ -2,14 +2,16 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 from uuid import uuid4
 
 from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import SelectOfScalar
 
 from app.domain.models import (
     InspectionObservation,
     InspectionTask,
+    KpiHeatmapSource,
     Mission,
     OutcomeCatalogCreate,
     OutcomeCatalogRecord,
@@ -29,11 +31,15 @@ from app.domain.models import (
     RawUploadSessionStatus,
     now_utc,
 )
-from app.infra.db import get_engine
+from app.infra.db import create_session, get_engine
 from app.infra.events import event_bus
+from app.infra.pagination import PageRequest, paginate_query
 from app.services.data_perimeter_service import DataPerimeterService
+from app.services.kpi_service import record_heatmap_points
 from app.services.object_storage_service import ObjectStorageNotFoundError, ObjectStorageService
 
+RecordT = TypeVar("RecordT", RawDataCatalogRecord, OutcomeCatalogRecord)
+
 
 class OutcomeError(Exception):
     pass
@@ -55,6 +61,9 @@ class OutcomeService:
     def _session(self) -> Session:
         return Session(get_engine(), expire_on_commit=False)
 
+    def _read_session(self) -> Session:
+        return create_session(read_only=True)
+
     def _get_scoped_task(self, session: Session, tenant_id: str, task_id: str) -> InspectionTask:
         task = session.exec(
             select(InspectionTask)
@@ -178,6 +187,16 @@ class OutcomeService:
             return 1
         return int(latest) + 1
 
+    def _record_heatmap_point(self, session: Session, row: OutcomeCatalogRecord) -> None:
+        if row.point_lat is None or row.point_lon is None:
+            return
+        record_heatmap_points(
+            session,
+            row.tenant_id,
+            KpiHeatmapSource.OUTCOME,
+            [(row.created_at, row.point_lat, row.point_lon, 1)],
+        )
+
     def _append_outcome_version(
         self,
         session: Session,
@@ -228,6 +247,23 @@ class OutcomeService:
             return self._data_perimeter.mission_visible(mission, scope)
         return True
 
+    def _restrict_visible(
+        self,
+        session: Session,
+        tenant_id: str,
+        viewer_user_id: str | None,
+        statement: SelectOfScalar[RecordT],
+        *,
+        task_id: Any,
+        mission_id: Any,
+    ) -> SelectOfScalar[RecordT]:
+        if viewer_user_id is None:
+            return statement
+        scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
+        return statement.where(
+            self._data_perimeter.linked_clause(scope, tenant_id, task_id=task_id, mission_id=mission_id)
+        )
+
     def create_raw_record(self, tenant_id: str, actor_id: str, payload: RawDataCatalogCreate) -> RawDataCatalogRecord:
         with self._session() as session:
             if payload.task_id is not None:
@@ -486,8 +522,9 @@ class OutcomeService:
         from_ts: datetime | None = None,
         to_ts: datetime | None = None,
         viewer_user_id: str | None = None,
+        page: PageRequest | None = None,
     ) -> list[RawDataCatalogRecord]:
-        with self._session() as session:
+        with self._read_session() as session:
             statement = select(RawDataCatalogRecord).where(RawDataCatalogRecord.tenant_id == tenant_id)
             if task_id is not None:
                 statement = statement.where(RawDataCatalogRecord.task_id == task_id)
@@ -499,18 +536,21 @@ class OutcomeService:
                 statement = statement.where(RawDataCatalogRecord.captured_at >= from_ts)
             if to_ts is not None:
                 statement = statement.where(RawDataCatalogRecord.captured_at <= to_ts)
-            rows = list(session.exec(statement).all())
-            return [
-                item
-                for item in rows
-                if self._is_visible(
-                    session,
-                    tenant_id,
-                    viewer_user_id,
-                    task_id=item.task_id,
-                    mission_id=item.mission_id,
-                )
-            ]
+            statement = self._restrict_visible(
+                session,
+                tenant_id,
+                viewer_user_id,
+                statement,
+                task_id=col(RawDataCatalogRecord.task_id),
+                mission_id=col(RawDataCatalogRecord.mission_id),
+            )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(RawDataCatalogRecord.captured_at),
+                id_column=col(RawDataCatalogRecord.id),
+            )
 
     def get_raw_download_path(
         self,
@@ -576,6 +616,7 @@ class OutcomeService:
                 created_by=actor_id,
             )
             session.add(row)
+            self._record_heatmap_point(session, row)
             session.commit()
             session.refresh(row)
             _ = self._append_outcome_version(
@@ -713,6 +754,7 @@ class OutcomeService:
                 created_by=actor_id,
             )
             session.add(row)
+            self._record_heatmap_point(session, row)
             session.commit()
             session.refresh(row)
             _ = self._append_outcome_version(
@@ -742,8 +784,9 @@ class OutcomeService:
         from_ts: datetime | None = None,
         to_ts: datetime | None = None,
         viewer_user_id: str | None = None,
+        page: PageRequest | None = None,
     ) -> list[OutcomeCatalogRecord]:
-        with self._session() as session:
+        with self._read_session() as session:
             statement = select(OutcomeCatalogRecord).where(OutcomeCatalogRecord.tenant_id == tenant_id)
             if task_id is not None:
                 statement = statement.where(OutcomeCatalogRecord.task_id == task_id)
@@ -759,18 +802,21 @@ class OutcomeService:
                 statement = statement.where(OutcomeCatalogRecord.created_at >= from_ts)
             if to_ts is not None:
                 statement = statement.where(OutcomeCatalogRecord.created_at <= to_ts)
-            rows = list(session.exec(statement).all())
-            return [
-                item
-                for item in rows
-                if self._is_visible(
-                    session,
-                    tenant_id,
-                    viewer_user_id,
-                    task_id=item.task_id,
-                    mission_id=item.mission_id,
-                )
-            ]
+            statement = self._restrict_visible(
+                session,
+                tenant_id,
+                viewer_user_id,
+                statement,
+                task_id=col(OutcomeCatalogRecord.task_id),
+                mission_id=col(OutcomeCatalogRecord.mission_id),
+            )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(OutcomeCatalogRecord.created_at),
+                id_column=col(OutcomeCatalogRecord.id),
+            )
 
     def update_outcome_status(
         self,
@@ -821,6 +867,7 @@ class OutcomeService:
         outcome_id: str,
         *,
         viewer_user_id: str | None,
+        page: PageRequest | None = None,
     ) -> list[OutcomeCatalogVersion]:
         with self._session() as session:
             row = self._get_scoped_outcome(session, tenant_id, outcome_id)
@@ -838,4 +885,10 @@ class OutcomeService:
                 .where(OutcomeCatalogVersion.outcome_id == outcome_id)
                 .order_by(col(OutcomeCatalogVersion.version_no))
             )
-            return list(session.exec(statement).all())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(OutcomeCatalogVersion.created_at),
+                id_column=col(OutcomeCatalogVersion.id),
+            )
@@ -3,11 +3,12 @@ from __future__ import annotations
 from datetime import UTC, datetime
 
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.domain.models import Drone, DroneCreate, DroneUpdate, Tenant
-from app.infra.db import get_engine
+from app.infra.db import create_session, get_engine
 from app.infra.events import event_bus
+from app.infra.pagination import PageRequest, paginate_query
 from app.services.data_perimeter_service import DataPerimeterService
 
 
@@ -30,6 +31,9 @@ class RegistryService:
     def _session(self) -> Session:
         return Session(get_engine(), expire_on_commit=False)
 
+    def _read_session(self) -> Session:
+        return create_session(read_only=True)
+
     def _get_scoped_drone(self, session: Session, tenant_id: str, drone_id: str) -> Drone:
         drone = session.exec(
             select(Drone).where(Drone.tenant_id == tenant_id).where(Drone.id == drone_id)
@@ -81,14 +85,27 @@ class RegistryService:
         )
         return drone
 
-    def list_drones(self, tenant_id: str, viewer_user_id: str | None = None) -> list[Drone]:
-        with self._session() as session:
+    def list_drones(
+        self,
+        tenant_id: str,
+        viewer_user_id: str | None = None,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[Drone]:
+        with self._read_session() as session:
             statement = select(Drone).where(Drone.tenant_id == tenant_id)
-            rows = list(session.exec(statement).all())
-            if viewer_user_id is None:
-                return rows
-            scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
-            return [item for item in rows if self._data_perimeter.drone_visible(item, scope)]
+            if viewer_user_id is not None:
+                scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
+                statement = self._data_perimeter.restrict(
+                    statement, self._data_perimeter.drone_clause(scope)
+                )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(Drone.created_at),
+                id_column=col(Drone.id),
+            )
 
     def get_drone(self, tenant_id: str, drone_id: str, viewer_user_id: str | None = None) -> Drone:
         with self._session() as session:
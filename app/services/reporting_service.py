@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import re
+import socket
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import Any
+from uuid import uuid4
 
+from sqlalchemy import and_, case, func, or_, update
+from sqlalchemy import select as sa_select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql.elements import ColumnElement
 from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import SelectOfScalar
 
 from app.domain.models import (
     AlertHandlingAction,
     AlertRecord,
+    AlertType,
     Defect,
     DefectStatus,
     DeviceUtilizationRead,
@@ -23,6 +35,7 @@ from app.domain.models import (
     OutcomeReportRetentionRunRequest,
     OutcomeReportTemplate,
     OutcomeReportTemplateCreate,
+    OutcomeType,
     ReportExportStatus,
     ReportFileFormat,
     ReportingClosureRateRead,
@@ -30,11 +43,156 @@ from app.domain.models import (
     ReportingOverviewRead,
     now_utc,
 )
-from app.infra.db import get_engine
-from app.services.data_perimeter_service import DataPerimeterScope, DataPerimeterService
+from app.infra.db import create_session, get_engine
+from app.infra.pagination import PageRequest, paginate_query
+from app.infra.policy_cache import PolicyCache
+from app.infra.projection import (
+    json_text_contains,
+    supports_json_search,
+    topic_clause,
+    without_json,
+)
+from app.infra.report_writers import (
+    CsvReportWriter,
+    DocxReportWriter,
+    PdfReportWriter,
+    ReportWriter,
+)
+from app.services.data_perimeter_service import DataPerimeterScope, DataPerimeterService, dump_scope
 from app.services.defect_service import DefectService
 
 
+def outcome_topic_clause(topic: str) -> ColumnElement[bool]:
+    return topic_clause(
+        OutcomeCatalogRecord.outcome_type,
+        OutcomeType,
+        topic,
+        json_columns=(OutcomeCatalogRecord.payload,),
+    )
+
+
+def alert_topic_clause(topic: str) -> ColumnElement[bool]:
+    return topic_clause(
+        AlertRecord.alert_type,
+        AlertType,
+        topic,
+        text_columns=(AlertRecord.message,),
+        json_columns=(AlertRecord.detail,),
+    )
+
+
+def outcome_matches_topic(item: OutcomeCatalogRecord, topic: str) -> bool:
+    return topic in item.outcome_type.value.lower() or json_text_contains(item.payload, topic)
+
+
+def alert_matches_topic(item: AlertRecord, topic: str) -> bool:
+    return (
+        topic in item.alert_type.value.lower()
+        or topic in item.message.lower()
+        or json_text_contains(item.detail, topic)
+    )
+
+
+REPORTING_CACHE_TTL_SECONDS = float(os.getenv("REPORTING_CACHE_TTL_SECONDS", "0"))
+
+# Keyed by tenant and perimeter scope. Off by default: entries only drop on a policy
+# version bump or TTL expiry, so cached counts may trail new missions by up to the TTL.
+overview_cache: PolicyCache[ReportingOverviewRead] = PolicyCache(
+    "reporting-overview",
+    dump=lambda value: value.model_dump_json(),
+    load=ReportingOverviewRead.model_validate_json,
+    ttl_seconds=REPORTING_CACHE_TTL_SECONDS,
+)
+utilization_cache: PolicyCache[list[DeviceUtilizationRead]] = PolicyCache(
+    "reporting-device-utilization",
+    dump=lambda value: json.dumps([item.model_dump() for item in value]),
+    load=lambda raw: [DeviceUtilizationRead.model_validate(item) for item in json.loads(raw)],
+    ttl_seconds=REPORTING_CACHE_TTL_SECONDS,
+)
+
+# `inline` runs outcome report exports inside the request; `queue` leaves them QUEUED for
+# `infra/scripts/report_export_worker.py`.
+REPORT_EXPORT_MODE = os.getenv("REPORT_EXPORT_MODE", "inline").strip().lower()
+REPORT_EXPORT_CHUNK_SIZE = max(int(os.getenv("REPORT_EXPORT_CHUNK_SIZE", "500")), 1)
+# A RUNNING export whose heartbeat is older than this is taken over by the next worker.
+REPORT_EXPORT_STALE_SECONDS = float(os.getenv("REPORT_EXPORT_STALE_SECONDS", "300"))
+
+OUTCOME_REPORT_COLUMNS = ("id", "type", "status", "task_id", "mission_id")
+_REPORT_SUFFIXES = {
+    ReportFileFormat.PDF: "pdf",
+    ReportFileFormat.WORD: "docx",
+    ReportFileFormat.CSV: "csv",
+}
+
+
+def report_export_worker_id(prefix: str) -> str:
+    # Unique per run, so two runs in one process never share an owner or a part file.
+    return f"{prefix}:{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+
+def _part_file_for(output_file: Path, worker_id: str) -> Path:
+    owner = re.sub(r"[^A-Za-z0-9_.-]", "_", worker_id)
+    return output_file.with_name(f"{output_file.name}.{owner}.part")
+
+
+def _adopt_part_file(previous: Path, part_file: Path, bytes_written: int) -> bool:
+    """Carry the checkpointed prefix of `previous` over to `part_file`.
+
+    A worker that lost the job may still be appending to `previous`, so only the bytes the
+    checkpoint vouches for are copied. False when the file is gone or shorter than that.
+    """
+    if not previous.exists() or previous.stat().st_size < bytes_written:
+        return False
+    if previous == part_file:
+        return True
+    with previous.open("rb") as source, part_file.open("wb") as target:
+        remaining = bytes_written
+        while remaining > 0:
+            data = source.read(min(remaining, 1024 * 1024))
+            if not data:
+                return False
+            target.write(data)
+            remaining -= len(data)
+    previous.unlink(missing_ok=True)
+    return True
+
+
+def _stale_export_clause(now: datetime) -> ColumnElement[bool]:
+    """RUNNING exports whose worker has not heartbeated for REPORT_EXPORT_STALE_SECONDS."""
+    return and_(
+        col(OutcomeReportExport.status) == ReportExportStatus.RUNNING,
+        col(OutcomeReportExport.heartbeat_at) < now - timedelta(seconds=REPORT_EXPORT_STALE_SECONDS),
+    )
+
+
+def _export_dir() -> Path:
+    export_dir = Path("logs") / "exports"
+    export_dir.mkdir(parents=True, exist_ok=True)
+    return export_dir
+
+
+def _open_report_writer(
+    report_format: ReportFileFormat,
+    part_file: Path,
+    state: dict[str, Any] | None,
+) -> ReportWriter:
+    if report_format == ReportFileFormat.PDF:
+        return PdfReportWriter(part_file, OUTCOME_REPORT_COLUMNS, state, heading="Outcomes:")
+    if report_format == ReportFileFormat.WORD:
+        return DocxReportWriter(part_file, OUTCOME_REPORT_COLUMNS, state, heading="Outcomes:")
+    return CsvReportWriter(part_file, OUTCOME_REPORT_COLUMNS, state)
+
+
+def _outcome_report_row(item: OutcomeCatalogRecord) -> tuple[str, ...]:
+    return (
+        item.id,
+        item.outcome_type.value,
+        item.status.value,
+        item.task_id or "",
+        item.mission_id or "",
+    )
+
+
 class ReportingError(Exception):
     pass
 
@@ -55,6 +213,9 @@ class ReportingService:
     def _session(self) -> Session:
         return Session(get_engine(), expire_on_commit=False)
 
+    def _read_session(self) -> Session:
+        return create_session(read_only=True)
+
     def _as_utc(self, value: datetime) -> datetime:
         if value.tzinfo is None:
             return value.replace(tzinfo=UTC)
@@ -90,32 +251,6 @@ class ReportingService:
             raise NotFoundError("outcome report export not found")
         return row
 
-    def _is_outcome_visible(
-        self,
-        session: Session,
-        scope: DataPerimeterScope,
-        outcome: OutcomeCatalogRecord,
-    ) -> bool:
-        if outcome.task_id is not None:
-            task = session.exec(
-                select(InspectionTask)
-                .where(InspectionTask.tenant_id == outcome.tenant_id)
-                .where(InspectionTask.id == outcome.task_id)
-            ).first()
-            if task is None:
-                return False
-            return self._data_perimeter.inspection_task_visible(task, scope)
-        if outcome.mission_id is not None:
-            mission = session.exec(
-                select(Mission)
-                .where(Mission.tenant_id == outcome.tenant_id)
-                .where(Mission.id == outcome.mission_id)
-            ).first()
-            if mission is None:
-                return False
-            return self._data_perimeter.mission_visible(mission, scope)
-        return True
-
     def create_outcome_report_template(
         self,
         tenant_id: str,
@@ -141,14 +276,25 @@ class ReportingService:
             session.refresh(row)
             return row
 
-    def list_outcome_report_templates(self, tenant_id: str) -> list[OutcomeReportTemplate]:
+    def list_outcome_report_templates(
+        self,
+        tenant_id: str,
+        *,
+        page: PageRequest | None = None,
+    ) -> list[OutcomeReportTemplate]:
         with self._session() as session:
             statement = (
                 select(OutcomeReportTemplate)
                 .where(OutcomeReportTemplate.tenant_id == tenant_id)
                 .order_by(col(OutcomeReportTemplate.created_at).desc())
             )
-            return list(session.exec(statement).all())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(OutcomeReportTemplate.created_at),
+                id_column=col(OutcomeReportTemplate.id),
+            )
 
     def get_outcome_report_export(self, tenant_id: str, export_id: str) -> OutcomeReportExport:
         with self._session() as session:
@@ -221,28 +367,64 @@ class ReportingService:
                 skipped_files=skipped_files,
             )
 
+    def _visible_missions_statement(
+        self, tenant_id: str, scope: DataPerimeterScope
+    ) -> SelectOfScalar[Mission]:
+        return self._data_perimeter.restrict(
+            select(Mission).where(Mission.tenant_id == tenant_id),
+            self._data_perimeter.mission_clause(scope),
+        )
+
+    def _visible_inspections_statement(
+        self, tenant_id: str, scope: DataPerimeterScope
+    ) -> SelectOfScalar[InspectionTask]:
+        return self._data_perimeter.restrict(
+            select(InspectionTask).where(InspectionTask.tenant_id == tenant_id),
+            self._data_perimeter.inspection_task_clause(scope),
+        )
+
+    def _scope_key(self, scope: DataPerimeterScope) -> str:
+        return hashlib.sha256(dump_scope(scope).encode()).hexdigest()
+
     def overview(self, tenant_id: str, viewer_user_id: str | None = None) -> ReportingOverviewRead:
-        with self._session() as session:
-            missions = list(session.exec(select(Mission).where(Mission.tenant_id == tenant_id)).all())
-            inspections = list(session.exec(select(InspectionTask).where(InspectionTask.tenant_id == tenant_id)).all())
-            defects = list(session.exec(select(Defect).where(Defect.tenant_id == tenant_id)).all())
+        with self._read_session() as session:
             scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
-            missions = [item for item in missions if self._data_perimeter.mission_visible(item, scope)]
-            inspections = [
-                item for item in inspections if self._data_perimeter.inspection_task_visible(item, scope)
-            ]
-            defects = [item for item in defects if self._data_perimeter.defect_visible(item, scope)]
-        defects_total = len(defects)
-        defects_closed = len([item for item in defects if item.status == DefectStatus.CLOSED])
+            return overview_cache.get_or_load(
+                tenant_id,
+                self._scope_key(scope),
+                lambda: self._load_overview(session, tenant_id, scope),
+            )
+
+    def _load_overview(
+        self,
+        session: Session,
+        tenant_id: str,
+        scope: DataPerimeterScope,
+    ) -> ReportingOverviewRead:
+        missions_total = self._count_visible(session, self._visible_missions_statement(tenant_id, scope))
+        inspections_total = self._count_visible(session, self._visible_inspections_statement(tenant_id, scope))
+        visible_defects = self._data_perimeter.restrict(
+            select(Defect).where(Defect.tenant_id == tenant_id),
+            self._data_perimeter.defect_clause(scope),
+        ).subquery()
+        defects_total, defects_closed = session.execute(
+            sa_select(
+                func.count(),
+                func.coalesce(func.sum(case((visible_defects.c.status == DefectStatus.CLOSED, 1), else_=0)), 0),
+            ).select_from(visible_defects)
+        ).one()
         closure_rate = (defects_closed / defects_total) if defects_total else 0.0
         return ReportingOverviewRead(
-            missions_total=len(missions),
-            inspections_total=len(inspections),
-            defects_total=defects_total,
-            defects_closed=defects_closed,
+            missions_total=missions_total,
+            inspections_total=inspections_total,
+            defects_total=int(defects_total),
+            defects_closed=int(defects_closed),
             closure_rate=closure_rate,
         )
 
+    def _count_visible(self, session: Session, statement: SelectOfScalar[Any]) -> int:
+        return int(session.exec(select(func.count()).select_from(statement.subquery())).one())
+
     def closure_rate(self, tenant_id: str, viewer_user_id: str | None = None) -> ReportingClosureRateRead:
         stats = self._defect_service.stats(tenant_id, viewer_user_id=viewer_user_id)
         return ReportingClosureRateRead(
@@ -252,30 +434,50 @@ class ReportingService:
         )
 
     def device_utilization(self, tenant_id: str, viewer_user_id: str | None = None) -> list[DeviceUtilizationRead]:
-        with self._session() as session:
-            drones = list(session.exec(select(Drone).where(Drone.tenant_id == tenant_id)).all())
-            missions = list(session.exec(select(Mission).where(Mission.tenant_id == tenant_id)).all())
-            inspections = list(session.exec(select(InspectionTask).where(InspectionTask.tenant_id == tenant_id)).all())
+        with self._read_session() as session:
             scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
-            missions = [item for item in missions if self._data_perimeter.mission_visible(item, scope)]
-            inspections = [
-                item for item in inspections if self._data_perimeter.inspection_task_visible(item, scope)
-            ]
+            return utilization_cache.get_or_load(
+                tenant_id,
+                self._scope_key(scope),
+                lambda: self._load_device_utilization(session, tenant_id, scope),
+            )
 
-        usage: list[DeviceUtilizationRead] = []
-        for drone in drones:
-            drone_mission_ids = {item.id for item in missions if item.drone_id == drone.id}
-            drone_missions = len(drone_mission_ids)
-            drone_inspections = len([item for item in inspections if item.mission_id in drone_mission_ids])
-            usage.append(
-                DeviceUtilizationRead(
-                    drone_id=drone.id,
-                    drone_name=drone.name,
-                    missions=drone_missions,
-                    inspections=drone_inspections,
-                )
+    def _load_device_utilization(
+        self,
+        session: Session,
+        tenant_id: str,
+        scope: DataPerimeterScope,
+    ) -> list[DeviceUtilizationRead]:
+        drones = list(session.exec(select(Drone.id, Drone.name).where(Drone.tenant_id == tenant_id)).all())
+        visible_missions = self._visible_missions_statement(tenant_id, scope).subquery()
+        visible_inspections = self._visible_inspections_statement(tenant_id, scope).subquery()
+        mission_counts: dict[str, int] = {
+            drone_id: int(count)
+            for drone_id, count in session.execute(
+                sa_select(visible_missions.c.drone_id, func.count())
+                .where(visible_missions.c.drone_id.is_not(None))
+                .group_by(visible_missions.c.drone_id)
+            ).all()
+        }
+        inspection_counts: dict[str, int] = {
+            drone_id: int(count)
+            for drone_id, count in session.execute(
+                sa_select(visible_missions.c.drone_id, func.count())
+                .select_from(visible_inspections)
+                .join(visible_missions, visible_inspections.c.mission_id == visible_missions.c.id)
+                .where(visible_missions.c.drone_id.is_not(None))
+                .group_by(visible_missions.c.drone_id)
+            ).all()
+        }
+        return [
+            DeviceUtilizationRead(
+                drone_id=drone_id,
+                drone_name=drone_name,
+                missions=mission_counts.get(drone_id, 0),
+                inspections=inspection_counts.get(drone_id, 0),
             )
-        return usage
+            for drone_id, drone_name in drones
+        ]
 
     def create_outcome_report_export(
         self,
@@ -285,94 +487,349 @@ class ReportingService:
         *,
         viewer_user_id: str | None,
     ) -> OutcomeReportExport:
+        background = payload.background if payload.background is not None else REPORT_EXPORT_MODE == "queue"
+        worker_id = None if background else report_export_worker_id("inline")
         with self._session() as session:
             template = self._get_scoped_outcome_report_template(session, tenant_id, payload.template_id)
             if not template.is_active:
                 raise ConflictError("outcome report template is inactive")
 
-            report_format = payload.report_format or template.format_default
+            now = now_utc()
             export_row = OutcomeReportExport(
                 tenant_id=tenant_id,
                 template_id=template.id,
-                report_format=report_format,
-                status=ReportExportStatus.RUNNING,
+                report_format=payload.report_format or template.format_default,
+                status=ReportExportStatus.QUEUED if background else ReportExportStatus.RUNNING,
                 task_id=payload.task_id,
                 from_ts=payload.from_ts,
                 to_ts=payload.to_ts,
                 topic=payload.topic,
                 requested_by=actor_id,
+                viewer_user_id=viewer_user_id,
+                worker_id=worker_id,
+                started_at=None if background else now,
+                heartbeat_at=None if background else now,
                 detail={},
             )
             session.add(export_row)
             session.commit()
             session.refresh(export_row)
+        if worker_id is None:
+            return export_row
+        return self.run_outcome_report_export(export_row.id, worker_id=worker_id)
 
-            scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
-            outcomes = list(
-                session.exec(select(OutcomeCatalogRecord).where(OutcomeCatalogRecord.tenant_id == tenant_id)).all()
-            )
-            outcomes = [item for item in outcomes if self._is_outcome_visible(session, scope, item)]
-            if export_row.task_id is not None:
-                outcomes = [item for item in outcomes if item.task_id == export_row.task_id]
-
-            def _within(ts: datetime) -> bool:
-                if export_row.from_ts is not None and ts < export_row.from_ts:
-                    return False
-                return not (export_row.to_ts is not None and ts > export_row.to_ts)
-
-            outcomes = [item for item in outcomes if _within(item.created_at)]
-
-            if export_row.topic:
-                topic = export_row.topic.strip().lower()
-                outcomes = [
-                    item
-                    for item in outcomes
-                    if topic in item.outcome_type.value.lower() or topic in str(item.payload).lower()
-                ]
-
-            export_dir = Path("logs") / "exports"
-            export_dir.mkdir(parents=True, exist_ok=True)
-            suffix = "pdf" if report_format == ReportFileFormat.PDF else "docx"
-            output_file = export_dir / f"outcome_report_{export_row.id}.{suffix}"
-
-            content = self._render_outcome_report_text(template, export_row, outcomes)
-            try:
-                if report_format == ReportFileFormat.PDF:
-                    self._write_minimal_pdf(output_file, content)
-                else:
-                    self._write_minimal_docx(output_file, content)
-            except Exception as exc:
-                export_row.status = ReportExportStatus.FAILED
-                export_row.detail = {"error": str(exc)}
-                export_row.updated_at = now_utc()
-                export_row.completed_at = now_utc()
-                session.add(export_row)
+    def claim_outcome_report_export(self, worker_id: str) -> OutcomeReportExport | None:
+        """Hand the oldest queued export, or one whose worker stopped heartbeating, to `worker_id`.
+
+        The claim is a conditional UPDATE, so concurrent workers never run the same job.
+        """
+        claimable = or_(
+            col(OutcomeReportExport.status) == ReportExportStatus.QUEUED,
+            _stale_export_clause(now_utc()),
+        )
+        with self._session() as session:
+            candidates = session.exec(
+                select(OutcomeReportExport.id)
+                .where(claimable)
+                .order_by(col(OutcomeReportExport.created_at))
+                .limit(10)
+            ).all()
+            for export_id in candidates:
+                now = now_utc()
+                result = session.execute(
+                    update(OutcomeReportExport)
+                    .where(col(OutcomeReportExport.id) == export_id)
+                    .where(claimable)
+                    .values(
+                        status=ReportExportStatus.RUNNING,
+                        worker_id=worker_id,
+                        heartbeat_at=now,
+                        updated_at=now,
+                        started_at=func.coalesce(col(OutcomeReportExport.started_at), now),
+                    )
+                )
                 session.commit()
-                session.refresh(export_row)
-                raise ConflictError("outcome report export failed") from exc
-
-            export_row.status = ReportExportStatus.SUCCEEDED
-            export_row.file_path = str(output_file)
-            export_row.detail = {"outcomes_total": len(outcomes), "template_id": template.id}
-            export_row.updated_at = now_utc()
-            export_row.completed_at = now_utc()
-            session.add(export_row)
+                if getattr(result, "rowcount", 0) == 1:
+                    return session.get(OutcomeReportExport, export_id)
+        return None
+
+    def run_outcome_report_export(self, export_id: str, *, worker_id: str) -> OutcomeReportExport:
+        """Stream a claimed export to disk, checkpointing progress after every chunk.
+
+        Returns the row as the job left it: SUCCEEDED, CANCELED, or still RUNNING when
+        another worker took the job over after this one missed its heartbeat.
+        """
+        with self._session() as session:
+            export_row = session.get(OutcomeReportExport, export_id)
+            if export_row is None:
+                raise NotFoundError("outcome report export not found")
+        try:
+            with self._session() as session:
+                template = self._get_scoped_outcome_report_template(
+                    session, export_row.tenant_id, export_row.template_id
+                )
+            self._stream_outcome_report(export_row, template, worker_id)
+        except Exception as exc:
+            self._fail_outcome_report_export(export_id, worker_id, exc)
+            raise ConflictError("outcome report export failed") from exc
+        return self.get_outcome_report_export(export_row.tenant_id, export_id)
+
+    def cancel_outcome_report_export(self, tenant_id: str, export_id: str) -> OutcomeReportExport:
+        """Cancel a queued export now; a running one stops at its next checkpoint.
+
+        A running export whose worker stopped heartbeating has no next checkpoint, so it is
+        canceled right away; a worker that turns out to be alive then stops on its own.
+        """
+        with self._session() as session:
+            self._get_scoped_outcome_report_export(session, tenant_id, export_id)
+            now = now_utc()
+            # The loaded row is stale once this UPDATE runs; it is re-read below.
+            scoped = (
+                update(OutcomeReportExport)
+                .where(col(OutcomeReportExport.id) == export_id)
+                .execution_options(synchronize_session=False)
+            )
+            result = session.execute(
+                scoped.where(
+                    or_(col(OutcomeReportExport.status) == ReportExportStatus.QUEUED, _stale_export_clause(now))
+                ).values(
+                    status=ReportExportStatus.CANCELED,
+                    cancel_requested=True,
+                    updated_at=now,
+                    completed_at=now,
+                )
+            )
+            if getattr(result, "rowcount", 0) != 1:
+                result = session.execute(
+                    scoped.where(col(OutcomeReportExport.status) == ReportExportStatus.RUNNING).values(
+                        cancel_requested=True,
+                        updated_at=now,
+                    )
+                )
+            session.commit()
+            if getattr(result, "rowcount", 0) != 1:
+                raise ConflictError("only queued or running exports can be canceled")
+        return self.get_outcome_report_export(tenant_id, export_id)
+
+    def resume_outcome_report_export(self, tenant_id: str, export_id: str) -> OutcomeReportExport:
+        """Restart a canceled or failed export from its last checkpoint.
+
+        A running export whose worker stopped heartbeating is taken over the same way, so an
+        inline export orphaned by a crashed request can be finished. Like creation it runs
+        in the request unless REPORT_EXPORT_MODE is `queue`.
+        """
+        worker_id = None if REPORT_EXPORT_MODE == "queue" else report_export_worker_id("inline")
+        with self._session() as session:
+            export_row = self._get_scoped_outcome_report_export(session, tenant_id, export_id)
+            now = now_utc()
+            detail = {key: value for key, value in export_row.detail.items() if key != "error"}
+            result = session.execute(
+                update(OutcomeReportExport)
+                .where(col(OutcomeReportExport.id) == export_id)
+                .execution_options(synchronize_session=False)
+                .where(
+                    or_(
+                        col(OutcomeReportExport.status).in_(
+                            [ReportExportStatus.CANCELED, ReportExportStatus.FAILED]
+                        ),
+                        _stale_export_clause(now),
+                    )
+                )
+                .values(
+                    status=ReportExportStatus.QUEUED if worker_id is None else ReportExportStatus.RUNNING,
+                    cancel_requested=False,
+                    worker_id=worker_id,
+                    heartbeat_at=None if worker_id is None else now,
+                    detail=detail,
+                    updated_at=now,
+                    completed_at=None,
+                )
+            )
+            session.commit()
+            if getattr(result, "rowcount", 0) != 1:
+                raise ConflictError("only canceled, failed or stalled exports can be resumed")
+        if worker_id is None:
+            return self.get_outcome_report_export(tenant_id, export_id)
+        return self.run_outcome_report_export(export_id, worker_id=worker_id)
+
+    def _outcome_export_statement(
+        self, session: Session, export_row: OutcomeReportExport
+    ) -> SelectOfScalar[OutcomeCatalogRecord]:
+        statement = select(OutcomeCatalogRecord).where(OutcomeCatalogRecord.tenant_id == export_row.tenant_id)
+        if export_row.task_id is not None:
+            statement = statement.where(OutcomeCatalogRecord.task_id == export_row.task_id)
+        if export_row.from_ts is not None:
+            statement = statement.where(col(OutcomeCatalogRecord.created_at) >= self._as_utc(export_row.from_ts))
+        if export_row.to_ts is not None:
+            statement = statement.where(col(OutcomeCatalogRecord.created_at) <= self._as_utc(export_row.to_ts))
+        if export_row.topic:
+            if supports_json_search(session):
+                statement = statement.where(outcome_topic_clause(export_row.topic.strip().lower()))
+        else:
+            statement = statement.options(*without_json(OutcomeCatalogRecord))
+        return statement
+
+    def _stream_outcome_report(
+        self,
+        export_row: OutcomeReportExport,
+        template: OutcomeReportTemplate,
+        worker_id: str,
+    ) -> None:
+        suffix = _REPORT_SUFFIXES[export_row.report_format]
+        output_file = _export_dir() / f"outcome_report_{export_row.id}.{suffix}"
+        # Each worker writes its own part file, so a worker that lost the job to a stale
+        # takeover can never append to the file its successor is writing.
+        part_file = _part_file_for(output_file, worker_id)
+        checkpoint = dict(export_row.checkpoint)
+        writer_state = checkpoint.get("writer")
+        if writer_state is not None and not _adopt_part_file(
+            output_file.with_name(str(checkpoint.get("part_file", part_file.name))),
+            part_file,
+            int(writer_state["bytes_written"]),
+        ):
+            # The partial file is gone or short; start over rather than resume.
+            checkpoint, writer_state = {}, None
+        rows_scanned = export_row.rows_scanned if writer_state is not None else 0
+        rows_written = export_row.rows_written if writer_state is not None else 0
+        cursor = checkpoint.get("cursor")
+        topic = export_row.topic.strip().lower() if export_row.topic else None
+
+        writer = _open_report_writer(export_row.report_format, part_file, writer_state)
+        try:
+            with self._session() as session:
+                scope = self._data_perimeter.resolve_scope(session, export_row.tenant_id, export_row.viewer_user_id)
+                visibility = self._data_perimeter.linked_visibility(session, export_row.tenant_id, scope)
+                statement = self._outcome_export_statement(session, export_row)
+                rows_total = export_row.rows_total
+                if rows_total is None or writer_state is None:
+                    rows_total = self._count_visible(session, statement)
+                keep_going = self._checkpoint_outcome_report_export(
+                    export_row.id,
+                    worker_id,
+                    rows_total=rows_total,
+                    rows_scanned=rows_scanned,
+                    rows_written=rows_written,
+                    checkpoint={"cursor": cursor, "writer": writer.checkpoint(), "part_file": part_file.name},
+                )
+                while keep_going:
+                    chunk_statement = statement
+                    if cursor is not None:
+                        cursor_ts = datetime.fromisoformat(cursor[0])
+                        chunk_statement = chunk_statement.where(
+                            or_(
+                                col(OutcomeCatalogRecord.created_at) > cursor_ts,
+                                and_(
+                                    col(OutcomeCatalogRecord.created_at) == cursor_ts,
+                                    col(OutcomeCatalogRecord.id) > cursor[1],
+                                ),
+                            )
+                        )
+                    chunk = list(
+                        session.exec(
+                            chunk_statement.order_by(
+                                col(OutcomeCatalogRecord.created_at), col(OutcomeCatalogRecord.id)
+                            ).limit(REPORT_EXPORT_CHUNK_SIZE)
+                        ).all()
+                    )
+                    if not chunk:
+                        break
+                    cursor = [chunk[-1].created_at.isoformat(), chunk[-1].id]
+                    rows_scanned += len(chunk)
+                    visible = [
+                        item
+                        for item in visibility.filter(chunk)
+                        if topic is None or outcome_matches_topic(item, topic)
+                    ]
+                    writer.write_rows(_outcome_report_row(item) for item in visible)
+                    rows_written += len(visible)
+                    session.expunge_all()
+                    keep_going = self._checkpoint_outcome_report_export(
+                        export_row.id,
+                        worker_id,
+                        rows_total=rows_total,
+                        rows_scanned=rows_scanned,
+                        rows_written=rows_written,
+                        checkpoint={"cursor": cursor, "writer": writer.checkpoint(), "part_file": part_file.name},
+                    )
+            if not keep_going:
+                return
+            writer.finish(self._render_outcome_report_header(template, export_row, rows_written), output_file)
+        finally:
+            writer.close()
+
+        with self._session() as session:
+            row = session.get(OutcomeReportExport, export_row.id)
+            if row is None or row.worker_id != worker_id:
+                return
+            now = now_utc()
+            row.status = ReportExportStatus.SUCCEEDED
+            row.file_path = str(output_file)
+            row.detail = {"outcomes_total": rows_written, "template_id": template.id}
+            row.rows_scanned = rows_scanned
+            row.rows_written = rows_written
+            row.checkpoint = {}
+            row.heartbeat_at = now
+            row.updated_at = now
+            row.completed_at = now
+            session.add(row)
+            session.commit()
+
+    def _checkpoint_outcome_report_export(
+        self,
+        export_id: str,
+        worker_id: str,
+        *,
+        rows_total: int,
+        rows_scanned: int,
+        rows_written: int,
+        checkpoint: dict[str, Any],
+    ) -> bool:
+        """Persist progress; False once the job is canceled or owned by another worker."""
+        with self._session() as session:
+            row = session.exec(
+                select(OutcomeReportExport).where(OutcomeReportExport.id == export_id).with_for_update()
+            ).first()
+            if row is None or row.status != ReportExportStatus.RUNNING or row.worker_id != worker_id:
+                return False
+            now = now_utc()
+            row.rows_total = rows_total
+            row.rows_scanned = rows_scanned
+            row.rows_written = rows_written
+            row.checkpoint = checkpoint
+            row.heartbeat_at = now
+            row.updated_at = now
+            if row.cancel_requested:
+                row.status = ReportExportStatus.CANCELED
+                row.completed_at = now
+            session.add(row)
+            session.commit()
+            return row.status == ReportExportStatus.RUNNING
+
+    def _fail_outcome_report_export(self, export_id: str, worker_id: str, exc: Exception) -> None:
+        with self._session() as session:
+            row = session.get(OutcomeReportExport, export_id)
+            if row is None or row.worker_id != worker_id:
+                return
+            now = now_utc()
+            row.status = ReportExportStatus.FAILED
+            row.detail = {**row.detail, "error": str(exc)}
+            row.updated_at = now
+            row.completed_at = now
+            session.add(row)
             session.commit()
-            session.refresh(export_row)
-            return export_row
 
-    def _render_outcome_report_text(
+    def _render_outcome_report_header(
         self,
         template: OutcomeReportTemplate,
         export_row: OutcomeReportExport,
-        outcomes: list[OutcomeCatalogRecord],
-    ) -> str:
+        count: int,
+    ) -> list[str]:
         context = {
             "task_id": export_row.task_id or "",
             "from_ts": export_row.from_ts.isoformat() if export_row.from_ts else "",
             "to_ts": export_row.to_ts.isoformat() if export_row.to_ts else "",
             "topic": export_row.topic or "",
-            "count": len(outcomes),
+            "count": count,
         }
 
         def _safe_format(text: str) -> str:
@@ -381,17 +838,23 @@ class ReportingService:
             except Exception:
                 return text
 
-        title = _safe_format(template.title_template)
-        body_template = _safe_format(template.body_template)
-        lines = [title, "", body_template, "", "Outcomes:"]
-        for item in outcomes:
-            lines.append(
-                
-                    f"- id={item.id} type={item.outcome_type.value} status={item.status.value} "
-                    f"task_id={item.task_id or ''} mission_id={item.mission_id or ''}"
-                
-            )
-        return "\n".join(lines)
+        return [
+            _safe_format(template.title_template),
+            "",
+            *_safe_format(template.body_template).splitlines(),
+        ]
+
+    def _count_matching(
+        self,
+        session: Session,
+        statement: SelectOfScalar[Any],
+        predicate: Callable[[Any], bool] | None,
+    ) -> int:
+        if predicate is None:
+            return self._count_visible(session, statement)
+        # Rows stream through in batches; only the running count is kept.
+        rows = session.exec(statement.execution_options(yield_per=REPORT_EXPORT_CHUNK_SIZE))
+        return sum(1 for item in rows if predicate(item))
 
     def export_report(
         self,
@@ -401,168 +864,73 @@ class ReportingService:
     ) -> str:
         overview = self.overview(tenant_id, viewer_user_id=viewer_user_id)
         closure = self.closure_rate(tenant_id, viewer_user_id=viewer_user_id)
+        topic = payload.topic.strip().lower() if payload.topic else None
+        from_ts = self._as_utc(payload.from_ts) if payload.from_ts is not None else None
+        to_ts = self._as_utc(payload.to_ts) if payload.to_ts is not None else None
+
+        def _within(statement: SelectOfScalar[Any], column: Any) -> SelectOfScalar[Any]:
+            if from_ts is not None:
+                statement = statement.where(col(column) >= from_ts)
+            if to_ts is not None:
+                statement = statement.where(col(column) <= to_ts)
+            return statement
+
         with self._session() as session:
-            outcomes = list(
-                session.exec(select(OutcomeCatalogRecord).where(OutcomeCatalogRecord.tenant_id == tenant_id)).all()
+            outcome_statement = _within(
+                select(OutcomeCatalogRecord).where(OutcomeCatalogRecord.tenant_id == tenant_id),
+                OutcomeCatalogRecord.created_at,
             )
-            alerts = list(session.exec(select(AlertRecord).where(AlertRecord.tenant_id == tenant_id)).all())
-            actions = list(
-                session.exec(select(AlertHandlingAction).where(AlertHandlingAction.tenant_id == tenant_id)).all()
+            if payload.task_id is not None:
+                outcome_statement = outcome_statement.where(OutcomeCatalogRecord.task_id == payload.task_id)
+            alert_statement = _within(
+                select(AlertRecord).where(AlertRecord.tenant_id == tenant_id),
+                AlertRecord.first_seen_at,
             )
-
-        if payload.task_id is not None:
-            outcomes = [item for item in outcomes if item.task_id == payload.task_id]
-
-        def _within(ts: datetime) -> bool:
-            if payload.from_ts is not None and ts < payload.from_ts:
-                return False
-            return not (payload.to_ts is not None and ts > payload.to_ts)
-
-        outcomes = [item for item in outcomes if _within(item.created_at)]
-        alerts = [item for item in alerts if _within(item.first_seen_at)]
-        actions = [item for item in actions if _within(item.created_at)]
-
-        if payload.topic:
-            topic = payload.topic.strip().lower()
-            outcomes = [
-                item
-                for item in outcomes
-                if topic in item.outcome_type.value.lower() or topic in str(item.payload).lower()
-            ]
-            alerts = [
-                item
-                for item in alerts
-                if topic in item.alert_type.value.lower()
-                or topic in item.message.lower()
-                or topic in str(item.detail).lower()
-            ]
-            actions = [
-                item
-                for item in actions
-                if topic in item.action_type.value.lower() or topic in str(item.note or "").lower()
-            ]
-
-        export_dir = Path("logs") / "exports"
-        export_dir.mkdir(parents=True, exist_ok=True)
-        output_file = export_dir / f"report_{tenant_id}.pdf"
-        text = (
-            f"{payload.title}\n"
-            f"task_id={payload.task_id or ''}\n"
-            f"from_ts={payload.from_ts.isoformat() if payload.from_ts else ''}\n"
-            f"to_ts={payload.to_ts.isoformat() if payload.to_ts else ''}\n"
-            f"topic={payload.topic or ''}\n"
-            f"missions_total={overview.missions_total}\n"
-            f"inspections_total={overview.inspections_total}\n"
-            f"defects_total={overview.defects_total}\n"
-            f"defects_closed={overview.defects_closed}\n"
-            f"closure_rate={closure.closure_rate:.4f}\n"
-            f"outcomes_total={len(outcomes)}\n"
-            f"alerts_total={len(alerts)}\n"
-            f"alert_actions_total={len(actions)}\n"
-        )
-        self._write_minimal_pdf(output_file, text)
-        return str(output_file)
-
-    def _write_minimal_pdf(self, path: Path, content: str) -> None:
-        escaped = content.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
-        stream = f"BT /F1 11 Tf 50 760 Td ({escaped}) Tj ET"
-        stream_bytes = stream.encode("latin-1", errors="replace")
-        objects = [
-            b"1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n",
-            b"2 0 obj << /Type /Pages /Kids [3 0 R] /Count 1 >> endobj\n",
-            b"3 0 obj << /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >> endobj\n",
-            b"4 0 obj << /Type /Font /Subtype /Type1 /BaseFont /Helvetica >> endobj\n",
-            f"5 0 obj << /Length {len(stream_bytes)} >> stream\n".encode("ascii")
-            + stream_bytes
-            + b"\nendstream endobj\n",
-        ]
-        result = bytearray(b"%PDF-1.4\n")
-        offsets = [0]
-        for obj in objects:
-            offsets.append(len(result))
-            result.extend(obj)
-        xref_pos = len(result)
-        result.extend(f"xref\n0 {len(offsets)}\n".encode("ascii"))
-        result.extend(b"0000000000 65535 f \n")
-        for offset in offsets[1:]:
-            result.extend(f"{offset:010d} 00000 n \n".encode("ascii"))
-        result.extend(
-            (
-                "trailer << /Size "
-                f"{len(offsets)} /Root 1 0 R >>\nstartxref\n{xref_pos}\n%%EOF\n"
-            ).encode("ascii")
-        )
-        path.write_bytes(bytes(result))
-
-    def _write_minimal_docx(self, path: Path, content: str) -> None:
-        escaped_lines = (
-            content.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .splitlines()
-        )
-        if not escaped_lines:
-            escaped_lines = [""]
-        paragraphs = "".join(
-            (
-                "<w:p><w:r><w:t xml:space=\"preserve\">"
-                f"{line}"
-                "</w:t></w:r></w:p>"
+            action_statement = _within(
+                select(AlertHandlingAction).where(AlertHandlingAction.tenant_id == tenant_id),
+                AlertHandlingAction.created_at,
             )
-            for line in escaped_lines
-        )
-        document_xml = (
-            "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
-            "<w:document "
-            "xmlns:wpc=\"http://schemas.microsoft.com/office/word/2010/wordprocessingCanvas\" "
-            "xmlns:mc=\"http://schemas.openxmlformats.org/markup-compatibility/2006\" "
-            "xmlns:o=\"urn:schemas-microsoft-com:office:office\" "
-            "xmlns:r=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships\" "
-            "xmlns:m=\"http://schemas.openxmlformats.org/officeDocument/2006/math\" "
-            "xmlns:v=\"urn:schemas-microsoft-com:vml\" "
-            "xmlns:wp14=\"http://schemas.microsoft.com/office/word/2010/wordprocessingDrawing\" "
-            "xmlns:wp=\"http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing\" "
-            "xmlns:w10=\"urn:schemas-microsoft-com:office:word\" "
-            "xmlns:w=\"http://schemas.openxmlformats.org/wordprocessingml/2006/main\" "
-            "xmlns:w14=\"http://schemas.microsoft.com/office/word/2010/wordml\" "
-            "xmlns:wpg=\"http://schemas.microsoft.com/office/word/2010/wordprocessingGroup\" "
-            "xmlns:wpi=\"http://schemas.microsoft.com/office/word/2010/wordprocessingInk\" "
-            "xmlns:wne=\"http://schemas.microsoft.com/office/word/2006/wordml\" "
-            "xmlns:wps=\"http://schemas.microsoft.com/office/word/2010/wordprocessingShape\" "
-            "mc:Ignorable=\"w14 wp14\">"
-            f"<w:body>{paragraphs}<w:sectPr><w:pgSz w:w=\"12240\" w:h=\"15840\"/>"
-            "<w:pgMar w:top=\"1440\" w:right=\"1440\" w:bottom=\"1440\" w:left=\"1440\" "
-            "w:header=\"708\" w:footer=\"708\" w:gutter=\"0\"/></w:sectPr></w:body></w:document>"
-        )
-        with ZipFile(path, mode="w", compression=ZIP_DEFLATED) as docx:
-            docx.writestr(
-                "[Content_Types].xml",
-                (
-                    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
-                    "<Types xmlns=\"http://schemas.openxmlformats.org/package/2006/content-types\">"
-                    "<Default Extension=\"rels\" ContentType=\"application/vnd.openxmlformats-package.relationships+xml\"/>"
-                    "<Default Extension=\"xml\" ContentType=\"application/xml\"/>"
-                    "<Override PartName=\"/word/document.xml\" "
-                    "ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml\"/>"
-                    "</Types>"
-                ),
+            if topic and supports_json_search(session):
+                # Narrow in SQL first; the streamed Python checks stay the reference semantics.
+                outcome_statement = outcome_statement.where(outcome_topic_clause(topic))
+                alert_statement = alert_statement.where(alert_topic_clause(topic))
+            outcomes_total = self._count_matching(
+                session,
+                outcome_statement,
+                None if topic is None else lambda item: outcome_matches_topic(item, topic),
             )
-            docx.writestr(
-                "_rels/.rels",
-                (
-                    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
-                    "<Relationships xmlns=\"http://schemas.openxmlformats.org/package/2006/relationships\">"
-                    "<Relationship Id=\"rId1\" "
-                    "Type=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument\" "
-                    "Target=\"word/document.xml\"/>"
-                    "</Relationships>"
-                ),
+            alerts_total = self._count_matching(
+                session,
+                alert_statement,
+                None if topic is None else lambda item: alert_matches_topic(item, topic),
             )
-            docx.writestr(
-                "word/_rels/document.xml.rels",
-                (
-                    "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
-                    "<Relationships xmlns=\"http://schemas.openxmlformats.org/package/2006/relationships\"/>"
-                ),
+            actions_total = self._count_matching(
+                session,
+                action_statement,
+                None
+                if topic is None
+                else lambda item: topic in item.action_type.value.lower() or topic in str(item.note or "").lower(),
             )
-            docx.writestr("word/document.xml", document_xml)
+
+        output_file = _export_dir() / f"report_{tenant_id}.pdf"
+        lines = [
+            payload.title,
+            f"task_id={payload.task_id or ''}",
+            f"from_ts={payload.from_ts.isoformat() if payload.from_ts else ''}",
+            f"to_ts={payload.to_ts.isoformat() if payload.to_ts else ''}",
+            f"topic={payload.topic or ''}",
+            f"missions_total={overview.missions_total}",
+            f"inspections_total={overview.inspections_total}",
+            f"defects_total={overview.defects_total}",
+            f"defects_closed={overview.defects_closed}",
+            f"closure_rate={closure.closure_rate:.4f}",
+            f"outcomes_total={outcomes_total}",
+            f"alerts_total={alerts_total}",
+            f"alert_actions_total={actions_total}",
+        ]
+        writer = PdfReportWriter(output_file.with_name(f"{output_file.name}.{uuid4().hex}.part"), ())
+        try:
+            writer.finish(lines, output_file)
+        finally:
+            writer.close()
+        return str(output_file)
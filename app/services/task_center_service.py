@@ -5,7 +5,7 @@ from typing import Any, ClassVar
 from uuid import uuid4
 
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.domain.models import (
     ApprovalDecision,
@@ -35,8 +35,9 @@ from app.domain.models import (
     UserOrgMembership,
 )
 from app.domain.state_machine import TaskCenterState, can_task_center_transition
-from app.infra.db import get_engine
+from app.infra.db import create_session, get_engine
 from app.infra.events import event_bus
+from app.infra.pagination import PageRequest, paginate_query
 from app.services.compliance_service import ComplianceService
 from app.services.data_perimeter_service import DataPerimeterService
 
@@ -69,6 +70,9 @@ class TaskCenterService:
     def _session(self) -> Session:
         return Session(get_engine(), expire_on_commit=False)
 
+    def _read_session(self) -> Session:
+        return create_session(read_only=True)
+
     @staticmethod
     def _ensure_utc(dt: datetime) -> datetime:
         if dt.tzinfo is None:
@@ -472,12 +476,24 @@ class TaskCenterService:
             session.refresh(row)
             return row
 
-    def list_task_types(self, tenant_id: str, *, is_active: bool | None = None) -> list[TaskTypeCatalog]:
+    def list_task_types(
+        self,
+        tenant_id: str,
+        *,
+        is_active: bool | None = None,
+        page: PageRequest | None = None,
+    ) -> list[TaskTypeCatalog]:
         with self._session() as session:
             statement = select(TaskTypeCatalog).where(TaskTypeCatalog.tenant_id == tenant_id)
             if is_active is not None:
                 statement = statement.where(TaskTypeCatalog.is_active == is_active)
-            return list(session.exec(statement).all())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(TaskTypeCatalog.created_at),
+                id_column=col(TaskTypeCatalog.id),
+            )
 
     def create_template(self, tenant_id: str, actor_id: str, payload: TaskTemplateCreate) -> TaskTemplate:
         with self._session() as session:
@@ -515,6 +531,7 @@ class TaskCenterService:
         *,
         task_type_id: str | None = None,
         is_active: bool | None = None,
+        page: PageRequest | None = None,
     ) -> list[TaskTemplate]:
         with self._session() as session:
             statement = select(TaskTemplate).where(TaskTemplate.tenant_id == tenant_id)
@@ -522,7 +539,13 @@ class TaskCenterService:
                 statement = statement.where(TaskTemplate.task_type_id == task_type_id)
             if is_active is not None:
                 statement = statement.where(TaskTemplate.is_active == is_active)
-            return list(session.exec(statement).all())
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(TaskTemplate.created_at),
+                id_column=col(TaskTemplate.id),
+            )
 
     def clone_template(
         self,
@@ -744,16 +767,24 @@ class TaskCenterService:
         *,
         state: TaskCenterState | None = None,
         viewer_user_id: str | None = None,
+        page: PageRequest | None = None,
     ) -> list[TaskCenterTask]:
-        with self._session() as session:
+        with self._read_session() as session:
             statement = select(TaskCenterTask).where(TaskCenterTask.tenant_id == tenant_id)
             if state is not None:
                 statement = statement.where(TaskCenterTask.state == state)
-            rows = list(session.exec(statement).all())
-            if viewer_user_id is None:
-                return rows
-            scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
-            return [item for item in rows if self._data_perimeter.task_center_visible(item, scope)]
+            if viewer_user_id is not None:
+                scope = self._data_perimeter.resolve_scope(session, tenant_id, viewer_user_id)
+                statement = self._data_perimeter.restrict(
+                    statement, self._data_perimeter.task_center_clause(scope)
+                )
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(TaskCenterTask.created_at),
+                id_column=col(TaskCenterTask.id),
+            )
 
     def get_task(
         self,
@@ -1160,6 +1191,7 @@ class TaskCenterService:
         task_id: str,
         *,
         viewer_user_id: str | None = None,
+        page: PageRequest | None = None,
     ) -> list[TaskCenterTaskHistory]:
         with self._session() as session:
             task = self._get_scoped_task(session, tenant_id, task_id)
@@ -1169,5 +1201,11 @@ class TaskCenterService:
                 .where(TaskCenterTaskHistory.tenant_id == tenant_id)
                 .where(TaskCenterTaskHistory.task_id == task_id)
             )
-            rows = list(session.exec(statement).all())
-            return sorted(rows, key=lambda item: item.created_at)
+            statement = statement.order_by(col(TaskCenterTaskHistory.created_at))
+            return paginate_query(
+                session,
+                statement,
+                page,
+                sort_column=col(TaskCenterTaskHistory.created_at),
+                id_column=col(TaskCenterTaskHistory.id),
+            )
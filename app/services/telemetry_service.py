@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from sqlmodel import Session
+
 from app.domain.models import TelemetryNormalized
 from app.infra import redis_state
+from app.infra.db import get_engine
 from app.infra.events import event_bus
 from app.services.alert_service import AlertService
+from app.services.kpi_service import KpiService
 
 
 class TelemetryError(Exception):
@@ -15,8 +19,17 @@ class NotFoundError(TelemetryError):
 
 
 class TelemetryService:
-    def __init__(self, *, alert_service: AlertService | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        alert_service: AlertService | None = None,
+        kpi_service: KpiService | None = None,
+    ) -> None:
         self._alert_service = alert_service or AlertService()
+        self._kpi_service = kpi_service or KpiService()
+
+    def _session(self) -> Session:
+        return Session(get_engine(), expire_on_commit=False)
 
     @staticmethod
     def _state_key(tenant_id: str, drone_id: str) -> str:
@@ -27,11 +40,25 @@ class TelemetryService:
         redis = redis_state.get_redis()
         key = self._state_key(tenant_id, normalized.drone_id)
         redis.set(key, normalized.model_dump_json())
-        event_bus.publish_dict(
-            "telemetry.normalized",
-            tenant_id,
-            normalized.model_dump(mode="json"),
-        )
+        # The raw event and its rollup fold commit together, so a rollup rebuild never sees
+        # a sample counted in the rollup that is missing from the events table.
+        with self._session() as session:
+            event = event_bus.publish_dict(
+                "telemetry.normalized",
+                tenant_id,
+                normalized.model_dump(mode="json"),
+                session=session,
+            )
+            self._kpi_service.record_flight_sample(
+                tenant_id,
+                normalized.drone_id,
+                event_ts=event.ts,
+                sample_ts=normalized.ts,
+                lat=normalized.position.lat,
+                lon=normalized.position.lon,
+                session=session,
+            )
+            session.commit()
         self._alert_service.evaluate_telemetry(tenant_id, normalized)
         return normalized
 
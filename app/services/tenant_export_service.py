@@ -3,17 +3,47 @@ from __future__ import annotations
 import enum
 import hashlib
 import json
-from datetime import UTC, date, datetime
+import os
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from typing import Any, cast
 from uuid import uuid4
 from zipfile import ZIP_DEFLATED, ZipFile
 
-from sqlalchemy import Table, select
+import sqlalchemy as sa
+from sqlalchemy import Table, delete, func, select, text, tuple_
+from sqlalchemy.engine import RowMapping
 from sqlmodel import Session, SQLModel
 
 from app.domain.models import Tenant
+from app.infra.columnar import asdict_schema, open_columnar_writer, table_schema
 from app.infra.db import get_engine
+from app.infra.upsert import upsert_rows
+
+TENANT_EXPORT_BATCH_SIZE = max(int(os.getenv("TENANT_EXPORT_BATCH_SIZE", "5000")), 1)
+TENANT_EXPORT_WORKERS = max(int(os.getenv("TENANT_EXPORT_WORKERS", "4")), 1)
+# A delta re-reads rows changed this long before the base's high-water mark, to catch
+# transactions that committed after the base export with an earlier timestamp.
+TENANT_EXPORT_WATERMARK_OVERLAP_SECONDS = max(int(os.getenv("TENANT_EXPORT_WATERMARK_OVERLAP_SECONDS", "300")), 0)
+_SNAPSHOT_ID_RE = re.compile(r"[0-9A-Fa-f]+(-[0-9A-Fa-f]+)+")
+# Export ids name directories under the tenant's export root, so nothing else is accepted.
+_EXPORT_ID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+EXPORT_FORMATS = ("jsonl", "columnar")
+# Tables without `updated_at` whose rows are never changed after insert, with the column
+# stamped by the server at insert time. Other tables without `updated_at` are re-exported
+# in full by every incremental export.
+APPEND_ONLY_TABLES = {
+    "audit_logs": "ts",
+    "events": "ts",
+    "billing_usage_events": "created_at",
+    "task_center_task_histories": "created_at",
+    "asset_maintenance_histories": "created_at",
+}
+# Below the bind-parameter limits of both SQLite and PostgreSQL.
+_RESTORE_MAX_PARAMS = 30000
 
 
 class TenantExportError(Exception):
@@ -24,6 +54,10 @@ class NotFoundError(TenantExportError):
     pass
 
 
+class ValidationError(TenantExportError):
+    pass
+
+
 class TenantExportWriter:
     def __init__(self, root_dir: Path | None = None) -> None:
         self.root_dir = root_dir or (Path("logs") / "exports")
@@ -39,7 +73,7 @@ class TenantExportWriter:
         *,
         export_dir: Path,
         table_name: str,
-        rows: list[dict[str, Any]],
+        rows: Iterable[dict[str, Any]],
     ) -> dict[str, Any]:
         relative_path = Path("tables") / f"{table_name}.jsonl"
         output_path = export_dir / relative_path
@@ -61,25 +95,110 @@ class TenantExportWriter:
             "file": str(relative_path).replace("\\", "/"),
         }
 
+    def write_table_columnar(
+        self,
+        *,
+        export_dir: Path,
+        table: Table,
+        batches: Iterator[Sequence[RowMapping]],
+    ) -> dict[str, Any]:
+        schema = table_schema(table)
+        output_path, writer = open_columnar_writer(export_dir / "tables" / table.name, schema)
+        for batch in batches:
+            writer.write_batch(batch)
+        summary = writer.close()
+        return {
+            "table": table.name,
+            "row_count": summary["row_count"],
+            "sha256": summary["sha256"],
+            "file": f"tables/{output_path.name}",
+            "encoding": summary["encoding"],
+            "compression": summary["compression"],
+            "row_groups": summary["row_groups"],
+            "bytes": summary["bytes"],
+            "schema": asdict_schema(schema),
+        }
+
+    def _read_keys(self, path: Path) -> Iterator[list[Any]]:
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _diff_sorted_keys(self, previous: Iterator[list[Any]], current: Iterator[list[Any]]) -> Iterator[list[Any]]:
+        """Keys of `previous` missing from `current`; both must be in ascending order."""
+        current_key = next(current, None)
+        for key in previous:
+            while current_key is not None and current_key < key:
+                current_key = next(current, None)
+            if current_key != key:
+                yield key
+
+    def write_table_keys(
+        self,
+        *,
+        export_dir: Path,
+        table_name: str,
+        keys: Iterable[list[Any]],
+        previous_keys: Path | None,
+    ) -> dict[str, Any]:
+        """Write every current primary key and, against a base's key file, delete tombstones.
+
+        `keys` and the base file are both in ascending order, so the diff is a single merge pass.
+        """
+        keys_path = Path("keys") / f"{table_name}.jsonl"
+        tombstones_path = Path("tombstones") / f"{table_name}.jsonl"
+        (export_dir / keys_path).parent.mkdir(parents=True, exist_ok=True)
+        key_count = 0
+        tombstone_count = 0
+        with (export_dir / keys_path).open("w", encoding="utf-8") as keys_handle:
+
+            def _written() -> Iterator[list[Any]]:
+                nonlocal key_count
+                for key in keys:
+                    keys_handle.write(f"{json.dumps(key, ensure_ascii=False)}\n")
+                    key_count += 1
+                    yield key
+
+            current = _written()
+            if previous_keys is not None:
+                (export_dir / tombstones_path).parent.mkdir(parents=True, exist_ok=True)
+                with (export_dir / tombstones_path).open("w", encoding="utf-8") as tombstones_handle:
+                    for key in self._diff_sorted_keys(self._read_keys(previous_keys), current):
+                        tombstones_handle.write(f"{json.dumps(key, ensure_ascii=False)}\n")
+                        tombstone_count += 1
+            for _ in current:
+                pass
+
+        return {
+            "keys_file": str(keys_path).replace("\\", "/"),
+            "key_count": key_count,
+            "tombstones_file": str(tombstones_path).replace("\\", "/") if previous_keys is not None else None,
+            "tombstone_count": tombstone_count,
+        }
+
+    def _manifest_text(self, manifest: dict[str, Any]) -> str:
+        return json.dumps(manifest, ensure_ascii=False, indent=2)
+
     def write_manifest(self, export_dir: Path, manifest: dict[str, Any]) -> Path:
         manifest_path = export_dir / "manifest.json"
-        manifest_path.write_text(
-            json.dumps(manifest, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        manifest_path.write_text(self._manifest_text(manifest), encoding="utf-8")
         return manifest_path
 
-    def write_zip(self, *, export_dir: Path, export_id: str) -> Path:
-        zip_name = f"{export_id}.zip"
-        zip_path = export_dir / zip_name
-        with ZipFile(zip_path, "w", compression=ZIP_DEFLATED) as archive:
-            for file_path in export_dir.rglob("*"):
-                if not file_path.is_file():
-                    continue
-                if file_path == zip_path:
-                    continue
-                archive.write(file_path, arcname=str(file_path.relative_to(export_dir)))
-        return zip_path
+    def open_zip(self, *, export_dir: Path, export_id: str) -> ZipFile:
+        """Open the export archive up front so tables are packed as soon as each one is written."""
+        return ZipFile(export_dir / f"{export_id}.zip", "w", compression=ZIP_DEFLATED, allowZip64=True)
+
+    def add_table_to_zip(self, archive: ZipFile, *, export_dir: Path, summary: dict[str, Any]) -> None:
+        for key in ("file", "keys_file", "tombstones_file"):
+            relative_path = summary.get(key)
+            if relative_path:
+                archive.write(export_dir / relative_path, arcname=relative_path)
+
+    def close_zip(self, archive: ZipFile, manifest: dict[str, Any]) -> Path:
+        archive.writestr("manifest.json", self._manifest_text(manifest))
+        archive.close()
+        return Path(str(archive.filename))
 
 
 class TenantExportService:
@@ -120,67 +239,300 @@ class TenantExportService:
             return {key: self._normalize_value(item) for key, item in value.items()}
         return str(value)
 
-    def _fetch_table_rows(
+    def _iter_table_batches(
         self,
         *,
         session: Session,
         table: Table,
         tenant_id: str,
-    ) -> list[dict[str, Any]]:
-        columns = list(table.columns)
-        statement = select(*columns).where(table.c.tenant_id == tenant_id)
+        since: tuple[str, datetime] | None = None,
+    ) -> Iterator[Sequence[RowMapping]]:
+        """Rows in primary-key order, fetched in batches through a server-side cursor.
+
+        `since` is a `(change column, lower bound)` pair that limits an incremental export.
+        """
+        statement = select(*table.columns).where(table.c.tenant_id == tenant_id)
+        if since is not None:
+            change_column, lower_bound = since
+            statement = statement.where(table.c[change_column] >= lower_bound)
         primary_keys = list(table.primary_key.columns)
         if primary_keys:
             statement = statement.order_by(*primary_keys)
-        rows = session.execute(statement).mappings().all()
-        normalized_rows: list[dict[str, Any]] = []
-        for row in rows:
-            normalized_rows.append(
-                {
-                    column.key: self._normalize_value(row[column.key])
-                    for column in columns
-                }
+        result = session.execute(statement.execution_options(yield_per=TENANT_EXPORT_BATCH_SIZE))
+        yield from result.mappings().partitions()
+
+    def _select_tables(self, scoped_tables: list[Table], names: Sequence[str] | None) -> list[Table]:
+        if not names:
+            return scoped_tables
+        by_name = {table.name: table for table in scoped_tables}
+        unknown = sorted(set(names) - by_name.keys())
+        if unknown:
+            raise ValidationError(f"unknown or non tenant-scoped tables: {unknown}")
+        return [table for table in scoped_tables if table.name in set(names)]
+
+    def _iter_table_rows(self, table: Table, batches: Iterator[Sequence[RowMapping]]) -> Iterator[dict[str, Any]]:
+        columns = list(table.columns)
+        for batch in batches:
+            for row in batch:
+                yield {column.key: self._normalize_value(row[column.key]) for column in columns}
+
+    def _change_column(self, table: Table) -> str | None:
+        if "updated_at" in table.columns:
+            return "updated_at"
+        return APPEND_ONLY_TABLES.get(table.name)
+
+    def _iter_table_keys(self, *, session: Session, table: Table, tenant_id: str) -> Iterator[list[Any]]:
+        """Primary keys in code-point order, the order Python compares the key files in."""
+        key_columns = list(table.primary_key.columns)
+        binary_collation = session.get_bind().dialect.name == "postgresql"
+        ordering = [
+            column.collate("C") if binary_collation and isinstance(column.type, sa.String) else column
+            for column in key_columns
+        ]
+        statement = (
+            select(*key_columns)
+            .where(table.c.tenant_id == tenant_id)
+            .order_by(*ordering)
+            .execution_options(yield_per=TENANT_EXPORT_BATCH_SIZE)
+        )
+        for row in session.execute(statement):
+            yield [self._normalize_value(value) for value in row]
+
+    def _high_water_mark(self, *, session: Session, table: Table, tenant_id: str, column: str) -> str | None:
+        value = session.execute(
+            select(func.max(table.c[column])).where(table.c.tenant_id == tenant_id)
+        ).scalar_one_or_none()
+        return cast(str | None, self._normalize_value(value))
+
+    def _export_table(
+        self,
+        *,
+        session: Session,
+        table: Table,
+        tenant_id: str,
+        export_dir: Path,
+        export_format: str,
+        previous: dict[str, Any] | None,
+        previous_dir: Path | None,
+    ) -> dict[str, Any]:
+        """Export one table; `previous` is its summary in the base of an incremental export."""
+        change_column = self._change_column(table)
+        high_water_mark = None
+        if change_column is not None:
+            # Read before the rows: anything changed meanwhile is exported again next time.
+            high_water_mark = self._high_water_mark(
+                session=session,
+                table=table,
+                tenant_id=tenant_id,
+                column=change_column,
+            )
+        since: tuple[str, datetime] | None = None
+        if (
+            previous is not None
+            and change_column is not None
+            and previous.get("change_column") == change_column
+            and previous.get("high_water_mark")
+        ):
+            lower_bound = datetime.fromisoformat(previous["high_water_mark"]) - timedelta(
+                seconds=TENANT_EXPORT_WATERMARK_OVERLAP_SECONDS
             )
-        return normalized_rows
+            since = (change_column, lower_bound)
+        previous_keys = None
+        if previous is not None and previous_dir is not None and previous.get("keys_file"):
+            previous_keys = previous_dir / previous["keys_file"]
 
-    def create_export(self, tenant_id: str, *, include_zip: bool = False) -> dict[str, Any]:
+        batches = self._iter_table_batches(session=session, table=table, tenant_id=tenant_id, since=since)
+        if export_format == "columnar":
+            summary = self._writer.write_table_columnar(export_dir=export_dir, table=table, batches=batches)
+        else:
+            summary = self._writer.write_table_jsonl(
+                export_dir=export_dir,
+                table_name=table.name,
+                rows=self._iter_table_rows(table, batches),
+            )
+        summary.update(
+            self._writer.write_table_keys(
+                export_dir=export_dir,
+                table_name=table.name,
+                keys=self._iter_table_keys(session=session, table=table, tenant_id=tenant_id),
+                previous_keys=previous_keys,
+            )
+        )
+        summary.update(
+            {
+                "primary_key": [column.key for column in table.primary_key.columns],
+                "change_column": change_column,
+                "high_water_mark": high_water_mark,
+                "since": since[1].astimezone(UTC).isoformat() if since is not None else None,
+            }
+        )
+        return summary
+
+    def _begin_snapshot(self, session: Session) -> None:
+        """Read every table of the export from one snapshot where the database allows it."""
+        if session.get_bind().dialect.name == "postgresql":
+            session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+    def _export_snapshot(self, session: Session) -> str | None:
+        """Publish the session's snapshot so parallel table workers read the same point in time.
+
+        Only PostgreSQL can share a snapshot between connections; elsewhere each worker
+        reads its table as of its own transaction start.
+        """
+        if session.get_bind().dialect.name != "postgresql":
+            return None
+        snapshot_id = session.execute(text("SELECT pg_export_snapshot()")).scalar_one()
+        return str(snapshot_id)
+
+    def _export_table_in_worker(self, snapshot_id: str | None, **kwargs: Any) -> dict[str, Any]:
+        with self._session() as session:
+            if snapshot_id is not None:
+                if _SNAPSHOT_ID_RE.fullmatch(snapshot_id) is None:
+                    raise TenantExportError(f"unexpected snapshot id: {snapshot_id!r}")
+                session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+                # Utility statements take no bind parameters; the id comes from the server.
+                session.execute(text(f"SET TRANSACTION SNAPSHOT '{snapshot_id}'"))
+            return self._export_table(session=session, **kwargs)
+
+    def _export_tables(
+        self,
+        *,
+        session: Session,
+        tables: list[Table],
+        tenant_id: str,
+        export_dir: Path,
+        export_format: str,
+        base_manifest: dict[str, Any] | None,
+        base_dir: Path | None,
+    ) -> Iterator[dict[str, Any]]:
+        """Table summaries in completion order.
+
+        With more than one worker every table streams through its own session on a
+        thread pool; `session` only holds the exported snapshot open until all are done.
+        """
+        previous_tables = {item["table"]: item for item in (base_manifest or {}).get("tables", [])}
+        workers = min(TENANT_EXPORT_WORKERS, len(tables))
+        if workers <= 1:
+            for table in tables:
+                yield self._export_table(
+                    session=session,
+                    table=table,
+                    tenant_id=tenant_id,
+                    export_dir=export_dir,
+                    export_format=export_format,
+                    previous=previous_tables.get(table.name),
+                    previous_dir=base_dir,
+                )
+            return
+
+        snapshot_id = self._export_snapshot(session)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tenant-export")
+        try:
+            futures = [
+                executor.submit(
+                    self._export_table_in_worker,
+                    snapshot_id,
+                    table=table,
+                    tenant_id=tenant_id,
+                    export_dir=export_dir,
+                    export_format=export_format,
+                    previous=previous_tables.get(table.name),
+                    previous_dir=base_dir,
+                )
+                for table in tables
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def create_export(
+        self,
+        tenant_id: str,
+        *,
+        include_zip: bool = False,
+        export_format: str = "jsonl",
+        tables: Sequence[str] | None = None,
+        since_export_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Export the tenant's rows of every (or each selected) tenant-scoped table.
+
+        `jsonl` writes one JSON object per row. `columnar` streams rows into typed,
+        compressed column chunks per row group: Parquet when pyarrow is installed,
+        otherwise the stdlib-only format of `app.infra.columnar`.
+
+        Rows are streamed in `TENANT_EXPORT_BATCH_SIZE` batches and hashed as they are
+        written, independent tables run on up to `TENANT_EXPORT_WORKERS` threads, and
+        with `include_zip` each table is packed into the archive as soon as it finishes.
+
+        Every table records its primary keys and, when it has a change column, the
+        high-water mark of that column. With `since_export_id` only rows changed since
+        that export are written, plus tombstones for keys that have disappeared;
+        `restore_export` applies such a chain on top of its full export.
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError(f"unsupported export format: {export_format}")
         export_id = str(uuid4())
+        archive: ZipFile | None = None
+        base_manifest: dict[str, Any] | None = None
+        base_dir: Path | None = None
+        if since_export_id is not None:
+            if _EXPORT_ID_RE.fullmatch(since_export_id) is None:
+                raise ValidationError("since_export_id is not an export id")
+            base_manifest = self._base_manifest(tenant_id, since_export_id, export_format=export_format)
+            base_dir = self._writer.root_dir / tenant_id / since_export_id
+            base_tables = [item["table"] for item in base_manifest["tables"]]
+            if tables and set(tables) != set(base_tables):
+                raise ValidationError("an incremental export covers the same tables as its base export")
+            tables = base_tables
         with self._session() as session:
+            self._begin_snapshot(session)
             tenant = session.get(Tenant, tenant_id)
             if tenant is None:
                 raise NotFoundError("tenant not found")
 
             scoped_tables, global_tables = self._discover_tables()
+            selected_tables = self._select_tables(scoped_tables, tables)
             export_dir = self._writer.prepare_export_dir(tenant_id, export_id)
-            table_summaries: list[dict[str, Any]] = []
-            for table in scoped_tables:
-                rows = self._fetch_table_rows(session=session, table=table, tenant_id=tenant_id)
-                table_summaries.append(
-                    self._writer.write_table_jsonl(
-                        export_dir=export_dir,
-                        table_name=table.name,
-                        rows=rows,
-                    )
-                )
+            if include_zip:
+                archive = self._writer.open_zip(export_dir=export_dir, export_id=export_id)
+            summaries_by_table: dict[str, dict[str, Any]] = {}
+            try:
+                for summary in self._export_tables(
+                    session=session,
+                    tables=selected_tables,
+                    tenant_id=tenant_id,
+                    export_dir=export_dir,
+                    export_format=export_format,
+                    base_manifest=base_manifest,
+                    base_dir=base_dir,
+                ):
+                    summaries_by_table[summary["table"]] = summary
+                    if archive is not None:
+                        self._writer.add_table_to_zip(archive, export_dir=export_dir, summary=summary)
+            except BaseException:
+                if archive is not None:
+                    archive.close()
+                raise
 
         manifest: dict[str, Any] = {
             "export_id": export_id,
             "tenant_id": tenant_id,
             "status": "completed",
             "export_version": self.EXPORT_VERSION,
+            "format": export_format,
+            "mode": "incremental" if since_export_id is not None else "full",
+            "base_export_id": since_export_id,
             "created_at": datetime.now(UTC).isoformat(),
-            "tables": table_summaries,
+            "tables": [summaries_by_table[table.name] for table in selected_tables],
             "global_tables_skipped": global_tables,
-            "zip_file": None,
+            "zip_file": f"{export_id}.zip" if archive is not None else None,
         }
 
-        # Write manifest before optional zip packaging so zip can include it.
         manifest_path = self._writer.write_manifest(export_dir, manifest)
         zip_path: Path | None = None
-        if include_zip:
-            zip_path = self._writer.write_zip(export_dir=export_dir, export_id=export_id)
-            manifest["zip_file"] = zip_path.name
-            manifest_path = self._writer.write_manifest(export_dir, manifest)
+        if archive is not None:
+            zip_path = self._writer.close_zip(archive, manifest)
         return {
             "export_id": export_id,
             "status": manifest["status"],
@@ -188,11 +540,25 @@ class TenantExportService:
             "zip_path": str(zip_path) if zip_path is not None else None,
         }
 
+    def _base_manifest(self, tenant_id: str, export_id: str, *, export_format: str) -> dict[str, Any]:
+        manifest = self.get_export_manifest(tenant_id, export_id)
+        if manifest.get("status") != "completed":
+            raise ValidationError("base export is not completed")
+        if manifest.get("format", "jsonl") != export_format:
+            raise ValidationError("an incremental export uses the same format as its base export")
+        if any("keys_file" not in item for item in manifest["tables"]):
+            raise ValidationError("base export predates change tracking; take a full export first")
+        return manifest
+
     def get_export_manifest(self, tenant_id: str, export_id: str) -> dict[str, Any]:
+        if _EXPORT_ID_RE.fullmatch(export_id) is None:
+            raise NotFoundError("export not found")
         manifest_path = self._writer.root_dir / tenant_id / export_id / "manifest.json"
         if not manifest_path.exists():
             raise NotFoundError("export not found")
         payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if payload.get("tenant_id") != tenant_id or payload.get("export_id") != export_id:
+            raise NotFoundError("export not found")
         return cast(dict[str, Any], payload)
 
     def get_export_zip_path(self, tenant_id: str, export_id: str) -> Path:
@@ -204,3 +570,148 @@ class TenantExportService:
         if not zip_path.exists():
             raise NotFoundError("zip export not found")
         return zip_path
+
+    def _export_chain(self, tenant_id: str, export_id: str) -> list[dict[str, Any]]:
+        """Manifests from the full export up to `export_id`, oldest first."""
+        chain: list[dict[str, Any]] = []
+        current_id: str | None = export_id
+        while current_id is not None:
+            if any(item["export_id"] == current_id for item in chain):
+                raise ValidationError("export chain refers back to itself")
+            manifest = self.get_export_manifest(tenant_id, current_id)
+            chain.append(manifest)
+            current_id = manifest.get("base_export_id")
+        chain.reverse()
+        return chain
+
+    def _verify_table_file(self, export_dir: Path, summary: dict[str, Any]) -> None:
+        digest = hashlib.sha256()
+        with (export_dir / summary["file"]).open("rb") as handle:
+            for block in iter(lambda: handle.read(1024 * 1024), b""):
+                digest.update(block)
+        if digest.hexdigest() != summary["sha256"]:
+            raise ValidationError(f"checksum mismatch in {export_dir.name}/{summary['file']}")
+
+    def _restore_value(self, column: sa.Column[Any], value: Any) -> Any:
+        if value is None:
+            return None
+        if isinstance(column.type, sa.DateTime):
+            return datetime.fromisoformat(value)
+        if isinstance(column.type, sa.Date):
+            return date.fromisoformat(value)
+        if isinstance(column.type, sa.Enum) and column.type.enum_class is not None:
+            return column.type.enum_class(value)
+        return value
+
+    def _iter_restore_batches(self, path: Path, size: int) -> Iterator[list[Any]]:
+        batch: list[Any] = []
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                batch.append(json.loads(line))
+                if len(batch) >= size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    def _restore_batch_size(self, table: Table) -> int:
+        return max(1, min(TENANT_EXPORT_BATCH_SIZE, _RESTORE_MAX_PARAMS // len(table.columns)))
+
+    def _delete_tombstones(self, *, session: Session, table: Table, tenant_id: str, path: Path) -> int:
+        key_columns = list(table.primary_key.columns)
+        target = tuple_(*key_columns) if len(key_columns) > 1 else key_columns[0]
+        deleted = 0
+        for batch in self._iter_restore_batches(path, self._restore_batch_size(table)):
+            keys = [
+                [self._restore_value(column, value) for column, value in zip(key_columns, key, strict=True)]
+                for key in batch
+            ]
+            values = [tuple(key) for key in keys] if len(key_columns) > 1 else [key[0] for key in keys]
+            result = session.execute(delete(table).where(table.c.tenant_id == tenant_id, target.in_(values)))
+            deleted += getattr(result, "rowcount", 0)
+        return deleted
+
+    def _upsert_table_rows(self, *, session: Session, table: Table, path: Path) -> int:
+        key_names = [column.key for column in table.primary_key.columns]
+        replace = [column.key for column in table.columns if column.key not in key_names]
+        # Rows may point at rows of the same table later in the file: write those
+        # references in a second pass once every row exists.
+        self_references = {
+            foreign_key.parent.key
+            for foreign_key in table.foreign_keys
+            if foreign_key.column.table is table and foreign_key.parent.nullable and not foreign_key.parent.primary_key
+        }
+        passes = [self_references, set()] if self_references else [set()]
+        upserted = 0
+        for cleared in passes:
+            for batch in self._iter_restore_batches(path, self._restore_batch_size(table)):
+                rows = [
+                    {
+                        column.key: None if column.key in cleared else self._restore_value(column, row[column.key])
+                        for column in table.columns
+                        if column.key in row
+                    }
+                    for row in batch
+                ]
+                upsert_rows(session, table, rows, conflict_columns=key_names, replace=replace)
+                if not cleared:
+                    upserted += len(rows)
+        return upserted
+
+    def restore_export(self, tenant_id: str, export_id: str) -> dict[str, Any]:
+        """Apply a full export and the incremental exports built on it to the database.
+
+        The chain is followed through `base_export_id` back to its full export and applied
+        oldest first: an export's tombstones are deleted (children before parents), then its
+        rows are upserted by primary key (parents before children). Each export commits on
+        its own and every step is idempotent, so an interrupted restore can simply be rerun.
+        The tenant row itself must already exist. Only `jsonl` exports can be restored.
+        """
+        chain = self._export_chain(tenant_id, export_id)
+        scoped_names = {table.name for table in self._discover_tables()[0]}
+        ordered_tables = [table for table in SQLModel.metadata.sorted_tables if table.name in scoped_names]
+        for manifest in chain:
+            if manifest.get("format", "jsonl") != "jsonl":
+                raise ValidationError("only jsonl exports can be restored")
+            unknown = sorted({item["table"] for item in manifest["tables"]} - scoped_names)
+            if unknown:
+                raise ValidationError(f"export {manifest['export_id']} has unknown tables: {unknown}")
+            export_dir = self._writer.root_dir / tenant_id / manifest["export_id"]
+            for summary in manifest["tables"]:
+                self._verify_table_file(export_dir, summary)
+
+        rows_upserted = 0
+        rows_deleted = 0
+        with self._session() as session:
+            if session.get(Tenant, tenant_id) is None:
+                raise NotFoundError("tenant not found")
+            for manifest in chain:
+                export_dir = self._writer.root_dir / tenant_id / manifest["export_id"]
+                summaries = {item["table"]: item for item in manifest["tables"]}
+                for table in reversed(ordered_tables):
+                    summary = summaries.get(table.name)
+                    if summary is not None and summary.get("tombstones_file"):
+                        rows_deleted += self._delete_tombstones(
+                            session=session,
+                            table=table,
+                            tenant_id=tenant_id,
+                            path=export_dir / summary["tombstones_file"],
+                        )
+                for table in ordered_tables:
+                    summary = summaries.get(table.name)
+                    if summary is not None:
+                        rows_upserted += self._upsert_table_rows(
+                            session=session,
+                            table=table,
+                            path=export_dir / summary["file"],
+                        )
+                session.commit()
+        return {
+            "tenant_id": tenant_id,
+            "export_id": export_id,
+            "applied_exports": [manifest["export_id"] for manifest in chain],
+            "rows_upserted": rows_upserted,
+            "rows_deleted": rows_deleted,
+        }
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import threading
+import time
 from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -16,8 +21,19 @@ from sqlmodel import Session, SQLModel
 
 from app.domain.models import Tenant
 from app.infra.db import get_engine
+from app.infra.policy_cache import bump_policy_version
 
 TENANT_PURGE_CONFIRM_PHRASE = "I_UNDERSTAND_THIS_WILL_DELETE_TENANT_DATA"
+TENANT_PURGE_BATCH_SIZE = max(int(os.getenv("TENANT_PURGE_BATCH_SIZE", "1000")), 1)
+TENANT_PURGE_WORKERS = max(int(os.getenv("TENANT_PURGE_WORKERS", "4")), 1)
+# 0 disables the limit.
+TENANT_PURGE_MAX_ROWS_PER_SECOND = max(float(os.getenv("TENANT_PURGE_MAX_ROWS_PER_SECOND", "0")), 0.0)
+# A running purge whose report has not been written for this long may be resumed.
+TENANT_PURGE_STALE_SECONDS = max(int(os.getenv("TENANT_PURGE_STALE_SECONDS", "300")), 1)
+_PROGRESS_WRITE_INTERVAL_SECONDS = 1.0
+# Rows can still land after their table is done (the audit sink flushes in the
+# background); tables found non-empty afterwards are purged again this many times.
+_VERIFY_PASSES = 3
 
 
 class TenantPurgeError(Exception):
@@ -65,7 +81,10 @@ class TenantPurgeWriter:
         output_dir = self.root_dir / tenant_id / purge_id
         output_dir.mkdir(parents=True, exist_ok=True)
         path = output_dir / "report.json"
-        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        # The report doubles as the resume checkpoint: never leave it half written.
+        partial_path = output_dir / "report.json.partial"
+        partial_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(partial_path, path)
         return path
 
     def read_report(self, tenant_id: str, purge_id: str) -> dict[str, Any]:
@@ -76,6 +95,66 @@ class TenantPurgeWriter:
         return cast(dict[str, Any], payload)
 
 
+class _RowRateLimiter:
+    """Spaces deletes out so all workers together stay under `rows_per_second`."""
+
+    def __init__(self, rows_per_second: float) -> None:
+        self._rows_per_second = rows_per_second
+        self._lock = threading.Lock()
+        self._available_at = time.monotonic()
+
+    def wait(self, rows: int) -> None:
+        if self._rows_per_second <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._available_at)
+            self._available_at = start + rows / self._rows_per_second
+        if start > now:
+            time.sleep(start - now)
+
+
+class _PurgeProgress:
+    """The purge report as it is being built; every chunk lands in its checkpoint."""
+
+    def __init__(self, writer: TenantPurgeWriter, report: dict[str, Any]) -> None:
+        self._writer = writer
+        self.report = report
+        self._lock = threading.Lock()
+        self._written_at = 0.0
+        self.stop = threading.Event()
+
+    def table_state(self, table_name: str) -> dict[str, Any]:
+        with self._lock:
+            return dict(self.report["checkpoint"][table_name])
+
+    def record(self, table_name: str, *, deleted: int = 0, **state: Any) -> None:
+        with self._lock:
+            entry = self.report["checkpoint"][table_name]
+            entry.update(state)
+            entry["deleted"] += deleted
+            self.report["deleted_counts"][table_name] = entry["deleted"]
+            progress = self.report["progress"]
+            progress["rows_deleted"] += deleted
+            progress["tables_completed"] = sum(
+                1 for item in self.report["checkpoint"].values() if item["status"] == "completed"
+            )
+            if progress["rows_estimated"]:
+                progress["percent"] = round(min(progress["rows_deleted"] / progress["rows_estimated"], 1.0) * 100, 1)
+            if entry["status"] == "completed" or time.monotonic() - self._written_at >= _PROGRESS_WRITE_INTERVAL_SECONDS:
+                self._write_locked()
+
+    def write(self, **fields: Any) -> Path:
+        with self._lock:
+            self.report.update(fields)
+            return self._write_locked()
+
+    def _write_locked(self) -> Path:
+        self.report["updated_at"] = datetime.now(UTC).isoformat()
+        self._written_at = time.monotonic()
+        return self._writer.write_report(self.report["tenant_id"], self.report["purge_id"], self.report)
+
+
 class TenantPurgeService:
     PURGE_VERSION = "07C-3"
 
@@ -259,6 +338,232 @@ class TenantPurgeService:
             "dry_run_path": str(dry_run_path),
         }
 
+    def _json_key(self, row: Any) -> list[Any]:
+        return [value if isinstance(value, str | int | float | bool) or value is None else str(value) for value in row]
+
+    def _iter_key_chunks(
+        self,
+        session: Session,
+        *,
+        table: Table,
+        where: ColumnElement[bool],
+        last_key: list[Any] | None,
+        batch_size: int,
+    ) -> Iterator[list[Any]]:
+        """Primary keys of matching rows in key order, one chunk per query.
+
+        The caller commits between chunks; the keyset start skips rows already handled
+        instead of re-reading the dead tuples they leave behind.
+        """
+        key_columns = list(table.primary_key.columns)
+        key_expression: Any = sa.tuple_(*key_columns) if len(key_columns) > 1 else key_columns[0]
+        while True:
+            statement = sa.select(*key_columns).where(where).order_by(*key_columns).limit(batch_size)
+            if last_key is not None:
+                bound: Any = sa.tuple_(*last_key) if len(key_columns) > 1 else last_key[0]
+                statement = statement.where(key_expression > bound)
+            rows = session.execute(statement).all()
+            if not rows:
+                return
+            yield [tuple(row) if len(key_columns) > 1 else row[0] for row in rows]
+            last_key = self._json_key(rows[-1])
+
+    def _purge_table(
+        self,
+        *,
+        table_name: str,
+        tenant_id: str,
+        target_map: dict[str, PurgeTarget],
+        progress: _PurgeProgress,
+        limiter: _RowRateLimiter,
+        batch_size: int,
+    ) -> None:
+        """Delete one table's tenant rows in primary-key chunks, committing after each chunk.
+
+        Nullable references from the table to itself are cleared first, so no chunk
+        deletes a row that a not-yet-deleted row still points at.
+        """
+        target = target_map[table_name]
+        table = target.table
+        clause = self._target_clause(target=target, tenant_id=tenant_id, target_map=target_map)
+        key_columns = list(table.primary_key.columns)
+        key_expression: Any = sa.tuple_(*key_columns) if len(key_columns) > 1 else key_columns[0]
+        self_references = [
+            foreign_key.parent
+            for foreign_key in table.foreign_keys
+            if foreign_key.column.table is table and foreign_key.parent.nullable and not foreign_key.parent.primary_key
+        ]
+        state = progress.table_state(table_name)
+        progress.record(table_name, status="running")
+        with self._session() as session:
+            if self_references and state["phase"] == "unlink":
+                linked = sa.and_(clause, sa.or_(*[column.isnot(None) for column in self_references]))
+                for keys in self._iter_key_chunks(
+                    session, table=table, where=linked, last_key=state["last_key"], batch_size=batch_size
+                ):
+                    if progress.stop.is_set():
+                        return
+                    limiter.wait(len(keys))
+                    session.execute(
+                        sa.update(table)
+                        .where(key_expression.in_(keys))
+                        .values({column.key: None for column in self_references})
+                    )
+                    session.commit()
+                    progress.record(table_name, last_key=self._json_key(_as_row(keys[-1])))
+                progress.record(table_name, phase="delete", last_key=None)
+                state = progress.table_state(table_name)
+            else:
+                progress.record(table_name, phase="delete")
+
+            for keys in self._iter_key_chunks(
+                session, table=table, where=clause, last_key=state["last_key"], batch_size=batch_size
+            ):
+                if progress.stop.is_set():
+                    return
+                limiter.wait(len(keys))
+                result = session.execute(sa.delete(table).where(key_expression.in_(keys)))
+                session.commit()
+                progress.record(
+                    table_name,
+                    deleted=int(getattr(result, "rowcount", 0) or 0),
+                    last_key=self._json_key(_as_row(keys[-1])),
+                )
+        progress.record(table_name, status="completed", last_key=None)
+
+    def _run_purge_plan(
+        self,
+        *,
+        tenant_id: str,
+        plan: list[str],
+        target_map: dict[str, PurgeTarget],
+        progress: _PurgeProgress,
+    ) -> None:
+        """Purge the plan's tables, up to `workers` at a time.
+
+        A table starts once every table that references it and comes before it in the
+        plan is done, so independent branches of the FK graph are deleted in parallel
+        while each parent still waits for its children.
+        """
+        settings = progress.report["settings"]
+        limiter = _RowRateLimiter(float(settings["max_rows_per_second"]))
+        position = {name: index for index, name in enumerate(plan)}
+        waits_for: dict[str, set[str]] = {name: set() for name in plan}
+        for child_name in plan:
+            for foreign_key in target_map[child_name].table.foreign_keys:
+                parent_name = foreign_key.column.table.name
+                if parent_name != child_name and parent_name in position and position[child_name] < position[parent_name]:
+                    waits_for[parent_name].add(child_name)
+
+        done = {name for name in plan if progress.table_state(name)["status"] == "completed"}
+        pending = [name for name in plan if name not in done]
+        workers = max(int(settings["workers"]), 1)
+        running: dict[Future[None], str] = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tenant-purge") as executor:
+            try:
+                while pending or running:
+                    for name in [item for item in pending if waits_for[item] <= done]:
+                        if len(running) >= workers:
+                            break
+                        pending.remove(name)
+                        future = executor.submit(
+                            self._purge_table,
+                            table_name=name,
+                            tenant_id=tenant_id,
+                            target_map=target_map,
+                            progress=progress,
+                            limiter=limiter,
+                            batch_size=int(settings["batch_size"]),
+                        )
+                        running[future] = name
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        name = running.pop(future)
+                        future.result()
+                        done.add(name)
+            except BaseException:
+                # Let the other workers stop after their current chunk.
+                progress.stop.set()
+                raise
+
+    def _remaining_counts(
+        self,
+        session: Session,
+        *,
+        target_map: dict[str, PurgeTarget],
+        table_names: list[str],
+        tenant_id: str,
+    ) -> dict[str, int]:
+        """Zero for every table without rows left; only tables that still have rows are counted."""
+        counts: dict[str, int] = {}
+        for table_name in table_names:
+            target = target_map[table_name]
+            clause = self._target_clause(target=target, tenant_id=tenant_id, target_map=target_map)
+            probe = session.execute(sa.select(sa.literal(1)).select_from(target.table).where(clause).limit(1)).first()
+            counts[table_name] = 0
+            if probe is not None:
+                counts[table_name] = self._target_row_count(
+                    session,
+                    target=target,
+                    tenant_id=tenant_id,
+                    target_map=target_map,
+                )
+        return counts
+
+    def _drive_purge(
+        self,
+        *,
+        tenant_id: str,
+        plan: list[str],
+        target_map: dict[str, PurgeTarget],
+        progress: _PurgeProgress,
+    ) -> dict[str, Any]:
+        try:
+            for _ in range(_VERIFY_PASSES):
+                self._run_purge_plan(tenant_id=tenant_id, plan=plan, target_map=target_map, progress=progress)
+                with self._session() as session:
+                    post_delete_counts = self._remaining_counts(
+                        session,
+                        target_map=target_map,
+                        table_names=plan,
+                        tenant_id=tenant_id,
+                    )
+                non_zero = {name: count for name, count in post_delete_counts.items() if count > 0}
+                if not non_zero:
+                    break
+                for name in non_zero:
+                    progress.record(name, status="pending", phase="unlink", last_key=None)
+        except Exception as exc:
+            progress.write(status="failed", error=str(exc))
+            raise ConflictError(f"purge stopped; resume it from its checkpoint: {exc}") from exc
+
+        if non_zero:
+            progress.write(status="failed", post_delete_counts=post_delete_counts, error="remaining rows detected")
+            raise ConflictError(f"purge verification failed; remaining rows detected: {non_zero}")
+        bump_policy_version(tenant_id)
+
+        dry_run_counts = progress.report["dry_run_counts"]
+        deleted_counts = progress.report["deleted_counts"]
+        report_path = progress.write(
+            status="completed",
+            completed_at=datetime.now(UTC).isoformat(),
+            post_delete_counts=post_delete_counts,
+            deleted_rows=sum(deleted_counts.values()),
+            dry_run_drift_detected=any(
+                int(deleted_counts.get(name, 0)) != int(dry_run_counts.get(name, 0)) for name in plan
+            ),
+            error=None,
+        )
+        return {
+            "purge_id": progress.report["purge_id"],
+            "tenant_id": tenant_id,
+            "dry_run_id": progress.report["dry_run_id"],
+            "status": "completed",
+            "report_path": str(report_path),
+            "deleted_rows": progress.report["deleted_rows"],
+            "post_delete_counts": post_delete_counts,
+        }
+
     def execute_purge(
         self,
         *,
@@ -267,7 +572,17 @@ class TenantPurgeService:
         confirm_token: str | None,
         confirm_phrase: str | None,
         mode: str,
+        batch_size: int | None = None,
+        max_rows_per_second: float | None = None,
+        workers: int | None = None,
     ) -> dict[str, Any]:
+        """Delete the tenant's rows following the dry run's plan.
+
+        Rows go in primary-key chunks of `batch_size`, each committed on its own, so no
+        lock or transaction outlives a chunk. The report is written as the purge runs and
+        holds a checkpoint per table; a purge that stops part way can be resumed with
+        `resume_purge`.
+        """
         if mode.lower() != "hard":
             raise ValidationError("only hard mode is supported")
 
@@ -288,72 +603,88 @@ class TenantPurgeService:
         if not isinstance(dry_run_counts_raw, dict):
             raise ValidationError("dry run counts are invalid")
         dry_run_counts = cast(dict[str, Any], dry_run_counts_raw)
+        if batch_size is not None and batch_size < 1:
+            raise ValidationError("batch_size must be positive")
+        if workers is not None and workers < 1:
+            raise ValidationError("workers must be positive")
+        if max_rows_per_second is not None and max_rows_per_second < 0:
+            raise ValidationError("max_rows_per_second must not be negative")
 
         target_map = self._discover_purge_targets()
         missing_tables = [name for name in plan_names if name not in target_map]
         if missing_tables:
             raise ValidationError(f"dry run plan references unknown tables: {missing_tables}")
 
-        purge_id = str(uuid4())
         with self._session() as session:
             self._ensure_tenant_exists(session, tenant_id)
-            pre_delete_counts = self._collect_counts(
-                session,
-                target_map=target_map,
-                table_names=plan_names,
-                tenant_id=tenant_id,
-            )
-            deleted_counts: dict[str, int] = {}
-            for table_name in plan_names:
-                target = target_map[table_name]
-                clause = self._target_clause(target=target, tenant_id=tenant_id, target_map=target_map)
-                delete_result = session.execute(sa.delete(target.table).where(clause))
-                rowcount = getattr(delete_result, "rowcount", None)
-                deleted_counts[table_name] = int(rowcount or 0)
-            post_delete_counts = self._collect_counts(
-                session,
-                target_map=target_map,
-                table_names=plan_names,
-                tenant_id=tenant_id,
-            )
-            non_zero = {name: count for name, count in post_delete_counts.items() if count > 0}
-            if non_zero:
-                session.rollback()
-                raise ConflictError(f"purge verification failed; remaining rows detected: {non_zero}")
-            session.commit()
-
-        deleted_rows = sum(deleted_counts.values())
-        drift_detected = any(
-            int(pre_delete_counts.get(name, 0)) != int(dry_run_counts.get(name, 0))
-            for name in plan_names
-        )
+
+        purge_id = str(uuid4())
         report_payload: dict[str, Any] = {
             "purge_id": purge_id,
             "dry_run_id": dry_run_id,
             "tenant_id": tenant_id,
-            "status": "completed",
+            "status": "running",
             "purge_version": self.PURGE_VERSION,
             "executed_at": datetime.now(UTC).isoformat(),
+            "completed_at": None,
             "mode": "hard",
             "confirm_method": "token" if confirm_token == expected_token else "phrase",
             "plan": plan_names,
+            "settings": {
+                "batch_size": batch_size or TENANT_PURGE_BATCH_SIZE,
+                "max_rows_per_second": (
+                    TENANT_PURGE_MAX_ROWS_PER_SECOND if max_rows_per_second is None else max_rows_per_second
+                ),
+                "workers": workers or TENANT_PURGE_WORKERS,
+            },
             "dry_run_counts": dry_run_counts,
-            "pre_delete_counts": pre_delete_counts,
-            "deleted_counts": deleted_counts,
-            "post_delete_counts": post_delete_counts,
-            "deleted_rows": deleted_rows,
-            "dry_run_drift_detected": drift_detected,
-        }
-        report_path = self._writer.write_report(tenant_id, purge_id, report_payload)
-        return {
-            "purge_id": purge_id,
-            "tenant_id": tenant_id,
-            "dry_run_id": dry_run_id,
-            "status": "completed",
-            "report_path": str(report_path),
-            "deleted_rows": deleted_rows,
-            "post_delete_counts": post_delete_counts,
+            "deleted_counts": {name: 0 for name in plan_names},
+            "post_delete_counts": {},
+            "deleted_rows": 0,
+            "dry_run_drift_detected": False,
+            "progress": {
+                "rows_estimated": sum(int(dry_run_counts.get(name, 0)) for name in plan_names),
+                "rows_deleted": 0,
+                "tables_total": len(plan_names),
+                "tables_completed": 0,
+                "percent": 0.0,
+            },
+            "checkpoint": {
+                name: {"status": "pending", "phase": "unlink", "last_key": None, "deleted": 0} for name in plan_names
+            },
+            "error": None,
         }
+        progress = _PurgeProgress(self._writer, report_payload)
+        progress.write()
+        return self._drive_purge(tenant_id=tenant_id, plan=plan_names, target_map=target_map, progress=progress)
+
+    def resume_purge(self, tenant_id: str, purge_id: str) -> dict[str, Any]:
+        """Continue a failed (or abandoned running) purge from its per-table checkpoints."""
+        report = self._writer.read_report(tenant_id, purge_id)
+        if "checkpoint" not in report:
+            raise ValidationError("purge report has no checkpoint")
+        status = report.get("status")
+        if status == "completed":
+            raise ConflictError("purge already completed")
+        if status == "running":
+            updated_at = datetime.fromisoformat(str(report.get("updated_at")))
+            if (datetime.now(UTC) - updated_at).total_seconds() < TENANT_PURGE_STALE_SECONDS:
+                raise ConflictError("purge is still running")
+        target_map = self._discover_purge_targets()
+        plan_names = cast(list[str], report["plan"])
+        missing_tables = [name for name in plan_names if name not in target_map]
+        if missing_tables:
+            raise ValidationError(f"purge plan references unknown tables: {missing_tables}")
+        with self._session() as session:
+            self._ensure_tenant_exists(session, tenant_id)
+
+        progress = _PurgeProgress(self._writer, report)
+        progress.write(status="running", error=None)
+        return self._drive_purge(tenant_id=tenant_id, plan=plan_names, target_map=target_map, progress=progress)
 
     def get_purge_report(self, tenant_id: str, purge_id: str) -> dict[str, Any]:
         return self._writer.read_report(tenant_id, purge_id)
+
+
+def _as_row(key: Any) -> tuple[Any, ...]:
+    return key if isinstance(key, tuple) else (key,)
@@ -0,0 +1,37 @@
+"""event stream offsets expand
+
+Revision ID: 202610190113
+Revises: 202602280112
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190113"
+down_revision = "202602280112"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_consumer_offsets",
+        sa.Column("group_name", sa.String(length=100), nullable=False),
+        sa.Column("last_ts", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_event_id", sa.String(), nullable=True),
+        sa.Column("delivered_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("group_name"),
+    )
+    op.create_index("ix_event_consumer_offsets_updated_at", "event_consumer_offsets", ["updated_at"])
+    op.create_index("ix_events_ts_event_id", "events", ["ts", "event_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_ts_event_id", table_name="events")
+    op.drop_index("ix_event_consumer_offsets_updated_at", table_name="event_consumer_offsets")
+    op.drop_table("event_consumer_offsets")
@@ -0,0 +1,40 @@
+"""event stream offsets backfill validate
+
+Revision ID: 202610190114
+Revises: 202610190113
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190114"
+down_revision = "202610190113"
+branch_labels = None
+depends_on = None
+
+
+def _assert_zero(bind: sa.Connection, sql: str, error_message: str) -> None:
+    rows = list(bind.execute(sa.text(sql)))
+    if rows:
+        raise RuntimeError(f"{error_message}. count={len(rows)}")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    _assert_zero(
+        bind,
+        """
+        SELECT group_name FROM event_consumer_offsets
+        WHERE group_name = '' OR delivered_count < 0
+        """,
+        "Event stream validation failed: consumer offset invalid",
+    )
+
+
+def downgrade() -> None:
+    # Validation/backfill step only.
+    pass
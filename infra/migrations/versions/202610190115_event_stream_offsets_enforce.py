@@ -0,0 +1,42 @@
+"""event stream offsets enforce
+
+Revision ID: 202610190115
+Revises: 202610190114
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190115"
+down_revision = "202610190114"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_check_constraint(
+        "ck_event_consumer_offsets_group_name",
+        "event_consumer_offsets",
+        "group_name <> ''",
+    )
+    op.create_check_constraint(
+        "ck_event_consumer_offsets_delivered_count",
+        "event_consumer_offsets",
+        "delivered_count >= 0",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "ck_event_consumer_offsets_delivered_count",
+        "event_consumer_offsets",
+        type_="check",
+    )
+    op.drop_constraint(
+        "ck_event_consumer_offsets_group_name",
+        "event_consumer_offsets",
+        type_="check",
+    )
@@ -0,0 +1,62 @@
+"""list keyset pagination indexes expand
+
+Revision ID: 202610190116
+Revises: 202610190115
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190116"
+down_revision = "202610190115"
+branch_labels = None
+depends_on = None
+
+KEYSET_INDEXES = (
+    ("drones", "created_at"),
+    ("assets", "created_at"),
+    ("missions", "created_at"),
+    ("task_center_tasks", "created_at"),
+    ("command_requests", "issued_at"),
+    ("alerts", "last_seen_at"),
+    ("raw_data_catalog_records", "captured_at"),
+    ("outcome_catalog_records", "created_at"),
+    ("open_adapter_ingress_events", "created_at"),
+    ("observability_signals", "created_at"),
+    ("inspection_tasks", "created_at"),
+    ("defects", "created_at"),
+    ("incidents", "created_at"),
+)
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    if not _is_postgresql():
+        for table_name, sort_column in KEYSET_INDEXES:
+            op.create_index(
+                f"ix_{table_name}_tenant_{sort_column}_id",
+                table_name,
+                ["tenant_id", sort_column, "id"],
+            )
+        return
+    # Build without blocking writes on the live list tables; the next step checks the result.
+    with op.get_context().autocommit_block():
+        for table_name, sort_column in KEYSET_INDEXES:
+            op.create_index(
+                f"ix_{table_name}_tenant_{sort_column}_id",
+                table_name,
+                ["tenant_id", sort_column, "id"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    for table_name, sort_column in reversed(KEYSET_INDEXES):
+        op.drop_index(f"ix_{table_name}_tenant_{sort_column}_id", table_name=table_name)
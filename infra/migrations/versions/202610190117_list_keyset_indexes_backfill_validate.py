@@ -0,0 +1,61 @@
+"""list keyset pagination indexes backfill validate
+
+Revision ID: 202610190117
+Revises: 202610190116
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190117"
+down_revision = "202610190116"
+branch_labels = None
+depends_on = None
+
+KEYSET_INDEX_NAMES = (
+    "ix_drones_tenant_created_at_id",
+    "ix_assets_tenant_created_at_id",
+    "ix_missions_tenant_created_at_id",
+    "ix_task_center_tasks_tenant_created_at_id",
+    "ix_command_requests_tenant_issued_at_id",
+    "ix_alerts_tenant_last_seen_at_id",
+    "ix_raw_data_catalog_records_tenant_captured_at_id",
+    "ix_outcome_catalog_records_tenant_created_at_id",
+    "ix_open_adapter_ingress_events_tenant_created_at_id",
+    "ix_observability_signals_tenant_created_at_id",
+    "ix_inspection_tasks_tenant_created_at_id",
+    "ix_defects_tenant_created_at_id",
+    "ix_incidents_tenant_created_at_id",
+)
+
+
+def _assert_zero(bind: sa.Connection, sql: str, error_message: str) -> None:
+    rows = list(bind.execute(sa.text(sql)))
+    if rows:
+        raise RuntimeError(f"{error_message}. count={len(rows)}")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    names = ", ".join(f"'{name}'" for name in KEYSET_INDEX_NAMES)
+    # A failed concurrent build leaves an INVALID index that IF NOT EXISTS would keep skipping.
+    _assert_zero(
+        bind,
+        f"""
+        SELECT c.relname FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE c.relname IN ({names}) AND NOT (i.indisvalid AND i.indisready)
+        """,
+        "List keyset validation failed: index build incomplete, drop it and rerun the expand step",
+    )
+
+
+def downgrade() -> None:
+    # Validation/backfill step only.
+    pass
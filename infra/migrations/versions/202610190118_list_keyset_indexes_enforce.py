@@ -0,0 +1,45 @@
+"""list keyset pagination indexes enforce
+
+Revision ID: 202610190118
+Revises: 202610190117
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190118"
+down_revision = "202610190117"
+branch_labels = None
+depends_on = None
+
+KEYSET_TABLES = (
+    "drones",
+    "assets",
+    "missions",
+    "task_center_tasks",
+    "command_requests",
+    "alerts",
+    "raw_data_catalog_records",
+    "outcome_catalog_records",
+    "open_adapter_ingress_events",
+    "observability_signals",
+    "inspection_tasks",
+    "defects",
+    "incidents",
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # Refresh planner statistics so list pages switch to the keyset indexes right away.
+    for table_name in KEYSET_TABLES:
+        op.execute(f"ANALYZE {table_name}")
+
+
+def downgrade() -> None:
+    # Statistics only.
+    pass
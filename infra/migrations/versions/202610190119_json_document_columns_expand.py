@@ -0,0 +1,28 @@
+"""jsonb document columns expand
+
+Revision ID: 202610190119
+Revises: 202610190118
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190119"
+down_revision = "202610190118"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # SQLite keeps JSON as text; only Postgres gets JSONB and trigram indexes.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+def downgrade() -> None:
+    # The extension may serve other schemas; leave it installed.
+    pass
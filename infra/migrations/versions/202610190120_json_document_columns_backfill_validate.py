@@ -0,0 +1,53 @@
+"""jsonb document columns backfill validate
+
+Revision ID: 202610190120
+Revises: 202610190119
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190120"
+down_revision = "202610190119"
+branch_labels = None
+depends_on = None
+
+JSON_DOCUMENT_COLUMNS = (
+    ("events", "event_id", "payload"),
+    ("audit_logs", "id", "detail"),
+    ("alerts", "id", "detail"),
+    ("outcome_catalog_records", "id", "payload"),
+    ("ai_evidence_records", "id", "payload"),
+    ("observability_signals", "id", "detail"),
+)
+
+
+def _assert_zero(bind: sa.Connection, sql: str, error_message: str) -> None:
+    rows = list(bind.execute(sa.text(sql)))
+    if rows:
+        raise RuntimeError(f"{error_message}. count={len(rows)}")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    # JSON accepts \u0000 in strings but JSONB rejects it, which would abort the type change.
+    for table_name, key_column, column_name in JSON_DOCUMENT_COLUMNS:
+        _assert_zero(
+            bind,
+            f"""
+            SELECT {key_column} FROM {table_name}
+            WHERE strpos(CAST({column_name} AS TEXT), '\\u0000') > 0
+            """,
+            f"JSON document validation failed: {table_name}.{column_name} contains \\u0000",
+        )
+
+
+def downgrade() -> None:
+    # Validation/backfill step only.
+    pass
@@ -0,0 +1,67 @@
+"""jsonb document columns and topic search indexes enforce
+
+Revision ID: 202610190121
+Revises: 202610190120
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190121"
+down_revision = "202610190120"
+branch_labels = None
+depends_on = None
+
+JSON_DOCUMENT_COLUMNS = (
+    ("events", "payload"),
+    ("audit_logs", "detail"),
+    ("alerts", "detail"),
+    ("outcome_catalog_records", "payload"),
+    ("ai_evidence_records", "payload"),
+    ("observability_signals", "detail"),
+)
+
+# Trigram indexes serve the case-insensitive topic filters of reporting and AI analysis.
+TOPIC_SEARCH_COLUMNS = (
+    ("outcome_catalog_records", "payload"),
+    ("alerts", "detail"),
+)
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    if not _is_postgresql():
+        return
+    # Maintenance-window step: changing the type rewrites each table (events and audit_logs
+    # are the large ones) under an ACCESS EXCLUSIVE lock that blocks reads and writes.
+    for table_name, column_name in JSON_DOCUMENT_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table_name} "
+            f"ALTER COLUMN {column_name} TYPE JSONB USING {column_name}::jsonb"
+        )
+    # The rewrites commit first; the search indexes are then built without blocking writes.
+    with op.get_context().autocommit_block():
+        for table_name, column_name in TOPIC_SEARCH_COLUMNS:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table_name}_{column_name}_text_trgm "
+                f"ON {table_name} USING gin (lower(CAST({column_name} AS TEXT)) gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    if not _is_postgresql():
+        return
+    with op.get_context().autocommit_block():
+        for table_name, column_name in reversed(TOPIC_SEARCH_COLUMNS):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table_name}_{column_name}_text_trgm")
+    for table_name, column_name in reversed(JSON_DOCUMENT_COLUMNS):
+        op.execute(
+            f"ALTER TABLE {table_name} "
+            f"ALTER COLUMN {column_name} TYPE JSON USING {column_name}::json"
+        )
@@ -0,0 +1,79 @@
+"""kpi hourly flight rollups expand
+
+Revision ID: 202610190122
+Revises: 202610190121
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190122"
+down_revision = "202610190121"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "kpi_flight_rollups_hourly",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("tenant_id", sa.String(), nullable=False),
+        sa.Column("drone_id", sa.String(), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("first_ts", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_ts", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("first_lat", sa.Float(), nullable=False),
+        sa.Column("first_lon", sa.Float(), nullable=False),
+        sa.Column("last_lat", sa.Float(), nullable=False),
+        sa.Column("last_lon", sa.Float(), nullable=False),
+        sa.Column("sample_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("distance_km", sa.Float(), nullable=False, server_default=sa.text("0")),
+        sa.Column("needs_rebuild", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "tenant_id",
+            "drone_id",
+            "bucket_start",
+            name="uq_kpi_flight_rollups_hourly_bucket",
+        ),
+    )
+    op.create_index(
+        "ix_kpi_flight_rollups_hourly_tenant_id",
+        "kpi_flight_rollups_hourly",
+        ["tenant_id"],
+    )
+    op.create_index(
+        "ix_kpi_flight_rollups_hourly_drone_id",
+        "kpi_flight_rollups_hourly",
+        ["drone_id"],
+    )
+    op.create_index(
+        "ix_kpi_flight_rollups_hourly_bucket_start",
+        "kpi_flight_rollups_hourly",
+        ["bucket_start"],
+    )
+    op.create_index(
+        "ix_kpi_flight_rollups_hourly_needs_rebuild",
+        "kpi_flight_rollups_hourly",
+        ["needs_rebuild"],
+    )
+    op.create_index(
+        "ix_kpi_flight_rollups_hourly_tenant_bucket",
+        "kpi_flight_rollups_hourly",
+        ["tenant_id", "bucket_start"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_kpi_flight_rollups_hourly_tenant_bucket", table_name="kpi_flight_rollups_hourly")
+    op.drop_index("ix_kpi_flight_rollups_hourly_needs_rebuild", table_name="kpi_flight_rollups_hourly")
+    op.drop_index("ix_kpi_flight_rollups_hourly_bucket_start", table_name="kpi_flight_rollups_hourly")
+    op.drop_index("ix_kpi_flight_rollups_hourly_drone_id", table_name="kpi_flight_rollups_hourly")
+    op.drop_index("ix_kpi_flight_rollups_hourly_tenant_id", table_name="kpi_flight_rollups_hourly")
+    op.drop_table("kpi_flight_rollups_hourly")
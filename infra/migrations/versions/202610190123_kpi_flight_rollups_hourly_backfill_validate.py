@@ -0,0 +1,41 @@
+"""kpi hourly flight rollups backfill validate
+
+Revision ID: 202610190123
+Revises: 202610190122
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190123"
+down_revision = "202610190122"
+branch_labels = None
+depends_on = None
+
+
+def _assert_zero(bind: sa.Connection, sql: str, error_message: str) -> None:
+    rows = list(bind.execute(sa.text(sql)))
+    if rows:
+        raise RuntimeError(f"{error_message}. count={len(rows)}")
+
+
+def upgrade() -> None:
+    # Rollups are filled at telemetry ingest or by POST /api/kpi/flight-rollups:backfill.
+    bind = op.get_bind()
+    _assert_zero(
+        bind,
+        """
+        SELECT id FROM kpi_flight_rollups_hourly
+        WHERE sample_count < 1 OR distance_km < 0 OR first_ts > last_ts
+        """,
+        "KPI flight rollup validation failed: rollup values invalid",
+    )
+
+
+def downgrade() -> None:
+    # Validation/backfill step only.
+    pass
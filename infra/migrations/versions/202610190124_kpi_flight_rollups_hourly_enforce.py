@@ -0,0 +1,52 @@
+"""kpi hourly flight rollups enforce
+
+Revision ID: 202610190124
+Revises: 202610190123
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190124"
+down_revision = "202610190123"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_check_constraint(
+        "ck_kpi_flight_rollups_hourly_sample_count",
+        "kpi_flight_rollups_hourly",
+        "sample_count >= 1",
+    )
+    op.create_check_constraint(
+        "ck_kpi_flight_rollups_hourly_distance_km",
+        "kpi_flight_rollups_hourly",
+        "distance_km >= 0",
+    )
+    op.create_check_constraint(
+        "ck_kpi_flight_rollups_hourly_ts_order",
+        "kpi_flight_rollups_hourly",
+        "first_ts <= last_ts",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "ck_kpi_flight_rollups_hourly_ts_order",
+        "kpi_flight_rollups_hourly",
+        type_="check",
+    )
+    op.drop_constraint(
+        "ck_kpi_flight_rollups_hourly_distance_km",
+        "kpi_flight_rollups_hourly",
+        type_="check",
+    )
+    op.drop_constraint(
+        "ck_kpi_flight_rollups_hourly_sample_count",
+        "kpi_flight_rollups_hourly",
+        type_="check",
+    )
@@ -0,0 +1,67 @@
+"""kpi heatmap grid cells expand
+
+Revision ID: 202610190125
+Revises: 202610190124
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190125"
+down_revision = "202610190124"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("alerts", sa.Column("position_lat", sa.Float(), nullable=True))
+    op.add_column("alerts", sa.Column("position_lon", sa.Float(), nullable=True))
+    op.create_index(
+        "ix_alerts_tenant_position",
+        "alerts",
+        ["tenant_id", "position_lat", "position_lon"],
+    )
+
+    op.create_table(
+        "kpi_heatmap_grid_cells",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("tenant_id", sa.String(), nullable=False),
+        sa.Column("source", sa.String(length=20), nullable=False),
+        sa.Column("zoom", sa.Integer(), nullable=False),
+        sa.Column("tile_x", sa.Integer(), nullable=False),
+        sa.Column("tile_y", sa.Integer(), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "tenant_id",
+            "source",
+            "zoom",
+            "tile_x",
+            "tile_y",
+            "bucket_start",
+            name="uq_kpi_heatmap_grid_cells_cell",
+        ),
+        sa.CheckConstraint("source IN ('OUTCOME', 'ALERT')", name="ck_kpi_heatmap_grid_cells_source"),
+    )
+    op.create_index("ix_kpi_heatmap_grid_cells_tenant_id", "kpi_heatmap_grid_cells", ["tenant_id"])
+    op.create_index(
+        "ix_kpi_heatmap_grid_cells_tenant_zoom_bucket",
+        "kpi_heatmap_grid_cells",
+        ["tenant_id", "zoom", "bucket_start"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_kpi_heatmap_grid_cells_tenant_zoom_bucket", table_name="kpi_heatmap_grid_cells")
+    op.drop_index("ix_kpi_heatmap_grid_cells_tenant_id", table_name="kpi_heatmap_grid_cells")
+    op.drop_table("kpi_heatmap_grid_cells")
+    op.drop_index("ix_alerts_tenant_position", table_name="alerts")
+    op.drop_column("alerts", "position_lon")
+    op.drop_column("alerts", "position_lat")
@@ -0,0 +1,80 @@
+"""kpi heatmap grid cells backfill validate
+
+Revision ID: 202610190126
+Revises: 202610190125
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190126"
+down_revision = "202610190125"
+branch_labels = None
+depends_on = None
+
+
+def _assert_zero(bind: sa.Connection, sql: str, error_message: str) -> None:
+    rows = list(bind.execute(sa.text(sql)))
+    if rows:
+        raise RuntimeError(f"{error_message}. count={len(rows)}")
+
+
+def _backfill_alert_positions(bind: sa.Connection) -> None:
+    # Only in-range positions are copied; anything else stays NULL like the ingest path.
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            """
+            UPDATE alerts
+            SET position_lat = (detail->'position'->>'lat')::double precision,
+                position_lon = (detail->'position'->>'lon')::double precision
+            WHERE jsonb_typeof(detail->'position'->'lat') = 'number'
+              AND jsonb_typeof(detail->'position'->'lon') = 'number'
+              AND (detail->'position'->>'lat')::double precision BETWEEN -90 AND 90
+              AND (detail->'position'->>'lon')::double precision BETWEEN -180 AND 180
+            """
+        )
+        return
+    op.execute(
+        """
+        UPDATE alerts
+        SET position_lat = json_extract(detail, '$.position.lat'),
+            position_lon = json_extract(detail, '$.position.lon')
+        WHERE json_type(detail, '$.position.lat') IN ('integer', 'real')
+          AND json_type(detail, '$.position.lon') IN ('integer', 'real')
+          AND json_extract(detail, '$.position.lat') BETWEEN -90 AND 90
+          AND json_extract(detail, '$.position.lon') BETWEEN -180 AND 180
+        """
+    )
+
+
+def upgrade() -> None:
+    # Grid cells are filled at ingest or by POST /api/kpi/heatmap-grid:rebuild.
+    bind = op.get_bind()
+    _backfill_alert_positions(bind)
+    _assert_zero(
+        bind,
+        """
+        SELECT id FROM alerts
+        WHERE (position_lat IS NULL) <> (position_lon IS NULL)
+           OR position_lat < -90 OR position_lat > 90
+           OR position_lon < -180 OR position_lon > 180
+        """,
+        "Alert position validation failed: positions incomplete or out of range",
+    )
+    _assert_zero(
+        bind,
+        """
+        SELECT id FROM kpi_heatmap_grid_cells
+        WHERE zoom < 0 OR zoom > 22 OR tile_x < 0 OR tile_y < 0
+        """,
+        "KPI heatmap grid validation failed: tile coordinates invalid",
+    )
+
+
+def downgrade() -> None:
+    # Validation/backfill step only.
+    pass
@@ -0,0 +1,35 @@
+"""kpi heatmap grid cells enforce
+
+Revision ID: 202610190127
+Revises: 202610190126
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190127"
+down_revision = "202610190126"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_check_constraint(
+        "ck_alerts_position_range",
+        "alerts",
+        "(position_lat IS NULL AND position_lon IS NULL) OR "
+        "(position_lat BETWEEN -90 AND 90 AND position_lon BETWEEN -180 AND 180)",
+    )
+    op.create_check_constraint(
+        "ck_kpi_heatmap_grid_cells_tile",
+        "kpi_heatmap_grid_cells",
+        "zoom BETWEEN 0 AND 22 AND tile_x >= 0 AND tile_y >= 0",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_kpi_heatmap_grid_cells_tile", "kpi_heatmap_grid_cells", type_="check")
+    op.drop_constraint("ck_alerts_position_range", "alerts", type_="check")
@@ -0,0 +1,59 @@
+"""outcome report export jobs expand
+
+Revision ID: 202610190128
+Revises: 202610190127
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190128"
+down_revision = "202610190127"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("outcome_report_exports", sa.Column("viewer_user_id", sa.String(), nullable=True))
+    op.add_column("outcome_report_exports", sa.Column("rows_total", sa.Integer(), nullable=True))
+    op.add_column(
+        "outcome_report_exports",
+        sa.Column("rows_scanned", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "outcome_report_exports",
+        sa.Column("rows_written", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "outcome_report_exports",
+        sa.Column("cancel_requested", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+    )
+    op.add_column("outcome_report_exports", sa.Column("worker_id", sa.String(length=200), nullable=True))
+    op.add_column("outcome_report_exports", sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("outcome_report_exports", sa.Column("started_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column(
+        "outcome_report_exports",
+        sa.Column("checkpoint", sa.JSON(), nullable=False, server_default=sa.text("'{}'::json")),
+    )
+    op.create_index(
+        "ix_outcome_report_exports_status_created_at",
+        "outcome_report_exports",
+        ["status", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outcome_report_exports_status_created_at", table_name="outcome_report_exports")
+    op.drop_column("outcome_report_exports", "checkpoint")
+    op.drop_column("outcome_report_exports", "started_at")
+    op.drop_column("outcome_report_exports", "heartbeat_at")
+    op.drop_column("outcome_report_exports", "worker_id")
+    op.drop_column("outcome_report_exports", "cancel_requested")
+    op.drop_column("outcome_report_exports", "rows_written")
+    op.drop_column("outcome_report_exports", "rows_scanned")
+    op.drop_column("outcome_report_exports", "rows_total")
+    op.drop_column("outcome_report_exports", "viewer_user_id")
@@ -0,0 +1,61 @@
+"""outcome report export jobs backfill validate
+
+Revision ID: 202610190129
+Revises: 202610190128
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190129"
+down_revision = "202610190128"
+branch_labels = None
+depends_on = None
+
+
+def _assert_zero(bind: sa.Connection, sql: str, error_message: str) -> None:
+    rows = list(bind.execute(sa.text(sql)))
+    if rows:
+        raise RuntimeError(f"{error_message}. count={len(rows)}")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # Exports used to run in the request as the requesting user.
+    op.execute("UPDATE outcome_report_exports SET viewer_user_id = requested_by WHERE viewer_user_id IS NULL")
+    # A RUNNING row from the synchronous path died with its request and has no checkpoint.
+    op.execute(
+        """
+        UPDATE outcome_report_exports
+        SET status = 'FAILED', completed_at = updated_at
+        WHERE status = 'RUNNING' AND heartbeat_at IS NULL
+        """
+    )
+    _assert_zero(
+        bind,
+        """
+        SELECT id FROM outcome_report_exports
+        WHERE status NOT IN ('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', 'CANCELED')
+           OR report_format NOT IN ('PDF', 'WORD', 'CSV')
+           OR json_typeof(checkpoint) <> 'object'
+           OR (status = 'RUNNING' AND heartbeat_at IS NULL)
+        """,
+        "Outcome report export validation failed: export rows invalid",
+    )
+    _assert_zero(
+        bind,
+        """
+        SELECT id FROM outcome_report_templates
+        WHERE format_default NOT IN ('PDF', 'WORD', 'CSV')
+        """,
+        "Outcome report template validation failed: format_default invalid",
+    )
+
+
+def downgrade() -> None:
+    # Validation/backfill step only.
+    pass
@@ -0,0 +1,77 @@
+"""outcome report export jobs enforce
+
+Revision ID: 202610190130
+Revises: 202610190129
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190130"
+down_revision = "202610190129"
+branch_labels = None
+depends_on = None
+
+
+def _replace_check(name: str, table: str, condition: str) -> None:
+    op.drop_constraint(name, table, type_="check")
+    op.create_check_constraint(name, table, condition)
+
+
+def upgrade() -> None:
+    _replace_check(
+        "ck_outcome_report_exports_status",
+        "outcome_report_exports",
+        "status IN ('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', 'CANCELED')",
+    )
+    _replace_check(
+        "ck_outcome_report_exports_report_format",
+        "outcome_report_exports",
+        "report_format IN ('PDF', 'WORD', 'CSV')",
+    )
+    _replace_check(
+        "ck_outcome_report_templates_format_default",
+        "outcome_report_templates",
+        "format_default IN ('PDF', 'WORD', 'CSV')",
+    )
+    op.create_check_constraint(
+        "ck_outcome_report_exports_checkpoint_is_object",
+        "outcome_report_exports",
+        "json_typeof(checkpoint) = 'object'",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "ck_outcome_report_exports_checkpoint_is_object",
+        "outcome_report_exports",
+        type_="check",
+    )
+    # The old constraints know neither CSV nor the queue states.
+    op.execute("UPDATE outcome_report_templates SET format_default = 'PDF' WHERE format_default = 'CSV'")
+    op.execute(
+        """
+        UPDATE outcome_report_exports
+        SET status = 'FAILED'
+        WHERE status IN ('QUEUED', 'CANCELED')
+        """
+    )
+    op.execute("DELETE FROM outcome_report_exports WHERE report_format = 'CSV'")
+    _replace_check(
+        "ck_outcome_report_templates_format_default",
+        "outcome_report_templates",
+        "format_default IN ('PDF', 'WORD')",
+    )
+    _replace_check(
+        "ck_outcome_report_exports_report_format",
+        "outcome_report_exports",
+        "report_format IN ('PDF', 'WORD')",
+    )
+    _replace_check(
+        "ck_outcome_report_exports_status",
+        "outcome_report_exports",
+        "status IN ('RUNNING', 'SUCCEEDED', 'FAILED')",
+    )
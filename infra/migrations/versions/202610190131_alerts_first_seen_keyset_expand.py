@@ -0,0 +1,43 @@
+"""alerts first seen keyset index expand
+
+Revision ID: 202610190131
+Revises: 202610190130
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190131"
+down_revision = "202610190130"
+branch_labels = None
+depends_on = None
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    if not _is_postgresql():
+        op.create_index(
+            "ix_alerts_tenant_first_seen_at_id",
+            "alerts",
+            ["tenant_id", "first_seen_at", "id"],
+        )
+        return
+    # last_seen_at moves on every repeat, so the alert list keysets on first_seen_at instead.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_alerts_tenant_first_seen_at_id",
+            "alerts",
+            ["tenant_id", "first_seen_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_alerts_tenant_first_seen_at_id", table_name="alerts")
@@ -0,0 +1,44 @@
+"""alerts first seen keyset index backfill validate
+
+Revision ID: 202610190132
+Revises: 202610190131
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190132"
+down_revision = "202610190131"
+branch_labels = None
+depends_on = None
+
+
+def _assert_zero(bind: sa.Connection, sql: str, error_message: str) -> None:
+    rows = list(bind.execute(sa.text(sql)))
+    if rows:
+        raise RuntimeError(f"{error_message}. count={len(rows)}")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    # A failed concurrent build leaves an INVALID index that IF NOT EXISTS would keep skipping.
+    _assert_zero(
+        bind,
+        """
+        SELECT c.relname FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE c.relname = 'ix_alerts_tenant_first_seen_at_id' AND NOT (i.indisvalid AND i.indisready)
+        """,
+        "Alerts keyset validation failed: index build incomplete, drop it and rerun the expand step",
+    )
+
+
+def downgrade() -> None:
+    # Validation/backfill step only.
+    pass
@@ -0,0 +1,53 @@
+"""alerts first seen keyset index enforce
+
+Revision ID: 202610190133
+Revises: 202610190132
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "202610190133"
+down_revision = "202610190132"
+branch_labels = None
+depends_on = None
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    if not _is_postgresql():
+        op.drop_index("ix_alerts_tenant_last_seen_at_id", table_name="alerts")
+        return
+    # Nothing pages on last_seen_at any more; drop its index without blocking alert writes.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_alerts_tenant_last_seen_at_id",
+            table_name="alerts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("ANALYZE alerts")
+
+
+def downgrade() -> None:
+    if not _is_postgresql():
+        op.create_index(
+            "ix_alerts_tenant_last_seen_at_id",
+            "alerts",
+            ["tenant_id", "last_seen_at", "id"],
+        )
+        return
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_alerts_tenant_last_seen_at_id",
+            "alerts",
+            ["tenant_id", "last_seen_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import UTC, datetime, timedelta
+
+from sqlmodel import Session, select
+
+from app.domain.models import KpiFlightRollupBackfillRequest, Tenant
+from app.infra.db import get_engine
+from app.services.kpi_service import KpiService
+
+
+def _env(name: str, default: str) -> str:
+    return os.getenv(name, default).strip()
+
+
+def _parse_ts(raw: str, fallback: datetime) -> datetime:
+    if not raw:
+        return fallback
+    parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def _tenant_ids() -> list[str]:
+    tenant_id = _env("BACKFILL_TENANT_ID", "")
+    if tenant_id:
+        return [tenant_id]
+    with Session(get_engine()) as session:
+        return list(session.exec(select(Tenant.id)).all())
+
+
+def main() -> None:
+    now = datetime.now(UTC)
+    from_ts = _parse_ts(_env("BACKFILL_FROM_TS", ""), now - timedelta(days=30))
+    to_ts = _parse_ts(_env("BACKFILL_TO_TS", ""), now)
+    chunk = timedelta(days=max(int(_env("BACKFILL_CHUNK_DAYS", "1")), 1))
+    service = KpiService()
+    for tenant_id in _tenant_ids():
+        cursor = from_ts
+        while cursor < to_ts:
+            chunk_end = min(cursor + chunk, to_ts)
+            result = service.backfill_flight_rollups(
+                tenant_id,
+                KpiFlightRollupBackfillRequest(from_ts=cursor, to_ts=chunk_end),
+            )
+            print(json.dumps({"tenant_id": tenant_id, **result.model_dump(mode="json")}, ensure_ascii=True))
+            cursor = chunk_end
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+
+from app.services.reporting_service import ReportingService, report_export_worker_id
+
+logger = logging.getLogger("report_export_worker")
+
+
+def _env(name: str, default: str) -> str:
+    return os.getenv(name, default).strip()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    poll_seconds = max(float(_env("REPORT_EXPORT_WORKER_POLL_SECONDS", "2")), 0.1)
+    run_once = _env("REPORT_EXPORT_WORKER_ONCE", "") in {"1", "true", "yes"}
+    worker_id = report_export_worker_id("worker")
+    service = ReportingService()
+    while True:
+        try:
+            export_row = service.claim_outcome_report_export(worker_id)
+        except Exception:
+            # Nothing is claimed yet; back off and retry rather than kill the worker.
+            logger.exception("claiming a report export failed")
+            if run_once:
+                raise
+            time.sleep(poll_seconds)
+            continue
+        if export_row is None:
+            if run_once:
+                return
+            time.sleep(poll_seconds)
+            continue
+        try:
+            # The service marks the job FAILED itself; a job it could not mark stays RUNNING
+            # and is taken over by the next claim once its heartbeat goes stale.
+            export_row = service.run_outcome_report_export(export_row.id, worker_id=worker_id)
+            error = None
+        except Exception as exc:
+            logger.exception("report export %s failed", export_row.id)
+            error = str(exc.__cause__ or exc)
+        print(
+            json.dumps(
+                {
+                    "export_id": export_row.id,
+                    "tenant_id": export_row.tenant_id,
+                    "status": "FAILED" if error else export_row.status,
+                    "rows_written": export_row.rows_written,
+                    "error": error,
+                },
+                ensure_ascii=True,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
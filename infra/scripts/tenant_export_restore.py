@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+from app.services.tenant_export_service import TenantExportService, TenantExportWriter
+
+
+def _env(name: str, default: str) -> str:
+    return os.getenv(name, default).strip()
+
+
+def main() -> None:
+    tenant_id = _env("RESTORE_TENANT_ID", "")
+    export_id = _env("RESTORE_EXPORT_ID", "")
+    if not tenant_id or not export_id:
+        sys.exit("RESTORE_TENANT_ID and RESTORE_EXPORT_ID are required")
+    root_dir = Path(_env("RESTORE_EXPORT_ROOT", str(Path("logs") / "exports")))
+    service = TenantExportService(TenantExportWriter(root_dir))
+    print(json.dumps(service.restore_export(tenant_id, export_id), ensure_ascii=True))
+
+
+if __name__ == "__main__":
+    main()
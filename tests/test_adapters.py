@@ -152,3 +152,93 @@ def test_dji_adapter_simulation_skeleton_is_usable() -> None:
     assert sample.health["simulation"] is True
     assert ack.ok is True
     assert ack.message.startswith("DJI SIM")
+
+
+class _StubAckMessage:
+    def __init__(self, command: int, result: int) -> None:
+        self.command = command
+        self.result = result
+
+    def get_type(self) -> str:
+        return "COMMAND_ACK"
+
+
+class _StubMavlinkMaster:
+    target_system = 1
+    target_component = 1
+
+    def __init__(self, results: list[int] | None = None) -> None:
+        self.sent: list[int] = []
+        self.inbox: list[_StubAckMessage] = []
+        self.results = list(results or [])
+        outer = self
+
+        class _Mav:
+            def command_long_send(self, *args: Any) -> None:
+                mav_cmd = int(args[2])
+                outer.sent.append(mav_cmd)
+                result = outer.results.pop(0) if outer.results else 0
+                outer.inbox.append(_StubAckMessage(mav_cmd, result))
+
+        self.mav = _Mav()
+
+    def recv_match(self, **_: Any) -> _StubAckMessage | None:
+        return self.inbox.pop(0) if self.inbox else None
+
+
+def test_mavlink_adapter_correlates_command_ack() -> None:
+    adapter = MavlinkAdapter(simulation_mode=False, tenant_id="tenant-mav")
+    master = _StubMavlinkMaster()
+    adapter._master = master
+
+    class _MavUtil:
+        class mavlink:  # noqa: N801
+            MAV_CMD_NAV_LAND = 21
+
+    adapter._mavutil = _MavUtil()
+    command = Command(
+        tenant_id="tenant-mav",
+        drone_id="drone-mav",
+        type=CommandType.LAND,
+        idempotency_key="mav-ack-1",
+    )
+
+    ack = asyncio.run(adapter.send_command("drone-mav", command))
+    assert master.sent == [21]
+    assert ack.ok is True
+    assert ack.message == "MAVLink COMMAND_ACK 21: ACCEPTED"
+    assert adapter._pending_acks == {}
+
+
+def test_mavlink_adapter_keeps_concurrent_acks_of_the_same_command_apart() -> None:
+    adapter = MavlinkAdapter(simulation_mode=False, tenant_id="tenant-mav")
+    master = _StubMavlinkMaster(results=[2, 0])
+    adapter._master = master
+
+    class _MavUtil:
+        class mavlink:  # noqa: N801
+            MAV_CMD_NAV_LAND = 21
+
+    adapter._mavutil = _MavUtil()
+    commands = [
+        Command(
+            tenant_id="tenant-mav",
+            drone_id=f"drone-mav-{index}",
+            type=CommandType.LAND,
+            idempotency_key=f"mav-ack-concurrent-{index}",
+        )
+        for index in range(2)
+    ]
+
+    async def _run() -> list[Ack]:
+        return list(
+            await asyncio.gather(*(adapter.send_command(item.drone_id, item) for item in commands))
+        )
+
+    first, second = asyncio.run(_run())
+    assert master.sent == [21, 21]
+    assert first.message == "MAVLink COMMAND_ACK 21: DENIED"
+    assert first.ok is False
+    assert second.message == "MAVLink COMMAND_ACK 21: ACCEPTED"
+    assert second.ok is True
+    assert adapter._pending_acks == {}
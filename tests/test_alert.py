@@ -154,6 +154,39 @@ def test_alert_generated_from_telemetry_and_lifecycle(alert_client: TestClient)
     assert "alert.closed" in event_types
 
 
+def test_alert_list_cursor_survives_repeated_alerts(alert_client: TestClient) -> None:
+    tenant_id = _create_tenant(alert_client, "alert-page-tenant")
+    _bootstrap_admin(alert_client, tenant_id, "admin", "admin-pass")
+    token = _login(alert_client, tenant_id, "admin", "admin-pass")
+    for drone_id in ("drone-page-1", "drone-page-2"):
+        ingest_resp = alert_client.post(
+            "/api/telemetry/ingest",
+            json=_ingest_payload(drone_id, battery_percent=12.0),
+            headers=_auth_header(token),
+        )
+        assert ingest_resp.status_code == 200
+
+    first_page = alert_client.get("/api/alert/alerts", params={"limit": 1}, headers=_auth_header(token))
+    assert first_page.status_code == 200
+    assert [item["drone_id"] for item in first_page.json()] == ["drone-page-2"]
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    # A repeat bumps last_seen_at on the unread alert; it must not jump ahead of the cursor.
+    repeat_resp = alert_client.post(
+        "/api/telemetry/ingest",
+        json=_ingest_payload("drone-page-1", battery_percent=11.0),
+        headers=_auth_header(token),
+    )
+    assert repeat_resp.status_code == 200
+    second_page = alert_client.get(
+        "/api/alert/alerts",
+        params={"limit": 1, "cursor": cursor},
+        headers=_auth_header(token),
+    )
+    assert second_page.status_code == 200
+    assert [item["drone_id"] for item in second_page.json()] == ["drone-page-1"]
+
+
 def test_alert_rules_link_loss_and_geofence(alert_client: TestClient) -> None:
     tenant_id = _create_tenant(alert_client, "alert-rules-tenant")
     _bootstrap_admin(alert_client, tenant_id, "admin", "admin-pass")
@@ -123,7 +123,7 @@ def test_maintenance_workorder_workflow_and_tenant_isolation(maintenance_client:
     )
     assert history_resp.status_code == 200
     actions = [item["action"] for item in history_resp.json()]
-    assert actions == ["created", "status_changed", "closed"]
+    assert actions == ["closed", "status_changed", "created"]
 
     cross_get = maintenance_client.get(
         f"/api/assets/maintenance/workorders/{workorder_id}",
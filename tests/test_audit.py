@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.domain.models import AuditLog
+from app.infra import audit
+from app.infra.audit import AuditMiddleware, AuditSink, set_audit_context
+
+
+def _log(index: int) -> AuditLog:
+    return AuditLog(
+        tenant_id="tenant-a",
+        actor_id="user-a",
+        action=f"POST:/api/items/{index}",
+        resource=f"/api/items/{index}",
+        method="POST",
+        status_code=201,
+        detail={"index": index},
+    )
+
+
+def test_audit_sink_batches_writes_in_background(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(audit, "engine", engine)
+
+    sink = AuditSink(batch_size=3, flush_interval_ms=20, spill_dir=tmp_path)
+    sink.start()
+    try:
+        for index in range(7):
+            sink.submit(_log(index))
+    finally:
+        sink.stop()
+
+    with Session(engine) as session:
+        rows = list(session.exec(select(AuditLog)).all())
+    assert sorted(row.detail["index"] for row in rows) == list(range(7))
+    assert sink.spilled_files() == []
+
+
+def test_audit_sink_spills_to_disk_and_replays(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    monkeypatch.setattr(audit, "engine", engine)
+
+    sink = AuditSink(spill_dir=tmp_path)
+    # No tables yet: the insert fails and the record must land on disk instead.
+    sink.submit(_log(1))
+    assert len(sink.spilled_files()) == 1
+
+    SQLModel.metadata.create_all(engine)
+    sink.submit(_log(2))
+
+    assert sink.spilled_files() == []
+    with Session(engine) as session:
+        rows = list(session.exec(select(AuditLog)).all())
+    assert sorted(row.detail["index"] for row in rows) == [1, 2]
+
+
+def test_audit_sink_overflow_goes_to_one_rolling_spill_file(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    monkeypatch.setattr(audit, "engine", engine)
+
+    sink = AuditSink(queue_size=1, overflow_size=3, spill_dir=tmp_path)
+    # Stand in for a stalled background thread so records queue up.
+    stalled = threading.Event()
+    worker = threading.Thread(target=stalled.wait, daemon=True)
+    worker.start()
+    monkeypatch.setattr(sink, "_worker", worker)
+    try:
+        for index in range(5):
+            sink.submit(_log(index))
+        # The request path only buffers; nothing is written to disk yet.
+        assert sink.spilled_files() == []
+        assert sink.dropped == 1
+
+        # No tables yet: overflow and the failed batch share one spill file.
+        sink.flush()
+        spilled = sink.spilled_files()
+        assert len(spilled) == 1
+        assert len(spilled[0].read_text(encoding="utf-8").splitlines()) == 4
+
+        SQLModel.metadata.create_all(engine)
+        sink.submit(_log(5))
+        sink.flush()
+    finally:
+        stalled.set()
+        worker.join()
+
+    assert sink.spilled_files() == []
+    with Session(engine) as session:
+        rows = list(session.exec(select(AuditLog)).all())
+    assert sorted(row.detail["index"] for row in rows) == [0, 1, 2, 3, 5]
+
+
+def test_asgi_audit_middleware_captures_status_and_context(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(audit, "engine", engine)
+
+    app = FastAPI()
+    app.add_middleware(AuditMiddleware)
+
+    @app.post("/api/items")
+    def create_item(request: Request) -> dict[str, str]:
+        request.state.claims = {"tenant_id": "tenant-a", "sub": "user-a"}
+        return {"id": "item-1"}
+
+    @app.get("/api/items/{item_id}")
+    def read_item(item_id: str, request: Request) -> dict[str, str]:
+        set_audit_context(request, action="item.read", detail={"what": {"item_id": item_id}})
+        raise HTTPException(status_code=404, detail="missing")
+
+    @app.get("/api/plain")
+    def plain() -> dict[str, str]:
+        return {"ok": "yes"}
+
+    @app.post("/healthz")
+    def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    client = TestClient(app)
+    assert client.post("/api/items?source=test").status_code == 200
+    assert client.get("/api/items/item-9").status_code == 404
+    assert client.get("/api/plain").status_code == 200
+    assert client.post("/healthz").status_code == 200
+
+    with Session(engine) as session:
+        rows = {row.action: row for row in session.exec(select(AuditLog)).all()}
+
+    assert set(rows) == {"POST:/api/items", "item.read"}
+    created = rows["POST:/api/items"]
+    assert created.tenant_id == "tenant-a"
+    assert created.actor_id == "user-a"
+    assert created.status_code == 200
+    assert created.detail["where"]["query"] == "source=test"
+    denied = rows["item.read"]
+    assert denied.tenant_id == "system"
+    assert denied.detail["result"] == {"status_code": 404, "outcome": "denied"}
+    assert denied.detail["what"]["item_id"] == "item-9"
+    assert denied.detail["where"]["route"] == "/api/items/{item_id}"
@@ -398,3 +398,90 @@ def test_billing_wp1_tenant_boundary_enforced(billing_client: TestClient) -> Non
         headers=_auth_header(token_b),
     )
     assert denied_invoice_generate.status_code == 404
+
+
+def test_billing_usage_batch_ingest_dedups_and_aggregates(billing_client: TestClient) -> None:
+    tenant_id = _create_tenant(billing_client, "phase24-billing-batch")
+    _bootstrap_admin(billing_client, tenant_id, "admin-batch", "admin-pass")
+    token = _login(billing_client, tenant_id, "admin-batch", "admin-pass")
+
+    seeded = billing_client.post(
+        "/api/billing/usage:ingest",
+        json={
+            "meter_key": "devices",
+            "quantity": 3,
+            "occurred_at": "2026-03-01T08:00:00+00:00",
+            "source_event_id": "evt-dev-001",
+        },
+        headers=_auth_header(token),
+    )
+    assert seeded.status_code == 201
+    seeded_event_id = seeded.json()["event"]["id"]
+
+    batch = [
+        {
+            "meter_key": meter_key,
+            "quantity": quantity,
+            "occurred_at": occurred_at,
+            "source_event_id": source_event_id,
+        }
+        for meter_key, quantity, occurred_at, source_event_id in [
+            ("devices", 3, "2026-03-01T08:00:00+00:00", "evt-dev-001"),
+            ("devices", 2, "2026-03-01T09:00:00+00:00", "evt-dev-002"),
+            ("devices", 4, "2026-03-02T09:00:00+00:00", "evt-dev-003"),
+            ("devices", 2, "2026-03-01T09:00:00+00:00", "evt-dev-002"),
+            ("users", 5, "2026-03-01T10:00:00+00:00", "evt-dev-002"),
+            ("users", 1, "2026-03-02T10:00:00+00:00", "evt-usr-001"),
+        ]
+    ]
+    first = billing_client.post(
+        "/api/billing/usage:batch-ingest",
+        json={"events": batch},
+        headers=_auth_header(token),
+    )
+    assert first.status_code == 201
+    body = first.json()
+    assert body["total"] == 6
+    assert body["accepted"] == 4
+    assert body["deduplicated"] == 2
+    results = body["results"]
+    assert [item["deduplicated"] for item in results] == [True, False, False, True, False, False]
+    assert results[0]["event_id"] == seeded_event_id
+    assert results[3]["event_id"] == results[1]["event_id"]
+    assert results[4]["event_id"] != results[1]["event_id"]
+
+    def _totals() -> dict[str, int]:
+        response = billing_client.get(
+            f"/api/billing/tenants/{tenant_id}/usage/summary",
+            headers=_auth_header(token),
+        )
+        assert response.status_code == 200
+        return {row["meter_key"]: row["total_quantity"] for row in response.json()}
+
+    assert _totals() == {"devices": 9, "users": 6}
+    march_first = billing_client.get(
+        f"/api/billing/tenants/{tenant_id}/usage/summary"
+        "?meter_key=devices&from_date=2026-03-01T00:00:00%2B00:00&to_date=2026-03-01T23:59:59%2B00:00",
+        headers=_auth_header(token),
+    )
+    assert march_first.status_code == 200
+    assert march_first.json()[0]["total_quantity"] == 5
+
+    replay = billing_client.post(
+        "/api/billing/usage:batch-ingest",
+        json={"events": batch},
+        headers=_auth_header(token),
+    )
+    assert replay.status_code == 201
+    assert replay.json()["accepted"] == 0
+    assert replay.json()["deduplicated"] == 6
+    replay_ids = [item["event_id"] for item in replay.json()["results"]]
+    assert replay_ids == [item["event_id"] for item in results]
+    assert _totals() == {"devices": 9, "users": 6}
+
+    empty = billing_client.post(
+        "/api/billing/usage:batch-ingest",
+        json={"events": []},
+        headers=_auth_header(token),
+    )
+    assert empty.status_code == 422
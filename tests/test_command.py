@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Generator
 from pathlib import Path
+from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
@@ -10,10 +12,18 @@ from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, SQLModel, create_engine, select
 
 from app import main as app_main
+from app.adapters.fake_adapter import FakeAdapter
 from app.api.routers import command as command_router
-from app.domain.models import CommandRequestRecord, CommandStatus, CommandType, EventRecord
+from app.domain.models import (
+    CommandDispatchRequest,
+    CommandRequestRecord,
+    CommandStatus,
+    CommandType,
+    DroneVendor,
+    EventRecord,
+)
 from app.infra import audit, db, events
-from app.services.command_service import CommandService
+from app.services.command_service import CommandAckTracker, CommandService
 
 
 @pytest.fixture()
@@ -247,3 +257,116 @@ def test_command_requests_composite_fk_enforced_in_db(command_client: TestClient
             )
         )
         session.commit()
+
+
+def test_command_non_blocking_dispatch_resolves_in_background(command_client: TestClient) -> None:
+    tenant_id = _create_tenant(command_client, "command-async-tenant")
+    _bootstrap_admin(command_client, tenant_id, "admin", "admin-pass")
+    token = _login(command_client, tenant_id, "admin", "admin-pass")
+    drone_id = _create_drone(command_client, token, "drone-command-async")
+
+    pushed: list[dict[str, Any]] = []
+
+    async def _notify(push_tenant_id: str, payload: dict[str, Any]) -> None:
+        assert push_tenant_id == tenant_id
+        pushed.append(payload)
+
+    tracker = CommandAckTracker()
+    service = CommandService(
+        ack_timeout_seconds=0.2,
+        ack_tracker=tracker,
+        state_notifier=_notify,
+    )
+
+    async def _run() -> tuple[CommandRequestRecord, CommandRequestRecord, list[str]]:
+        acked, _ = await service.dispatch_command(
+            tenant_id=tenant_id,
+            actor_id="tester",
+            payload=CommandDispatchRequest(
+                drone_id=drone_id,
+                type=CommandType.START_MISSION,
+                params={"_fake_delay_seconds": 0.05},
+                idempotency_key="async-ack-1",
+                wait_for_ack=False,
+            ),
+        )
+        timed_out, _ = await service.dispatch_command(
+            tenant_id=tenant_id,
+            actor_id="tester",
+            payload=CommandDispatchRequest(
+                drone_id=drone_id,
+                type=CommandType.HOLD,
+                params={"_fake_timeout": True},
+                idempotency_key="async-timeout-1",
+                wait_for_ack=False,
+            ),
+        )
+        pending_ids = tracker.pending_command_ids()
+        await tracker.drain()
+        return acked, timed_out, pending_ids
+
+    acked, timed_out, pending_ids = asyncio.run(_run())
+    assert acked.status == CommandStatus.PENDING
+    assert timed_out.status == CommandStatus.PENDING
+    assert pending_ids == sorted([acked.id, timed_out.id])
+    assert tracker.pending_command_ids() == []
+
+    assert service.get_command(tenant_id, acked.id).status == CommandStatus.ACKED
+    assert service.get_command(tenant_id, timed_out.id).status == CommandStatus.TIMEOUT
+    statuses = {item["command"]["id"]: item["command"]["status"] for item in pushed}
+    assert statuses == {acked.id: "ACKED", timed_out.id: "TIMEOUT"}
+
+
+def test_command_dispatch_shares_one_adapter_and_applies_per_type_deadlines(
+    command_client: TestClient,
+) -> None:
+    tenant_id = _create_tenant(command_client, "command-deadline-tenant")
+    _bootstrap_admin(command_client, tenant_id, "admin", "admin-pass")
+    token = _login(command_client, tenant_id, "admin", "admin-pass")
+    drone_id = _create_drone(command_client, token, "drone-command-deadline")
+
+    built: list[FakeAdapter] = []
+
+    def _factory() -> FakeAdapter:
+        adapter = FakeAdapter()
+        built.append(adapter)
+        return adapter
+
+    tracker = CommandAckTracker()
+    service = CommandService(
+        ack_timeout_seconds=0.05,
+        ack_deadlines={CommandType.START_MISSION: 1.0},
+        adapter_factories={DroneVendor.FAKE: _factory},
+        ack_tracker=tracker,
+    )
+
+    async def _run() -> tuple[CommandRequestRecord, CommandRequestRecord]:
+        mission, _ = await service.dispatch_command(
+            tenant_id=tenant_id,
+            actor_id="tester",
+            payload=CommandDispatchRequest(
+                drone_id=drone_id,
+                type=CommandType.START_MISSION,
+                params={"_fake_delay_seconds": 0.2},
+                idempotency_key="deadline-mission-1",
+                wait_for_ack=False,
+            ),
+        )
+        hold, _ = await service.dispatch_command(
+            tenant_id=tenant_id,
+            actor_id="tester",
+            payload=CommandDispatchRequest(
+                drone_id=drone_id,
+                type=CommandType.HOLD,
+                params={"_fake_delay_seconds": 0.2},
+                idempotency_key="deadline-hold-1",
+                wait_for_ack=False,
+            ),
+        )
+        await tracker.drain()
+        return mission, hold
+
+    mission, hold = asyncio.run(_run())
+    assert len(built) == 1
+    assert service.get_command(tenant_id, mission.id).status == CommandStatus.ACKED
+    assert service.get_command(tenant_id, hold.id).status == CommandStatus.TIMEOUT
@@ -1,15 +1,37 @@
 from __future__ import annotations
 
 from collections.abc import Generator
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import event
-from sqlmodel import SQLModel, create_engine
+from sqlmodel import Session, SQLModel, create_engine, select
 
 from app import main as app_main
-from app.infra import audit, db, events
+from app.domain.models import (
+    DataAccessPolicy,
+    DataScopeMode,
+    InspectionTask,
+    Mission,
+    MissionPlanType,
+)
+from app.infra import audit, db, events, policy_cache
+from app.infra.policy_cache import (
+    MemoryPolicyCacheBackend,
+    NullPolicyCacheBackend,
+    PolicyCache,
+    PolicyCacheBackend,
+    RedisPolicyCacheBackend,
+)
+from app.services.data_perimeter_service import (
+    DataPerimeterRule,
+    DataPerimeterScope,
+    DataPerimeterService,
+    dump_scope,
+    load_scope,
+)
 
 
 @pytest.fixture()
@@ -594,3 +616,190 @@ def test_data_perimeter_conflict_resolution_order(perimeter_client: TestClient)
         headers=_auth_header(scoped_token),
     )
     assert mission_b_get.status_code == 200
+
+
+def test_data_perimeter_sql_clause_matches_python_filter(tmp_path: Path) -> None:
+    test_engine = create_engine(f"sqlite:///{tmp_path / 'perimeter_clause.db'}")
+    SQLModel.metadata.create_all(test_engine)
+    service = DataPerimeterService()
+
+    with Session(test_engine) as session:
+        for org_unit_id in (None, "org-a", "org-b"):
+            for project_code in (None, "p-1", "p-2"):
+                for area_code in (None, "area-1", "area-2"):
+                    session.add(
+                        Mission(
+                            tenant_id="tenant-1",
+                            name=f"{org_unit_id}-{project_code}-{area_code}",
+                            org_unit_id=org_unit_id,
+                            project_code=project_code,
+                            area_code=area_code,
+                            plan_type=MissionPlanType.POINT_TASK,
+                            created_by="user-1",
+                        )
+                    )
+        session.commit()
+
+        missions = list(session.exec(select(Mission)).all())
+        pinned_task_id = missions[4].id
+        scopes = [
+            DataPerimeterScope(mode=DataScopeMode.ALL),
+            DataPerimeterScope(
+                mode=DataScopeMode.ALL,
+                explicit_deny=DataPerimeterRule(project_codes=frozenset({"p-2"})),
+            ),
+            DataPerimeterScope(mode=DataScopeMode.SCOPED),
+            DataPerimeterScope(
+                mode=DataScopeMode.SCOPED,
+                explicit_allow=DataPerimeterRule(
+                    org_unit_ids=frozenset({"org-a"}),
+                    area_codes=frozenset({"area-1"}),
+                ),
+            ),
+            DataPerimeterScope(
+                mode=DataScopeMode.SCOPED,
+                explicit_allow=DataPerimeterRule(task_ids=frozenset({pinned_task_id})),
+                explicit_deny=DataPerimeterRule(area_codes=frozenset({"area-2"})),
+                inherited_allow=DataPerimeterRule(project_codes=frozenset({"p-1"})),
+            ),
+            DataPerimeterScope(
+                mode=DataScopeMode.SCOPED,
+                explicit_deny=DataPerimeterRule(org_unit_ids=frozenset({"org-b"})),
+                inherited_allow_all=True,
+            ),
+            DataPerimeterScope(
+                mode=DataScopeMode.SCOPED,
+                explicit_allow=DataPerimeterRule(resource_ids=frozenset({"drone-1"})),
+            ),
+        ]
+        for scope in scopes:
+            expected = {item.id for item in missions if service.mission_visible(item, scope)}
+            statement = service.restrict(select(Mission), service.mission_clause(scope))
+            actual = {item.id for item in session.exec(statement).all()}
+            assert actual == expected, scope
+
+
+def test_data_perimeter_scope_cache_invalidated_by_policy_version(tmp_path: Path) -> None:
+    test_engine = create_engine(f"sqlite:///{tmp_path / 'perimeter_cache.db'}")
+    SQLModel.metadata.create_all(test_engine)
+    backend = MemoryPolicyCacheBackend()
+    cache: PolicyCache[DataPerimeterScope] = PolicyCache(
+        "data-perimeter",
+        dump=dump_scope,
+        load=load_scope,
+        backend=backend,
+        ttl_seconds=60,
+    )
+    service = DataPerimeterService(cache=cache)
+
+    with Session(test_engine) as session:
+        policy = DataAccessPolicy(
+            tenant_id="tenant-1",
+            user_id="user-1",
+            scope_mode=DataScopeMode.SCOPED,
+            project_codes=["p-1"],
+            denied_area_codes=["area-9"],
+        )
+        session.add(policy)
+        session.commit()
+
+        first = service.resolve_scope(session, "tenant-1", "user-1")
+        assert first.mode == DataScopeMode.SCOPED
+        assert first.explicit_allow.project_codes == frozenset({"p-1"})
+        assert first.explicit_deny.area_codes == frozenset({"area-9"})
+
+        policy.project_codes = ["p-2"]
+        session.add(policy)
+        session.commit()
+        assert service.resolve_scope(session, "tenant-1", "user-1") == first
+
+        backend.bump("tenant-2")
+        assert service.resolve_scope(session, "tenant-1", "user-1") == first
+
+        backend.bump("tenant-1")
+        refreshed = service.resolve_scope(session, "tenant-1", "user-1")
+        assert refreshed.explicit_allow.project_codes == frozenset({"p-2"})
+        assert refreshed.explicit_deny == first.explicit_deny
+
+
+def test_policy_cache_defaults_to_shared_backend_with_redis(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(policy_cache, "POLICY_CACHE_BACKEND", "")
+
+    def _backend() -> PolicyCacheBackend:
+        policy_cache.get_policy_cache_backend.cache_clear()
+        return PolicyCache("default-backend", dump=str, load=str).backend
+
+    try:
+        monkeypatch.setenv("REDIS_URL", "redis://redis:6379/0")
+        assert isinstance(_backend(), RedisPolicyCacheBackend)
+        monkeypatch.setenv("REDIS_URL", "")
+        assert isinstance(_backend(), MemoryPolicyCacheBackend)
+        monkeypatch.delenv("REDIS_URL")
+        assert isinstance(_backend(), MemoryPolicyCacheBackend)
+        monkeypatch.setattr(policy_cache, "POLICY_CACHE_BACKEND", "off")
+        assert isinstance(_backend(), NullPolicyCacheBackend)
+    finally:
+        policy_cache.get_policy_cache_backend.cache_clear()
+
+
+@dataclass(frozen=True)
+class _LinkedItem:
+    task_id: str | None
+    mission_id: str | None
+
+
+def test_data_perimeter_linked_visibility_batches_lookups(tmp_path: Path) -> None:
+    test_engine = create_engine(f"sqlite:///{tmp_path / 'perimeter_linked.db'}")
+    SQLModel.metadata.create_all(test_engine)
+    service = DataPerimeterService()
+    scope = DataPerimeterScope(
+        mode=DataScopeMode.SCOPED,
+        explicit_allow=DataPerimeterRule(project_codes=frozenset({"p-1"})),
+    )
+
+    with Session(test_engine) as session:
+        missions = [
+            Mission(
+                tenant_id="tenant-1",
+                name=f"mission-{index}",
+                project_code="p-1" if index % 2 == 0 else "p-2",
+                plan_type=MissionPlanType.POINT_TASK,
+                created_by="user-1",
+            )
+            for index in range(6)
+        ]
+        tasks = [
+            InspectionTask(
+                tenant_id="tenant-1",
+                name=f"task-{index}",
+                template_id="template-1",
+                project_code="p-1" if index % 3 == 0 else "p-3",
+            )
+            for index in range(6)
+        ]
+        session.add_all([*missions, *tasks])
+        session.commit()
+
+        items = [
+            *[_LinkedItem(task_id=None, mission_id=item.id) for item in missions],
+            *[_LinkedItem(task_id=item.id, mission_id=missions[1].id) for item in tasks],
+            _LinkedItem(task_id="missing-task", mission_id=None),
+            _LinkedItem(task_id=None, mission_id=None),
+        ]
+        expected = [
+            *[_LinkedItem(task_id=None, mission_id=item.id) for item in missions[::2]],
+            *[_LinkedItem(task_id=item.id, mission_id=missions[1].id) for item in tasks[::3]],
+            _LinkedItem(task_id=None, mission_id=None),
+        ]
+
+        statements: list[str] = []
+
+        @event.listens_for(test_engine, "before_cursor_execute")
+        def _count(*args: object) -> None:
+            statements.append(str(args[2]))
+
+        resolver = service.linked_visibility(session, "tenant-1", scope)
+        assert resolver.filter(items) == expected
+        assert len(statements) == 2
+        assert resolver.is_visible(task_id=tasks[0].id, mission_id=None)
+        assert len(statements) == 2
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine, select
 
 from app.domain.models import EventEnvelope, EventRecord
+from app.infra import db, events
+from app.infra.event_stream import SqlEventStream, consume_group
 from app.infra.events import EventBus
 
 
@@ -34,3 +40,113 @@ def test_event_bus_publish_and_subscribe() -> None:
     assert stored[0].event_id == event.event_id
     assert seen == [event.event_id]
 
+
+
+def test_event_bus_session_outbox_dispatches_after_commit_only() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+
+    bus = EventBus()
+    seen: list[str] = []
+    bus.subscribe("*", lambda event: seen.append(event.event_type))
+
+    with Session(engine) as session:
+        bus.publish_dict("alert.created", "tenant-a", {"alert_id": "a-1"}, session=session)
+        assert seen == []
+        session.rollback()
+
+    with Session(engine) as session:
+        bus.publish_dict("alert.routed", "tenant-a", {"alert_id": "a-1"}, session=session)
+        session.commit()
+
+    with Session(engine) as session:
+        stored = [row.event_type for row in session.exec(select(EventRecord)).all()]
+
+    assert stored == ["alert.routed"]
+    assert seen == ["alert.routed"]
+
+
+def test_event_bus_buffers_and_flushes_in_background(monkeypatch: pytest.MonkeyPatch) -> None:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(events, "engine", engine)
+
+    bus = EventBus(batch_size=2, flush_interval_seconds=0.05)
+    seen: list[str] = []
+
+    def failing_handler(_: EventEnvelope) -> None:
+        raise RuntimeError("subscriber failure")
+
+    bus.subscribe("command.requested", failing_handler)
+    bus.subscribe("command.requested", lambda event: seen.append(event.event_id))
+
+    bus.start()
+    try:
+        published = [
+            bus.publish_dict("command.requested", "tenant-a", {"index": index}) for index in range(3)
+        ]
+    finally:
+        bus.stop()
+
+    with Session(engine) as session:
+        stored = {row.event_id for row in session.exec(select(EventRecord)).all()}
+
+    assert stored == {item.event_id for item in published}
+    assert sorted(seen) == sorted(item.event_id for item in published)
+    assert bus.stats()["handler_errors"] == 3
+    assert bus.stats()["buffered"] == 0
+
+
+def test_sql_event_stream_consumer_groups_and_replay(monkeypatch: pytest.MonkeyPatch) -> None:
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(db, "engine", engine)
+
+    base_ts = datetime(2026, 1, 1, tzinfo=UTC)
+    published = [
+        EventEnvelope(
+            event_type="alert.created" if index % 2 == 0 else "command.requested",
+            tenant_id="tenant-a" if index < 4 else "tenant-b",
+            ts=base_ts + timedelta(seconds=index),
+            payload={"index": index},
+        )
+        for index in range(6)
+    ]
+    with Session(engine) as session:
+        bus = EventBus()
+        for item in published:
+            bus.publish(item, session=session)
+        session.commit()
+
+    stream = SqlEventStream(settle_seconds=0)
+    first = stream.read_group("dashboard", count=4)
+    assert [entry.event.event_id for entry in first] == [item.event_id for item in published[:4]]
+
+    # Only the first two are acknowledged, so the rest are redelivered.
+    stream.ack("dashboard", first[:2])
+    redelivered = stream.read_group("dashboard", count=10)
+    assert [entry.event.event_id for entry in redelivered] == [item.event_id for item in published[2:]]
+
+    seen: list[int] = []
+    assert consume_group(stream, "dashboard", lambda event: seen.append(event.payload["index"])) == 4
+    assert seen == [2, 3, 4, 5]
+    assert stream.read_group("dashboard") == []
+    assert stream.read_group("kpi", count=1)[0].event.event_id == published[0].event_id
+
+    stream.seek_group("dashboard", after_event_id=published[3].event_id)
+    assert [entry.event.payload["index"] for entry in stream.read_group("dashboard")] == [4, 5]
+    stream.seek_group("dashboard", since_ts=base_ts + timedelta(seconds=5))
+    assert [entry.event.payload["index"] for entry in stream.read_group("dashboard")] == [5]
+
+    replayed = stream.replay(
+        since_ts=base_ts + timedelta(seconds=1),
+        tenant_id="tenant-a",
+        event_types=["command.requested"],
+    )
+    assert [entry.event.payload["index"] for entry in replayed] == [1, 3]
+    after_replay = stream.replay(after_event_id=published[4].event_id)
+    assert [entry.event.payload["index"] for entry in after_replay] == [5]
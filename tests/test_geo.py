@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.domain import geo
+
+
+def _track() -> tuple[list[datetime], list[float], list[float]]:
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    timestamps = [base + timedelta(seconds=10 * idx) for idx in range(200)]
+    lats = [30.0 + 0.001 * idx for idx in range(200)]
+    lons = [114.0 + 0.0005 * (idx % 7) for idx in range(200)]
+    return timestamps, lats, lons
+
+
+def test_geo_track_statistics_pure_python() -> None:
+    timestamps, lats, lons = _track()
+    legs = geo.segment_distances_km(lats, lons, vectorized=False)
+    assert len(legs) == len(lats) - 1
+    assert legs[0] == pytest.approx(geo.haversine_km(lats[0], lons[0], lats[1], lons[1]))
+
+    cumulative = geo.cumulative_distance_km(lats, lons, vectorized=False)
+    assert cumulative[0] == 0.0
+    assert cumulative[-1] == pytest.approx(geo.track_length_km(lats, lons, vectorized=False))
+
+    speeds = geo.segment_speeds_mps(timestamps, lats, lons, vectorized=False)
+    assert speeds[0] == pytest.approx(legs[0] * 1000 / 10)
+
+    box = geo.bounding_box(lats, lons)
+    assert box is not None
+    assert box.min_lat == pytest.approx(30.0)
+    assert box.max_lon == pytest.approx(114.003)
+    assert geo.bounding_box([], []) is None
+    assert geo.segment_distances_km([30.0], [114.0]) == []
+
+
+def test_geo_vectorized_path_matches_pure_python() -> None:
+    pytest.importorskip("numpy")
+    timestamps, lats, lons = _track()
+    assert geo.segment_distances_km(lats, lons, vectorized=True) == pytest.approx(
+        geo.segment_distances_km(lats, lons, vectorized=False)
+    )
+    assert geo.segment_speeds_mps(timestamps, lats, lons, vectorized=True) == pytest.approx(
+        geo.segment_speeds_mps(timestamps, lats, lons, vectorized=False)
+    )
+
+
+def test_geo_dwell_detection() -> None:
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    timestamps = [base + timedelta(seconds=30 * idx) for idx in range(8)]
+    # Moves, hovers within a few metres for two minutes, then moves on.
+    lats = [30.0, 30.001, 30.00101, 30.00102, 30.00101, 30.00103, 30.003, 30.004]
+    lons = [114.0] * 8
+    dwells = geo.detect_dwells(timestamps, lats, lons, radius_m=10, min_duration_seconds=90)
+    assert len(dwells) == 1
+    assert (dwells[0].start_index, dwells[0].end_index) == (1, 5)
+    assert dwells[0].duration_seconds == 120
+    assert geo.detect_dwells(timestamps, lats, lons, radius_m=10, min_duration_seconds=180) == []
+
+
+def test_geo_polygon_and_sampling() -> None:
+    square = [(114.0, 30.0), (114.1, 30.0), (114.1, 30.1), (114.0, 30.1), (114.0, 30.0)]
+    prepared = geo.PreparedPolygon.from_vertices(square)
+    assert prepared.contains(114.05, 30.05)
+    assert geo.point_in_polygon(114.05, 30.05, square)
+    assert not prepared.contains(114.2, 30.05)
+    assert not prepared.contains(113.9, 30.05)
+
+    points = list(range(10))
+    for step, limit in [(1, 500), (2, 500), (3, 2), (4, 1)]:
+        expected = points[::step]
+        if len(expected) > limit:
+            expected = expected[-limit:]
+        assert [points[idx] for idx in geo.sample_indices(len(points), step=step, limit=limit)] == expected
+
+
+def test_geo_web_mercator_tiles() -> None:
+    assert geo.tile_quadkey(3, 5, 3) == "213"
+    tile_x, tile_y = geo.tile_xy(30.5801, 114.3001, 12)
+    bounds = geo.tile_bounds(tile_x, tile_y, 12)
+    assert bounds.contains(30.5801, 114.3001)
+    box = geo.BoundingBox(min_lat=30.0, min_lon=114.0, max_lat=31.0, max_lon=115.0)
+    min_x, min_y, max_x, max_y = geo.tile_range(box, 12)
+    assert min_x <= tile_x <= max_x and min_y <= tile_y <= max_y
+    assert geo.tile_xy(89.9, 180.0, 2) == (3, 0)
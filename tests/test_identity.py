@@ -861,3 +861,96 @@ def test_identity_user_roles_batch_bind_audit(identity_client: TestClient) -> No
     assert denied_detail["what"]["target"]["user_id"] == user_a_id
     assert denied_detail["result"]["outcome"] == "denied"
     assert denied_detail["result"]["reason"] == "cross_tenant_boundary"
+
+
+def test_identity_verified_token_cache(
+    identity_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.infra import auth
+
+    auth.token_cache.clear()
+    tenant_id = _create_tenant(identity_client, "token-cache-tenant")
+    _bootstrap_admin(identity_client, tenant_id, "admin", "admin-pass")
+    token = _login(identity_client, tenant_id, "admin", "admin-pass")
+
+    decode_calls: list[str] = []
+    original_decode = auth.jwt.decode
+
+    def _counting_decode(*args: object, **kwargs: object) -> object:
+        decode_calls.append("decode")
+        return original_decode(*args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(auth.jwt, "decode", _counting_decode)
+    for _ in range(3):
+        response = identity_client.get("/api/identity/users", headers=_auth_header(token))
+        assert response.status_code == 200
+    assert len(decode_calls) == 1
+
+    cached = auth.verify_access_token(token)
+    assert cached.permissions.allows("identity.read")
+    claims = auth.decode_access_token(token)
+    # Nested values are copied too, so a caller cannot grant itself permissions in the cache.
+    claims["permissions"].append("platform.super_admin")
+    assert "platform.super_admin" not in auth.verify_access_token(token).claims["permissions"]
+    claims["permissions"] = []
+    assert auth.verify_access_token(token).claims["permissions"]
+
+    # Entries never outlive the token expiry.
+    monkeypatch.setattr(auth.time, "time", lambda: cached.expires_at + 1)
+    assert auth.token_cache.get(token) is None
+    auth.token_cache.clear()
+
+
+def test_identity_effective_permissions_cache_and_bulk(identity_client: TestClient) -> None:
+    tenant_id = _create_tenant(identity_client, "perm-cache-tenant")
+    _bootstrap_admin(identity_client, tenant_id, "admin", "admin-pass")
+    token = _login(identity_client, tenant_id, "admin", "admin-pass")
+
+    user_resp = identity_client.post(
+        "/api/identity/users",
+        json={"username": "viewer", "password": "viewer-pass", "is_active": True},
+        headers=_auth_header(token),
+    )
+    assert user_resp.status_code == 201
+    viewer_id = user_resp.json()["id"]
+    role_resp = identity_client.post(
+        "/api/identity/roles",
+        json={"name": "viewer-role", "description": "viewer"},
+        headers=_auth_header(token),
+    )
+    assert role_resp.status_code == 201
+    role_id = role_resp.json()["id"]
+    permission_id = _get_permission_id_by_name(identity_client, token, "mission.read")
+
+    def _effective(user_ids: list[str]) -> dict[str, list[str]]:
+        response = identity_client.post(
+            "/api/identity/users:effective-permissions",
+            json={"user_ids": user_ids},
+            headers=_auth_header(token),
+        )
+        assert response.status_code == 200
+        return {item["user_id"]: item["permissions"] for item in response.json()}
+
+    assert _effective([viewer_id, "missing-user"]) == {viewer_id: [], "missing-user": []}
+
+    bind_role = identity_client.post(
+        f"/api/identity/users/{viewer_id}/roles/{role_id}",
+        headers=_auth_header(token),
+    )
+    assert bind_role.status_code == 204
+    bind_perm = identity_client.post(
+        f"/api/identity/roles/{role_id}/permissions/{permission_id}",
+        headers=_auth_header(token),
+    )
+    assert bind_perm.status_code == 204
+    assert _effective([viewer_id])[viewer_id] == ["mission.read"]
+    viewer_token = _login(identity_client, tenant_id, "viewer", "viewer-pass")
+    assert identity_client.get("/api/mission/missions", headers=_auth_header(viewer_token)).status_code == 200
+
+    unbind_perm = identity_client.delete(
+        f"/api/identity/roles/{role_id}/permissions/{permission_id}",
+        headers=_auth_header(token),
+    )
+    assert unbind_perm.status_code == 204
+    assert _effective([viewer_id])[viewer_id] == []
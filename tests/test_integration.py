@@ -49,9 +49,8 @@ def integration_client(
     monkeypatch.setattr(IntegrationService, "_device_sessions", {})
     monkeypatch.setattr(IntegrationService, "_video_streams", {})
 
-    client = TestClient(app_main.app)
-    yield client
-    client.close()
+    with TestClient(app_main.app) as client:
+        yield client
 
 
 def _auth_header(token: str) -> dict[str, str]:
@@ -10,10 +10,24 @@ from pathlib import Path
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import event
-from sqlmodel import SQLModel, create_engine
+from sqlmodel import Session, SQLModel, create_engine, delete, select
 
 from app import main as app_main
+from app.domain.models import (
+    AlertRecord,
+    EventRecord,
+    KpiFlightRollupBackfillRequest,
+    KpiFlightRollupHourly,
+    KpiSnapshotRecomputeRequest,
+    OutcomeCatalogRecord,
+    OutcomeSourceType,
+    OutcomeType,
+    TelemetryNormalized,
+    TelemetryPosition,
+)
 from app.infra import audit, db, events
+from app.services.alert_service import AlertService
+from app.services.kpi_service import KpiService
 
 
 @pytest.fixture()
@@ -257,3 +271,227 @@ def test_open_platform_signature_and_webhook(platform_client: TestClient) -> Non
     statuses = {item["status"] for item in events_resp.json()}
     assert "ACCEPTED" in statuses
     assert "REJECTED" in statuses
+
+
+
+def _as_naive(value: datetime) -> datetime:
+    # SQLite hands timestamps back without their UTC offset.
+    return value.astimezone(UTC).replace(tzinfo=None) if value.tzinfo else value
+
+def test_kpi_flight_rollups_match_raw_telemetry(platform_client: TestClient) -> None:
+    tenant_id = _create_tenant(platform_client, "phase15-kpi-rollups")
+    service = KpiService()
+    base = datetime(2026, 10, 1, 8, 0, tzinfo=UTC)
+    # (minutes after base, lat, lon); the 70-minute sample arrives late, after the 100-minute one,
+    # and the 20-minute one lands between points already folded into its hour.
+    samples = [
+        (5, 30.0, 114.0),
+        (40, 30.01, 114.0),
+        (100, 30.03, 114.02),
+        (70, 30.02, 114.01),
+        (150, 30.05, 114.03),
+        (20, 30.004, 114.001),
+    ]
+    with Session(db.get_engine()) as session:
+        for minutes, lat, lon in samples:
+            ts = base + timedelta(minutes=minutes)
+            session.add(
+                EventRecord(
+                    event_type="telemetry.normalized",
+                    tenant_id=tenant_id,
+                    ts=ts,
+                    payload={
+                        "drone_id": "rollup-drone",
+                        "ts": ts.isoformat(),
+                        "position": {"lat": lat, "lon": lon, "alt_m": 50.0},
+                    },
+                )
+            )
+        session.commit()
+    for minutes, lat, lon in samples:
+        ts = base + timedelta(minutes=minutes)
+        service.record_flight_sample(tenant_id, "rollup-drone", event_ts=ts, sample_ts=ts, lat=lat, lon=lon)
+
+    ordered = sorted(samples)
+    expected_km = sum(
+        KpiService._haversine_km(ordered[idx - 1][1], ordered[idx - 1][2], ordered[idx][1], ordered[idx][2])
+        for idx in range(1, len(ordered))
+    )
+    with Session(db.get_engine()) as session:
+        rollups = {
+            _as_naive(item.bucket_start): item
+            for item in session.exec(
+                select(KpiFlightRollupHourly).where(KpiFlightRollupHourly.tenant_id == tenant_id)
+            )
+        }
+    first_hour = rollups[_as_naive(base)]
+    assert first_hour.needs_rebuild
+    assert first_hour.sample_count == 3
+    second_hour = rollups[_as_naive(base + timedelta(hours=1))]
+    assert not second_hour.needs_rebuild
+    assert _as_naive(second_hour.first_ts) == _as_naive(base + timedelta(minutes=70))
+    assert second_hour.distance_km == pytest.approx(KpiService._haversine_km(30.02, 114.01, 30.03, 114.02))
+    window = KpiSnapshotRecomputeRequest(from_ts=base + timedelta(minutes=1), to_ts=base + timedelta(minutes=170))
+
+    def _flight_metrics() -> tuple[float, float]:
+        snapshot = service.recompute_snapshot(tenant_id, "tester", window)
+        return snapshot.metrics["flight_duration_sec"], snapshot.metrics["flight_mileage_km"]
+
+    assert _flight_metrics() == (145 * 60.0, round(expected_km, 3))
+    with Session(db.get_engine()) as session:
+        rollups = list(session.exec(select(KpiFlightRollupHourly).where(KpiFlightRollupHourly.tenant_id == tenant_id)))
+        assert len(rollups) == 3
+        session.exec(delete(KpiFlightRollupHourly).where(KpiFlightRollupHourly.tenant_id == tenant_id))
+        session.commit()
+
+    backfill = service.backfill_flight_rollups(
+        tenant_id,
+        KpiFlightRollupBackfillRequest(from_ts=base, to_ts=base + timedelta(hours=3)),
+    )
+    assert backfill.events_scanned == len(samples)
+    assert backfill.buckets_written == 3
+    assert _flight_metrics() == (145 * 60.0, round(expected_km, 3))
+
+
+
+def test_kpi_flight_rollup_rebuild_keeps_flag_until_events_cover_the_row(
+    platform_client: TestClient,
+) -> None:
+    tenant_id = _create_tenant(platform_client, "phase15-kpi-rollup-coverage")
+    service = KpiService()
+    base = datetime(2026, 10, 2, 8, 0, tzinfo=UTC)
+    # The 30-minute sample lands between points already folded in, which flags the hour.
+    samples = [(5, 30.0, 114.0), (50, 30.02, 114.02), (30, 30.01, 114.01)]
+    for minutes, lat, lon in samples:
+        ts = base + timedelta(minutes=minutes)
+        service.record_flight_sample(tenant_id, "coverage-drone", event_ts=ts, sample_ts=ts, lat=lat, lon=lon)
+
+    def _add_event(minutes: int, lat: float, lon: float) -> None:
+        ts = base + timedelta(minutes=minutes)
+        with Session(db.get_engine()) as session:
+            session.add(
+                EventRecord(
+                    event_type="telemetry.normalized",
+                    tenant_id=tenant_id,
+                    ts=ts,
+                    payload={
+                        "drone_id": "coverage-drone",
+                        "ts": ts.isoformat(),
+                        "position": {"lat": lat, "lon": lon, "alt_m": 50.0},
+                    },
+                )
+            )
+            session.commit()
+
+    def _rollup() -> KpiFlightRollupHourly:
+        with Session(db.get_engine()) as session:
+            return session.exec(
+                select(KpiFlightRollupHourly).where(KpiFlightRollupHourly.tenant_id == tenant_id)
+            ).one()
+
+    # Only two of the three folded samples are visible as raw events.
+    for minutes, lat, lon in samples[:2]:
+        _add_event(minutes, lat, lon)
+    window = KpiSnapshotRecomputeRequest(from_ts=base - timedelta(hours=1), to_ts=base + timedelta(hours=2))
+    service.recompute_snapshot(tenant_id, "tester", window)
+    partial = _rollup()
+    assert partial.needs_rebuild
+    assert partial.sample_count == 3
+
+    _add_event(*samples[2])
+    service.recompute_snapshot(tenant_id, "tester", window)
+    rebuilt = _rollup()
+    assert not rebuilt.needs_rebuild
+    assert rebuilt.sample_count == 3
+    assert rebuilt.distance_km == pytest.approx(
+        KpiService._haversine_km(30.0, 114.0, 30.01, 114.01) + KpiService._haversine_km(30.01, 114.01, 30.02, 114.02)
+    )
+
+def test_kpi_heatmap_grid_is_maintained_incrementally(platform_client: TestClient) -> None:
+    tenant_id = _create_tenant(platform_client, "phase15-kpi-heatmap-grid")
+    _bootstrap_admin(platform_client, tenant_id, "admin", "admin-pass")
+    token = _login(platform_client, tenant_id, "admin", "admin-pass")
+    alert_service = AlertService()
+
+    def _breach(drone_id: str, lat: float, lon: float) -> None:
+        alert_service.evaluate_telemetry(
+            tenant_id,
+            TelemetryNormalized(
+                tenant_id=tenant_id,
+                drone_id=drone_id,
+                position=TelemetryPosition(lat=lat, lon=lon, alt_m=80.0),
+                mode="AUTO",
+                health={"geofence_breach": True},
+            ),
+        )
+
+    _breach("grid-drone-1", 30.5801, 114.3001)
+    _breach("grid-drone-2", 30.5802, 114.3002)
+    # Re-triggering moves the open alert, and its grid count, to the latest position.
+    _breach("grid-drone-2", 31.2001, 121.4001)
+    with Session(db.get_engine()) as session:
+        session.add(
+            OutcomeCatalogRecord(
+                tenant_id=tenant_id,
+                source_type=OutcomeSourceType.MANUAL,
+                source_id="manual-1",
+                outcome_type=OutcomeType.OTHER,
+                point_lat=30.5803,
+                point_lon=114.3003,
+                created_by="tester",
+            )
+        )
+        session.commit()
+        positions = sorted(
+            (alert.position_lat, alert.position_lon)
+            for alert in session.exec(select(AlertRecord).where(AlertRecord.tenant_id == tenant_id))
+        )
+    assert positions == [(30.5801, 114.3001), (31.2001, 121.4001)]
+
+    now = datetime.now(UTC)
+    recompute_resp = platform_client.post(
+        "/api/kpi/snapshots/recompute",
+        json={
+            "from_ts": (now - timedelta(hours=1)).isoformat(),
+            "to_ts": (now + timedelta(hours=1)).isoformat(),
+            "window_type": "CUSTOM",
+        },
+        headers=_auth_header(token),
+    )
+    assert recompute_resp.status_code == 201
+
+    def _cells(query: str) -> list[tuple[str, int]]:
+        response = platform_client.get(f"/api/kpi/heatmap?{query}", headers=_auth_header(token))
+        assert response.status_code == 200
+        return sorted((item["source"], item["count"]) for item in response.json())
+
+    fixed = _cells("source=ALERT")
+    assert fixed == [("ALERT", 1), ("ALERT", 1)]
+    # The outcome was not created through the service, so the grid only knows the alerts.
+    assert _cells("zoom=6") == [("ALERT", 1), ("ALERT", 1)]
+    # Below the coarsest precomputed level the stored tiles fold up into their ancestors.
+    assert _cells("zoom=0") == [("ALERT", 2)]
+    world = platform_client.get("/api/kpi/heatmap?zoom=0", headers=_auth_header(token)).json()[0]
+    assert world["detail"]["zoom"] == 0
+    assert (world["detail"]["tile_x"], world["detail"]["tile_y"]) == (0, 0)
+    assert _cells("zoom=12&bbox=114.0,30.0,115.0,31.0") == [("ALERT", 1)]
+    cell = platform_client.get(
+        "/api/kpi/heatmap?zoom=12&bbox=114.0,30.0,115.0,31.0",
+        headers=_auth_header(token),
+    ).json()[0]
+    assert cell["detail"]["zoom"] == 12
+    assert len(cell["detail"]["quadkey"]) == 12
+    min_lon, min_lat, max_lon, max_lat = cell["detail"]["bbox"]
+    assert min_lat <= 30.5801 <= max_lat and min_lon <= 114.3001 <= max_lon
+    bad_bbox = platform_client.get("/api/kpi/heatmap?zoom=12&bbox=1,2,3", headers=_auth_header(token))
+    assert bad_bbox.status_code == 422
+    for raw in ("nan,30,115,31", "114,30,inf,31", "114,-91,115,31", "-181,30,115,31"):
+        response = platform_client.get(f"/api/kpi/heatmap?zoom=12&bbox={raw}", headers=_auth_header(token))
+        assert response.status_code == 422, raw
+
+    rebuild_resp = platform_client.post("/api/kpi/heatmap-grid:rebuild", headers=_auth_header(token))
+    assert rebuild_resp.status_code == 200
+    assert rebuild_resp.json()["alerts_scanned"] == 2
+    assert rebuild_resp.json()["outcomes_scanned"] == 1
+    assert _cells("zoom=6") == [("ALERT", 1), ("ALERT", 1), ("OUTCOME", 1)]
+    assert _cells("zoom=8&source=OUTCOME") == [("OUTCOME", 1)]
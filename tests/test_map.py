@@ -6,10 +6,11 @@ from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import SQLModel, create_engine
+from sqlmodel import Session, SQLModel, create_engine
 
 from app import main as app_main
-from app.infra import audit, db, events, redis_state
+from app.domain.geo import haversine_km
+from app.infra import audit, db, events, redis_state, unit_of_work
 
 
 class FakeRedis:
@@ -258,6 +259,32 @@ def test_map_overview_and_layers_are_tenant_scoped(map_client: TestClient) -> No
     assert outcome_items[0]["id"] == outcome_a
 
 
+def test_map_overview_shares_one_request_session(
+    map_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tenant_id = _create_tenant(map_client, "map-uow-tenant")
+    _bootstrap_admin(map_client, tenant_id, "admin", "admin-pass")
+    token = _login(map_client, tenant_id, "admin", "admin-pass")
+    _create_drone(map_client, token, name="drone-uow")
+    _create_mission(map_client, token, name="mission-uow")
+
+    opened: list[bool] = []
+    real_create_session = unit_of_work.create_session
+
+    def _counting_create_session(*, read_only: bool = False) -> Session:
+        opened.append(read_only)
+        return real_create_session(read_only=read_only)
+
+    monkeypatch.setattr(unit_of_work, "create_session", _counting_create_session)
+
+    overview = map_client.get("/api/map/overview", headers=_auth_header(token))
+    assert overview.status_code == 200
+    assert overview.json()["tasks_total"] == 1
+    # All six layers and the data perimeter lookups run on a single read-only session.
+    assert opened == [True]
+
+
 def test_map_track_replay_supports_sampling_and_tenant_boundary(map_client: TestClient) -> None:
     tenant_a = _create_tenant(map_client, "map-replay-tenant-a")
     tenant_b = _create_tenant(map_client, "map-replay-tenant-b")
@@ -303,6 +330,10 @@ def test_map_track_replay_supports_sampling_and_tenant_boundary(map_client: Test
     assert len(replay_body["points"]) == 2
     assert replay_body["points"][0]["lat"] == pytest.approx(30.0)
     assert replay_body["points"][1]["lat"] == pytest.approx(30.2)
+    # Track statistics cover every point in the window, not just the sampled ones.
+    expected_km = haversine_km(30.0, 114.0, 30.1, 114.1) + haversine_km(30.1, 114.1, 30.2, 114.2)
+    assert replay_body["distance_km"] == pytest.approx(expected_km, abs=1e-3)
+    assert replay_body["max_speed_mps"] > 10_000
 
     cross_tenant = map_client.get(
         f"/api/map/tracks/replay?drone_id={drone_a}",
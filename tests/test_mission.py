@@ -13,6 +13,7 @@ from sqlmodel import Session, SQLModel, create_engine, select
 from app import main as app_main
 from app.domain.models import EventRecord, Mission, MissionPlanType, MissionRun, MissionState
 from app.infra import audit, db, events
+from app.infra.pagination import encode_cursor
 
 
 @pytest.fixture()
@@ -222,6 +223,44 @@ def test_mission_emits_events_on_create_and_approve(mission_client: TestClient)
     assert "mission.approved" in event_types
 
 
+def test_mission_list_keyset_pagination(mission_client: TestClient) -> None:
+    tenant_id = _create_tenant(mission_client, "mission-page-tenant")
+    _bootstrap_admin(mission_client, tenant_id, "admin", "admin-pass")
+    admin_token = _login(mission_client, tenant_id, "admin", "admin-pass")
+    created = {_create_basic_mission(mission_client, admin_token) for _ in range(3)}
+
+    full_resp = mission_client.get("/api/mission/missions", headers=_auth_header(admin_token))
+    assert full_resp.status_code == 200
+    assert {item["id"] for item in full_resp.json()} == created
+    assert "X-Next-Cursor" not in full_resp.headers
+
+    seen: list[str] = []
+    params: dict[str, str | int | bool] = {"limit": 2, "include_total": True}
+    while True:
+        page_resp = mission_client.get(
+            "/api/mission/missions",
+            params=params,
+            headers=_auth_header(admin_token),
+        )
+        assert page_resp.status_code == 200
+        assert page_resp.headers["X-Total-Count"] == "3"
+        seen.extend(item["id"] for item in page_resp.json())
+        cursor = page_resp.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        params = {"limit": 2, "cursor": cursor, "include_total": True}
+    assert len(seen) == 3
+    assert set(seen) == created
+
+    for cursor in ("not-a-cursor", encode_cursor(5, "x")):
+        invalid_resp = mission_client.get(
+            "/api/mission/missions",
+            params={"cursor": cursor},
+            headers=_auth_header(admin_token),
+        )
+        assert invalid_resp.status_code == 400
+
+
 def test_mission_tenant_isolation_by_id_endpoints(mission_client: TestClient) -> None:
     tenant_a = _create_tenant(mission_client, "mission-tenant-a")
     tenant_b = _create_tenant(mission_client, "mission-tenant-b")
@@ -68,6 +68,39 @@ def _login(client: TestClient, tenant_id: str, username: str, password: str) ->
     return response.json()["access_token"]
 
 
+def _platform_super_admin_token(client: TestClient, tenant_id: str, admin_token: str) -> str:
+    perm_resp = client.post(
+        "/api/identity/permissions",
+        json={"name": "platform.super_admin", "description": "platform governance capability"},
+        headers=_auth_header(admin_token),
+    )
+    assert perm_resp.status_code == 201
+    role_resp = client.post(
+        "/api/identity/roles",
+        json={"name": "platform-super-admin", "description": "platform governance role"},
+        headers=_auth_header(admin_token),
+    )
+    assert role_resp.status_code == 201
+    role_id = role_resp.json()["id"]
+    bind_perm_resp = client.post(
+        f"/api/identity/roles/{role_id}/permissions/{perm_resp.json()['id']}",
+        headers=_auth_header(admin_token),
+    )
+    assert bind_perm_resp.status_code == 204
+    user_resp = client.post(
+        "/api/identity/users",
+        json={"username": "platform_super", "password": "super-pass", "is_active": True},
+        headers=_auth_header(admin_token),
+    )
+    assert user_resp.status_code == 201
+    bind_role_resp = client.post(
+        f"/api/identity/users/{user_resp.json()['id']}/roles/{role_id}",
+        headers=_auth_header(admin_token),
+    )
+    assert bind_role_resp.status_code == 204
+    return _login(client, tenant_id, "platform_super", "super-pass")
+
+
 def test_observability_phase25_full_chain(observability_client: TestClient) -> None:
     tenant_id = _create_tenant(observability_client, "phase25-observability")
     _bootstrap_admin(observability_client, tenant_id, "admin-obv", "admin-pass")
@@ -324,3 +357,122 @@ def test_observability_tenant_boundary(observability_client: TestClient) -> None
     )
     assert alerts_b.status_code == 200
     assert alerts_b.json() == []
+
+
+def test_observability_list_reads_route_to_replica(
+    observability_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    tenant_id = _create_tenant(observability_client, "phase25-obv-replica")
+    _bootstrap_admin(observability_client, tenant_id, "admin-replica", "admin-pass")
+    token = _login(observability_client, tenant_id, "admin-replica", "admin-pass")
+
+    ingest = observability_client.post(
+        "/api/observability/signals:ingest",
+        json={
+            "items": [
+                {
+                    "signal_type": "LOG",
+                    "level": "INFO",
+                    "service_name": "replica-service",
+                    "signal_name": "heartbeat",
+                    "message": "ok",
+                }
+            ]
+        },
+        headers=_auth_header(token),
+    )
+    assert ingest.status_code == 201
+
+    primary_rows = observability_client.get("/api/observability/signals", headers=_auth_header(token))
+    assert primary_rows.status_code == 200
+    assert len(primary_rows.json()) == 1
+
+    # An empty replica makes it visible which engine served the list query.
+    replica_engine = create_engine(
+        f"sqlite:///{tmp_path / 'observability_replica.db'}",
+        connect_args={"check_same_thread": False},
+        execution_options={"db_role": db.ROLE_REPLICA},
+    )
+    SQLModel.metadata.create_all(replica_engine)
+    monkeypatch.setattr(db, "read_engine", replica_engine)
+
+    replica_rows = observability_client.get("/api/observability/signals", headers=_auth_header(token))
+    assert replica_rows.status_code == 200
+    assert replica_rows.json() == []
+
+    # Pool and query metrics are process wide, so tenant admins do not see them.
+    denied_stats = observability_client.get("/api/observability/database", headers=_auth_header(token))
+    assert denied_stats.status_code == 403
+
+    super_token = _platform_super_admin_token(observability_client, tenant_id, token)
+    stats_resp = observability_client.get(
+        "/api/observability/database",
+        headers=_auth_header(super_token),
+    )
+    assert stats_resp.status_code == 200
+    engines = {item["role"]: item for item in stats_resp.json()["engines"]}
+    assert set(engines) == {db.ROLE_PRIMARY, db.ROLE_REPLICA}
+    assert engines[db.ROLE_PRIMARY]["queries"] > 0
+    assert engines[db.ROLE_REPLICA]["queries"] > 0
+
+
+def test_observability_backup_counts_and_overview_skip_json_blobs(
+    observability_client: TestClient,
+) -> None:
+    tenant_id = _create_tenant(observability_client, "phase25-obv-projection")
+    _bootstrap_admin(observability_client, tenant_id, "admin-projection", "admin-pass")
+    token = _login(observability_client, tenant_id, "admin-projection", "admin-pass")
+
+    ingest = observability_client.post(
+        "/api/observability/signals:ingest",
+        json={
+            "items": [
+                {
+                    "signal_type": "LOG",
+                    "level": "ERROR",
+                    "service_name": "projection-service",
+                    "signal_name": f"signal-{index}",
+                    "message": "boom",
+                    "detail": {"blob": "x" * 512},
+                }
+                for index in range(3)
+            ]
+        },
+        headers=_auth_header(token),
+    )
+    assert ingest.status_code == 201
+
+    statements: list[str] = []
+
+    def _capture(
+        _conn: object,
+        _cursor: object,
+        statement: str,
+        _parameters: object,
+        _context: object,
+        _executemany: bool,
+    ) -> None:
+        statements.append(statement)
+
+    engine = db.get_engine()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        overview = observability_client.get("/api/observability/overview", headers=_auth_header(token))
+        backup_resp = observability_client.post(
+            "/api/observability/backups:runs",
+            json={"run_type": "FULL", "is_drill": True},
+            headers=_auth_header(token),
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert overview.status_code == 200
+    assert overview.json()["error_signals"] == 3
+    assert backup_resp.status_code == 201
+    assert backup_resp.json()["detail"]["snapshot"]["signals"] == 3
+
+    signal_reads = [item for item in statements if "FROM observability_signals" in item]
+    assert signal_reads
+    assert all("observability_signals.detail" not in item for item in signal_reads)
@@ -342,12 +342,12 @@ def test_outcome_versions_and_scope_guard(outcomes_client: TestClient) -> None:
     )
     assert versions_after.status_code == 200
     version_rows = versions_after.json()
-    assert [item["version_no"] for item in version_rows] == [1, 2, 3]
-    assert [item["status"] for item in version_rows] == ["NEW", "IN_REVIEW", "VERIFIED"]
+    assert [item["version_no"] for item in version_rows] == [3, 2, 1]
+    assert [item["status"] for item in version_rows] == ["VERIFIED", "IN_REVIEW", "NEW"]
     assert [item["change_type"] for item in version_rows] == [
-        "INIT_SNAPSHOT",
         "STATUS_UPDATE",
         "STATUS_UPDATE",
+        "INIT_SNAPSHOT",
     ]
 
     admin_user_id = _get_user_id_by_username(outcomes_client, token, "admin")
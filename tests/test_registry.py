@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Generator
+from datetime import UTC, datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
@@ -9,8 +10,10 @@ from sqlalchemy import event
 from sqlmodel import Session, SQLModel, create_engine, select
 
 from app import main as app_main
+from app.api import deps
 from app.domain.models import EventRecord
 from app.infra import audit, db, events
+from app.infra.pagination import encode_cursor
 
 
 @pytest.fixture()
@@ -138,3 +141,69 @@ def test_registry_emits_registered_and_updated_events(registry_client: TestClien
     event_types = {row.event_type for row in filtered_rows}
     assert "drone.registered" in event_types
     assert "drone.updated" in event_types
+
+
+def test_registry_drone_list_keyset_pagination_and_cursor_validation(
+    registry_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tenant_id = _create_tenant(registry_client, "registry-page-tenant")
+    _bootstrap_admin(registry_client, tenant_id, "admin", "pass")
+    token = _login(registry_client, tenant_id, "admin", "pass")
+    created = set()
+    for index in range(5):
+        create_resp = registry_client.post(
+            "/api/registry/drones",
+            json={"name": f"drone-page-{index}", "vendor": "FAKE", "capabilities": {}},
+            headers=_auth_header(token),
+        )
+        assert create_resp.status_code == 201
+        created.add(create_resp.json()["id"])
+
+    seen: list[str] = []
+    params: dict[str, str | int | bool] = {"limit": 2, "include_total": True}
+    while True:
+        page_resp = registry_client.get(
+            "/api/registry/drones",
+            params=params,
+            headers=_auth_header(token),
+        )
+        assert page_resp.status_code == 200
+        assert page_resp.headers["X-Total-Count"] == "5"
+        assert len(page_resp.json()) <= 2
+        seen.extend(item["id"] for item in page_resp.json())
+        cursor = page_resp.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        params = {"limit": 2, "cursor": cursor, "include_total": True}
+    assert len(seen) == 5
+    assert set(seen) == created
+
+    # Without paging parameters the list is still bounded by the default limit.
+    monkeypatch.setattr(deps, "PAGINATION_DEFAULT_LIMIT", 3)
+    default_resp = registry_client.get("/api/registry/drones", headers=_auth_header(token))
+    assert default_resp.status_code == 200
+    assert [item["id"] for item in default_resp.json()] == seen[:3]
+    assert default_resp.headers.get("X-Next-Cursor") is not None
+
+    # Naive and offset timestamps are read as instants, so both cursors start after every drone.
+    later = datetime.now(UTC) + timedelta(days=1)
+    for sort_value in (
+        later.replace(tzinfo=None),
+        later.astimezone(timezone(timedelta(hours=8))),
+    ):
+        resp = registry_client.get(
+            "/api/registry/drones",
+            params={"limit": 10, "cursor": encode_cursor(sort_value, "~")},
+            headers=_auth_header(token),
+        )
+        assert resp.status_code == 200
+        assert {item["id"] for item in resp.json()} == created
+
+    for cursor in ("not-a-cursor", encode_cursor(5, "x"), encode_cursor("yesterday", "x")):
+        invalid_resp = registry_client.get(
+            "/api/registry/drones",
+            params={"limit": 2, "cursor": cursor},
+            headers=_auth_header(token),
+        )
+        assert invalid_resp.status_code == 400
@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Generator
 from datetime import timedelta
 from pathlib import Path
+from typing import Any
 from zipfile import ZipFile
 
 import pytest
@@ -11,8 +12,31 @@ from sqlalchemy import event
 from sqlmodel import Session, SQLModel, create_engine, select
 
 from app import main as app_main
-from app.domain.models import AuditLog, OutcomeReportExport, now_utc
-from app.infra import audit, db, events
+from app.domain.models import (
+    AuditLog,
+    DataScopeMode,
+    Defect,
+    DefectStatus,
+    DeviceUtilizationRead,
+    Drone,
+    DroneVendor,
+    InspectionTask,
+    Mission,
+    MissionPlanType,
+    OutcomeReportExport,
+    ReportExportStatus,
+    ReportingOverviewRead,
+    now_utc,
+)
+from app.infra import audit, db, events, report_writers
+from app.infra.projection import json_text_contains
+from app.services import reporting_service
+from app.services.data_perimeter_service import (
+    DataPerimeterRule,
+    DataPerimeterScope,
+    DataPerimeterService,
+)
+from app.services.reporting_service import ReportingService
 
 
 @pytest.fixture()
@@ -382,3 +406,332 @@ def test_outcome_report_retention_lifecycle_and_audit(reporting_client: TestClie
             ).all()
         )
     assert len(audit_rows) >= 2
+
+
+def test_outcome_report_export_jobs_stream_cancel_and_resume(
+    reporting_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tenant_id = _create_tenant(reporting_client, "reporting-export-jobs")
+    _bootstrap_admin(reporting_client, tenant_id, "admin", "admin-pass")
+    token = _login(reporting_client, tenant_id, "admin", "admin-pass")
+
+    template_resp = reporting_client.post(
+        "/api/reporting/outcome-report-templates",
+        json={
+            "name": "export-jobs-template",
+            "format_default": "CSV",
+            "title_template": "Job Report count={count}",
+            "body_template": "streamed",
+            "is_active": True,
+        },
+        headers=_auth_header(token),
+    )
+    assert template_resp.status_code == 201
+    template_id = template_resp.json()["id"]
+    inspection_template_id = _create_template(reporting_client, token, "export-jobs-inspection-template")
+    task_id = _create_task(reporting_client, token, inspection_template_id, "export-jobs-task")
+    outcome_ids = []
+    for idx in range(5):
+        outcome_resp = reporting_client.post(
+            "/api/outcomes/records",
+            json={
+                "task_id": task_id,
+                "source_type": "MANUAL",
+                "source_id": f"export-jobs-source-{idx}",
+                "outcome_type": "DEFECT",
+                "payload": {"note": f"export job {idx}"},
+            },
+            headers=_auth_header(token),
+        )
+        assert outcome_resp.status_code == 201
+        outcome_ids.append(outcome_resp.json()["id"])
+
+    monkeypatch.setattr(reporting_service, "REPORT_EXPORT_CHUNK_SIZE", 2)
+    queued = reporting_client.post(
+        "/api/reporting/outcome-report-exports",
+        json={"template_id": template_id, "task_id": task_id, "background": True},
+        headers=_auth_header(token),
+    )
+    assert queued.status_code == 201
+    assert queued.json()["status"] == "QUEUED"
+    assert queued.json()["report_format"] == "CSV"
+    export_id = queued.json()["id"]
+
+    service = ReportingService()
+    claimed = service.claim_outcome_report_export("worker-a")
+    assert claimed is not None and claimed.id == export_id
+    assert claimed.status == ReportExportStatus.RUNNING
+    assert service.claim_outcome_report_export("worker-b") is None
+
+    checkpoint = ReportingService._checkpoint_outcome_report_export
+
+    def _cancel_after_first_chunk(self: ReportingService, export_id: str, worker_id: str, **kwargs: Any) -> bool:
+        if kwargs["rows_scanned"] >= 2:
+            response = reporting_client.post(
+                f"/api/reporting/outcome-report-exports/{export_id}:cancel",
+                headers=_auth_header(token),
+            )
+            assert response.status_code == 200
+        return checkpoint(self, export_id, worker_id, **kwargs)
+
+    monkeypatch.setattr(ReportingService, "_checkpoint_outcome_report_export", _cancel_after_first_chunk)
+    canceled = service.run_outcome_report_export(export_id, worker_id="worker-a")
+    monkeypatch.setattr(ReportingService, "_checkpoint_outcome_report_export", checkpoint)
+    assert canceled.status == ReportExportStatus.CANCELED
+    assert (canceled.rows_total, canceled.rows_scanned, canceled.rows_written) == (5, 2, 2)
+    assert canceled.file_path is None
+    assert canceled.checkpoint["writer"]["bytes_written"] > 0
+
+    resumed = reporting_client.post(
+        f"/api/reporting/outcome-report-exports/{export_id}:resume",
+        headers=_auth_header(token),
+    )
+    assert resumed.status_code == 200
+    body = resumed.json()
+    assert body["status"] == "SUCCEEDED"
+    assert (body["rows_total"], body["rows_scanned"], body["rows_written"]) == (5, 5, 5)
+    assert body["detail"]["outcomes_total"] == 5
+    lines = Path(body["file_path"]).read_text().splitlines()
+    assert lines[0] == "id,type,status,task_id,mission_id"
+    assert sorted(line.split(",")[0] for line in lines[1:]) == sorted(outcome_ids)
+    assert reporting_client.post(
+        f"/api/reporting/outcome-report-exports/{export_id}:resume",
+        headers=_auth_header(token),
+    ).status_code == 409
+
+    monkeypatch.setattr(report_writers, "PDF_LINES_PER_PAGE", 2)
+    monkeypatch.setattr(report_writers, "PDF_LINE_CHARS", 200)
+    pdf_export = reporting_client.post(
+        "/api/reporting/outcome-report-exports",
+        json={"template_id": template_id, "report_format": "PDF", "task_id": task_id},
+        headers=_auth_header(token),
+    )
+    assert pdf_export.status_code == 201
+    assert pdf_export.json()["status"] == "SUCCEEDED"
+    pdf_bytes = Path(pdf_export.json()["file_path"]).read_bytes()
+    assert pdf_bytes.startswith(b"%PDF")
+    # Three header lines, then the heading and five rows, two lines per page.
+    assert b"/Count 5" in pdf_bytes
+    assert b"(Job Report count=5) Tj" in pdf_bytes
+    xref_pos = int(pdf_bytes.rsplit(b"startxref\n", 1)[1].split(b"\n", 1)[0])
+    xref_entries = pdf_bytes[xref_pos:].split(b"\n")[3:]
+    for object_id, entry in enumerate(xref_entries[: int(pdf_bytes.split(b"/Size ")[1].split(b" ")[0]) - 1], start=1):
+        offset = int(entry[:10])
+        assert pdf_bytes[offset:].startswith(f"{object_id} 0 obj".encode())
+
+
+def test_outcome_report_export_takes_over_stalled_jobs_and_fails_broken_ones(
+    reporting_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tenant_id = _create_tenant(reporting_client, "reporting-export-takeover")
+    _bootstrap_admin(reporting_client, tenant_id, "admin", "admin-pass")
+    token = _login(reporting_client, tenant_id, "admin", "admin-pass")
+    template_resp = reporting_client.post(
+        "/api/reporting/outcome-report-templates",
+        json={
+            "name": "export-takeover-template",
+            "format_default": "CSV",
+            "title_template": "Takeover count={count}",
+            "body_template": "streamed",
+            "is_active": True,
+        },
+        headers=_auth_header(token),
+    )
+    assert template_resp.status_code == 201
+    template_id = template_resp.json()["id"]
+    inspection_template_id = _create_template(reporting_client, token, "export-takeover-inspection-template")
+    task_id = _create_task(reporting_client, token, inspection_template_id, "export-takeover-task")
+    outcome_ids = []
+    for idx in range(3):
+        outcome_resp = reporting_client.post(
+            "/api/outcomes/records",
+            json={
+                "task_id": task_id,
+                "source_type": "MANUAL",
+                "source_id": f"export-takeover-source-{idx}",
+                "outcome_type": "DEFECT",
+                "payload": {"note": f"takeover {idx}"},
+            },
+            headers=_auth_header(token),
+        )
+        assert outcome_resp.status_code == 201
+        outcome_ids.append(outcome_resp.json()["id"])
+    monkeypatch.setattr(reporting_service, "REPORT_EXPORT_CHUNK_SIZE", 1)
+    service = ReportingService()
+
+    def _queue_and_claim(worker_id: str) -> str:
+        response = reporting_client.post(
+            "/api/reporting/outcome-report-exports",
+            json={"template_id": template_id, "task_id": task_id, "background": True},
+            headers=_auth_header(token),
+        )
+        assert response.status_code == 201
+        claimed = service.claim_outcome_report_export(worker_id)
+        assert claimed is not None and claimed.id == response.json()["id"]
+        return claimed.id
+
+    def _stall(export_id: str) -> None:
+        with Session(db.engine) as session:
+            row = session.get(OutcomeReportExport, export_id)
+            assert row is not None
+            row.heartbeat_at = row.updated_at - timedelta(seconds=reporting_service.REPORT_EXPORT_STALE_SECONDS + 60)
+            session.add(row)
+            session.commit()
+
+    class _Crash(BaseException):
+        pass
+
+    checkpoint = ReportingService._checkpoint_outcome_report_export
+
+    def _crash_after_first_chunk(self: ReportingService, export_id: str, worker_id: str, **kwargs: Any) -> bool:
+        keep_going = checkpoint(self, export_id, worker_id, **kwargs)
+        if kwargs["rows_scanned"] >= 1:
+            raise _Crash()
+        return keep_going
+
+    crashed_id = _queue_and_claim("worker-a")
+    monkeypatch.setattr(ReportingService, "_checkpoint_outcome_report_export", _crash_after_first_chunk)
+    with pytest.raises(_Crash):
+        service.run_outcome_report_export(crashed_id, worker_id="worker-a")
+    monkeypatch.setattr(ReportingService, "_checkpoint_outcome_report_export", checkpoint)
+    crashed = service.get_outcome_report_export(tenant_id, crashed_id)
+    assert crashed.status == ReportExportStatus.RUNNING
+    assert crashed.checkpoint["part_file"].endswith(".worker-a.part")
+    export_dir = Path("logs") / "exports"
+    assert (export_dir / crashed.checkpoint["part_file"]).exists()
+
+    resume_url = f"/api/reporting/outcome-report-exports/{crashed_id}:resume"
+    assert reporting_client.post(resume_url, headers=_auth_header(token)).status_code == 409
+    _stall(crashed_id)
+    resumed = reporting_client.post(resume_url, headers=_auth_header(token))
+    assert resumed.status_code == 200
+    assert resumed.json()["status"] == "SUCCEEDED"
+    assert resumed.json()["rows_written"] == 3
+    lines = Path(resumed.json()["file_path"]).read_text().splitlines()
+    assert sorted(line.split(",")[0] for line in lines[1:]) == sorted(outcome_ids)
+    assert list(export_dir.glob(f"outcome_report_{crashed_id}*.part")) == []
+
+    stalled_id = _queue_and_claim("worker-b")
+    _stall(stalled_id)
+    canceled = reporting_client.post(
+        f"/api/reporting/outcome-report-exports/{stalled_id}:cancel",
+        headers=_auth_header(token),
+    )
+    assert canceled.status_code == 200
+    assert canceled.json()["status"] == "CANCELED"
+
+    broken_id = _queue_and_claim("worker-c")
+
+    def _missing_template(*args: Any, **kwargs: Any) -> Any:
+        raise reporting_service.NotFoundError("outcome report template not found")
+
+    monkeypatch.setattr(ReportingService, "_get_scoped_outcome_report_template", staticmethod(_missing_template))
+    with pytest.raises(reporting_service.ConflictError):
+        service.run_outcome_report_export(broken_id, worker_id="worker-c")
+    broken = service.get_outcome_report_export(tenant_id, broken_id)
+    assert broken.status == ReportExportStatus.FAILED
+    assert broken.detail["error"] == "outcome report template not found"
+
+
+def test_reporting_aggregates_match_row_by_row_counts(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    test_engine = create_engine(f"sqlite:///{tmp_path / 'reporting_aggregates.db'}")
+    SQLModel.metadata.create_all(test_engine)
+    monkeypatch.setattr(db, "engine", test_engine)
+    service = ReportingService()
+    perimeter = DataPerimeterService()
+
+    with Session(test_engine) as session:
+        drones = [Drone(tenant_id="tenant-1", name=f"drone-{idx}", vendor=DroneVendor.FAKE) for idx in range(4)]
+        session.add_all(drones)
+        session.add(Drone(tenant_id="tenant-2", name="other-tenant", vendor=DroneVendor.FAKE))
+        missions: list[Mission] = []
+        for idx in range(12):
+            missions.append(
+                Mission(
+                    tenant_id="tenant-1",
+                    name=f"mission-{idx}",
+                    drone_id=drones[idx % 3].id if idx % 5 else None,
+                    project_code="p-1" if idx % 2 else "p-2",
+                    area_code="area-1" if idx % 3 else "area-2",
+                    plan_type=MissionPlanType.POINT_TASK,
+                    created_by="user-1",
+                )
+            )
+        session.add_all(missions)
+        tasks = [
+            InspectionTask(
+                tenant_id="tenant-1",
+                name=f"task-{idx}",
+                template_id="template-1",
+                mission_id=missions[idx % len(missions)].id if idx % 4 else None,
+                project_code="p-1" if idx % 3 else "p-2",
+            )
+            for idx in range(20)
+        ]
+        session.add_all(tasks)
+        defects = [
+            Defect(
+                tenant_id="tenant-1",
+                observation_id=f"obs-{idx}",
+                project_code="p-1" if idx % 2 else "p-2",
+                title=f"defect-{idx}",
+                status=DefectStatus.CLOSED if idx % 3 == 0 else DefectStatus.OPEN,
+            )
+            for idx in range(7)
+        ]
+        session.add_all(defects)
+        session.commit()
+
+        scopes = [
+            DataPerimeterScope(mode=DataScopeMode.ALL),
+            DataPerimeterScope(mode=DataScopeMode.SCOPED),
+            DataPerimeterScope(
+                mode=DataScopeMode.SCOPED,
+                explicit_allow=DataPerimeterRule(project_codes=frozenset({"p-1"})),
+                explicit_deny=DataPerimeterRule(area_codes=frozenset({"area-2"})),
+            ),
+        ]
+        for scope in scopes:
+            visible_missions = [item for item in missions if perimeter.mission_visible(item, scope)]
+            visible_tasks = [item for item in tasks if perimeter.inspection_task_visible(item, scope)]
+            visible_defects = [item for item in defects if perimeter.defect_visible(item, scope)]
+            expected_usage = []
+            for drone in drones:
+                mission_ids = {item.id for item in visible_missions if item.drone_id == drone.id}
+                expected_usage.append(
+                    DeviceUtilizationRead(
+                        drone_id=drone.id,
+                        drone_name=drone.name,
+                        missions=len(mission_ids),
+                        inspections=len([item for item in visible_tasks if item.mission_id in mission_ids]),
+                    )
+                )
+            assert service._load_device_utilization(session, "tenant-1", scope) == expected_usage
+
+            closed = len([item for item in visible_defects if item.status == DefectStatus.CLOSED])
+            assert service._load_overview(session, "tenant-1", scope) == ReportingOverviewRead(
+                missions_total=len(visible_missions),
+                inspections_total=len(visible_tasks),
+                defects_total=len(visible_defects),
+                defects_closed=closed,
+                closure_rate=(closed / len(visible_defects)) if visible_defects else 0.0,
+            )
+
+    usage = service.device_utilization("tenant-1")
+    assert [item.drone_name for item in usage] == ["drone-0", "drone-1", "drone-2", "drone-3"]
+    assert sum(item.missions for item in usage) == len([item for item in missions if item.drone_id])
+
+
+def test_reporting_topic_match_searches_json_text() -> None:
+    # Same text form as Postgres renders JSONB, which the SQL pre-filter searches.
+    assert json_text_contains({"status": None}, "null")
+    assert not json_text_contains({"status": None}, "none")
+    assert json_text_contains({"zone": "river"}, '"zone": "river"')
+    assert not json_text_contains({"zone": "river"}, "'zone'")
+    assert json_text_contains({"区域": "河道巡查"}, "河道")
+    assert json_text_contains({"tags": ["Flood", "Bridge"]}, "flood")
@@ -284,7 +284,7 @@ def test_task_center_p0_workflow(task_center_client: TestClient) -> None:
     )
     assert history_resp.status_code == 200
     actions = [item["action"] for item in history_resp.json()]
-    assert actions[0] == "created"
+    assert actions[-1] == "created"
     assert "submitted_for_approval" in actions
     assert "approved" in actions
     assert "dispatched" in actions
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Generator
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import SQLModel, create_engine
+from sqlmodel import Session, SQLModel, create_engine, select
 
 from app import main as app_main
+from app.domain.models import EventRecord, KpiFlightRollupHourly, TelemetryNormalized
 from app.infra import audit, db, events, redis_state
+from app.services.kpi_service import KpiService
+from app.services.telemetry_service import TelemetryService
 
 
 class FakeRedis:
@@ -129,3 +133,66 @@ def test_telemetry_ws_receives_updates(telemetry_client: TestClient) -> None:
         assert message["drone_id"] == "drone-ws"
         assert message["mode"] == "AUTO"
 
+
+
+def test_telemetry_ingest_runs_off_the_event_loop(
+    telemetry_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tenant_id = _create_tenant(telemetry_client, "telemetry-thread-tenant")
+    _bootstrap_admin(telemetry_client, tenant_id, "admin", "admin-pass")
+    token = _login(telemetry_client, tenant_id, "admin", "admin-pass")
+
+    loop_running: list[bool] = []
+    real_ingest = TelemetryService.ingest
+
+    def _recording_ingest(
+        self: TelemetryService,
+        tenant_id: str,
+        payload: TelemetryNormalized,
+    ) -> TelemetryNormalized:
+        try:
+            asyncio.get_running_loop()
+            loop_running.append(True)
+        except RuntimeError:
+            loop_running.append(False)
+        return real_ingest(self, tenant_id, payload)
+
+    monkeypatch.setattr(TelemetryService, "ingest", _recording_ingest)
+
+    ingest_resp = telemetry_client.post(
+        "/api/telemetry/ingest",
+        json=_telemetry_payload("drone-thread"),
+        headers=_auth_header(token),
+    )
+    assert ingest_resp.status_code == 200
+    assert loop_running == [False]
+
+
+def test_telemetry_ingest_commits_event_and_rollup_together(
+    telemetry_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tenant_id = _create_tenant(telemetry_client, "telemetry-atomic-tenant")
+    service = TelemetryService()
+    sample = TelemetryNormalized.model_validate(_telemetry_payload("drone-atomic"))
+    service.ingest(tenant_id, sample)
+
+    def _failing_fold(self: KpiService, *args: object, **kwargs: object) -> None:
+        raise RuntimeError("rollup fold failed")
+
+    monkeypatch.setattr(KpiService, "record_flight_sample", _failing_fold)
+    with pytest.raises(RuntimeError):
+        service.ingest(tenant_id, sample)
+
+    with Session(db.get_engine()) as session:
+        events_written = session.exec(
+            select(EventRecord)
+            .where(EventRecord.tenant_id == tenant_id)
+            .where(EventRecord.event_type == "telemetry.normalized")
+        ).all()
+        rollups = session.exec(
+            select(KpiFlightRollupHourly).where(KpiFlightRollupHourly.tenant_id == tenant_id)
+        ).all()
+    assert len(events_written) == 1
+    assert [item.sample_count for item in rollups] == [1]
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import shutil
 from collections.abc import Generator
 from pathlib import Path
+from uuid import uuid4
 from zipfile import ZipFile
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import event
-from sqlmodel import SQLModel, create_engine
+from sqlmodel import Session, SQLModel, create_engine, select
 
 from app import main as app_main
-from app.infra import audit, db, events
+from app.domain.models import Drone, Tenant
+from app.infra import audit, columnar, db, events
+from app.services import tenant_export_service
 
 
 @pytest.fixture()
@@ -194,3 +199,231 @@ def test_tenant_export_is_admin_only(tenant_export_client: TestClient) -> None:
         headers=_auth_header(operator_token),
     )
     assert export_resp.status_code == 403
+
+
+def test_tenant_columnar_export_round_trips_selected_tables(
+    tenant_export_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tenant_id = _create_tenant(tenant_export_client, "export-columnar")
+    _bootstrap_admin(tenant_export_client, tenant_id, "admin", "admin-pass")
+    token = _login(tenant_export_client, tenant_id, "admin", "admin-pass")
+    _create_user(tenant_export_client, token, "analyst", "analyst-pass")
+    _create_drone(tenant_export_client, token, "drone-columnar")
+
+    monkeypatch.setattr(columnar, "COLUMNAR_ENGINE", "builtin")
+    monkeypatch.setattr(columnar, "COLUMNAR_ROW_GROUP_SIZE", 1)
+    columnar_resp = tenant_export_client.post(
+        f"/api/tenants/{tenant_id}/export?format=columnar&tables=users&tables=drones",
+        headers=_auth_header(token),
+    )
+    assert columnar_resp.status_code == 201
+    jsonl_resp = tenant_export_client.post(
+        f"/api/tenants/{tenant_id}/export?tables=users&tables=drones",
+        headers=_auth_header(token),
+    )
+    assert jsonl_resp.status_code == 201
+
+    manifest_path = Path(columnar_resp.json()["manifest_path"])
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert manifest["format"] == "columnar"
+    assert [item["table"] for item in manifest["tables"]] == ["drones", "users"]
+    jsonl_dir = Path(jsonl_resp.json()["manifest_path"]).parent
+    for summary in manifest["tables"]:
+        assert summary["encoding"] == "uavcol-1"
+        column_file = manifest_path.parent / summary["file"]
+        assert hashlib.sha256(column_file.read_bytes()).hexdigest() == summary["sha256"]
+        assert summary["row_groups"] == summary["row_count"]
+        schema, rows = columnar.read_builtin_columnar(column_file)
+        assert [spec.name for spec in schema] == [item["name"] for item in summary["schema"]]
+        types = {spec.name: spec.type for spec in schema}
+        assert types["created_at"] == "timestamp"
+
+        expected = [
+            json.loads(line)
+            for line in (jsonl_dir / "tables" / f"{summary['table']}.jsonl").read_text(encoding="utf-8").splitlines()
+        ]
+        decoded = [
+            {
+                key: value.isoformat() if types[key] == "timestamp" and value is not None else value
+                for key, value in row.items()
+            }
+            for row in rows
+        ]
+        assert decoded == expected
+        assert len(decoded) == summary["row_count"] >= 1
+
+    unknown_resp = tenant_export_client.post(
+        f"/api/tenants/{tenant_id}/export?format=columnar&tables=permissions",
+        headers=_auth_header(token),
+    )
+    assert unknown_resp.status_code == 400
+
+
+def test_tenant_export_streams_tables_in_parallel_into_zip(
+    tenant_export_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tenant_id = _create_tenant(tenant_export_client, "export-parallel")
+    _bootstrap_admin(tenant_export_client, tenant_id, "admin", "admin-pass")
+    token = _login(tenant_export_client, tenant_id, "admin", "admin-pass")
+    for index in range(5):
+        _create_user(tenant_export_client, token, f"user_{index}", "user-pass")
+        _create_drone(tenant_export_client, token, f"drone-{index}")
+
+    def _export(workers: int, batch_size: int) -> dict:
+        monkeypatch.setattr(tenant_export_service, "TENANT_EXPORT_WORKERS", workers)
+        monkeypatch.setattr(tenant_export_service, "TENANT_EXPORT_BATCH_SIZE", batch_size)
+        response = tenant_export_client.post(
+            f"/api/tenants/{tenant_id}/export?include_zip=true",
+            headers=_auth_header(token),
+        )
+        assert response.status_code == 201
+        return response.json()
+
+    sequential = _export(1, 5000)
+    parallel = _export(4, 2)
+    sequential_manifest = json.loads(Path(sequential["manifest_path"]).read_text(encoding="utf-8"))
+    parallel_manifest = json.loads(Path(parallel["manifest_path"]).read_text(encoding="utf-8"))
+    table_names = [item["table"] for item in parallel_manifest["tables"]]
+    assert table_names == sorted(table_names)
+
+    def _fingerprint(manifest: dict) -> list[tuple[str, int, str]]:
+        # The first export's own audit entry lands between the two runs.
+        return [
+            (item["table"], item["row_count"], item["sha256"])
+            for item in manifest["tables"]
+            if item["table"] != "audit_logs"
+        ]
+
+    assert _fingerprint(parallel_manifest) == _fingerprint(sequential_manifest)
+    users = next(item for item in parallel_manifest["tables"] if item["table"] == "users")
+    assert users["row_count"] == 6
+
+    zip_path = Path(parallel["zip_path"])
+    assert parallel_manifest["zip_file"] == zip_path.name
+    export_dir = zip_path.parent
+    with ZipFile(zip_path, "r") as archive:
+        assert json.loads(archive.read("manifest.json")) == parallel_manifest
+        for summary in parallel_manifest["tables"]:
+            packed = archive.read(summary["file"])
+            assert packed == (export_dir / summary["file"]).read_bytes()
+            assert hashlib.sha256(packed).hexdigest() == summary["sha256"]
+
+
+def test_incremental_tenant_exports_restore_base_plus_deltas(
+    tenant_export_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    tenant_id = _create_tenant(tenant_export_client, "export-incremental")
+    _bootstrap_admin(tenant_export_client, tenant_id, "admin", "admin-pass")
+    token = _login(tenant_export_client, tenant_id, "admin", "admin-pass")
+    drone_ids = [_create_drone(tenant_export_client, token, f"drone-{index}") for index in range(3)]
+    monkeypatch.setattr(tenant_export_service, "TENANT_EXPORT_WATERMARK_OVERLAP_SECONDS", 0)
+
+    def _export(query: str) -> dict:
+        response = tenant_export_client.post(
+            f"/api/tenants/{tenant_id}/export?tables=drones&tables=audit_logs{query}",
+            headers=_auth_header(token),
+        )
+        assert response.status_code == 201
+        return json.loads(Path(response.json()["manifest_path"]).read_text(encoding="utf-8"))
+
+    def _drones(manifest: dict) -> tuple[dict, list[dict], list[list[str]]]:
+        summary = next(item for item in manifest["tables"] if item["table"] == "drones")
+        export_dir = Path("logs/exports") / tenant_id / manifest["export_id"]
+        rows = [json.loads(line) for line in (export_dir / summary["file"]).read_text(encoding="utf-8").splitlines()]
+        tombstones: list[list[str]] = []
+        if summary["tombstones_file"]:
+            tombstones = [
+                json.loads(line)
+                for line in (export_dir / summary["tombstones_file"]).read_text(encoding="utf-8").splitlines()
+            ]
+        return summary, rows, tombstones
+
+    base = _export("")
+    base_summary, base_rows, _ = _drones(base)
+    assert base["mode"] == "full"
+    assert base_summary["change_column"] == "updated_at"
+    assert base_summary["high_water_mark"] == max(row["updated_at"] for row in base_rows)
+    assert base_summary["key_count"] == 3
+    audit_summary = next(item for item in base["tables"] if item["table"] == "audit_logs")
+    assert audit_summary["change_column"] == "ts"
+
+    patch_resp = tenant_export_client.patch(
+        f"/api/registry/drones/{drone_ids[0]}",
+        json={"name": "drone-0-renamed"},
+        headers=_auth_header(token),
+    )
+    assert patch_resp.status_code == 200
+    delete_resp = tenant_export_client.delete(
+        f"/api/registry/drones/{drone_ids[1]}",
+        headers=_auth_header(token),
+    )
+    assert delete_resp.status_code == 204
+    new_drone_id = _create_drone(tenant_export_client, token, "drone-new")
+
+    delta = _export(f"&since_export_id={base['export_id']}")
+    delta_summary, delta_rows, tombstones = _drones(delta)
+    assert delta["mode"] == "incremental"
+    assert delta["base_export_id"] == base["export_id"]
+    # The bound is inclusive, so the base's newest row is read again.
+    assert {row["id"] for row in delta_rows} == {drone_ids[0], drone_ids[2], new_drone_id}
+    assert next(row for row in delta_rows if row["id"] == drone_ids[0])["name"] == "drone-0-renamed"
+    assert tombstones == [[drone_ids[1]]]
+    assert delta_summary["key_count"] == 3
+
+    latest = _export(f"&since_export_id={delta['export_id']}")
+    _, latest_rows, latest_tombstones = _drones(latest)
+    assert [row["id"] for row in latest_rows] == [new_drone_id]
+    assert latest_tombstones == []
+
+    mismatch_resp = tenant_export_client.post(
+        f"/api/tenants/{tenant_id}/export?tables=drones&since_export_id={base['export_id']}",
+        headers=_auth_header(token),
+    )
+    assert mismatch_resp.status_code == 400
+    missing_resp = tenant_export_client.post(
+        f"/api/tenants/{tenant_id}/export?since_export_id={uuid4()}",
+        headers=_auth_header(token),
+    )
+    assert missing_resp.status_code == 404
+    for since_export_id in ("missing-export", f"../{tenant_id}/{base['export_id']}"):
+        malformed_resp = tenant_export_client.post(
+            f"/api/tenants/{tenant_id}/export",
+            params={"since_export_id": since_export_id},
+            headers=_auth_header(token),
+        )
+        assert malformed_resp.status_code == 400
+    # A manifest copied in from another tenant's export is not a valid base.
+    foreign_id = str(uuid4())
+    foreign_dir = Path("logs/exports") / tenant_id / foreign_id
+    shutil.copytree(Path("logs/exports") / tenant_id / base["export_id"], foreign_dir)
+    foreign_manifest = {**base, "export_id": foreign_id, "tenant_id": str(uuid4())}
+    (foreign_dir / "manifest.json").write_text(json.dumps(foreign_manifest), encoding="utf-8")
+    foreign_resp = tenant_export_client.post(
+        f"/api/tenants/{tenant_id}/export?tables=drones&tables=audit_logs&since_export_id={foreign_id}",
+        headers=_auth_header(token),
+    )
+    assert foreign_resp.status_code == 404
+    shutil.rmtree(foreign_dir)
+
+    with Session(db.engine) as source:
+        tenant = source.get(Tenant, tenant_id)
+        assert tenant is not None
+        expected = [drone.model_dump() for drone in source.exec(select(Drone).order_by(Drone.id)).all()]
+    restore_engine = create_engine(f"sqlite:///{tmp_path / 'restore_target.db'}")
+    SQLModel.metadata.create_all(restore_engine)
+    with Session(restore_engine) as target:
+        target.add(Tenant.model_validate(tenant.model_dump()))
+        target.commit()
+    monkeypatch.setattr(db, "engine", restore_engine)
+
+    result = tenant_export_service.TenantExportService().restore_export(tenant_id, latest["export_id"])
+    assert result["applied_exports"] == [base["export_id"], delta["export_id"], latest["export_id"]]
+    assert result["rows_deleted"] == 1
+    with Session(restore_engine) as target:
+        restored = [drone.model_dump() for drone in target.exec(select(Drone).order_by(Drone.id)).all()]
+    assert restored == expected
+    assert len(restored) == 3
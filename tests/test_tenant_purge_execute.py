@@ -3,14 +3,17 @@ from __future__ import annotations
 import json
 from collections.abc import Generator
 from pathlib import Path
+from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import event
-from sqlmodel import SQLModel, create_engine
+from sqlmodel import Session, SQLModel, create_engine, select
 
 from app import main as app_main
+from app.domain.models import OrgUnit
 from app.infra import audit, db, events
+from app.services import tenant_purge_service
 from app.services.tenant_purge_service import TENANT_PURGE_CONFIRM_PHRASE
 
 
@@ -179,3 +182,155 @@ def test_tenant_purge_execute_requires_confirmation_and_deletes_data(
         headers=_auth_header(token_b),
     )
     assert status_cross_tenant.status_code == 404
+
+
+def test_tenant_purge_runs_in_chunks_and_resumes_from_checkpoint(
+    tenant_purge_execute_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tenant_a = _create_tenant(tenant_purge_execute_client, "purge-chunk-a")
+    tenant_b = _create_tenant(tenant_purge_execute_client, "purge-chunk-b")
+    _bootstrap_admin(tenant_purge_execute_client, tenant_a, "admin_a", "pass-a")
+    _bootstrap_admin(tenant_purge_execute_client, tenant_b, "admin_b", "pass-b")
+    token_a = _login(tenant_purge_execute_client, tenant_a, "admin_a", "pass-a")
+    token_b = _login(tenant_purge_execute_client, tenant_b, "admin_b", "pass-b")
+    for index in range(3):
+        drone_id = _create_drone(tenant_purge_execute_client, token_a, f"drone-a-{index}")
+        _create_mission(tenant_purge_execute_client, token_a, f"mission-a-{index}", drone_id)
+    drone_b = _create_drone(tenant_purge_execute_client, token_b, "drone-b")
+    _create_mission(tenant_purge_execute_client, token_b, "mission-b", drone_b)
+
+    dry_run_resp = tenant_purge_execute_client.post(
+        f"/api/tenants/{tenant_a}/purge:dry_run",
+        headers=_auth_header(token_a),
+    )
+    assert dry_run_resp.status_code == 200
+    dry_run_body = dry_run_resp.json()
+
+    original_wait = tenant_purge_service._RowRateLimiter.wait
+    chunks: list[int] = []
+
+    def _failing_wait(self: object, rows: int) -> None:
+        chunks.append(rows)
+        if len(chunks) == 6:
+            raise RuntimeError("database connection lost")
+        original_wait(self, rows)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(tenant_purge_service._RowRateLimiter, "wait", _failing_wait)
+    failed_resp = tenant_purge_execute_client.post(
+        f"/api/tenants/{tenant_a}/purge",
+        json={
+            "dry_run_id": dry_run_body["dry_run_id"],
+            "confirm_token": dry_run_body["confirm_token"],
+            "mode": "hard",
+            "batch_size": 1,
+            "workers": 2,
+        },
+        headers=_auth_header(token_a),
+    )
+    assert failed_resp.status_code == 409
+    assert all(rows == 1 for rows in chunks)
+
+    report_paths = list(Path("logs/purge", tenant_a).glob("*/report.json"))
+    assert len(report_paths) == 1
+    purge_id = report_paths[0].parent.name
+    failed_report = tenant_purge_execute_client.get(
+        f"/api/tenants/{tenant_a}/purge/{purge_id}",
+        headers=_auth_header(token_a),
+    ).json()
+    assert failed_report["status"] == "failed"
+    assert "database connection lost" in failed_report["error"]
+    assert failed_report["settings"]["batch_size"] == 1
+    assert 0 < failed_report["progress"]["rows_deleted"] < dry_run_body["estimated_rows"]
+    assert failed_report["progress"]["rows_deleted"] == sum(failed_report["deleted_counts"].values())
+    assert {item["status"] for item in failed_report["checkpoint"].values()} >= {"completed", "pending"}
+
+    monkeypatch.setattr(tenant_purge_service._RowRateLimiter, "wait", original_wait)
+    # Land the audit rows of the requests so far before the resumed purge verifies.
+    audit.audit_sink.flush()
+    resume_resp = tenant_purge_execute_client.post(
+        f"/api/tenants/{tenant_a}/purge/{purge_id}:resume",
+        headers=_auth_header(token_a),
+    )
+    assert resume_resp.status_code == 200
+    resume_body = resume_resp.json()
+    assert resume_body["status"] == "completed"
+    # The purge requests themselves are audited, so only audit_logs grows past the dry run.
+    assert resume_body["deleted_rows"] > dry_run_body["estimated_rows"]
+    assert all(count == 0 for count in resume_body["post_delete_counts"].values())
+
+    report = tenant_purge_execute_client.get(
+        f"/api/tenants/{tenant_a}/purge/{purge_id}",
+        headers=_auth_header(token_a),
+    ).json()
+    assert report["progress"]["percent"] == 100.0
+    assert report["progress"]["rows_deleted"] == report["deleted_rows"]
+    assert report["progress"]["tables_completed"] == report["progress"]["tables_total"]
+    assert report["deleted_rows"] == sum(report["deleted_counts"].values())
+    assert {
+        name: count for name, count in report["deleted_counts"].items() if name != "audit_logs"
+    } == {name: count for name, count in dry_run_body["counts"].items() if name != "audit_logs"}
+
+    again_resp = tenant_purge_execute_client.post(
+        f"/api/tenants/{tenant_a}/purge/{purge_id}:resume",
+        headers=_auth_header(token_a),
+    )
+    assert again_resp.status_code == 409
+
+    overview_b = tenant_purge_execute_client.get(
+        "/api/reporting/overview",
+        headers=_auth_header(token_b),
+    )
+    assert overview_b.json()["missions_total"] == 1
+
+
+def test_tenant_purge_verification_pass_unlinks_rows_written_during_purge(
+    tenant_purge_execute_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tenant_id = _create_tenant(tenant_purge_execute_client, "purge-late-writes")
+    _bootstrap_admin(tenant_purge_execute_client, tenant_id, "admin", "admin-pass")
+    token = _login(tenant_purge_execute_client, tenant_id, "admin", "admin-pass")
+    dry_run_body = tenant_purge_execute_client.post(
+        f"/api/tenants/{tenant_id}/purge:dry_run",
+        headers=_auth_header(token),
+    ).json()
+
+    run_plan = tenant_purge_service.TenantPurgeService._run_purge_plan
+    passes: list[int] = []
+
+    def _write_during_purge(self: tenant_purge_service.TenantPurgeService, **kwargs: Any) -> None:
+        run_plan(self, **kwargs)
+        passes.append(1)
+        if len(passes) == 1:
+            # The parent sorts first, so deleting by key without unlinking breaks the FK.
+            with Session(db.engine) as session:
+                session.add(OrgUnit(id="late-a-parent", tenant_id=tenant_id, name="parent", code="late-parent"))
+                session.flush()
+                session.add(
+                    OrgUnit(
+                        id="late-b-child",
+                        tenant_id=tenant_id,
+                        name="child",
+                        code="late-child",
+                        parent_id="late-a-parent",
+                    )
+                )
+                session.commit()
+
+    monkeypatch.setattr(tenant_purge_service.TenantPurgeService, "_run_purge_plan", _write_during_purge)
+    response = tenant_purge_execute_client.post(
+        f"/api/tenants/{tenant_id}/purge",
+        json={
+            "dry_run_id": dry_run_body["dry_run_id"],
+            "confirm_token": dry_run_body["confirm_token"],
+            "mode": "hard",
+            "batch_size": 1,
+        },
+        headers=_auth_header(token),
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+    assert len(passes) >= 2
+    with Session(db.engine) as session:
+        assert session.exec(select(OrgUnit).where(OrgUnit.tenant_id == tenant_id)).all() == []